@@ -5,7 +5,7 @@ from typing import Optional, Any
 
 from agentops.client.api import ApiClient
 from agentops.config import Config
-from agentops.instrumentation import instrument_all
+from agentops.instrumentation import instrument_all, instrument_process_pools
 from agentops.logging import logger
 from agentops.logging.config import configure_logging, intercept_opentelemetry_logging
 from agentops.sdk.core import TraceContext, tracer
@@ -195,6 +195,10 @@ class Client:
         if self.config.instrument_llm_calls:
             instrument_all()
 
+        # after instrument_all, which only starts while nothing is instrumented yet
+        if self.config.propagate_to_processes:
+            instrument_process_pools()
+
         # Start authentication task only if we have an API key
         if self.config.api_key:
             self._start_auth_task(self.config.api_key)
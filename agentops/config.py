@@ -31,6 +31,10 @@ class ConfigDict(TypedDict):
     fail_safe: Optional[bool]
     prefetch_jwt_token: Optional[bool]
     log_session_replay_url: Optional[bool]
+    deferred_attribute_extraction: Optional[bool]
+    batch_by_trace: Optional[bool]
+    propagate_to_processes: Optional[bool]
+    profile_overhead: Optional[bool]
 
 
 @dataclass
@@ -120,6 +124,26 @@ class Config:
         metadata={"description": "Whether to log session replay URLs to the console"},
     )
 
+    deferred_attribute_extraction: bool = field(
+        default_factory=lambda: get_env_bool("AGENTOPS_DEFERRED_ATTRIBUTE_EXTRACTION", False),
+        metadata={"description": "Whether to extract LLM call attributes on the export thread instead of the caller's"},
+    )
+
+    batch_by_trace: bool = field(
+        default_factory=lambda: get_env_bool("AGENTOPS_BATCH_BY_TRACE", False),
+        metadata={"description": "Whether to export each trace's spans together when the trace ends"},
+    )
+
+    propagate_to_processes: bool = field(
+        default_factory=lambda: get_env_bool("AGENTOPS_PROPAGATE_TO_PROCESSES", True),
+        metadata={"description": "Whether to carry the current trace into thread and process pool workers"},
+    )
+
+    profile_overhead: bool = field(
+        default_factory=lambda: get_env_bool("AGENTOPS_PROFILE_OVERHEAD", False),
+        metadata={"description": "Whether to measure and report the time AgentOps adds to instrumented code"},
+    )
+
     exporter_endpoint: Optional[str] = field(
         default_factory=lambda: os.getenv("AGENTOPS_EXPORTER_ENDPOINT", "https://otlp.agentops.ai/v1/traces"),
         metadata={
@@ -154,6 +178,10 @@ class Config:
         fail_safe: Optional[bool] = None,
         prefetch_jwt_token: Optional[bool] = None,
         log_session_replay_url: Optional[bool] = None,
+        deferred_attribute_extraction: Optional[bool] = None,
+        batch_by_trace: Optional[bool] = None,
+        propagate_to_processes: Optional[bool] = None,
+        profile_overhead: Optional[bool] = None,
         exporter: Optional[SpanExporter] = None,
         processor: Optional[SpanProcessor] = None,
         exporter_endpoint: Optional[str] = None,
@@ -229,6 +257,18 @@ class Config:
         if log_session_replay_url is not None:
             self.log_session_replay_url = log_session_replay_url
 
+        if deferred_attribute_extraction is not None:
+            self.deferred_attribute_extraction = deferred_attribute_extraction
+
+        if batch_by_trace is not None:
+            self.batch_by_trace = batch_by_trace
+
+        if propagate_to_processes is not None:
+            self.propagate_to_processes = propagate_to_processes
+
+        if profile_overhead is not None:
+            self.profile_overhead = profile_overhead
+
         if exporter is not None:
             self.exporter = exporter
 
@@ -260,6 +300,10 @@ class Config:
             "fail_safe": self.fail_safe,
             "prefetch_jwt_token": self.prefetch_jwt_token,
             "log_session_replay_url": self.log_session_replay_url,
+            "deferred_attribute_extraction": self.deferred_attribute_extraction,
+            "batch_by_trace": self.batch_by_trace,
+            "propagate_to_processes": self.propagate_to_processes,
+            "profile_overhead": self.profile_overhead,
             "exporter": self.exporter,
             "processor": self.processor,
             "exporter_endpoint": self.exporter_endpoint,
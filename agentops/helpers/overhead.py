@@ -0,0 +1,301 @@
+"""Measurement of the time AgentOps adds to the code it instruments.
+
+When profiling is enabled, the SDK times its own work (instrumentation
+wrappers, stream chunk handling, serialization, span processors and the
+exporter) and accumulates wall and CPU time per `(component, instrumentor,
+method)`. Time spent in the wrapped call itself is excluded, so the numbers
+are what AgentOps costs on top of the instrumented library.
+
+Totals are kept in per-thread tables, so recording a measurement never
+contends on a lock. When a thread ends, its totals are folded into a shared
+table and its own table is dropped, so short-lived threads don't accumulate. They are reported through `get_overhead_report()` and,
+once `create_overhead_metrics()` has been called, as observable counters on
+the SDK's meter provider.
+
+Measurements nest: serialization done inside a wrapper counts towards both.
+"""
+
+import functools
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
+
+from agentops.semconv import Meters
+
+COMPONENT_WRAPPER = "wrapper"
+COMPONENT_STREAM = "stream"
+COMPONENT_SERIALIZATION = "serialization"
+COMPONENT_SPAN_PROCESSOR = "span_processor"
+COMPONENT_EXPORTER = "exporter"
+
+# (component, instrumentor, method)
+OverheadKey = Tuple[str, str, str]
+
+_enabled = False
+
+_local = threading.local()
+_tables: List[Dict[OverheadKey, List[float]]] = []
+# totals of threads that have ended
+_retired: Dict[OverheadKey, List[float]] = {}
+# reentrant: a thread's finalizer can run during garbage collection on any thread
+_tables_lock = threading.RLock()
+
+
+class _ThreadTable:
+    """Holder for a thread's table, stored on `_local` and freed when the thread ends."""
+
+    __slots__ = ("totals", "__weakref__")
+
+    def __init__(self) -> None:
+        self.totals: Dict[OverheadKey, List[float]] = {}
+
+
+def _merge(into: Dict[OverheadKey, List[float]], table: Dict[OverheadKey, List[float]]) -> None:
+    for key, (calls, wall_time, cpu_time) in list(table.items()):
+        totals = into.setdefault(key, [0, 0.0, 0.0])
+        totals[0] += calls
+        totals[1] += wall_time
+        totals[2] += cpu_time
+
+
+def _retire(table: Dict[OverheadKey, List[float]]) -> None:
+    """Fold an ended thread's totals into `_retired` and stop tracking its table."""
+    with _tables_lock:
+        _merge(_retired, table)
+        _tables[:] = [other for other in _tables if other is not table]
+
+
+def _table() -> Dict[OverheadKey, List[float]]:
+    """Return this thread's table of key -> [calls, wall_time, cpu_time]."""
+    holder = getattr(_local, "holder", None)
+    if holder is None:
+        holder = _local.holder = _ThreadTable()
+        with _tables_lock:
+            _tables.append(holder.totals)
+        # thread-local values are released when their thread ends
+        weakref.finalize(holder, _retire, holder.totals)
+    return holder.totals
+
+
+def _record(key: OverheadKey, wall_time: float, cpu_time: float) -> None:
+    table = _table()
+    totals = table.get(key)
+    if totals is None:
+        totals = table[key] = [0, 0.0, 0.0]
+    totals[0] += 1
+    totals[1] += wall_time
+    totals[2] += cpu_time
+
+
+class _Exclusion:
+    """Context manager that keeps a block's time out of the enclosing timer."""
+
+    __slots__ = ("_timer", "_wall", "_cpu")
+
+    def __init__(self, timer: "_Timer"):
+        self._timer = timer
+
+    def __enter__(self) -> "_Exclusion":
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        self._timer.excluded_wall += time.perf_counter() - self._wall
+        self._timer.excluded_cpu += time.thread_time() - self._cpu
+        return False
+
+
+class _Timer:
+    """Context manager that records the wall and CPU time of a block under `key`."""
+
+    __slots__ = ("key", "excluded_wall", "excluded_cpu", "_wall", "_cpu")
+
+    def __init__(self, key: OverheadKey):
+        self.key = key
+        self.excluded_wall = 0.0
+        self.excluded_cpu = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        wall_time = time.perf_counter() - self._wall - self.excluded_wall
+        cpu_time = time.thread_time() - self._cpu - self.excluded_cpu
+        _record(self.key, max(0.0, wall_time), max(0.0, cpu_time))
+        return False
+
+    def excluded(self) -> _Exclusion:
+        """Exclude a nested block, typically the wrapped call, from this measurement."""
+        return _Exclusion(self)
+
+
+class _NullTimer:
+    """Stand-in used while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+    def excluded(self) -> "_NullTimer":
+        return self
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def enable_overhead_profiling(enabled: bool = True) -> None:
+    """Turn overhead profiling on or off. Totals recorded so far are kept."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_overhead_profiling_enabled() -> bool:
+    """Whether AgentOps is currently measuring its own overhead."""
+    return _enabled
+
+
+def measure_overhead(key: OverheadKey):
+    """Return a context manager that records the time spent in its block under `key`.
+
+    Usage:
+        with measure_overhead(key) as timer:
+            ...  # AgentOps work
+            with timer.excluded():
+                result = wrapped(*args, **kwargs)
+    """
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(key)
+
+
+def timed(key: OverheadKey, func: Callable) -> Callable:
+    """Return `func` timed under `key` if profiling is enabled, otherwise `func` itself.
+
+    Meant for callables resolved once per object, such as a stream's chunk
+    handler, so streams started with profiling disabled pay nothing per call.
+    """
+    if not _enabled:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _Timer(key):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def profiled(component: str, instrumentor: str, method: str) -> Callable[[Callable], Callable]:
+    """Decorator that times every call of a function while profiling is enabled."""
+    key = (component, instrumentor, method)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Timer(key):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _snapshot() -> Dict[OverheadKey, List[float]]:
+    """Merge the per-thread tables and the totals of ended threads into a single table."""
+    merged: Dict[OverheadKey, List[float]] = {}
+    with _tables_lock:
+        _merge(merged, _retired)
+        for table in _tables:
+            _merge(merged, table)
+    return merged
+
+
+def reset_overhead_stats() -> None:
+    """Discard everything recorded so far."""
+    with _tables_lock:
+        _retired.clear()
+        for table in _tables:
+            table.clear()
+
+
+def get_overhead_report() -> Dict[str, Any]:
+    """Return the overhead recorded so far, broken down per instrumentor and method.
+
+    Returns:
+        Dictionary with:
+            enabled: Whether profiling is currently enabled
+            entries: One dict per (component, instrumentor, method) with its
+                calls, wall_time, cpu_time and mean_wall_time in seconds,
+                sorted by wall time, highest first
+            components: calls, wall_time and cpu_time totals per component
+    """
+    entries = []
+    components: Dict[str, Dict[str, float]] = {}
+    for (component, instrumentor, method), (calls, wall_time, cpu_time) in _snapshot().items():
+        entries.append(
+            {
+                "component": component,
+                "instrumentor": instrumentor,
+                "method": method,
+                "calls": calls,
+                "wall_time": wall_time,
+                "cpu_time": cpu_time,
+                "mean_wall_time": wall_time / calls if calls else 0.0,
+            }
+        )
+        totals = components.setdefault(component, {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0})
+        totals["calls"] += calls
+        totals["wall_time"] += wall_time
+        totals["cpu_time"] += cpu_time
+
+    entries.sort(key=lambda entry: entry["wall_time"], reverse=True)
+    return {"enabled": _enabled, "entries": entries, "components": components}
+
+
+def create_overhead_metrics(meter: Meter) -> Dict[str, Any]:
+    """Create observable counters reporting the recorded overhead through `meter`.
+
+    Returns:
+        Dictionary with metric names as keys and metric instances as values
+    """
+
+    def observe(index: int) -> Callable[[CallbackOptions], Iterable[Observation]]:
+        def callback(options: CallbackOptions) -> Iterable[Observation]:
+            for (component, instrumentor, method), totals in _snapshot().items():
+                attributes = {"component": component, "instrumentor": instrumentor, "method": method}
+                yield Observation(totals[index], attributes)
+
+        return callback
+
+    return {
+        "overhead_calls": meter.create_observable_counter(
+            name=Meters.AGENTOPS_OVERHEAD_CALLS,
+            callbacks=[observe(0)],
+            unit="call",
+            description="Number of measured calls into AgentOps instrumentation",
+        ),
+        "overhead_wall_time": meter.create_observable_counter(
+            name=Meters.AGENTOPS_OVERHEAD_WALL_TIME,
+            callbacks=[observe(1)],
+            unit="s",
+            description="Wall time spent inside AgentOps instrumentation",
+        ),
+        "overhead_cpu_time": meter.create_observable_counter(
+            name=Meters.AGENTOPS_OVERHEAD_CPU_TIME,
+            callbacks=[observe(2)],
+            unit="s",
+            description="CPU time spent inside AgentOps instrumentation",
+        ),
+    }
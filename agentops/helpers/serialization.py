@@ -7,6 +7,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
+from agentops.helpers.overhead import COMPONENT_SERIALIZATION, profiled
 from agentops.logging import logger
 
 
@@ -106,6 +107,7 @@ def model_to_dict(obj: Any) -> dict:
             return {}
 
 
+@profiled(COMPONENT_SERIALIZATION, "agentops", "safe_serialize")
 def safe_serialize(obj: Any) -> Any:
     """Safely serialize an object to JSON-compatible format
 
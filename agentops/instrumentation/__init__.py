@@ -120,6 +120,31 @@ AGENTIC_LIBRARIES: dict[str, InstrumentorConfig] = {
     },
 }
 
+# Configuration for stdlib utilities instrumented alongside the libraries that need them
+UTILITY_INSTRUMENTORS: dict[str, InstrumentorConfig] = {
+    "concurrent.futures": {
+        "module_name": "agentops.instrumentation.utilities.concurrent_futures",
+        "class_name": "ConcurrentFuturesInstrumentor",
+        "min_version": "3.7.0",  # Python 3.7+ (concurrent.futures is stdlib)
+        "package_name": "python",  # Special case for stdlib modules
+    },
+    "asyncio": {
+        "module_name": "agentops.instrumentation.utilities.asyncio_context",
+        "class_name": "AsyncioInstrumentor",
+        "min_version": "3.7.0",
+        "package_name": "python",
+    },
+}
+
+# Utilities each library fans work out through
+UTILITY_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "mem0": ("concurrent.futures",),
+    "autogen": ("concurrent.futures",),
+    "langgraph": ("asyncio",),
+    "google.adk": ("asyncio",),
+    "agno": ("asyncio",),
+}
+
 # Combine all target packages for monitoring
 TARGET_PACKAGES = set(PROVIDERS.keys()) | set(AGENTIC_LIBRARIES.keys())
 
@@ -337,35 +362,37 @@ def _perform_instrumentation(package_name: str):
             # _uninstrument_providers() was already called in _should_instrument_package for the first agentic library.
             _has_agentic_library = True
 
-        # Special case: If mem0 is instrumented, also instrument concurrent.futures
-        if (package_name == "mem0" or package_name == "autogen") and is_newly_added:
-            try:
-                # Check if concurrent.futures module is available
-
-                # Create config for concurrent.futures instrumentor
-                concurrent_config = InstrumentorConfig(
-                    module_name="agentops.instrumentation.utilities.concurrent_futures",
-                    class_name="ConcurrentFuturesInstrumentor",
-                    min_version="3.7.0",  # Python 3.7+ (concurrent.futures is stdlib)
-                    package_name="python",  # Special case for stdlib modules
-                )
-
-                # Create and instrument concurrent.futures
-                concurrent_loader = InstrumentorLoader(**concurrent_config)
-                concurrent_instrumentor = instrument_one(concurrent_loader)
-
-                if concurrent_instrumentor is not None:
-                    concurrent_instrumentor._agentops_instrumented_package_key = "concurrent.futures"
-                    _active_instrumentors.append(concurrent_instrumentor)
-                    logger.debug("AgentOps: Instrumented concurrent.futures as a dependency of mem0.")
-            except Exception as e:
-                logger.debug(f"Could not instrument concurrent.futures for mem0: {e}")
+        # Also instrument the stdlib utilities the library fans work out through
+        if is_newly_added:
+            for utility_name in UTILITY_DEPENDENCIES.get(package_name, ()):
+                _instrument_utility(utility_name, package_name)
     else:
         logger.debug(
             f"_perform_instrumentation: instrument_one for '{package_name}' returned None. Not added to active instrumentors."
         )
 
 
+def _instrument_utility(utility_name: str, dependent_name: str):
+    """Instrument a stdlib utility from UTILITY_INSTRUMENTORS, if not already instrumented."""
+    if _is_package_instrumented(utility_name):
+        return
+    try:
+        loader = InstrumentorLoader(**UTILITY_INSTRUMENTORS[utility_name])
+        instrumentor = instrument_one(loader)
+
+        if instrumentor is not None:
+            instrumentor._agentops_instrumented_package_key = utility_name
+            _active_instrumentors.append(instrumentor)
+            logger.debug(f"AgentOps: Instrumented {utility_name} as a dependency of {dependent_name}.")
+    except Exception as e:
+        logger.debug(f"Could not instrument {utility_name} for {dependent_name}: {e}")
+
+
+def instrument_process_pools():
+    """Carry the current trace into thread and process pool workers, whichever libraries are in use."""
+    _instrument_utility("concurrent.futures", "agentops")
+
+
 def _import_monitor(name: str, globals_dict=None, locals_dict=None, fromlist=(), level=0):
     """
     Monitor imports and instrument packages as they are imported.
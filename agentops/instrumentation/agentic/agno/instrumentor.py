@@ -19,6 +19,9 @@ from agentops.instrumentation.common import (
     CommonInstrumentor,
     StandardMetrics,
     InstrumentorConfig,
+    SpanRegistry,
+    end_evicted_span,
+    create_span_registry_metrics,
 )
 from agentops.instrumentation.common.wrappers import WrapConfig
 
@@ -35,47 +38,53 @@ from agentops.instrumentation.agentic.agno.attributes import (
 )
 
 
+def _end_evicted_context(context_id: str, entry: tuple) -> None:
+    """End the span of a streaming context that was never removed."""
+    end_evicted_span(context_id, entry[1])
+
+
 class StreamingContextManager:
     """Manages span contexts for streaming agent and workflow executions."""
 
     def __init__(self):
-        self._contexts = {}  # context_id -> (span_context, span)
-        self._agent_sessions = {}  # session_id -> agent_id mapping for context lookup
-        self._lock = threading.Lock()
+        # context_id -> (span_context, span); evicted only on overflow, as ending a
+        # long-running stream's span early would give it the wrong end time
+        self._contexts = SpanRegistry("agno.contexts", ttl=None, on_evict=_end_evicted_context)
+        # session_id -> agent_id mapping for context lookup
+        self._agent_sessions = SpanRegistry("agno.agent_sessions")
 
     def store_context(self, context_id: str, span_context: Any, span: Any) -> None:
         """Store span context for streaming execution."""
-        with self._lock:
-            self._contexts[context_id] = (span_context, span)
+        self._contexts.set(context_id, (span_context, span))
 
     def get_context(self, context_id: str) -> Optional[tuple]:
         """Retrieve stored span context."""
-        with self._lock:
-            return self._contexts.get(context_id)
+        return self._contexts.get(context_id)
 
     def remove_context(self, context_id: str) -> None:
         """Remove stored context (when streaming completes)."""
-        with self._lock:
-            self._contexts.pop(context_id, None)
+        self._contexts.pop(context_id)
 
     def store_agent_session_mapping(self, session_id: str, agent_id: str) -> None:
         """Store mapping between session and agent for context lookup."""
-        with self._lock:
-            self._agent_sessions[session_id] = agent_id
+        self._agent_sessions.set(session_id, agent_id)
 
     def get_agent_context_by_session(self, session_id: str) -> Optional[tuple]:
         """Get agent context using session ID."""
-        with self._lock:
-            agent_id = self._agent_sessions.get(session_id)
-            if agent_id:
-                return self._contexts.get(agent_id)
-            return None
+        agent_id = self._agent_sessions.get(session_id)
+        if agent_id:
+            return self._contexts.get(agent_id)
+        return None
 
     def clear_all(self) -> None:
         """Clear all stored contexts."""
-        with self._lock:
-            self._contexts.clear()
-            self._agent_sessions.clear()
+        self._contexts.clear()
+        self._agent_sessions.clear()
+
+    @property
+    def registries(self) -> tuple:
+        """The span registries backing this manager, for metrics."""
+        return (self._contexts, self._agent_sessions)
 
 
 # Methods to wrap for instrumentation
@@ -1154,7 +1163,9 @@ class AgnoInstrumentor(CommonInstrumentor):
         Returns a dictionary of metric name to metric instance.
         """
         # Create standard metrics for LLM operations
-        return StandardMetrics.create_standard_metrics(meter)
+        metrics = StandardMetrics.create_standard_metrics(meter)
+        metrics.update(create_span_registry_metrics(meter, *self._streaming_context_manager.registries))
+        return metrics
 
     def _initialize(self, **kwargs):
         """Perform custom initialization."""
@@ -18,6 +18,8 @@ from agentops.instrumentation.common import (
     safe_set_attribute,
     set_token_usage_attributes,
     TokenUsageExtractor,
+    SpanRegistry,
+    create_span_registry_metrics,
 )
 from agentops.instrumentation.agentic.crewai.version import __version__
 from agentops.semconv import SpanAttributes, AgentOpsSpanKindValues, ToolAttributes, MessageAttributes
@@ -31,7 +33,7 @@ logger = logging.getLogger(__name__)
 _instruments = ("crewai >= 0.70.0",)
 
 # Global context to store tool executions by parent span ID
-_tool_executions_by_agent = {}
+_tool_executions_by_agent = SpanRegistry("crewai.tool_executions")
 
 
 @contextmanager
@@ -41,8 +43,7 @@ def store_tool_execution():
     parent_span_id = getattr(parent_span.get_span_context(), "span_id", None)
 
     if parent_span_id:
-        if parent_span_id not in _tool_executions_by_agent:
-            _tool_executions_by_agent[parent_span_id] = []
+        tool_executions = _tool_executions_by_agent.setdefault(parent_span_id, list)
 
         tool_details = {}
 
@@ -50,7 +51,7 @@ def store_tool_execution():
             yield tool_details
 
             if tool_details:
-                _tool_executions_by_agent[parent_span_id].append(tool_details)
+                tool_executions.append(tool_details)
         finally:
             pass
 
@@ -59,14 +60,14 @@ def attach_tool_executions_to_agent_span(span):
     """Attach stored tool executions to the agent span."""
     span_id = getattr(span.get_span_context(), "span_id", None)
 
-    if span_id and span_id in _tool_executions_by_agent:
-        for idx, tool_execution in enumerate(_tool_executions_by_agent[span_id]):
+    tool_executions = _tool_executions_by_agent.pop(span_id) if span_id else None
+
+    if tool_executions:
+        for idx, tool_execution in enumerate(tool_executions):
             for key, value in tool_execution.items():
                 if value is not None:
                     span.set_attribute(f"crewai.agent.tool_execution.{idx}.{key}", str(value))
 
-        del _tool_executions_by_agent[span_id]
-
 
 class CrewaiInstrumentor(CommonInstrumentor):
     """Instrumentor for CrewAI framework."""
@@ -92,7 +93,9 @@ class CrewaiInstrumentor(CommonInstrumentor):
 
     def _create_metrics(self, meter: Meter) -> Dict[str, Any]:
         """Create metrics for CrewAI instrumentation."""
-        return StandardMetrics.create_standard_metrics(meter)
+        metrics = StandardMetrics.create_standard_metrics(meter)
+        metrics.update(create_span_registry_metrics(meter, _tool_executions_by_agent))
+        return metrics
 
     def _custom_wrap(self, **kwargs):
         """Perform custom wrapping for CrewAI methods."""
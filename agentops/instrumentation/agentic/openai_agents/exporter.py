@@ -32,6 +32,7 @@ from agentops.instrumentation.common.attributes import (
     get_base_trace_attributes,
     get_base_span_attributes,
 )
+from agentops.instrumentation.common.span_registry import SpanRegistry, end_evicted_span
 
 from agentops.instrumentation.agentic.openai_agents import LIBRARY_NAME, LIBRARY_VERSION
 from agentops.instrumentation.agentic.openai_agents.attributes.common import (
@@ -123,11 +124,18 @@ class OpenAIAgentsExporter:
 
     def __init__(self, tracer_provider=None):
         self.tracer_provider = tracer_provider
-        # Dictionary to track active spans by their SDK span ID
+        # Registry to track active spans by their SDK span ID
         # Allows us to reference spans later during task completion
-        self._active_spans = {}
-        # Dictionary to track spans by trace/span ID for faster lookups
-        self._span_map = {}
+        self._active_spans = SpanRegistry("openai_agents.active_spans")
+        # Registry to track spans by trace/span ID for faster lookups. Spans whose
+        # end event never arrives are ended when they overflow the registry; they
+        # don't expire, since agent runs can legitimately stay open for hours.
+        self._span_map = SpanRegistry("openai_agents.span_map", ttl=None, on_evict=end_evicted_span)
+
+    @property
+    def registries(self) -> tuple:
+        """The span registries backing this exporter, for metrics."""
+        return (self._active_spans, self._span_map)
 
     def export_trace(self, trace: Any) -> None:
         """
@@ -147,9 +155,8 @@ class OpenAIAgentsExporter:
         attributes = get_base_trace_attributes(trace)
 
         # For end events, check if we already have the span
-        if is_end_event and trace_lookup_key in self._span_map:
-            existing_span = self._span_map[trace_lookup_key]
-
+        existing_span = self._span_map.get(trace_lookup_key) if is_end_event else None
+        if existing_span is not None:
             span_is_ended = False
             if isinstance(existing_span, Span) and hasattr(existing_span, "_end_time"):
                 span_is_ended = existing_span._end_time is not None
@@ -222,8 +229,8 @@ class OpenAIAgentsExporter:
         if parent_id:
             # Try to find the parent span in our tracking dictionary
             parent_lookup_key = f"span:{trace_id}:{parent_id}"
-            if parent_lookup_key in self._span_map:
-                parent_span = self._span_map[parent_lookup_key]
+            parent_span = self._span_map.get(parent_lookup_key)
+            if parent_span is not None:
                 # Get the context from the parent span if it exists
                 if hasattr(parent_span, "get_span_context"):
                     parent_span_ctx = parent_span.get_span_context()
@@ -233,8 +240,8 @@ class OpenAIAgentsExporter:
             # Try using the trace span as parent
             trace_lookup_key = _get_span_lookup_key(trace_id, trace_id)
 
-            if trace_lookup_key in self._span_map:
-                trace_span = self._span_map[trace_lookup_key]
+            trace_span = self._span_map.get(trace_lookup_key)
+            if trace_span is not None:
                 if hasattr(trace_span, "get_span_context"):
                     parent_span_ctx = trace_span.get_span_context()
 
@@ -351,9 +358,8 @@ class OpenAIAgentsExporter:
             return
 
         # For end events, check if we already have the span
-        if span_lookup_key in self._span_map:
-            existing_span = self._span_map[span_lookup_key]
-
+        existing_span = self._span_map.get(span_lookup_key)
+        if existing_span is not None:
             span_is_ended = False
             if isinstance(existing_span, Span) and hasattr(existing_span, "_end_time"):
                 span_is_ended = existing_span._end_time is not None
@@ -463,7 +469,8 @@ class OpenAIAgentsExporter:
         """Clean up any outstanding spans during shutdown.
 
         This ensures we don't leak span resources when the exporter is shutdown.
+        Spans that are still open are ended so the work they cover is exported.
         """
-        # Clear all tracking dictionaries
+        for lookup_key, span in self._span_map.drain():
+            end_evicted_span(lookup_key, span)
         self._active_spans.clear()
-        self._span_map.clear()
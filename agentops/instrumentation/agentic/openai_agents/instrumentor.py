@@ -24,12 +24,14 @@ The implementation uses a clean separation between exporters and processors. The
 from typing import Collection
 
 from opentelemetry import trace
+from opentelemetry.metrics import get_meter
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor  # type: ignore
 from agentops.instrumentation.agentic.openai_agents import LIBRARY_VERSION
 
 from agentops.logging import logger
 from agentops.instrumentation.agentic.openai_agents.processor import OpenAIAgentsProcessor
 from agentops.instrumentation.agentic.openai_agents.exporter import OpenAIAgentsExporter
+from agentops.instrumentation.common.span_registry import create_span_registry_metrics
 
 
 class OpenAIAgentsInstrumentor(BaseInstrumentor):
@@ -65,6 +67,9 @@ class OpenAIAgentsInstrumentor(BaseInstrumentor):
                 exporter=self._exporter,
             )
 
+            meter = get_meter("agentops.instrumentation.openai_agents", LIBRARY_VERSION, kwargs.get("meter_provider"))
+            create_span_registry_metrics(meter, *self._exporter.registries)
+
             # Replace the default processor with our processor
             from agents import set_trace_processors
             from agents.tracing.processors import default_processor
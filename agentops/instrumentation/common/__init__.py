@@ -34,6 +34,21 @@ from agentops.instrumentation.common.streaming import (
     AsyncStreamWrapper,
     create_stream_wrapper_factory,
     StreamingResponseHandler,
+    StreamAccumulator,
+    ToolCallBuffer,
+    ChunkAdapter,
+    TextChunkAdapter,
+)
+from agentops.instrumentation.common.span_registry import (
+    SpanRegistry,
+    end_evicted_span,
+    create_span_registry_metrics,
+)
+from agentops.instrumentation.common.deferred import (
+    DeferredAttributeExporter,
+    defer_attributes,
+    enable_deferred_extraction,
+    is_deferred_extraction_enabled,
 )
 from agentops.instrumentation.common.version import (
     get_library_version,
@@ -76,6 +91,19 @@ __all__ = [
     "AsyncStreamWrapper",
     "create_stream_wrapper_factory",
     "StreamingResponseHandler",
+    "StreamAccumulator",
+    "ToolCallBuffer",
+    "ChunkAdapter",
+    "TextChunkAdapter",
+    # Span Registry
+    "SpanRegistry",
+    "end_evicted_span",
+    "create_span_registry_metrics",
+    # Deferred Attributes
+    "DeferredAttributeExporter",
+    "defer_attributes",
+    "enable_deferred_extraction",
+    "is_deferred_extraction_enabled",
     # Version
     "get_library_version",
     "LibraryInfo",
@@ -23,7 +23,7 @@ These utilities ensure consistent attribute handling across different
 LLM service instrumentors while maintaining separation of concerns.
 """
 
-from typing import runtime_checkable, Protocol, Any, Optional, Dict, TypedDict
+from typing import runtime_checkable, Protocol, Any, Optional, Dict, Iterable, Tuple, TypedDict
 from agentops.logging import logger
 from agentops.helpers import safe_serialize, get_agentops_version
 from agentops.semconv import (
@@ -31,6 +31,7 @@ from agentops.semconv import (
     InstrumentationAttributes,
     WorkflowAttributes,
 )
+from agentops.semconv.message import get_key_table
 
 
 # `AttributeMap` is a dictionary that maps target attribute keys to source attribute keys.
@@ -117,22 +118,16 @@ class IndexedAttributeData(TypedDict, total=False):
     j: Optional[int] = None
 
 
-def _extract_attributes_from_mapping(span_data: Any, attribute_mapping: AttributeMap) -> AttributeMap:
-    """Helper function to extract attributes based on a mapping.
-
-    Args:
-        span_data: The span data object or dict to extract attributes from
-        attribute_mapping: Dictionary mapping target attributes to source attributes
-
-    Returns:
-        Dictionary of extracted attributes
-    """
-    attributes = {}
-    for target_attr, source_attr in attribute_mapping.items():
+def _extract_attributes_into(
+    attributes: AttributeMap, span_data: Any, attribute_pairs: Iterable[Tuple[str, str]]
+) -> None:
+    """Extract `(target_attribute, source_attribute)` pairs from `span_data` into `attributes`."""
+    is_dict = isinstance(span_data, dict)
+    for target_attr, source_attr in attribute_pairs:
         if hasattr(span_data, source_attr):
             # Use getattr to handle properties
             value = getattr(span_data, source_attr)
-        elif isinstance(span_data, dict) and source_attr in span_data:
+        elif is_dict and source_attr in span_data:
             # Use direct key access for dicts
             value = span_data[source_attr]
         else:
@@ -148,6 +143,19 @@ def _extract_attributes_from_mapping(span_data: Any, attribute_mapping: Attribut
 
         attributes[target_attr] = value
 
+
+def _extract_attributes_from_mapping(span_data: Any, attribute_mapping: AttributeMap) -> AttributeMap:
+    """Helper function to extract attributes based on a mapping.
+
+    Args:
+        span_data: The span data object or dict to extract attributes from
+        attribute_mapping: Dictionary mapping target attributes to source attributes
+
+    Returns:
+        Dictionary of extracted attributes
+    """
+    attributes = {}
+    _extract_attributes_into(attributes, span_data, attribute_mapping.items())
     return attributes
 
 
@@ -159,6 +167,7 @@ def _extract_attributes_from_mapping_with_index(
     This function extends `_extract_attributes_from_mapping` by allowing for indexed keys in the attribute mapping.
 
     Span data is expected to have keys which contain format strings for i/j, e.g. `my_attr_{i}` or `my_attr_{i}_{j}`.
+    The formatted keys are cached per mapping and index, see `agentops.semconv.message.IndexedKeyTable`.
 
     Args:
         span_data: The span data object or dict to extract attributes from
@@ -168,18 +177,37 @@ def _extract_attributes_from_mapping_with_index(
     Returns:
         Dictionary of extracted attributes with formatted indexed keys.
     """
+    attributes = {}
+    keys = get_key_table(tuple(attribute_mapping)).keys(i, j)
+    _extract_attributes_into(attributes, span_data, zip(keys, attribute_mapping.values()))
+    return attributes
+
+
+def _extract_attributes_from_sequence_with_index(
+    items: Iterable[Any], attribute_mapping: IndexedAttributeMap, i: Optional[int] = None
+) -> AttributeMap:
+    """Extract indexed attributes for every item in a sequence in one pass.
 
-    # `i` is required for formatting the attribute keys, `j` is optional
-    format_kwargs: IndexedAttributeData = {"i": i}
-    if j is not None:
-        format_kwargs["j"] = j
+    Equivalent to calling `_extract_attributes_from_mapping_with_index` for each
+    item and merging the results, without rebuilding the key mapping per item.
 
-    # Update the attribute mapping to include the index for the span
-    attribute_mapping_with_index: AttributeMap = {}
-    for target_attr, source_attr in attribute_mapping.items():
-        attribute_mapping_with_index[target_attr.format(**format_kwargs)] = source_attr
+    Args:
+        items: The span data objects or dicts to extract attributes from
+        attribute_mapping: Dictionary mapping target attributes to source attributes, with format strings for i/j
+        i: If given, items are indexed by `j` under this fixed `i` (e.g. the
+            annotations of one completion); otherwise items are indexed by `i`.
+    Returns:
+        Dictionary of extracted attributes with formatted indexed keys.
+    """
+    attributes = {}
+    table = get_key_table(tuple(attribute_mapping))
+    sources = tuple(attribute_mapping.values())
 
-    return _extract_attributes_from_mapping(span_data, attribute_mapping_with_index)
+    for index, item in enumerate(items):
+        keys = table.keys(index) if i is None else table.keys(i, index)
+        _extract_attributes_into(attributes, item, zip(keys, sources))
+
+    return attributes
 
 
 def get_common_attributes() -> AttributeMap:
@@ -0,0 +1,197 @@
+"""Deferred attribute extraction for provider wrappers.
+
+Turning request kwargs and response objects into span attributes means walking
+messages, tool definitions and output items, which wrappers normally do in the
+caller's thread before the LLM call returns to user code. When deferred
+extraction is enabled, wrappers only record the handler and references to its
+inputs against the span; `DeferredAttributeExporter` runs the handlers on the
+`BatchSpanProcessor` worker thread, right before the span is exported.
+
+Request kwargs are snapshotted (the dict and any top-level lists are copied)
+because agent loops commonly keep appending to the same `messages` list they
+pass to the next call. Response objects are stored as-is; provider SDKs return
+fresh objects per call and don't mutate them afterwards.
+
+Resolved attributes are cleaned and bounded with the tracer provider's
+`SpanLimits` the same way attributes set on a live span are, so both modes
+export the same attributes. Only the exporter sees them: span processors run
+`on_end` before export and never see deferred attributes.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from opentelemetry.attributes import BoundedAttributes
+from opentelemetry.sdk.trace import ReadableSpan, SpanLimits
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+from opentelemetry.trace import Span
+
+from agentops.instrumentation.common.attributes import AttributeMap
+from agentops.instrumentation.common.span_registry import SpanRegistry
+from agentops.logging import logger
+
+# Spans that are never ended (and so never exported) must not pin their
+# request and response objects for long.
+DEFAULT_PENDING_TTL = 600.0
+
+_enabled = False
+
+# span_id -> list of pending extractions, in the order they were recorded
+_pending = SpanRegistry("deferred_attributes", ttl=DEFAULT_PENDING_TTL)
+
+
+class _DeferredExtraction:
+    """A handler and the references it will be called with."""
+
+    __slots__ = ("handler", "args", "kwargs", "return_value", "overwrite")
+
+    def __init__(self, handler, args, kwargs, return_value, overwrite):
+        self.handler = handler
+        self.args = args
+        self.kwargs = kwargs
+        self.return_value = return_value
+        self.overwrite = overwrite
+
+    def apply(self, attributes: AttributeMap) -> None:
+        extracted = self.handler(args=self.args, kwargs=self.kwargs, return_value=self.return_value)
+        if self.overwrite:
+            attributes.update(extracted)
+            return
+        for key, value in extracted.items():
+            attributes.setdefault(key, value)
+
+
+def enable_deferred_extraction(enabled: bool = True) -> None:
+    """Turn deferred extraction on or off for wrappers that support it.
+
+    Only enable this when `DeferredAttributeExporter` is in the export
+    pipeline; otherwise deferred attributes are never resolved.
+    """
+    global _enabled
+    _enabled = enabled
+    if not enabled:
+        _pending.clear()
+
+
+def is_deferred_extraction_enabled() -> bool:
+    """Whether wrappers should defer attribute extraction to the exporter."""
+    return _enabled
+
+
+def _snapshot_kwargs(kwargs: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if kwargs is None:
+        return None
+    return {key: list(value) if isinstance(value, list) else value for key, value in kwargs.items()}
+
+
+def defer_attributes(
+    span: Span,
+    handler,
+    args: Optional[Tuple] = None,
+    kwargs: Optional[Dict[str, Any]] = None,
+    return_value: Optional[Any] = None,
+    overwrite: bool = True,
+) -> bool:
+    """Record `handler` to be run against `span` at export time.
+
+    Wrappers call this in place of extracting attributes themselves and fall
+    back to eager extraction when it returns False:
+
+        if not defer_attributes(span, handler, kwargs=kwargs):
+            _update_span(span, handler(kwargs=kwargs))
+
+    Args:
+        span: The span to annotate
+        handler: Attribute handler called as `handler(args=..., kwargs=..., return_value=...)`
+        args: Positional arguments of the wrapped call
+        kwargs: Keyword arguments of the wrapped call
+        return_value: Return value of the wrapped call
+        overwrite: Whether these attributes replace ones extracted earlier for the
+            same span; when False, keys that are already present are kept
+
+    Returns:
+        True if extraction was deferred, False if deferred extraction is
+        disabled or the span isn't recording
+    """
+    if not _enabled or not span.is_recording():
+        return False
+
+    extraction = _DeferredExtraction(handler, args, _snapshot_kwargs(kwargs), return_value, overwrite)
+    _pending.setdefault(span.get_span_context().span_id, list).append(extraction)
+    return True
+
+
+def resolve_deferred_attributes(span: ReadableSpan, span_limits: Optional[SpanLimits] = None) -> ReadableSpan:
+    """Return `span` with its deferred attributes applied.
+
+    Deferred attributes are resolved in the order they were recorded. Attributes
+    set directly on the span take precedence, since they were set with
+    information the handlers don't have (stream accumulators, status, timing).
+    Values are cleaned, truncated and counted against `span_limits` as they
+    would have been had the handlers set them on the span.
+    """
+    extractions: Optional[List[_DeferredExtraction]] = _pending.pop(span.context.span_id)
+    if not extractions:
+        return span
+
+    attributes: AttributeMap = {}
+    for extraction in extractions:
+        try:
+            extraction.apply(attributes)
+        except Exception as e:
+            logger.debug(f"[DeferredAttributes] Error extracting attributes for span {span.name}: {e}")
+
+    if not attributes:
+        return span
+
+    limits = span_limits or SpanLimits()
+    bounded = BoundedAttributes(
+        limits.max_span_attributes,
+        attributes,
+        immutable=False,
+        max_value_len=limits.max_span_attribute_length,
+    )
+    for key, value in (span.attributes or {}).items():
+        bounded[key] = value
+    bounded.dropped += span.dropped_attributes
+    return ReadableSpan(
+        name=span.name,
+        context=span.context,
+        parent=span.parent,
+        resource=span.resource,
+        attributes=bounded,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+class DeferredAttributeExporter(SpanExporter):
+    """Exporter that resolves deferred attributes before delegating to `exporter`.
+
+    Placed behind a `BatchSpanProcessor`, `export()` runs on the processor's
+    worker thread, which keeps attribute extraction off the caller's thread.
+    """
+
+    def __init__(self, exporter: SpanExporter, span_limits: Optional[SpanLimits] = None):
+        self._exporter = exporter
+        # the tracer provider's limits, applied to the attributes resolved here
+        self._span_limits = span_limits or SpanLimits()
+
+    @property
+    def exporter(self) -> SpanExporter:
+        return self._exporter
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        return self._exporter.export([resolve_deferred_attributes(span, self._span_limits) for span in spans])
+
+    def shutdown(self) -> None:
+        # Nothing resolves deferred attributes once this exporter is gone
+        enable_deferred_extraction(False)
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
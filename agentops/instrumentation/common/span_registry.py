@@ -0,0 +1,285 @@
+"""Bounded registries for spans that outlive the call that started them.
+
+Agentic frameworks report the start and end of a unit of work as separate
+events, so instrumentors have to remember the span they opened until the end
+event arrives. If the end event never comes (a cancelled run, a crashed tool,
+an abandoned stream) a plain dict holds on to that span forever.
+
+`SpanRegistry` is a drop-in replacement for those dicts. Entries expire after a
+TTL and the registry never holds more than `max_size` entries; whatever is
+pushed out is handed to an `on_evict` callback so the caller can end the span
+instead of silently dropping it. Registries that end spans on eviction should
+pass `ttl=None`: a span that is merely long-running (an agent server's run)
+would otherwise be ended early with the wrong end time. Keys are spread over several shards, each with
+its own lock, so concurrent agents don't serialize on a single lock.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from opentelemetry.metrics import CallbackOptions, Meter, Observation
+
+from agentops.logging import logger
+from agentops.semconv import Meters
+
+DEFAULT_MAX_SIZE = 10_000
+DEFAULT_TTL = 3600.0
+DEFAULT_SHARDS = 16
+
+EvictionCallback = Callable[[Any, Any], None]
+
+_MISSING = object()
+
+
+class _Shard:
+    """A lock and the entries it guards, ordered oldest first."""
+
+    __slots__ = ("lock", "entries")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # key -> (expires_at, value)
+        self.entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+
+class SpanRegistry:
+    """A thread-safe mapping with TTL and size-bounded eviction.
+
+    Writing a key refreshes its TTL. Expired entries are dropped lazily when
+    they are read and whenever their shard is written to; `purge()` sweeps all
+    shards explicitly.
+
+    Args:
+        name: Name reported in logs and metrics
+        max_size: Maximum number of live entries across all shards
+        ttl: Seconds an entry may live without being written to
+        shards: Number of independently locked shards
+        on_evict: Called with `(key, value)` for every entry that is expired or
+            pushed out, outside of any lock. Not called for `pop()` or `clear()`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: Optional[float] = DEFAULT_TTL,
+        shards: int = DEFAULT_SHARDS,
+        on_evict: Optional[EvictionCallback] = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._shard_size = max(1, max_size // len(self._shards))
+        self._counter_lock = threading.Lock()
+        self._expired = 0
+        self._overflowed = 0
+
+    def _shard(self, key: Any) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _expires_at(self, now: float) -> float:
+        return now + self.ttl if self.ttl is not None else float("inf")
+
+    def _evict_expired(self, shard: _Shard, now: float, evicted: List[Tuple[Any, Any]]) -> None:
+        """Pop expired entries off the front of a shard. Caller holds the lock."""
+        entries = shard.entries
+        while entries:
+            key, (expires_at, value) = next(iter(entries.items()))
+            if expires_at > now:
+                break
+            del entries[key]
+            evicted.append((key, value))
+
+    def _finish_eviction(self, expired: List[Tuple[Any, Any]], overflowed: List[Tuple[Any, Any]]) -> None:
+        """Update counters and run the eviction callback for evicted entries."""
+        if not expired and not overflowed:
+            return
+
+        with self._counter_lock:
+            self._expired += len(expired)
+            self._overflowed += len(overflowed)
+
+        logger.debug(
+            f"[SpanRegistry] {self.name}: evicted {len(expired)} expired and {len(overflowed)} overflowing entries"
+        )
+        if self.on_evict is None:
+            return
+
+        for key, value in expired + overflowed:
+            try:
+                self.on_evict(key, value)
+            except Exception as e:
+                logger.debug(f"[SpanRegistry] {self.name}: eviction callback failed for {key!r}: {e}")
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, refreshing its TTL."""
+        shard = self._shard(key)
+        now = time.monotonic()
+        expired: List[Tuple[Any, Any]] = []
+        overflowed: List[Tuple[Any, Any]] = []
+
+        with shard.lock:
+            self._evict_expired(shard, now, expired)
+            shard.entries[key] = (self._expires_at(now), value)
+            shard.entries.move_to_end(key)
+            while len(shard.entries) > self._shard_size:
+                evicted_key, evicted_entry = shard.entries.popitem(last=False)
+                overflowed.append((evicted_key, evicted_entry[1]))
+
+        self._finish_eviction(expired, overflowed)
+
+    __setitem__ = set
+
+    def setdefault(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """Return the live value for `key`, storing `factory()` first if there is none.
+
+        Unlike `dict.setdefault` the default is built lazily, and an existing
+        entry keeps its original TTL.
+        """
+        shard = self._shard(key)
+        now = time.monotonic()
+        expired: List[Tuple[Any, Any]] = []
+        overflowed: List[Tuple[Any, Any]] = []
+
+        with shard.lock:
+            self._evict_expired(shard, now, expired)
+            entry = shard.entries.get(key)
+            if entry is not None:
+                value = entry[1]
+            else:
+                value = factory()
+                shard.entries[key] = (self._expires_at(now), value)
+                while len(shard.entries) > self._shard_size:
+                    evicted_key, evicted_entry = shard.entries.popitem(last=False)
+                    overflowed.append((evicted_key, evicted_entry[1]))
+
+        self._finish_eviction(expired, overflowed)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the live value for `key`, or `default`."""
+        shard = self._shard(key)
+        expired: List[Tuple[Any, Any]] = []
+
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del shard.entries[key]
+                expired.append((key, entry[1]))
+            else:
+                return entry[1]
+
+        self._finish_eviction(expired, [])
+        return default
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove `key` and return its value, or `default` if it isn't live."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.pop(key, None)
+
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            self._finish_eviction([(key, entry[1])], [])
+            return default
+        return entry[1]
+
+    def purge(self) -> int:
+        """Evict every expired entry now. Returns the number of entries evicted."""
+        now = time.monotonic()
+        expired: List[Tuple[Any, Any]] = []
+        for shard in self._shards:
+            with shard.lock:
+                self._evict_expired(shard, now, expired)
+
+        self._finish_eviction(expired, [])
+        return len(expired)
+
+    def clear(self) -> None:
+        """Drop all entries without running the eviction callback."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+
+    def drain(self) -> List[Tuple[Any, Any]]:
+        """Remove and return all entries, live or expired, as `(key, value)` pairs."""
+        drained: List[Tuple[Any, Any]] = []
+        for shard in self._shards:
+            with shard.lock:
+                drained.extend((key, entry[1]) for key, entry in shard.entries.items())
+                shard.entries.clear()
+        return drained
+
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet evicted."""
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the current entry count and eviction totals."""
+        with self._counter_lock:
+            return {
+                "live_entries": len(self),
+                "expired": self._expired,
+                "overflowed": self._overflowed,
+            }
+
+
+def end_evicted_span(key: Any, span: Any) -> None:
+    """Eviction callback that ends a span whose end event never arrived.
+
+    The span is exported with whatever it has recorded so far and flagged as
+    evicted, rather than being dropped without a trace.
+    """
+    if span is None or not span.is_recording():
+        return
+
+    span.set_attribute("agentops.span_registry.evicted", True)
+    span.end()
+
+
+def create_span_registry_metrics(meter: Meter, *registries: SpanRegistry) -> Dict[str, Any]:
+    """Create observable instruments reporting the size and evictions of `registries`.
+
+    Returns:
+        Dictionary with metric names as keys and metric instances as values
+    """
+
+    def observe_live_entries(options: CallbackOptions) -> Iterable[Observation]:
+        for registry in registries:
+            yield Observation(len(registry), {"registry": registry.name})
+
+    def observe_evictions(options: CallbackOptions) -> Iterable[Observation]:
+        for registry in registries:
+            stats = registry.stats()
+            yield Observation(stats["expired"], {"registry": registry.name, "reason": "expired"})
+            yield Observation(stats["overflowed"], {"registry": registry.name, "reason": "overflowed"})
+
+    return {
+        "span_registry_live_entries": meter.create_observable_gauge(
+            name=Meters.SPAN_REGISTRY_LIVE_ENTRIES,
+            callbacks=[observe_live_entries],
+            unit="entry",
+            description="Number of in-flight spans held by instrumentation span registries",
+        ),
+        "span_registry_evictions": meter.create_observable_counter(
+            name=Meters.SPAN_REGISTRY_EVICTIONS,
+            callbacks=[observe_evictions],
+            unit="entry",
+            description="Number of entries evicted from instrumentation span registries",
+        ),
+    }
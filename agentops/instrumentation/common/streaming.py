@@ -2,15 +2,20 @@
 
 This module provides utilities for instrumenting streaming API responses
 in a consistent way across different providers.
+
+Provider stream wrappers collect their data into a `StreamAccumulator` through
+a provider specific `ChunkAdapter`, which keeps the per-chunk work to a few
+attribute reads and list appends.
 """
 
-from typing import Optional, Any, Dict, Callable
-from abc import ABC
+from typing import Optional, Any, Dict, Callable, List
+from abc import ABC, abstractmethod
 import time
 
 from opentelemetry.trace import Tracer, Span, Status, StatusCode
 
 from agentops.logging import logger
+from agentops.semconv import SpanAttributes
 from agentops.instrumentation.common.span_management import safe_set_attribute
 from agentops.instrumentation.common.token_counting import TokenUsage, TokenUsageExtractor
 
@@ -216,3 +221,140 @@ class StreamingResponseHandler:
         elif isinstance(chunk, str):
             return chunk
         return None
+
+
+class ToolCallBuffer:
+    """Accumulates a single streamed tool call.
+
+    Argument fragments are buffered in a list and joined once when read, rather
+    than concatenated as they arrive.
+    """
+
+    __slots__ = ("id", "type", "name", "_arguments")
+
+    def __init__(self):
+        self.id = ""
+        self.type = "function"
+        self.name = ""
+        self._arguments: List[str] = []
+
+    def append_arguments(self, fragment: str) -> None:
+        self._arguments.append(fragment)
+
+    @property
+    def arguments(self) -> str:
+        return "".join(self._arguments)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the tool call in the OpenAI message format."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "function": {"name": self.name, "arguments": self.arguments},
+        }
+
+
+class StreamAccumulator:
+    """Provider-agnostic state for a streaming response.
+
+    The accumulator only collects data; a `ChunkAdapter` knows how to read a
+    provider's chunks into it, and the stream wrapper decides which span
+    attributes to set from it once the stream is finished. Providers that need
+    to track more state can subclass it and extend `__slots__`.
+    """
+
+    __slots__ = (
+        "span",
+        "start_time",
+        "first_token_time",
+        "chunk_count",
+        "response_id",
+        "model",
+        "finish_reason",
+        "usage",
+        "tool_calls",
+        "_content",
+    )
+
+    def __init__(self, span: Span):
+        self.span = span
+        self.start_time = time.time()
+        self.first_token_time: Optional[float] = None
+        self.chunk_count = 0
+        self.response_id: Optional[str] = None
+        self.model: Optional[str] = None
+        self.finish_reason: Optional[str] = None
+        self.usage: Any = None
+        self.tool_calls: Dict[Any, ToolCallBuffer] = {}
+        self._content: List[str] = []
+
+    def add_content(self, text: str) -> None:
+        self._content.append(text)
+
+    @property
+    def content(self) -> str:
+        return "".join(self._content)
+
+    def tool_call(self, index: Any) -> ToolCallBuffer:
+        """Return the buffer for the tool call at `index`, creating it if needed."""
+        buffer = self.tool_calls.get(index)
+        if buffer is None:
+            buffer = self.tool_calls[index] = ToolCallBuffer()
+        return buffer
+
+    def mark_first_token(self, event_name: Optional[str] = None) -> None:
+        """Record the time to first token on the span."""
+        self.first_token_time = time.time()
+        time_to_first_token = self.first_token_time - self.start_time
+        self.span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_FIRST_TOKEN, time_to_first_token)
+        if event_name:
+            self.span.add_event(event_name, {"time_elapsed": time_to_first_token})
+
+    @property
+    def generation_time(self) -> Optional[float]:
+        """Time from the first token to now, if a token was received."""
+        if self.first_token_time is None:
+            return None
+        return time.time() - self.first_token_time
+
+
+class ChunkAdapter(ABC):
+    """Reads one provider's stream chunks into a `StreamAccumulator`.
+
+    Adapters are stateless; wrappers resolve the adapter for a stream once and
+    call `process` for every chunk, so implementations should avoid repeated
+    `hasattr` probes and generator scans on the per-chunk path.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def process(self, accumulator: StreamAccumulator, chunk: Any) -> None: ...
+
+
+class TextChunkAdapter(ChunkAdapter):
+    """Adapter for streams whose chunks expose their text as an attribute.
+
+    Chunks carrying `usage_attr` are stored as the accumulator's usage so the
+    final counts can be read once the stream ends.
+    """
+
+    __slots__ = ("text_attr", "usage_attr")
+
+    def __init__(self, text_attr: str = "text", usage_attr: Optional[str] = None):
+        self.text_attr = text_attr
+        self.usage_attr = usage_attr
+
+    def process(self, accumulator: StreamAccumulator, chunk: Any) -> None:
+        accumulator.chunk_count += 1
+
+        if self.usage_attr is not None:
+            usage = getattr(chunk, self.usage_attr, None)
+            if usage:
+                accumulator.usage = usage
+
+        text = getattr(chunk, self.text_attr, None)
+        if text:
+            if accumulator.first_token_time is None:
+                accumulator.mark_first_token()
+            accumulator.add_content(text)
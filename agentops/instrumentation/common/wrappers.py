@@ -16,7 +16,9 @@ from opentelemetry.trace import Span, SpanKind, Status, StatusCode
 from opentelemetry import context as context_api
 from opentelemetry.instrumentation.utils import _SUPPRESS_INSTRUMENTATION_KEY
 
+from agentops.helpers.overhead import COMPONENT_WRAPPER, measure_overhead
 from agentops.instrumentation.common.attributes import AttributeMap
+from agentops.instrumentation.common.deferred import defer_attributes
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +106,7 @@ def _create_wrapper(wrap_config: WrapConfig, tracer: Tracer) -> Callable:
         A wrapper function compatible with wrapt.wrap_function_wrapper
     """
     handler = wrap_config.handler
+    overhead_key = (COMPONENT_WRAPPER, wrap_config.package, f"{wrap_config.class_name}.{wrap_config.method_name}")
 
     async def awrapper(wrapped, instance, args, kwargs):
         # Skip instrumentation if it's suppressed in the current context
@@ -113,20 +116,22 @@ def _create_wrapper(wrap_config: WrapConfig, tracer: Tracer) -> Callable:
 
         return_value = None
 
-        with tracer.start_as_current_span(
+        span_context = tracer.start_as_current_span(
             wrap_config.trace_name,
             kind=wrap_config.span_kind,
-        ) as span:
+        )
+        with measure_overhead(overhead_key) as timer, span_context as span:
             try:
                 # Add the input attributes to the span before execution
-                attributes = handler(args=args, kwargs=kwargs)
-                _update_span(span, attributes)
+                if not defer_attributes(span, handler, args=args, kwargs=kwargs):
+                    _update_span(span, handler(args=args, kwargs=kwargs))
 
-                return_value = await wrapped(*args, **kwargs)
+                with timer.excluded():
+                    return_value = await wrapped(*args, **kwargs)
 
                 # Add the output attributes to the span after execution
-                attributes = handler(return_value=return_value)
-                _update_span(span, attributes)
+                if not defer_attributes(span, handler, return_value=return_value):
+                    _update_span(span, handler(return_value=return_value))
                 _finish_span_success(span)
             except Exception as e:
                 # Add everything we have in the case of an error
@@ -145,20 +150,22 @@ def _create_wrapper(wrap_config: WrapConfig, tracer: Tracer) -> Callable:
 
         return_value = None
 
-        with tracer.start_as_current_span(
+        span_context = tracer.start_as_current_span(
             wrap_config.trace_name,
             kind=wrap_config.span_kind,
-        ) as span:
+        )
+        with measure_overhead(overhead_key) as timer, span_context as span:
             try:
                 # Add the input attributes to the span before execution
-                attributes = handler(args=args, kwargs=kwargs)
-                _update_span(span, attributes)
+                if not defer_attributes(span, handler, args=args, kwargs=kwargs):
+                    _update_span(span, handler(args=args, kwargs=kwargs))
 
-                return_value = wrapped(*args, **kwargs)
+                with timer.excluded():
+                    return_value = wrapped(*args, **kwargs)
 
                 # Add the output attributes to the span after execution
-                attributes = handler(return_value=return_value)
-                _update_span(span, attributes)
+                if not defer_attributes(span, handler, return_value=return_value):
+                    _update_span(span, handler(return_value=return_value))
                 _finish_span_success(span)
             except Exception as e:
                 # Add everything we have in the case of an error
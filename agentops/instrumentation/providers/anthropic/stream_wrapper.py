@@ -12,6 +12,7 @@ from opentelemetry import context as context_api
 from opentelemetry.trace import SpanKind
 from opentelemetry.instrumentation.utils import _SUPPRESS_INSTRUMENTATION_KEY
 
+from agentops.helpers.overhead import COMPONENT_STREAM, profiled, timed
 from agentops.semconv import SpanAttributes, LLMRequestTypeValues, CoreAttributes, MessageAttributes
 from agentops.instrumentation.common.wrappers import _with_tracer_wrapper
 from agentops.instrumentation.providers.anthropic.attributes.message import (
@@ -24,6 +25,41 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_TEXT_CHUNK_OVERHEAD_KEY = (COMPONENT_STREAM, "anthropic", "messages.stream.text")
+
+
+def _count_tokens(text: str) -> int:
+    """Approximate the number of tokens in a text chunk by its word count."""
+    return len(text.split())
+
+
+@profiled(COMPONENT_STREAM, "anthropic", "messages.stream.finalize")
+def _set_final_message_attributes(span, final_message) -> None:
+    """Set the completion content and token usage of the final message snapshot on the span."""
+    if hasattr(final_message, "content"):
+        content_text = ""
+        if isinstance(final_message.content, list):
+            content_text = "".join(
+                content_block.text for content_block in final_message.content if hasattr(content_block, "text")
+            )
+
+        if content_text:
+            span.set_attribute(MessageAttributes.COMPLETION_TYPE.format(i=0), "text")
+            span.set_attribute(MessageAttributes.COMPLETION_ROLE.format(i=0), "assistant")
+            span.set_attribute(MessageAttributes.COMPLETION_CONTENT.format(i=0), content_text)
+
+    if hasattr(final_message, "usage"):
+        usage = final_message.usage
+        if hasattr(usage, "input_tokens"):
+            span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, usage.input_tokens)
+
+        if hasattr(usage, "output_tokens"):
+            span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, usage.output_tokens)
+
+        if hasattr(usage, "input_tokens") and hasattr(usage, "output_tokens"):
+            total_tokens = usage.input_tokens + usage.output_tokens
+            span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, total_tokens)
+
 
 @_with_tracer_wrapper
 def messages_stream_wrapper(tracer, wrapped, instance, args, kwargs):
@@ -103,6 +139,7 @@ def messages_stream_wrapper(tracer, wrapped, instance, args, kwargs):
                     try:
                         original_text_stream = self.stream.text_stream
                         token_count = 0
+                        count_tokens = timed(_TEXT_CHUNK_OVERHEAD_KEY, _count_tokens)
 
                         class InstrumentedTextStream:
                             """A wrapper for Anthropic's text stream that counts tokens."""
@@ -114,10 +151,13 @@ def messages_stream_wrapper(tracer, wrapped, instance, args, kwargs):
                                     Text chunks from the original stream
                                 """
                                 nonlocal token_count
-                                for text in original_text_stream:
-                                    token_count += len(text.split())
+                                try:
+                                    for text in original_text_stream:
+                                        token_count += count_tokens(text)
+                                        yield text
+                                finally:
+                                    # set once rather than on every chunk
                                     span.set_attribute(SpanAttributes.LLM_USAGE_STREAMING_TOKENS, token_count)
-                                    yield text
 
                         self.stream.text_stream = InstrumentedTextStream()
                     except Exception as e:
@@ -152,29 +192,7 @@ def messages_stream_wrapper(tracer, wrapped, instance, args, kwargs):
                             final_message = self.original_manager._MessageStreamManager__stream._MessageStream__final_message_snapshot
 
                         if final_message:
-                            if hasattr(final_message, "content"):
-                                content_text = ""
-                                if isinstance(final_message.content, list):
-                                    for content_block in final_message.content:
-                                        if hasattr(content_block, "text"):
-                                            content_text += content_block.text
-
-                                if content_text:
-                                    span.set_attribute(MessageAttributes.COMPLETION_TYPE.format(i=0), "text")
-                                    span.set_attribute(MessageAttributes.COMPLETION_ROLE.format(i=0), "assistant")
-                                    span.set_attribute(MessageAttributes.COMPLETION_CONTENT.format(i=0), content_text)
-
-                            if hasattr(final_message, "usage"):
-                                usage = final_message.usage
-                                if hasattr(usage, "input_tokens"):
-                                    span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, usage.input_tokens)
-
-                                if hasattr(usage, "output_tokens"):
-                                    span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, usage.output_tokens)
-
-                                if hasattr(usage, "input_tokens") and hasattr(usage, "output_tokens"):
-                                    total_tokens = usage.input_tokens + usage.output_tokens
-                                    span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, total_tokens)
+                            _set_final_message_attributes(span, final_message)
                     except Exception as e:
                         logger.debug(f"Failed to extract final message data: {e}")
                 finally:
@@ -340,6 +358,7 @@ def messages_stream_async_wrapper(tracer, wrapped, instance, args, kwargs):
                         try:
                             original_text_stream = self.stream.text_stream
                             token_count = 0
+                            count_tokens = timed(_TEXT_CHUNK_OVERHEAD_KEY, _count_tokens)
 
                             class InstrumentedAsyncTextStream:
                                 """A wrapper for Anthropic's async text stream that counts tokens."""
@@ -351,10 +370,13 @@ def messages_stream_async_wrapper(tracer, wrapped, instance, args, kwargs):
                                         Text chunks from the original async stream
                                     """
                                     nonlocal token_count
-                                    async for text in original_text_stream:
-                                        token_count += len(text.split())
+                                    try:
+                                        async for text in original_text_stream:
+                                            token_count += count_tokens(text)
+                                            yield text
+                                    finally:
+                                        # set once rather than on every chunk
                                         span.set_attribute(SpanAttributes.LLM_USAGE_STREAMING_TOKENS, token_count)
-                                        yield text
 
                             self.stream.text_stream = InstrumentedAsyncTextStream()
                         except Exception as e:
@@ -389,33 +411,7 @@ def messages_stream_async_wrapper(tracer, wrapped, instance, args, kwargs):
                                 final_message = self.original_manager._AsyncMessageStreamManager__stream._AsyncMessageStream__final_message_snapshot
 
                             if final_message:
-                                if hasattr(final_message, "content"):
-                                    content_text = ""
-                                    if isinstance(final_message.content, list):
-                                        for content_block in final_message.content:
-                                            if hasattr(content_block, "text"):
-                                                content_text += content_block.text
-
-                                    if content_text:
-                                        span.set_attribute(MessageAttributes.COMPLETION_TYPE.format(i=0), "text")
-                                        span.set_attribute(MessageAttributes.COMPLETION_ROLE.format(i=0), "assistant")
-                                        span.set_attribute(
-                                            MessageAttributes.COMPLETION_CONTENT.format(i=0), content_text
-                                        )
-
-                                if hasattr(final_message, "usage"):
-                                    usage = final_message.usage
-                                    if hasattr(usage, "input_tokens"):
-                                        span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, usage.input_tokens)
-
-                                    if hasattr(usage, "output_tokens"):
-                                        span.set_attribute(
-                                            SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, usage.output_tokens
-                                        )
-
-                                    if hasattr(usage, "input_tokens") and hasattr(usage, "output_tokens"):
-                                        total_tokens = usage.input_tokens + usage.output_tokens
-                                        span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, total_tokens)
+                                _set_final_message_attributes(span, final_message)
                         except Exception as e:
                             logger.debug(f"Failed to extract final async message data: {e}")
                     finally:
@@ -6,13 +6,16 @@ It instruments streams to collect telemetry data for monitoring and analysis.
 """
 
 import logging
+from functools import partial
 from typing import TypeVar
 
 from opentelemetry import context as context_api
 from opentelemetry.trace import SpanKind, Status, StatusCode
 from opentelemetry.instrumentation.utils import _SUPPRESS_INSTRUMENTATION_KEY
 
+from agentops.helpers.overhead import COMPONENT_STREAM, profiled, timed
 from agentops.semconv import SpanAttributes, LLMRequestTypeValues, CoreAttributes, MessageAttributes
+from agentops.instrumentation.common.streaming import StreamAccumulator, TextChunkAdapter
 from agentops.instrumentation.common.wrappers import _with_tracer_wrapper
 from agentops.instrumentation.providers.google_genai.attributes.model import (
     get_generate_content_attributes,
@@ -26,6 +29,30 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# `GenerateContentResponse` chunks expose their text as `.text`; usage is only
+# populated on the final chunk(s)
+_CHUNK_ADAPTER = TextChunkAdapter(text_attr="text", usage_attr="usage_metadata")
+_CHUNK_OVERHEAD_KEY = (COMPONENT_STREAM, "google_genai", "generate_content_stream.chunk")
+
+
+@profiled(COMPONENT_STREAM, "google_genai", "generate_content_stream.finalize")
+def _finalize_stream(span, accumulator: StreamAccumulator) -> None:
+    """Set the accumulated content and token usage on the span once the stream is complete."""
+    full_text = accumulator.content
+    if full_text:
+        span.set_attribute(MessageAttributes.COMPLETION_CONTENT.format(i=0), full_text)
+        span.set_attribute(MessageAttributes.COMPLETION_ROLE.format(i=0), "assistant")
+
+    # Get token usage from the last chunk if available
+    if accumulator.usage:
+        metadata = accumulator.usage
+        if hasattr(metadata, "prompt_token_count"):
+            span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, metadata.prompt_token_count)
+        if hasattr(metadata, "candidates_token_count"):
+            span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, metadata.candidates_token_count)
+        if hasattr(metadata, "total_token_count"):
+            span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, metadata.total_token_count)
+
 
 @_with_tracer_wrapper
 def generate_content_stream_wrapper(tracer, wrapped, instance, args, kwargs):
@@ -81,37 +108,16 @@ def generate_content_stream_wrapper(tracer, wrapped, instance, args, kwargs):
             Yields:
                 Items from the original stream with added instrumentation
             """
-            full_text = ""
-            last_chunk_with_metadata = None
+            accumulator = StreamAccumulator(span)
+            process_chunk = timed(_CHUNK_OVERHEAD_KEY, partial(_CHUNK_ADAPTER.process, accumulator))
 
             try:
                 for chunk in stream:
-                    # Keep track of the last chunk that might have metadata
-                    if hasattr(chunk, "usage_metadata") and chunk.usage_metadata:
-                        last_chunk_with_metadata = chunk
-
-                    # Track token count (approximate by word count if metadata not available)
-                    if hasattr(chunk, "text"):
-                        text_value = getattr(chunk, "text", None)
-                        if text_value:
-                            full_text += text_value
-
+                    process_chunk(chunk)
                     yield chunk
 
                 # Set final content when complete
-                if full_text:
-                    span.set_attribute(MessageAttributes.COMPLETION_CONTENT.format(i=0), full_text)
-                    span.set_attribute(MessageAttributes.COMPLETION_ROLE.format(i=0), "assistant")
-
-                # Get token usage from the last chunk if available
-                if last_chunk_with_metadata and hasattr(last_chunk_with_metadata, "usage_metadata"):
-                    metadata = last_chunk_with_metadata.usage_metadata
-                    if hasattr(metadata, "prompt_token_count"):
-                        span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, metadata.prompt_token_count)
-                    if hasattr(metadata, "candidates_token_count"):
-                        span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, metadata.candidates_token_count)
-                    if hasattr(metadata, "total_token_count"):
-                        span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, metadata.total_token_count)
+                _finalize_stream(span, accumulator)
 
                 span.set_status(Status(StatusCode.OK))
             except Exception as e:
@@ -187,36 +193,16 @@ async def generate_content_stream_async_wrapper(tracer, wrapped, instance, args,
             Yields:
                 Items from the original stream with added instrumentation
             """
-            full_text = ""
-            last_chunk_with_metadata = None
+            accumulator = StreamAccumulator(span)
+            process_chunk = timed(_CHUNK_OVERHEAD_KEY, partial(_CHUNK_ADAPTER.process, accumulator))
 
             try:
                 async for chunk in stream:
-                    # Keep track of the last chunk that might have metadata
-                    if hasattr(chunk, "usage_metadata") and chunk.usage_metadata:
-                        last_chunk_with_metadata = chunk
-
-                    if hasattr(chunk, "text"):
-                        text_value = getattr(chunk, "text", None)
-                        if text_value:
-                            full_text += text_value
-
+                    process_chunk(chunk)
                     yield chunk
 
                 # Set final content when complete
-                if full_text:
-                    span.set_attribute(MessageAttributes.COMPLETION_CONTENT.format(i=0), full_text)
-                    span.set_attribute(MessageAttributes.COMPLETION_ROLE.format(i=0), "assistant")
-
-                # Get token usage from the last chunk if available
-                if last_chunk_with_metadata and hasattr(last_chunk_with_metadata, "usage_metadata"):
-                    metadata = last_chunk_with_metadata.usage_metadata
-                    if hasattr(metadata, "prompt_token_count"):
-                        span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, metadata.prompt_token_count)
-                    if hasattr(metadata, "candidates_token_count"):
-                        span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, metadata.candidates_token_count)
-                    if hasattr(metadata, "total_token_count"):
-                        span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, metadata.total_token_count)
+                _finalize_stream(span, accumulator)
 
                 span.set_status(Status(StatusCode.OK))
             except Exception as e:
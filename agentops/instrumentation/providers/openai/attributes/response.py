@@ -3,12 +3,14 @@ from agentops.logging import logger
 from agentops.semconv import (
     SpanAttributes,
     MessageAttributes,
+    IndexedKeyTable,
 )
 from agentops.instrumentation.common.attributes import (
     AttributeMap,
     IndexedAttributeMap,
     _extract_attributes_from_mapping,
     _extract_attributes_from_mapping_with_index,
+    _extract_attributes_from_sequence_with_index,
 )
 
 try:
@@ -316,6 +318,14 @@ RESPONSE_REASONING_ATTRIBUTES: AttributeMap = {
 }
 
 
+# Prompt keys for each `input` item, in the order (type, role, content)
+PROMPT_KEYS = IndexedKeyTable(
+    MessageAttributes.PROMPT_TYPE,
+    MessageAttributes.PROMPT_ROLE,
+    MessageAttributes.PROMPT_CONTENT,
+)
+
+
 def get_response_kwarg_attributes(kwargs: dict) -> AttributeMap:
     """Handles interpretation of openai Responses.create method keyword arguments."""
 
@@ -352,19 +362,21 @@ def get_response_kwarg_attributes(kwargs: dict) -> AttributeMap:
     # type our way into some usable common attributes
     _input: Union[str, list, None] = kwargs.get("input")
     if isinstance(_input, str):
-        attributes[MessageAttributes.PROMPT_ROLE.format(i=0)] = "user"
-        attributes[MessageAttributes.PROMPT_CONTENT.format(i=0)] = _input
+        _, role_key, content_key = PROMPT_KEYS.keys(0)
+        attributes[role_key] = "user"
+        attributes[content_key] = _input
 
     elif isinstance(_input, list):
         for i, prompt in enumerate(_input):
+            type_key, role_key, content_key = PROMPT_KEYS.keys(i)
             # Object type is pretty diverse, so we handle common attributes, but do so
             # conditionally because not all attributes are guaranteed to exist
             if hasattr(prompt, "type"):
-                attributes[MessageAttributes.PROMPT_TYPE.format(i=i)] = prompt.type
+                attributes[type_key] = prompt.type
             if hasattr(prompt, "role"):
-                attributes[MessageAttributes.PROMPT_ROLE.format(i=i)] = prompt.role
+                attributes[role_key] = prompt.role
             if hasattr(prompt, "content"):
-                attributes[MessageAttributes.PROMPT_CONTENT.format(i=i)] = prompt.content
+                attributes[content_key] = prompt.content
 
     else:
         logger.debug(f"[agentops.instrumentation.openai.response] '{type(_input)}' is not a recognized input type.")
@@ -447,12 +459,11 @@ def get_response_output_text_attributes(output_text: "ResponseOutputText", index
     attributes = _extract_attributes_from_mapping_with_index(output_text, RESPONSE_OUTPUT_TEXT_ATTRIBUTES, index)
 
     if hasattr(output_text, "annotations"):
-        for j, output_text_annotation in enumerate(output_text.annotations):
-            attributes.update(
-                _extract_attributes_from_mapping_with_index(
-                    output_text_annotation, RESPONSE_OUTPUT_TOOL_WEB_SEARCH_URL_ANNOTATIONS, i=index, j=j
-                )
+        attributes.update(
+            _extract_attributes_from_sequence_with_index(
+                output_text.annotations, RESPONSE_OUTPUT_TOOL_WEB_SEARCH_URL_ANNOTATIONS, i=index
             )
+        )
 
     return attributes
 
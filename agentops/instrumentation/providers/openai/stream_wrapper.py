@@ -3,24 +3,105 @@
 This module provides wrappers for OpenAI's streaming functionality,
 handling both Chat Completions API and Responses API streaming.
 It instruments streams to collect telemetry data for monitoring and analysis.
+
+Chunks are read into a `StreamAccumulator` by the chunk adapters defined here;
+span attributes are only set once the stream is finished.
 """
 
 import time
+from functools import partial
 from typing import Any, AsyncIterator, Iterator
 
 from opentelemetry import context as context_api
 from opentelemetry.trace import Span, SpanKind, Status, StatusCode, set_span_in_context
 from opentelemetry.context import _SUPPRESS_INSTRUMENTATION_KEY
 
+from agentops.helpers.overhead import COMPONENT_STREAM, profiled, timed
 from agentops.logging import logger
+from agentops.instrumentation.common.streaming import ChunkAdapter, StreamAccumulator
+from agentops.instrumentation.common.deferred import defer_attributes
 from agentops.instrumentation.common.wrappers import _with_tracer_wrapper
 from agentops.instrumentation.providers.openai.utils import is_metrics_enabled
 from agentops.instrumentation.providers.openai.wrappers.chat import handle_chat_attributes, _create_tool_span
 from agentops.semconv import SpanAttributes, LLMRequestTypeValues, MessageAttributes
 
 
-class OpenaiStreamWrapper:
-    """Wrapper for OpenAI Chat Completions streaming responses.
+class ChatCompletionChunkAdapter(ChunkAdapter):
+    """Reads Chat Completions `ChatCompletionChunk`s into a `StreamAccumulator`."""
+
+    __slots__ = ()
+
+    def process(self, accumulator: StreamAccumulator, chunk: Any) -> None:
+        accumulator.chunk_count += 1
+
+        # Usage is sent on a final chunk without choices when stream_options.include_usage=true
+        usage = getattr(chunk, "usage", None)
+        if usage is not None:
+            accumulator.usage = usage
+
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            return
+
+        if accumulator.response_id is None:
+            response_id = getattr(chunk, "id", None)
+            if response_id:
+                accumulator.response_id = response_id
+                accumulator.span.set_attribute(SpanAttributes.LLM_RESPONSE_ID, response_id)
+
+        if accumulator.model is None:
+            model = getattr(chunk, "model", None)
+            if model:
+                accumulator.model = model
+                accumulator.span.set_attribute(SpanAttributes.LLM_RESPONSE_MODEL, model)
+
+        for choice in choices:
+            delta = getattr(choice, "delta", None)
+            if delta is None:
+                continue
+
+            content = getattr(delta, "content", None)
+            if content is not None:
+                if content and accumulator.first_token_time is None:
+                    accumulator.mark_first_token("first_token_received")
+                accumulator.add_content(content)
+
+            tool_calls = getattr(delta, "tool_calls", None)
+            if tool_calls:
+                # tool calls count as first tokens too
+                if accumulator.first_token_time is None:
+                    accumulator.mark_first_token("first_tool_call_token_received")
+
+                for tool_call in tool_calls:
+                    index = getattr(tool_call, "index", None)
+                    if index is None:
+                        continue
+
+                    buffer = accumulator.tool_call(index)
+                    tool_call_id = getattr(tool_call, "id", None)
+                    if tool_call_id:
+                        buffer.id = tool_call_id
+
+                    function = getattr(tool_call, "function", None)
+                    if function is not None:
+                        name = getattr(function, "name", None)
+                        if name:
+                            buffer.name = name
+                        arguments = getattr(function, "arguments", None)
+                        if arguments:
+                            buffer.append_arguments(arguments)
+
+            finish_reason = getattr(choice, "finish_reason", None)
+            if finish_reason:
+                accumulator.finish_reason = finish_reason
+
+
+_CHAT_CHUNK_ADAPTER = ChatCompletionChunkAdapter()
+_CHAT_CHUNK_OVERHEAD_KEY = (COMPONENT_STREAM, "openai", "chat.completions.chunk")
+
+
+class _ChatCompletionStream:
+    """Shared state and finalization for the sync and async Chat Completions stream wrappers.
 
     This wrapper intercepts streaming chunks to collect telemetry data including:
     - Time to first token
@@ -41,146 +122,25 @@ class OpenaiStreamWrapper:
         self._stream = stream
         self._span = span
         self._request_kwargs = request_kwargs
-        self._start_time = time.time()
-        self._first_token_time = None
-        self._chunk_count = 0
-        self._content_chunks = []
-        self._finish_reason = None
-        self._model = None
-        self._response_id = None
-        self._usage = None
-        self._tool_calls = {}
-        self._current_tool_call_index = None
+        self._accumulator = StreamAccumulator(span)
+        # resolve the chunk handler once for the lifetime of the stream
+        self._process_chunk = timed(_CHAT_CHUNK_OVERHEAD_KEY, partial(_CHAT_CHUNK_ADAPTER.process, self._accumulator))
 
         # Make sure the span is attached to the current context
         current_context = context_api.get_current()
         self._token = context_api.attach(set_span_in_context(span, current_context))
 
-    def __iter__(self) -> Iterator[Any]:
-        """Return iterator for sync streaming."""
-        return self
-
-    def __next__(self) -> Any:
-        """Process the next chunk from the stream."""
-        try:
-            chunk = next(self._stream)
-            self._process_chunk(chunk)
-            return chunk
-        except StopIteration:
-            self._finalize_stream()
-            raise
-
-    def __enter__(self):
-        """Support context manager protocol."""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Clean up on context manager exit."""
-        if exc_type is not None:
-            self._span.record_exception(exc_val)
-            self._span.set_status(Status(StatusCode.ERROR, str(exc_val)))
-
-        self._span.end()
-        context_api.detach(self._token)
-        return False
-
-    def _process_chunk(self, chunk: Any) -> None:
-        """Process a single chunk from the stream.
-
-        Args:
-            chunk: A chunk from the OpenAI streaming response
-        """
-        self._chunk_count += 1
-
-        # Usage (may be in final chunk with a different structure)
-        if hasattr(chunk, "usage"):
-            self._usage = chunk.usage
-            # Check if this is a usage-only chunk (often the final chunk when stream_options.include_usage=true)
-            is_usage_only_chunk = not (hasattr(chunk, "choices") and chunk.choices)
-
-            # If this is a usage-only chunk, we don't need to process it as a content chunk
-            if is_usage_only_chunk:
-                return
-
-        # Skip processing if no choices are present
-        if not hasattr(chunk, "choices") or not chunk.choices:
-            return
-
-        # Track first token timing
-        if self._first_token_time is None:
-            if any(choice.delta.content for choice in chunk.choices if hasattr(choice.delta, "content")):
-                self._first_token_time = time.time()
-                time_to_first_token = self._first_token_time - self._start_time
-                self._span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_FIRST_TOKEN, time_to_first_token)
-                self._span.add_event("first_token_received", {"time_elapsed": time_to_first_token})
-            # Also check for tool_calls as first tokens
-            elif any(
-                choice.delta.tool_calls
-                for choice in chunk.choices
-                if hasattr(choice.delta, "tool_calls") and choice.delta.tool_calls
-            ):
-                self._first_token_time = time.time()
-                time_to_first_token = self._first_token_time - self._start_time
-                self._span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_FIRST_TOKEN, time_to_first_token)
-                self._span.add_event("first_tool_call_token_received", {"time_elapsed": time_to_first_token})
-
-        # Extract chunk data
-        if hasattr(chunk, "id") and chunk.id and not self._response_id:
-            self._response_id = chunk.id
-            if self._response_id is not None:
-                self._span.set_attribute(SpanAttributes.LLM_RESPONSE_ID, self._response_id)
-
-        if hasattr(chunk, "model") and chunk.model and not self._model:
-            self._model = chunk.model
-            if self._model is not None:
-                self._span.set_attribute(SpanAttributes.LLM_RESPONSE_MODEL, self._model)
-
-        # Process choices
-        for choice in chunk.choices:
-            if not hasattr(choice, "delta"):
-                continue
-
-            delta = choice.delta
-
-            # Content
-            if hasattr(delta, "content") and delta.content is not None:
-                self._content_chunks.append(delta.content)
-
-            # Tool calls
-            if hasattr(delta, "tool_calls") and delta.tool_calls:
-                for tool_call in delta.tool_calls:
-                    if hasattr(tool_call, "index"):
-                        idx = tool_call.index
-                        if idx not in self._tool_calls:
-                            self._tool_calls[idx] = {
-                                "id": "",
-                                "type": "function",
-                                "function": {"name": "", "arguments": ""},
-                            }
-
-                        if hasattr(tool_call, "id") and tool_call.id:
-                            self._tool_calls[idx]["id"] = tool_call.id
-
-                        if hasattr(tool_call, "function"):
-                            if hasattr(tool_call.function, "name") and tool_call.function.name:
-                                self._tool_calls[idx]["function"]["name"] = tool_call.function.name
-                            if hasattr(tool_call.function, "arguments") and tool_call.function.arguments:
-                                self._tool_calls[idx]["function"]["arguments"] += tool_call.function.arguments
-
-            # Finish reason
-            if hasattr(choice, "finish_reason") and choice.finish_reason:
-                self._finish_reason = choice.finish_reason
-
+    @profiled(COMPONENT_STREAM, "openai", "chat.completions.finalize")
     def _finalize_stream(self) -> None:
         """Finalize the stream and set final attributes on the span."""
-        total_time = time.time() - self._start_time
+        accumulator = self._accumulator
+        total_time = time.time() - accumulator.start_time
 
         # Aggregate content
-        full_content = "".join(self._content_chunks)
+        full_content = accumulator.content
 
         # Set generation time
-        if self._first_token_time:
-            generation_time = total_time - (self._first_token_time - self._start_time)
+        if (generation_time := accumulator.generation_time) is not None:
             self._span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_GENERATE, generation_time)
 
         # Add content attributes
@@ -189,29 +149,28 @@ class OpenaiStreamWrapper:
             self._span.set_attribute(MessageAttributes.COMPLETION_ROLE.format(i=0), "assistant")
 
         # Set finish reason
-        if self._finish_reason:
-            self._span.set_attribute(MessageAttributes.COMPLETION_FINISH_REASON.format(i=0), self._finish_reason)
+        if accumulator.finish_reason:
+            self._span.set_attribute(MessageAttributes.COMPLETION_FINISH_REASON.format(i=0), accumulator.finish_reason)
 
-        # Create tool spans for each tool call
-        if len(self._tool_calls) > 0:
-            for idx, tool_call in self._tool_calls.items():
-                # Create a child span for this tool call
-                _create_tool_span(self._span, tool_call)
+        # Create a child span for each tool call
+        for tool_call in accumulator.tool_calls.values():
+            _create_tool_span(self._span, tool_call.to_dict())
 
         # Set usage if available from the API
-        if self._usage is not None:
+        usage = accumulator.usage
+        if usage is not None:
             # Only set token attributes if they exist and have non-None values
-            if hasattr(self._usage, "prompt_tokens") and self._usage.prompt_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, int(self._usage.prompt_tokens))
+            if getattr(usage, "prompt_tokens", None) is not None:
+                self._span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, int(usage.prompt_tokens))
 
-            if hasattr(self._usage, "completion_tokens") and self._usage.completion_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, int(self._usage.completion_tokens))
+            if getattr(usage, "completion_tokens", None) is not None:
+                self._span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, int(usage.completion_tokens))
 
-            if hasattr(self._usage, "total_tokens") and self._usage.total_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, int(self._usage.total_tokens))
+            if getattr(usage, "total_tokens", None) is not None:
+                self._span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, int(usage.total_tokens))
 
         # Stream statistics
-        self._span.set_attribute("llm.openai.stream.chunk_count", self._chunk_count)
+        self._span.set_attribute("llm.openai.stream.chunk_count", accumulator.chunk_count)
         self._span.set_attribute("llm.openai.stream.content_length", len(full_content))
         self._span.set_attribute("llm.openai.stream.total_duration", total_time)
 
@@ -219,10 +178,10 @@ class OpenaiStreamWrapper:
         self._span.add_event(
             "stream_completed",
             {
-                "chunks_received": self._chunk_count,
+                "chunks_received": accumulator.chunk_count,
                 "total_content_length": len(full_content),
                 "duration": total_time,
-                "had_tool_calls": len(self._tool_calls) > 0,
+                "had_tool_calls": len(accumulator.tool_calls) > 0,
             },
         )
 
@@ -232,33 +191,40 @@ class OpenaiStreamWrapper:
         context_api.detach(self._token)
 
 
-class OpenAIAsyncStreamWrapper:
-    """Async wrapper for OpenAI Chat Completions streaming responses."""
+class OpenaiStreamWrapper(_ChatCompletionStream):
+    """Wrapper for OpenAI Chat Completions streaming responses."""
 
-    def __init__(self, stream: Any, span: Span, request_kwargs: dict):
-        """Initialize the async stream wrapper.
+    def __iter__(self) -> Iterator[Any]:
+        """Return iterator for sync streaming."""
+        return self
 
-        Args:
-            stream: The original OpenAI async stream object
-            span: The OpenTelemetry span for tracking
-            request_kwargs: Original request parameters for context
-        """
-        self._stream = stream
-        self._span = span
-        self._request_kwargs = request_kwargs
-        self._start_time = time.time()
-        self._first_token_time = None
-        self._chunk_count = 0
-        self._content_chunks = []
-        self._finish_reason = None
-        self._model = None
-        self._response_id = None
-        self._usage = None
-        self._tool_calls = {}
+    def __next__(self) -> Any:
+        """Process the next chunk from the stream."""
+        try:
+            chunk = next(self._stream)
+            self._process_chunk(chunk)
+            return chunk
+        except StopIteration:
+            self._finalize_stream()
+            raise
 
-        # Make sure the span is attached to the current context
-        current_context = context_api.get_current()
-        self._token = context_api.attach(set_span_in_context(span, current_context))
+    def __enter__(self):
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Clean up on context manager exit."""
+        if exc_type is not None:
+            self._span.record_exception(exc_val)
+            self._span.set_status(Status(StatusCode.ERROR, str(exc_val)))
+
+        self._span.end()
+        context_api.detach(self._token)
+        return False
+
+
+class OpenAIAsyncStreamWrapper(_ChatCompletionStream):
+    """Async wrapper for OpenAI Chat Completions streaming responses."""
 
     def __aiter__(self) -> AsyncIterator[Any]:
         """Return async iterator for async streaming."""
@@ -267,12 +233,7 @@ class OpenAIAsyncStreamWrapper:
     async def __anext__(self) -> Any:
         """Process the next chunk from the async stream."""
         try:
-            if not hasattr(self, "_aiter_debug_logged"):
-                self._aiter_debug_logged = True
-
             chunk = await self._stream.__anext__()
-
-            # Process the chunk
             self._process_chunk(chunk)
             return chunk
         except StopAsyncIteration:
@@ -301,153 +262,6 @@ class OpenAIAsyncStreamWrapper:
         context_api.detach(self._token)
         return False
 
-    def _process_chunk(self, chunk: Any) -> None:
-        """Process a single chunk from the stream.
-
-        Args:
-            chunk: A chunk from the OpenAI streaming response
-        """
-        self._chunk_count += 1
-
-        # Usage (may be in final chunk with a different structure)
-        if hasattr(chunk, "usage"):
-            self._usage = chunk.usage
-            # Check if this is a usage-only chunk (often the final chunk when stream_options.include_usage=true)
-            is_usage_only_chunk = not (hasattr(chunk, "choices") and chunk.choices)
-
-            # If this is a usage-only chunk, we don't need to process it as a content chunk
-            if is_usage_only_chunk:
-                return
-
-        # Skip processing if no choices are present
-        if not hasattr(chunk, "choices") or not chunk.choices:
-            return
-
-        # Track first token timing
-        if self._first_token_time is None:
-            if any(choice.delta.content for choice in chunk.choices if hasattr(choice.delta, "content")):
-                self._first_token_time = time.time()
-                time_to_first_token = self._first_token_time - self._start_time
-                self._span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_FIRST_TOKEN, time_to_first_token)
-                self._span.add_event("first_token_received", {"time_elapsed": time_to_first_token})
-            # Also check for tool_calls as first tokens
-            elif any(
-                choice.delta.tool_calls
-                for choice in chunk.choices
-                if hasattr(choice.delta, "tool_calls") and choice.delta.tool_calls
-            ):
-                self._first_token_time = time.time()
-                time_to_first_token = self._first_token_time - self._start_time
-                self._span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_FIRST_TOKEN, time_to_first_token)
-                self._span.add_event("first_tool_call_token_received", {"time_elapsed": time_to_first_token})
-
-        # Extract chunk data
-        if hasattr(chunk, "id") and chunk.id and not self._response_id:
-            self._response_id = chunk.id
-            if self._response_id is not None:
-                self._span.set_attribute(SpanAttributes.LLM_RESPONSE_ID, self._response_id)
-
-        if hasattr(chunk, "model") and chunk.model and not self._model:
-            self._model = chunk.model
-            if self._model is not None:
-                self._span.set_attribute(SpanAttributes.LLM_RESPONSE_MODEL, self._model)
-
-        # Process choices
-        for choice in chunk.choices:
-            if not hasattr(choice, "delta"):
-                continue
-
-            delta = choice.delta
-
-            # Content
-            if hasattr(delta, "content") and delta.content is not None:
-                self._content_chunks.append(delta.content)
-
-            # Tool calls
-            if hasattr(delta, "tool_calls") and delta.tool_calls:
-                for tool_call in delta.tool_calls:
-                    if hasattr(tool_call, "index"):
-                        idx = tool_call.index
-                        if idx not in self._tool_calls:
-                            self._tool_calls[idx] = {
-                                "id": "",
-                                "type": "function",
-                                "function": {"name": "", "arguments": ""},
-                            }
-
-                        if hasattr(tool_call, "id") and tool_call.id:
-                            self._tool_calls[idx]["id"] = tool_call.id
-
-                        if hasattr(tool_call, "function"):
-                            if hasattr(tool_call.function, "name") and tool_call.function.name:
-                                self._tool_calls[idx]["function"]["name"] = tool_call.function.name
-                            if hasattr(tool_call.function, "arguments") and tool_call.function.arguments:
-                                self._tool_calls[idx]["function"]["arguments"] += tool_call.function.arguments
-
-            # Finish reason
-            if hasattr(choice, "finish_reason") and choice.finish_reason:
-                self._finish_reason = choice.finish_reason
-
-    def _finalize_stream(self) -> None:
-        """Finalize the stream and set final attributes on the span."""
-        total_time = time.time() - self._start_time
-
-        # Aggregate content
-        full_content = "".join(self._content_chunks)
-
-        # Set generation time
-        if self._first_token_time:
-            generation_time = total_time - (self._first_token_time - self._start_time)
-            self._span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_GENERATE, generation_time)
-
-        # Add content attributes
-        if full_content:
-            self._span.set_attribute(MessageAttributes.COMPLETION_CONTENT.format(i=0), full_content)
-            self._span.set_attribute(MessageAttributes.COMPLETION_ROLE.format(i=0), "assistant")
-
-        # Set finish reason
-        if self._finish_reason:
-            self._span.set_attribute(MessageAttributes.COMPLETION_FINISH_REASON.format(i=0), self._finish_reason)
-
-        # Create tool spans for each tool call
-        if len(self._tool_calls) > 0:
-            for idx, tool_call in self._tool_calls.items():
-                # Create a child span for this tool call
-                _create_tool_span(self._span, tool_call)
-
-        # Set usage if available from the API
-        if self._usage is not None:
-            # Only set token attributes if they exist and have non-None values
-            if hasattr(self._usage, "prompt_tokens") and self._usage.prompt_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, int(self._usage.prompt_tokens))
-
-            if hasattr(self._usage, "completion_tokens") and self._usage.completion_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, int(self._usage.completion_tokens))
-
-            if hasattr(self._usage, "total_tokens") and self._usage.total_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, int(self._usage.total_tokens))
-
-        # Stream statistics
-        self._span.set_attribute("llm.openai.stream.chunk_count", self._chunk_count)
-        self._span.set_attribute("llm.openai.stream.content_length", len(full_content))
-        self._span.set_attribute("llm.openai.stream.total_duration", total_time)
-
-        # Add completion event
-        self._span.add_event(
-            "stream_completed",
-            {
-                "chunks_received": self._chunk_count,
-                "total_content_length": len(full_content),
-                "duration": total_time,
-                "had_tool_calls": len(self._tool_calls) > 0,
-            },
-        )
-
-        # Finalize span and context
-        self._span.set_status(Status(StatusCode.OK))
-        self._span.end()
-        context_api.detach(self._token)
-
 
 @_with_tracer_wrapper
 def chat_completion_stream_wrapper(tracer, wrapped, instance, args, kwargs):
@@ -587,6 +401,123 @@ async def async_chat_completion_stream_wrapper(tracer, wrapped, instance, args,
         raise
 
 
+class _ResponsesAccumulator(StreamAccumulator):
+    """Accumulator with the extra output kinds produced by the Responses API."""
+
+    __slots__ = ("function_arguments", "function_call_chunks", "reasoning_chunks")
+
+    def __init__(self, span: Span):
+        super().__init__(span)
+        self.function_arguments: list = []
+        self.function_call_chunks: list = []
+        self.reasoning_chunks: list = []
+
+
+class ResponsesEventAdapter(ChunkAdapter):
+    """Reads typed Responses API stream events into a `_ResponsesAccumulator`.
+
+    Events are dispatched on their `type` through a lookup table, so each event
+    costs a single dict lookup regardless of how many event types are handled.
+    """
+
+    __slots__ = ("_handlers",)
+
+    # events that carry the first generated output
+    FIRST_TOKEN_EVENTS = frozenset({"response.output_text.delta", "response.function_call_arguments.delta"})
+    # only these are recorded as span events, not every delta
+    SIGNIFICANT_EVENTS = frozenset({"response.created", "response.completed", "response.output_item.added"})
+
+    def __init__(self):
+        self._handlers = {
+            "response.created": self._on_created,
+            "response.output_text.delta": self._on_output_text_delta,
+            "response.function_call_arguments.delta": self._on_function_call_arguments_delta,
+            "response.completed": self._on_completed,
+        }
+
+    def process(self, accumulator: _ResponsesAccumulator, event: Any) -> None:
+        accumulator.chunk_count += 1
+
+        event_type = getattr(event, "type", None)
+        if event_type is None:
+            return
+
+        if accumulator.first_token_time is None and event_type in self.FIRST_TOKEN_EVENTS:
+            accumulator.mark_first_token()
+
+        handler = self._handlers.get(event_type)
+        if handler is not None:
+            handler(accumulator, event)
+
+        if event_type in self.SIGNIFICANT_EVENTS:
+            accumulator.span.add_event(
+                "responses_api_event",
+                {"event_type": event_type, "event_number": accumulator.chunk_count},
+            )
+
+    @staticmethod
+    def _on_created(accumulator: _ResponsesAccumulator, event: Any) -> None:
+        response = getattr(event, "response", None)
+        if response is None:
+            return
+
+        if (response_id := getattr(response, "id", None)) is not None:
+            accumulator.response_id = response_id
+            accumulator.span.set_attribute(SpanAttributes.LLM_RESPONSE_ID, response_id)
+        if (model := getattr(response, "model", None)) is not None:
+            accumulator.model = model
+            accumulator.span.set_attribute(SpanAttributes.LLM_RESPONSE_MODEL, model)
+
+    @staticmethod
+    def _on_output_text_delta(accumulator: _ResponsesAccumulator, event: Any) -> None:
+        if (delta := getattr(event, "delta", None)) is not None:
+            accumulator.add_content(delta)
+
+    @staticmethod
+    def _on_function_call_arguments_delta(accumulator: _ResponsesAccumulator, event: Any) -> None:
+        if (delta := getattr(event, "delta", None)) is not None:
+            accumulator.function_arguments.append(delta)
+
+    @staticmethod
+    def _on_completed(accumulator: _ResponsesAccumulator, event: Any) -> None:
+        # The final response contains all output items
+        response = getattr(event, "response", None)
+        if response is None:
+            return
+
+        if hasattr(response, "usage"):
+            accumulator.usage = response.usage
+
+        for output_item in getattr(response, "output", None) or []:
+            item_type = getattr(output_item, "type", None)
+            if item_type == "function_call" and hasattr(output_item, "arguments"):
+                accumulator.function_call_chunks.append(output_item.arguments)
+            elif item_type == "reasoning":
+                # Extract reasoning text - could be in summary or content
+                if hasattr(output_item, "summary"):
+                    accumulator.reasoning_chunks.append(str(output_item.summary))
+                elif hasattr(output_item, "content"):
+                    # content might be a list of text items
+                    if isinstance(output_item.content, list):
+                        for content_item in output_item.content:
+                            if hasattr(content_item, "text"):
+                                accumulator.reasoning_chunks.append(str(content_item.text))
+                    else:
+                        accumulator.reasoning_chunks.append(str(output_item.content))
+            elif item_type == "message" and hasattr(output_item, "content"):
+                # Extract text content from message items
+                if isinstance(output_item.content, list):
+                    for content in output_item.content:
+                        if getattr(content, "type", None) == "text" and hasattr(content, "text"):
+                            accumulator.add_content(str(content.text))
+                else:
+                    accumulator.add_content(str(output_item.content))
+
+
+_RESPONSES_EVENT_ADAPTER = ResponsesEventAdapter()
+_RESPONSES_EVENT_OVERHEAD_KEY = (COMPONENT_STREAM, "openai", "responses.event")
+
+
 class ResponsesAPIStreamWrapper:
     """Wrapper for OpenAI Responses API streaming.
 
@@ -599,17 +530,11 @@ class ResponsesAPIStreamWrapper:
         self._stream = stream
         self._span = span
         self._request_kwargs = request_kwargs
-        self._start_time = time.time()
-        self._first_token_time = None
-        self._event_count = 0
-        self._content_chunks = []
-        self._function_call_chunks = []
-        self._reasoning_chunks = []
-        self._response_id = None
-        self._model = None
-        self._usage = None
-        self._output_items = []
-        self._current_function_args = ""
+        self._accumulator = _ResponsesAccumulator(span)
+        # resolve the event handler once for the lifetime of the stream
+        self._process_event = timed(
+            _RESPONSES_EVENT_OVERHEAD_KEY, partial(_RESPONSES_EVENT_ADAPTER.process, self._accumulator)
+        )
 
         # Make sure the span is attached to the current context
         current_context = context_api.get_current()
@@ -645,7 +570,6 @@ class ResponsesAPIStreamWrapper:
                 try:
                     event = next(self._stream)
                 except StopIteration:
-                    self._finalize_stream()
                     raise StopAsyncIteration
 
             self._process_event(event)
@@ -662,110 +586,26 @@ class ResponsesAPIStreamWrapper:
             context_api.detach(self._token)
             raise
 
-    def _process_event(self, event: Any) -> None:
-        """Process a single event from the Responses API stream."""
-        self._event_count += 1
-
-        # Track first content event
-        if self._first_token_time is None and hasattr(event, "type"):
-            if event.type in ["response.output_text.delta", "response.function_call_arguments.delta"]:
-                self._first_token_time = time.time()
-                time_to_first_token = self._first_token_time - self._start_time
-                self._span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_FIRST_TOKEN, time_to_first_token)
-
-        # Process different event types
-        if hasattr(event, "type"):
-            if event.type == "response.created":
-                if hasattr(event, "response"):
-                    response = event.response
-                    if hasattr(response, "id"):
-                        self._response_id = response.id
-                        self._span.set_attribute(SpanAttributes.LLM_RESPONSE_ID, self._response_id)
-                    if hasattr(response, "model"):
-                        self._model = response.model
-                        self._span.set_attribute(SpanAttributes.LLM_RESPONSE_MODEL, self._model)
-
-            elif event.type == "response.output_text.delta":
-                if hasattr(event, "delta"):
-                    self._content_chunks.append(event.delta)
-
-            elif event.type == "response.function_call_arguments.delta":
-                # Accumulate function call arguments
-                if hasattr(event, "delta"):
-                    self._current_function_args += event.delta
-
-            elif event.type == "response.completed":
-                # Process the final response which contains all output items
-                if hasattr(event, "response"):
-                    response = event.response
-                    if hasattr(response, "usage"):
-                        self._usage = response.usage
-
-                    # Extract output items from the completed response
-                    if hasattr(response, "output"):
-                        for output_item in response.output:
-                            if hasattr(output_item, "type"):
-                                if output_item.type == "function_call" and hasattr(output_item, "arguments"):
-                                    self._function_call_chunks.append(output_item.arguments)
-                                elif output_item.type == "reasoning":
-                                    # Extract reasoning text - could be in summary or content
-                                    if hasattr(output_item, "summary"):
-                                        self._reasoning_chunks.append(str(output_item.summary))
-                                    elif hasattr(output_item, "content"):
-                                        # content might be a list of text items
-                                        if isinstance(output_item.content, list):
-                                            for content_item in output_item.content:
-                                                if hasattr(content_item, "text"):
-                                                    self._reasoning_chunks.append(str(content_item.text))
-                                        else:
-                                            self._reasoning_chunks.append(str(output_item.content))
-                                elif output_item.type == "message" and hasattr(output_item, "content"):
-                                    # Extract text content from message items
-                                    if isinstance(output_item.content, list):
-                                        for content in output_item.content:
-                                            if (
-                                                hasattr(content, "type")
-                                                and content.type == "text"
-                                                and hasattr(content, "text")
-                                            ):
-                                                self._content_chunks.append(str(content.text))
-                                    else:
-                                        self._content_chunks.append(str(output_item.content))
-
-        # Only add significant events, not every delta
-        if hasattr(event, "type") and event.type in [
-            "response.created",
-            "response.completed",
-            "response.output_item.added",
-        ]:
-            self._span.add_event(
-                "responses_api_event",
-                {"event_type": event.type, "event_number": self._event_count},
-            )
-
+    @profiled(COMPONENT_STREAM, "openai", "responses.finalize")
     def _finalize_stream(self) -> None:
         """Finalize the Responses API stream."""
-        total_time = time.time() - self._start_time
+        accumulator = self._accumulator
+        total_time = time.time() - accumulator.start_time
 
         # Aggregate different types of content
-        text_content = "".join(self._content_chunks)
-        function_content = self._current_function_args or "".join(self._function_call_chunks)
-        reasoning_content = "".join(self._reasoning_chunks)
+        text_content = accumulator.content
+        function_content = "".join(accumulator.function_arguments) or "".join(accumulator.function_call_chunks)
+        reasoning_content = "".join(accumulator.reasoning_chunks)
 
         # Combine all content types for the completion
-        full_content = ""
+        parts = []
         if reasoning_content:
-            full_content = f"Reasoning: {reasoning_content}"
+            parts.append(f"Reasoning: {reasoning_content}")
         if function_content:
-            if full_content:
-                full_content += f"\nFunction Call: {function_content}"
-            else:
-                full_content = f"Function Call: {function_content}"
+            parts.append(f"Function Call: {function_content}")
         if text_content:
-            if full_content:
-                full_content += f"\nResponse: {text_content}"
-            else:
-                full_content = text_content
+            parts.append(f"Response: {text_content}" if parts else text_content)
+        full_content = "\n".join(parts)
 
         if full_content:
             self._span.set_attribute(MessageAttributes.COMPLETION_CONTENT.format(i=0), full_content)
@@ -776,31 +616,31 @@ class ResponsesAPIStreamWrapper:
             )
 
         # Set timing
-        if self._first_token_time:
-            generation_time = total_time - (self._first_token_time - self._start_time)
+        if (generation_time := accumulator.generation_time) is not None:
             self._span.set_attribute(SpanAttributes.LLM_STREAMING_TIME_TO_GENERATE, generation_time)
 
         # Set usage if available from the API
-        if self._usage is not None:
+        usage = accumulator.usage
+        if usage is not None:
             # Only set token attributes if they exist and have non-None values
-            if hasattr(self._usage, "input_tokens") and self._usage.input_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, int(self._usage.input_tokens))
+            if getattr(usage, "input_tokens", None) is not None:
+                self._span.set_attribute(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, int(usage.input_tokens))
 
-            if hasattr(self._usage, "output_tokens") and self._usage.output_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, int(self._usage.output_tokens))
+            if getattr(usage, "output_tokens", None) is not None:
+                self._span.set_attribute(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, int(usage.output_tokens))
 
-            if hasattr(self._usage, "total_tokens") and self._usage.total_tokens is not None:
-                self._span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, int(self._usage.total_tokens))
+            if getattr(usage, "total_tokens", None) is not None:
+                self._span.set_attribute(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, int(usage.total_tokens))
 
         else:
             logger.debug(
                 f"[RESPONSES API] No usage provided by API. "
                 f"content_length={len(full_content)}, "
-                f"event_count={self._event_count}"
+                f"event_count={accumulator.chunk_count}"
             )
 
         # Stream statistics
-        self._span.set_attribute("llm.openai.responses.event_count", self._event_count)
+        self._span.set_attribute("llm.openai.responses.event_count", accumulator.chunk_count)
         self._span.set_attribute("llm.openai.responses.content_length", len(full_content))
         self._span.set_attribute("llm.openai.responses.total_duration", total_time)
 
@@ -808,7 +648,7 @@ class ResponsesAPIStreamWrapper:
         self._span.add_event(
             "stream_completed",
             {
-                "event_count": self._event_count,
+                "event_count": accumulator.chunk_count,
                 "total_content_length": len(full_content),
                 "duration": total_time,
                 "had_function_calls": bool(function_content),
@@ -822,7 +662,7 @@ class ResponsesAPIStreamWrapper:
         self._span.end()
         context_api.detach(self._token)
         logger.debug(
-            f"[RESPONSES API] Finalized streaming span after {self._event_count} events. Content length: {len(full_content)}"
+            f"[RESPONSES API] Finalized streaming span after {accumulator.chunk_count} events. Content length: {len(full_content)}"
         )
 
 
@@ -851,9 +691,11 @@ def responses_stream_wrapper(tracer, wrapped, instance, args, kwargs):
         # Extract and set request attributes
         from agentops.instrumentation.providers.openai.wrappers.responses import handle_responses_attributes
 
-        request_attributes = handle_responses_attributes(kwargs=kwargs)
-        for key, value in request_attributes.items():
-            span.set_attribute(key, value)
+        request_attributes = {}
+        if not defer_attributes(span, handle_responses_attributes, kwargs=kwargs):
+            request_attributes = handle_responses_attributes(kwargs=kwargs)
+            for key, value in request_attributes.items():
+                span.set_attribute(key, value)
 
         # Call the original method
         response = wrapped(*args, **kwargs)
@@ -864,10 +706,14 @@ def responses_stream_wrapper(tracer, wrapped, instance, args, kwargs):
             return ResponsesAPIStreamWrapper(response, span, kwargs)
         else:
             # For non-streaming, handle response attributes and close span
-            response_attributes = handle_responses_attributes(kwargs=kwargs, return_value=response)
-            for key, value in response_attributes.items():
-                if key not in request_attributes:  # Avoid overwriting request attributes
-                    span.set_attribute(key, value)
+            # Avoid overwriting request attributes
+            if not defer_attributes(
+                span, handle_responses_attributes, kwargs=kwargs, return_value=response, overwrite=False
+            ):
+                response_attributes = handle_responses_attributes(kwargs=kwargs, return_value=response)
+                for key, value in response_attributes.items():
+                    if key not in request_attributes:
+                        span.set_attribute(key, value)
 
             span.set_status(Status(StatusCode.OK))
             span.end()
@@ -908,9 +754,11 @@ async def async_responses_stream_wrapper(tracer, wrapped, instance, args, kwargs
         # Extract and set request attributes
         from agentops.instrumentation.providers.openai.wrappers.responses import handle_responses_attributes
 
-        request_attributes = handle_responses_attributes(kwargs=kwargs)
-        for key, value in request_attributes.items():
-            span.set_attribute(key, value)
+        request_attributes = {}
+        if not defer_attributes(span, handle_responses_attributes, kwargs=kwargs):
+            request_attributes = handle_responses_attributes(kwargs=kwargs)
+            for key, value in request_attributes.items():
+                span.set_attribute(key, value)
 
         # Call the original method
         response = await wrapped(*args, **kwargs)
@@ -922,10 +770,14 @@ async def async_responses_stream_wrapper(tracer, wrapped, instance, args, kwargs
             return ResponsesAPIStreamWrapper(response, span, kwargs)
         else:
             # For non-streaming, handle response attributes and close span
-            response_attributes = handle_responses_attributes(kwargs=kwargs, return_value=response)
-            for key, value in response_attributes.items():
-                if key not in request_attributes:  # Avoid overwriting request attributes
-                    span.set_attribute(key, value)
+            # Avoid overwriting request attributes
+            if not defer_attributes(
+                span, handle_responses_attributes, kwargs=kwargs, return_value=response, overwrite=False
+            ):
+                response_attributes = handle_responses_attributes(kwargs=kwargs, return_value=response)
+                for key, value in response_attributes.items():
+                    if key not in request_attributes:
+                        span.set_attribute(key, value)
 
             span.set_status(Status(StatusCode.OK))
             span.end()
@@ -16,7 +16,7 @@ from agentops.instrumentation.providers.openai.wrappers.shared import (
     should_send_prompts,
 )
 from agentops.instrumentation.common.attributes import AttributeMap
-from agentops.semconv import SpanAttributes, LLMRequestTypeValues
+from agentops.semconv import SpanAttributes, MessageAttributes, LLMRequestTypeValues, IndexedKeyTable
 from agentops.semconv.tool import ToolAttributes
 from agentops.semconv.span_kinds import AgentOpsSpanKindValues
 
@@ -27,6 +27,19 @@ logger = logging.getLogger(__name__)
 
 LLM_REQUEST_TYPE = LLMRequestTypeValues.CHAT
 
+# Keys for each prompt message, in the order (role, content, tool_call_id)
+PROMPT_KEYS = IndexedKeyTable(
+    MessageAttributes.PROMPT_ROLE,
+    MessageAttributes.PROMPT_CONTENT,
+    MessageAttributes.PROMPT_TOOL_CALL_ID,
+)
+# Keys for each tool call in a prompt message, in the order (id, name, arguments)
+PROMPT_TOOL_CALL_KEYS = IndexedKeyTable(
+    MessageAttributes.PROMPT_TOOL_CALLS_ID,
+    MessageAttributes.PROMPT_TOOL_CALLS_NAME,
+    MessageAttributes.PROMPT_TOOL_CALLS_ARGUMENTS,
+)
+
 
 def _create_tool_span(parent_span, tool_call_data):
     """
@@ -112,17 +125,17 @@ def handle_chat_attributes(
         if should_send_prompts() and "messages" in kwargs:
             messages = kwargs["messages"]
             for i, msg in enumerate(messages):
-                prefix = f"{SpanAttributes.LLM_PROMPTS}.{i}"
+                role_key, content_key, tool_call_id_key = PROMPT_KEYS.keys(i)
                 if "role" in msg:
-                    attributes[f"{prefix}.role"] = msg["role"]
+                    attributes[role_key] = msg["role"]
                 if "content" in msg:
                     content = msg["content"]
                     if isinstance(content, list):
                         # Handle multi-modal content
                         content = json.dumps(content)
-                    attributes[f"{prefix}.content"] = content
+                    attributes[content_key] = content
                 if "tool_call_id" in msg:
-                    attributes[f"{prefix}.tool_call_id"] = msg["tool_call_id"]
+                    attributes[tool_call_id_key] = msg["tool_call_id"]
 
                 # Tool calls
                 if "tool_calls" in msg:
@@ -132,9 +145,10 @@ def handle_chat_attributes(
                             if is_openai_v1() and hasattr(tool_call, "__dict__"):
                                 tool_call = model_as_dict(tool_call)
                             function = tool_call.get("function", {})
-                            attributes[f"{prefix}.tool_calls.{j}.id"] = tool_call.get("id")
-                            attributes[f"{prefix}.tool_calls.{j}.name"] = function.get("name")
-                            attributes[f"{prefix}.tool_calls.{j}.arguments"] = function.get("arguments")
+                            id_key, name_key, arguments_key = PROMPT_TOOL_CALL_KEYS.keys(i, j)
+                            attributes[id_key] = tool_call.get("id")
+                            attributes[name_key] = function.get("name")
+                            attributes[arguments_key] = function.get("arguments")
 
         # Functions
         if "functions" in kwargs:
@@ -0,0 +1,10 @@
+"""
+Instrumentation for asyncio.
+
+This module provides automatic instrumentation for event loops to ensure
+proper OpenTelemetry context propagation into executor threads.
+"""
+
+from .instrumentation import AsyncioInstrumentor
+
+__all__ = ["AsyncioInstrumentor"]
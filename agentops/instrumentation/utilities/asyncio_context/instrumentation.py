@@ -0,0 +1,117 @@
+"""
+OpenTelemetry Instrumentation for asyncio.
+
+Tasks created with `asyncio.create_task`, `asyncio.gather` or a `TaskGroup`
+already run in a copy of the context they were created in, so spans started
+inside them nest under the span that was current when they were created.
+`loop.run_in_executor` does not: the function runs in an executor thread with
+whatever context that thread was left with, detaching its spans from the
+calling coroutine's trace. This instrumentation patches it to run the function
+in a copy of the caller's context, which is what `asyncio.to_thread` does.
+The context is only copied while a span is current, so untraced code pays no
+more than a context lookup per call.
+"""
+
+import contextvars
+import functools
+from asyncio import base_events
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Collection, Dict, List
+
+from opentelemetry import trace
+
+from agentops.instrumentation.common import CommonInstrumentor, InstrumentorConfig
+from agentops.instrumentation.common.wrappers import WrapConfig
+from agentops.logging import logger
+
+
+def _runs_in_context(func: Callable) -> bool:
+    """Whether `func` is already bound to a context, as `asyncio.to_thread` does."""
+    return isinstance(func, functools.partial) and isinstance(getattr(func.func, "__self__", None), contextvars.Context)
+
+
+def _context_propagating_run_in_executor(original_run_in_executor: Callable) -> Callable:
+    """Wrap BaseEventLoop.run_in_executor to run the function in the caller's context."""
+
+    @functools.wraps(original_run_in_executor)
+    def wrapped_run_in_executor(self: base_events.BaseEventLoop, executor: Any, func: Callable, *args: Any) -> Any:
+        # Without a current span there is no trace for the function to join
+        if not trace.get_current_span().get_span_context().is_valid:
+            return original_run_in_executor(self, executor, func, *args)
+        # Contexts can't be pickled; process pools carry the span context on submit instead
+        if isinstance(executor, ProcessPoolExecutor) or _runs_in_context(func):
+            return original_run_in_executor(self, executor, func, *args)
+        return original_run_in_executor(self, executor, functools.partial(contextvars.copy_context().run, func), *args)
+
+    return wrapped_run_in_executor
+
+
+class AsyncioInstrumentor(CommonInstrumentor):
+    """
+    Instrumentor for asyncio.
+
+    This instrumentor patches the event loop's run_in_executor to automatically
+    propagate OpenTelemetry context to the executor thread, so spans started by
+    blocking calls offloaded from a coroutine stay in the coroutine's trace.
+    """
+
+    def __init__(self):
+        """Initialize the asyncio instrumentor."""
+        config = InstrumentorConfig(
+            library_name="agentops.instrumentation.asyncio",
+            library_version="0.1.0",
+            wrapped_methods=[],  # We handle wrapping manually
+            metrics_enabled=False,  # No metrics needed for context propagation
+            dependencies=[],
+        )
+        super().__init__(config)
+        self._original_run_in_executor = None
+
+    def instrumentation_dependencies(self) -> Collection[str]:
+        """Return a list of instrumentation dependencies."""
+        return []
+
+    def _get_wrapped_methods(self) -> List[WrapConfig]:
+        """
+        Return list of methods to be wrapped.
+
+        For asyncio, we don't use the standard wrapping mechanism
+        since we're patching methods directly for context propagation.
+        """
+        return []
+
+    def _create_metrics(self, meter) -> Dict[str, Any]:
+        """
+        Create metrics for this instrumentor.
+
+        This instrumentor doesn't need metrics as it's purely for context propagation.
+
+        Args:
+            meter: The meter instance (unused)
+
+        Returns:
+            Empty dict since no metrics are needed
+        """
+        return {}
+
+    def _instrument(self, **kwargs: Any) -> None:
+        """Instrument the asyncio event loop."""
+        # Note: We don't call super()._instrument() here because we're not using
+        # the standard wrapping mechanism for this special instrumentor
+
+        logger.debug("[AsyncioInstrumentor] Starting instrumentation")
+
+        self._original_run_in_executor = base_events.BaseEventLoop.run_in_executor
+        base_events.BaseEventLoop.run_in_executor = _context_propagating_run_in_executor(self._original_run_in_executor)
+
+        logger.info("[AsyncioInstrumentor] Successfully instrumented asyncio.BaseEventLoop.run_in_executor")
+
+    def _uninstrument(self, **kwargs: Any) -> None:
+        """Uninstrument the asyncio event loop."""
+        logger.debug("[AsyncioInstrumentor] Starting uninstrumentation")
+
+        if self._original_run_in_executor:
+            base_events.BaseEventLoop.run_in_executor = self._original_run_in_executor
+            self._original_run_in_executor = None
+
+        logger.info("[AsyncioInstrumentor] Successfully uninstrumented asyncio.BaseEventLoop.run_in_executor")
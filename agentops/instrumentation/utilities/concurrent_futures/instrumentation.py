@@ -3,16 +3,26 @@ OpenTelemetry Instrumentation for concurrent.futures module.
 
 This instrumentation automatically patches ThreadPoolExecutor to ensure proper
 context propagation across thread boundaries, preventing "NEW TRACE DETECTED" issues.
+ProcessPoolExecutor and multiprocessing.Pool are patched to carry the span context
+to worker processes and to forward the spans created there back to the parent.
 """
 
 import contextvars
 import functools
+import multiprocessing
+import multiprocessing.pool
 from typing import Any, Callable, Collection, Optional, Tuple, TypeVar, List, Dict
 
-from concurrent.futures import ThreadPoolExecutor, Future
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
 
 from agentops.instrumentation.common import CommonInstrumentor, InstrumentorConfig
 from agentops.instrumentation.common.wrappers import WrapConfig
+from agentops.instrumentation.utilities.concurrent_futures.process import (
+    get_collector,
+    initialize_worker,
+    inject_context,
+    run_with_context,
+)
 from agentops.logging import logger
 
 # Store original methods to restore during uninstrumentation
@@ -89,6 +99,91 @@ def _context_propagating_submit(original_submit: Callable) -> Callable:
     return wrapped_submit
 
 
+def _forwarding_initializer(
+    multiprocessing_context, initializer: Optional[Callable], initargs: Tuple
+) -> Tuple[Optional[Callable], Tuple]:
+    """Return the initializer and initargs that make workers forward their spans to this process."""
+    collector = get_collector(multiprocessing_context)
+    if collector is None:
+        return initializer, initargs
+    return initialize_worker, (collector.queue, initializer, tuple(initargs))
+
+
+def _context_propagating_process_init(original_init: Callable) -> Callable:
+    """Wrap ProcessPoolExecutor.__init__ so workers forward their spans to this process."""
+
+    @functools.wraps(original_init)
+    def wrapped_init(
+        self: ProcessPoolExecutor,
+        max_workers: Optional[int] = None,
+        mp_context: Any = None,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+        **kwargs: Any,
+    ) -> None:
+        # Same default ProcessPoolExecutor resolves a missing mp_context to
+        mp_context = mp_context or multiprocessing.get_context()
+        initializer, initargs = _forwarding_initializer(mp_context, initializer, initargs)
+        original_init(
+            self,
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=initializer,
+            initargs=initargs,
+            **kwargs,
+        )
+
+    return wrapped_init
+
+
+def _context_propagating_process_submit(original_submit: Callable) -> Callable:
+    """Wrap ProcessPoolExecutor.submit to carry the current span context to the worker."""
+
+    @functools.wraps(original_submit)
+    def wrapped_submit(self: ProcessPoolExecutor, fn: Callable[..., R], /, *args: Any, **kwargs: Any) -> Future[R]:
+        return original_submit(self, run_with_context, inject_context(), fn, *args, **kwargs)
+
+    return wrapped_submit
+
+
+def _context_propagating_pool_init(original_init: Callable) -> Callable:
+    """Wrap multiprocessing.pool.Pool.__init__ so workers forward their spans to this process."""
+
+    @functools.wraps(original_init)
+    def wrapped_init(
+        self: multiprocessing.pool.Pool,
+        processes: Optional[int] = None,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # ThreadPool workers share this process and its tracer provider
+        if not isinstance(self, multiprocessing.pool.ThreadPool):
+            pool_context = kwargs.get("context") or (args[1] if len(args) > 1 else None)
+            initializer, initargs = _forwarding_initializer(
+                pool_context or multiprocessing.get_context(), initializer, initargs
+            )
+        original_init(self, processes, initializer, initargs, *args, **kwargs)
+
+    return wrapped_init
+
+
+def _context_propagating_pool_method(original_method: Callable) -> Callable:
+    """Wrap a multiprocessing.pool.Pool method taking a callable to carry the current span context."""
+
+    @functools.wraps(original_method)
+    def wrapped_method(self: multiprocessing.pool.Pool, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        return original_method(self, functools.partial(run_with_context, inject_context(), func), *args, **kwargs)
+
+    return wrapped_method
+
+
+# Pool methods receiving the user's callable; apply, map, starmap and their
+# async variants all go through apply_async or _map_async.
+_POOL_METHODS = ("apply_async", "_map_async", "imap", "imap_unordered")
+
+
 class ConcurrentFuturesInstrumentor(CommonInstrumentor):
     """
     Instrumentor for concurrent.futures module.
@@ -96,6 +191,10 @@ class ConcurrentFuturesInstrumentor(CommonInstrumentor):
     This instrumentor patches ThreadPoolExecutor to automatically propagate
     OpenTelemetry context to worker threads, ensuring all LLM calls and other
     instrumented operations maintain proper trace context.
+
+    ProcessPoolExecutor and multiprocessing.Pool are patched as well: submitted
+    work runs under the submitting span context, and spans created in worker
+    processes are sent back to this process and exported with its own.
     """
 
     def __init__(self):
@@ -110,6 +209,9 @@ class ConcurrentFuturesInstrumentor(CommonInstrumentor):
         super().__init__(config)
         self._original_init = None
         self._original_submit = None
+        self._original_process_init = None
+        self._original_process_submit = None
+        self._original_pool_methods: Dict[str, Callable] = {}
 
     def instrumentation_dependencies(self) -> Collection[str]:
         """Return a list of instrumentation dependencies."""
@@ -153,7 +255,23 @@ class ConcurrentFuturesInstrumentor(CommonInstrumentor):
         ThreadPoolExecutor.__init__ = _context_propagating_init(self._original_init)
         ThreadPoolExecutor.submit = _context_propagating_submit(self._original_submit)
 
-        logger.info("[ConcurrentFuturesInstrumentor] Successfully instrumented concurrent.futures.ThreadPoolExecutor")
+        # Patch process pools
+        self._original_process_init = ProcessPoolExecutor.__init__
+        self._original_process_submit = ProcessPoolExecutor.submit
+        ProcessPoolExecutor.__init__ = _context_propagating_process_init(self._original_process_init)
+        ProcessPoolExecutor.submit = _context_propagating_process_submit(self._original_process_submit)
+
+        Pool = multiprocessing.pool.Pool
+        self._original_pool_methods = {"__init__": Pool.__init__}
+        Pool.__init__ = _context_propagating_pool_init(Pool.__init__)
+        for name in _POOL_METHODS:
+            original_method = getattr(Pool, name)
+            self._original_pool_methods[name] = original_method
+            setattr(Pool, name, _context_propagating_pool_method(original_method))
+
+        logger.info(
+            "[ConcurrentFuturesInstrumentor] Successfully instrumented concurrent.futures executors and multiprocessing.Pool"
+        )
 
     def _uninstrument(self, **kwargs: Any) -> None:
         """Uninstrument the concurrent.futures module."""
@@ -171,7 +289,21 @@ class ConcurrentFuturesInstrumentor(CommonInstrumentor):
             ThreadPoolExecutor.submit = self._original_submit
             self._original_submit = None
 
-        logger.info("[ConcurrentFuturesInstrumentor] Successfully uninstrumented concurrent.futures.ThreadPoolExecutor")
+        if self._original_process_init:
+            ProcessPoolExecutor.__init__ = self._original_process_init
+            self._original_process_init = None
+
+        if self._original_process_submit:
+            ProcessPoolExecutor.submit = self._original_process_submit
+            self._original_process_submit = None
+
+        for name, original_method in self._original_pool_methods.items():
+            setattr(multiprocessing.pool.Pool, name, original_method)
+        self._original_pool_methods = {}
+
+        logger.info(
+            "[ConcurrentFuturesInstrumentor] Successfully uninstrumented concurrent.futures executors and multiprocessing.Pool"
+        )
 
     @staticmethod
     def instrument_module_directly() -> bool:
@@ -0,0 +1,271 @@
+"""
+Cross-process trace propagation for process pools.
+
+Work submitted to a `ProcessPoolExecutor` or `multiprocessing.Pool` runs in
+another interpreter, so neither the active span nor the SDK's exporter come
+along. This module provides the pieces the concurrent.futures instrumentor
+uses to keep such work inside the submitting trace:
+
+- On submit, the current span context is serialized into a W3C trace-context
+  carrier and the callable is wrapped with `run_with_context()`, which
+  re-attaches it in the worker.
+- Each worker process is initialized with `initialize_worker()`, which routes
+  its spans to a `ForwardingSpanExporter`. Instead of bootstrapping its own
+  connection to AgentOps, the worker sends finished spans back to the parent
+  through a pipe, one message per batch.
+- In the parent, a `SpanCollector` reads those batches and feeds the spans to
+  the parent's span processors, so they are exported in batches together with
+  the parent's own spans, under the parent's resource.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from opentelemetry import context as context_api
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import Event, ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.trace import Link, SpanContext, SpanKind, TraceFlags, TraceState
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+from opentelemetry.trace.status import Status, StatusCode
+
+from agentops.logging import logger
+
+_propagator = TraceContextTextMapPropagator()
+
+# Set in worker processes by initialize_worker(), flushed after every task
+_worker_processor: Optional[SpanProcessor] = None
+
+# start method -> collector reading spans forwarded by workers of that start method
+_collectors: Dict[str, "SpanCollector"] = {}
+_collectors_lock = threading.Lock()
+
+
+def inject_context() -> Dict[str, str]:
+    """Serialize the current span context into a carrier that can be sent to another process."""
+    carrier: Dict[str, str] = {}
+    _propagator.inject(carrier)
+    return carrier
+
+
+def run_with_context(carrier: Dict[str, str], func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run `func` in a worker with the submitting span context attached.
+
+    Spans the worker created are forwarded to the parent before the result is
+    returned, so they reach the parent before the caller sees the result.
+    """
+    token = context_api.attach(_propagator.extract(carrier)) if carrier else None
+    try:
+        return func(*args, **kwargs)
+    finally:
+        if token is not None:
+            context_api.detach(token)
+        if _worker_processor is not None:
+            _worker_processor.force_flush()
+
+
+def _serialize_span_context(span_context: Optional[SpanContext]) -> Optional[Tuple[int, int, int, str]]:
+    if span_context is None:
+        return None
+    trace_state = span_context.trace_state.to_header() if span_context.trace_state else ""
+    return (span_context.trace_id, span_context.span_id, int(span_context.trace_flags), trace_state)
+
+
+def _deserialize_span_context(data: Optional[Tuple[int, int, int, str]]) -> Optional[SpanContext]:
+    if data is None:
+        return None
+    trace_id, span_id, trace_flags, trace_state = data
+    return SpanContext(
+        trace_id=trace_id,
+        span_id=span_id,
+        is_remote=False,
+        trace_flags=TraceFlags(trace_flags),
+        trace_state=TraceState.from_header([trace_state]) if trace_state else None,
+    )
+
+
+def serialize_span(span: ReadableSpan) -> Dict[str, Any]:
+    """Convert a finished span into plain, picklable data.
+
+    The resource is left out; the parent exports the span under its own.
+    """
+    scope = span.instrumentation_scope
+    return {
+        "name": span.name,
+        "context": _serialize_span_context(span.context),
+        "parent": _serialize_span_context(span.parent),
+        "kind": span.kind.value,
+        "attributes": dict(span.attributes or {}),
+        "events": [(event.name, dict(event.attributes or {}), event.timestamp) for event in span.events],
+        "links": [(_serialize_span_context(link.context), dict(link.attributes or {})) for link in span.links],
+        "status": (span.status.status_code.value, span.status.description),
+        "start_time": span.start_time,
+        "end_time": span.end_time,
+        "scope": (scope.name, scope.version, scope.schema_url) if scope else None,
+    }
+
+
+def deserialize_span(data: Dict[str, Any], resource=None) -> ReadableSpan:
+    """Rebuild a span serialized with `serialize_span()`."""
+    status_code, description = data["status"]
+    scope = data["scope"]
+    return ReadableSpan(
+        name=data["name"],
+        context=_deserialize_span_context(data["context"]),
+        parent=_deserialize_span_context(data["parent"]),
+        resource=resource,
+        attributes=data["attributes"],
+        events=[Event(name, attributes, timestamp) for name, attributes, timestamp in data["events"]],
+        links=[Link(_deserialize_span_context(context), attributes) for context, attributes in data["links"]],
+        kind=SpanKind(data["kind"]),
+        status=Status(StatusCode(status_code), description),
+        start_time=data["start_time"],
+        end_time=data["end_time"],
+        instrumentation_scope=InstrumentationScope(*scope) if scope else None,
+    )
+
+
+class ForwardingSpanExporter(SpanExporter):
+    """Exporter used in worker processes that sends spans to the parent process.
+
+    Each export call puts a single message, the serialized batch, on `queue`.
+    """
+
+    def __init__(self, queue):
+        self._queue = queue
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        try:
+            self._queue.put([serialize_span(span) for span in spans])
+        except Exception as e:
+            logger.debug(f"[ConcurrentFuturesInstrumentor] Could not forward spans to parent process: {e}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+def initialize_worker(queue, initializer: Optional[Callable] = None, initargs: Tuple = ()) -> None:
+    """Process pool initializer that forwards the worker's spans to the parent.
+
+    In a forked worker the parent's tracer provider was copied along with its
+    processors; they are replaced so the worker doesn't export on its own.
+    Workers started with spawn or forkserver get a fresh provider.
+    """
+    global _worker_processor
+
+    processor = BatchSpanProcessor(ForwardingSpanExporter(queue))
+    provider = trace.get_tracer_provider()
+    if isinstance(provider, TracerProvider):
+        active_processor = provider._active_span_processor
+        with active_processor._lock:
+            active_processor._span_processors = (processor,)
+    else:
+        provider = TracerProvider()
+        provider.add_span_processor(processor)
+        trace.set_tracer_provider(provider)
+
+    # Collectors copied from a forked parent belong to the parent; nested pools get their own
+    with _collectors_lock:
+        _collectors.clear()
+    _worker_processor = processor
+
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        finally:
+            processor.force_flush()
+
+
+class SpanCollector(SpanProcessor):
+    """Feeds spans forwarded by worker processes to the parent's span processors.
+
+    The collector is installed as the first processor of the parent's tracer
+    provider, so flushing or shutting the provider down first drains spans
+    still in the pipe into the processors that export them.
+    """
+
+    def __init__(self, multiprocessing_context, provider: TracerProvider):
+        self.queue = multiprocessing_context.SimpleQueue()
+        self._provider = provider
+        self._condition = threading.Condition()
+        self._flushes_requested = 0
+        self._flushes_done = 0
+        self._reader = threading.Thread(name="AgentOpsSpanCollector", target=self._run, daemon=True)
+        self._reader.start()
+
+    def _run(self) -> None:
+        while True:
+            message = self.queue.get()
+            if message is None:
+                return
+            if isinstance(message, int):
+                with self._condition:
+                    self._flushes_done = message
+                    self._condition.notify_all()
+                continue
+            self._process(message)
+
+    def _process(self, batch: List[Dict[str, Any]]) -> None:
+        active_processor = self._provider._active_span_processor
+        for data in batch:
+            try:
+                active_processor.on_end(deserialize_span(data, self._provider.resource))
+            except Exception as e:
+                logger.debug(f"[ConcurrentFuturesInstrumentor] Could not process forwarded span: {e}")
+
+    def on_start(self, span, parent_context: Optional[Context] = None) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Wait until every span already forwarded to the parent has been processed."""
+        if not self._reader.is_alive():
+            return True
+        with self._condition:
+            self._flushes_requested += 1
+            marker = self._flushes_requested
+            self.queue.put(marker)
+            return self._condition.wait_for(lambda: self._flushes_done >= marker, timeout_millis / 1000)
+
+    def shutdown(self) -> None:
+        if self._reader.is_alive():
+            self.force_flush()
+            self.queue.put(None)
+            self._reader.join(timeout=5)
+        with _collectors_lock:
+            for start_method, collector in list(_collectors.items()):
+                if collector is self:
+                    del _collectors[start_method]
+
+
+def get_collector(multiprocessing_context) -> Optional[SpanCollector]:
+    """Return the collector for workers started with `multiprocessing_context`.
+
+    Returns None if the SDK's tracer provider isn't set up, in which case
+    workers are left to themselves.
+    """
+    provider = trace.get_tracer_provider()
+    if not isinstance(provider, TracerProvider):
+        return None
+
+    start_method = multiprocessing_context.get_start_method()
+    with _collectors_lock:
+        collector = _collectors.get(start_method)
+        if collector is not None and collector._provider is provider:
+            return collector
+
+        collector = SpanCollector(multiprocessing_context, provider)
+        active_processor = provider._active_span_processor
+        with active_processor._lock:
+            active_processor._span_processors = (collector,) + active_processor._span_processors
+        _collectors[start_method] = collector
+        return collector
@@ -9,15 +9,16 @@ from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExp
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider, Span
+from opentelemetry.sdk.trace import SpanLimits, TracerProvider, Span
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry import context as context_api
 
 from agentops.exceptions import AgentOpsClientNotInitializedException
 from agentops.logging import logger, setup_print_logger
-from agentops.sdk.processors import InternalSpanProcessor
+from agentops.sdk.processors import InternalSpanProcessor, ProfiledSpanProcessor, TraceBatchSpanProcessor
 from agentops.sdk.types import TracingConfig
-from agentops.sdk.exporters import AuthenticatedOTLPExporter
+from agentops.sdk.exporters import AuthenticatedOTLPExporter, ProfiledSpanExporter
+from agentops.helpers.overhead import create_overhead_metrics, enable_overhead_profiling
 from agentops.sdk.attributes import (
     get_global_resource_attributes,
     get_trace_attributes,
@@ -84,6 +85,9 @@ def setup_telemetry(
     max_wait_time: int = 5000,
     export_flush_interval: int = 1000,
     jwt_provider: Optional[Callable[[], Optional[str]]] = None,
+    deferred_attribute_extraction: bool = False,
+    batch_by_trace: bool = False,
+    profile_overhead: bool = False,
 ) -> tuple[TracerProvider, MeterProvider]:
     """
     Setup the telemetry system.
@@ -97,6 +101,12 @@ def setup_telemetry(
         max_wait_time: Maximum time in milliseconds to wait before flushing
         export_flush_interval: Time interval in milliseconds between automatic exports of telemetry data
         jwt_provider: Function that returns the current JWT token
+        deferred_attribute_extraction: Extract LLM call attributes on the export thread instead of the caller's.
+            They are resolved by the exporter, so span processors, including `InternalSpanProcessor`,
+            never see them
+        batch_by_trace: Export each trace's spans together when its root span ends, with `max_queue_size`
+            and `max_wait_time` capping how many spans and for how long a trace is buffered
+        profile_overhead: Measure the time AgentOps adds to instrumented code and report it as metrics
 
     Returns:
         Tuple of (TracerProvider, MeterProvider)
@@ -108,7 +118,8 @@ def setup_telemetry(
     )
 
     resource = Resource(resource_attrs)
-    provider = TracerProvider(resource=resource)
+    span_limits = SpanLimits()
+    provider = TracerProvider(resource=resource, span_limits=span_limits)
 
     # Set as global provider
     trace.set_tracer_provider(provider)
@@ -116,14 +127,37 @@ def setup_telemetry(
     # Create exporter with dynamic JWT support
     exporter = AuthenticatedOTLPExporter(endpoint=exporter_endpoint, jwt_provider=jwt_provider)
 
-    # Regular processor for normal spans and immediate export
-    processor = BatchSpanProcessor(
-        exporter,
-        max_export_batch_size=max_queue_size,
-        schedule_delay_millis=export_flush_interval,
-    )
-    provider.add_span_processor(processor)
+    # Imported here since the instrumentation package imports this module
+    from agentops.instrumentation.common.deferred import DeferredAttributeExporter, enable_deferred_extraction
+
+    # Wrappers hand their attribute extraction to the batch processor's worker thread
+    if deferred_attribute_extraction:
+        exporter = DeferredAttributeExporter(exporter, span_limits=span_limits)
+    enable_deferred_extraction(deferred_attribute_extraction)
+
+    if profile_overhead:
+        exporter = ProfiledSpanExporter(exporter)
+
+    if batch_by_trace:
+        # Buffers spans per trace and exports them together when the trace ends
+        processor = TraceBatchSpanProcessor(
+            exporter,
+            max_spans_per_trace=max_queue_size,
+            max_trace_age_millis=max_wait_time,
+            schedule_delay_millis=export_flush_interval,
+        )
+    else:
+        # Regular processor for normal spans and immediate export
+        processor = BatchSpanProcessor(
+            exporter,
+            max_export_batch_size=max_queue_size,
+            schedule_delay_millis=export_flush_interval,
+        )
     internal_processor = InternalSpanProcessor()  # Catches spans for AgentOps on-terminal printing
+    if profile_overhead:
+        processor = ProfiledSpanProcessor(processor)
+        internal_processor = ProfiledSpanProcessor(internal_processor)
+    provider.add_span_processor(processor)
     provider.add_span_processor(internal_processor)
 
     # Setup metrics with JWT provider
@@ -137,6 +171,11 @@ def setup_telemetry(
     meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
     metrics.set_meter_provider(meter_provider)
 
+    # Report the SDK's own overhead alongside the instrumentation metrics
+    if profile_overhead:
+        create_overhead_metrics(meter_provider.get_meter("agentops.overhead"))
+    enable_overhead_profiling(profile_overhead)
+
     ### Logging
     setup_print_logger()
 
@@ -163,6 +202,7 @@ class TracingCore:
         self._initialized = False
         self._config: Optional[TracingConfig] = None
         self._span_processors: list = []
+        self._trace_processor: Optional[TraceBatchSpanProcessor] = None
         self._active_traces: dict = {}
         self._traces_lock = threading.Lock()
         self._jwt_provider: Optional[Callable[[], Optional[str]]] = None
@@ -185,6 +225,9 @@ class TracingCore:
                 max_wait_time: Maximum time in milliseconds to wait before flushing
                 api_key: API key for authentication (required for authenticated exporter)
                 project_id: Project ID to include in resource attributes
+                deferred_attribute_extraction: Extract LLM call attributes on the export thread
+                batch_by_trace: Export each trace's spans together when its root span ends
+                profile_overhead: Measure the time AgentOps adds to instrumented code
         """
         if self._initialized:
             return
@@ -199,6 +242,9 @@ class TracingCore:
         kwargs.setdefault("max_queue_size", 512)
         kwargs.setdefault("max_wait_time", 5000)
         kwargs.setdefault("export_flush_interval", 1000)
+        kwargs.setdefault("deferred_attribute_extraction", False)
+        kwargs.setdefault("batch_by_trace", False)
+        kwargs.setdefault("profile_overhead", False)
 
         # Create a TracingConfig from kwargs with proper defaults
         config: TracingConfig = {
@@ -210,6 +256,9 @@ class TracingCore:
             "export_flush_interval": kwargs["export_flush_interval"],
             "api_key": kwargs.get("api_key"),
             "project_id": kwargs.get("project_id"),
+            "deferred_attribute_extraction": kwargs["deferred_attribute_extraction"],
+            "batch_by_trace": kwargs["batch_by_trace"],
+            "profile_overhead": kwargs["profile_overhead"],
         }
 
         self._config = config
@@ -224,10 +273,14 @@ class TracingCore:
             max_wait_time=config["max_wait_time"],
             export_flush_interval=config["export_flush_interval"],
             jwt_provider=jwt_provider,
+            deferred_attribute_extraction=config["deferred_attribute_extraction"],
+            batch_by_trace=config["batch_by_trace"],
+            profile_overhead=config["profile_overhead"],
         )
 
         self.provider = provider
         self._meter_provider = meter_provider
+        self._trace_processor = self._find_trace_processor()
 
         self._initialized = True
         logger.debug("Tracing core initialized")
@@ -302,6 +355,18 @@ class TracingCore:
 
         finally:
             self._initialized = False
+            self._trace_processor = None
+
+    def _find_trace_processor(self) -> Optional[TraceBatchSpanProcessor]:
+        """Return the provider's trace-batching span processor, if it has one."""
+        # TracerProvider doesn't expose its processors publicly
+        active_processor = getattr(self.provider, "_active_span_processor", None)
+        for processor in getattr(active_processor, "_span_processors", ()):
+            if isinstance(processor, ProfiledSpanProcessor):
+                processor = processor.processor
+            if isinstance(processor, TraceBatchSpanProcessor):
+                return processor
+        return None
 
     def _flush_span_processors(self) -> None:
         """Helper to force flush all span processors."""
@@ -366,6 +431,9 @@ class TracingCore:
                     "api_key": getattr(config_obj, "api_key", None),
                     "project_id": getattr(config_obj, "project_id", None),
                     "endpoint": getattr(config_obj, "endpoint", None),
+                    "deferred_attribute_extraction": getattr(config_obj, "deferred_attribute_extraction", None),
+                    "batch_by_trace": getattr(config_obj, "batch_by_trace", None),
+                    "profile_overhead": getattr(config_obj, "profile_overhead", None),
                 }.items()
                 if v is not None
             }
@@ -428,7 +496,10 @@ class TracingCore:
         return trace_context
 
     def end_trace(
-        self, trace_context: Optional[TraceContext] = None, end_state: Union[Any, StatusCode, str] = None
+        self,
+        trace_context: Optional[TraceContext] = None,
+        end_state: Union[Any, StatusCode, str] = None,
+        flush: bool = False,
     ) -> None:
         """
         Ends a trace (its root span) and finalizes it.
@@ -437,6 +508,8 @@ class TracingCore:
         Args:
             trace_context: The TraceContext object returned by start_trace. If None, ends all active traces.
             end_state: The final state of the trace (e.g., "Success", "Indeterminate", "Error").
+            flush: Wait until the trace's spans have been exported before returning. With trace batching
+                enabled this only waits for the spans of the ended trace.
         """
         if not self.initialized:
             logger.warning("Global tracer not initialized. Cannot end trace.")
@@ -455,19 +528,22 @@ class TracingCore:
                 logger.debug(f"Ending all {len(active_traces)} active traces with state: {end_state}")
 
             for active_trace in active_traces:
-                self._end_single_trace(active_trace, end_state)
+                self._end_single_trace(active_trace, end_state, flush=flush)
             return
 
         # End specific trace
-        self._end_single_trace(trace_context, end_state)
+        self._end_single_trace(trace_context, end_state, flush=flush)
 
-    def _end_single_trace(self, trace_context: TraceContext, end_state: Union[Any, StatusCode, str]) -> None:
+    def _end_single_trace(
+        self, trace_context: TraceContext, end_state: Union[Any, StatusCode, str], flush: bool = False
+    ) -> None:
         """
         Internal method to end a single trace.
 
         Args:
             trace_context: The TraceContext object to end.
             end_state: The final state of the trace.
+            flush: Wait until the trace's spans have been exported.
         """
         if not trace_context or not trace_context.span:
             logger.warning("Invalid TraceContext or span provided to end trace.")
@@ -509,8 +585,13 @@ class TracingCore:
                     del self._active_traces[trace_id]
                     logger.debug(f"Removed trace {trace_id} from active traces. Remaining: {len(self._active_traces)}")
 
-            # For root spans (traces), we might want an immediate flush after they end.
-            self._flush_span_processors()
+            if self._trace_processor is not None:
+                # The processor exports the trace as soon as its root span ends; only wait for it if asked to
+                if flush:
+                    self._trace_processor.flush_trace(span.get_span_context().trace_id)
+            else:
+                # For root spans (traces), we might want an immediate flush after they end.
+                self._flush_span_processors()
 
             # Log the session replay URL again after the trace has ended
             # The span object should still contain the necessary context (trace_id)
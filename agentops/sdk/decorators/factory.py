@@ -5,6 +5,7 @@ from typing import Any, Dict, Callable, Optional, Union
 
 
 import wrapt  # type: ignore
+from opentelemetry import trace
 
 from agentops.logging import logger
 from agentops.sdk.core import TraceContext, tracer
@@ -22,6 +23,333 @@ from agentops.sdk.decorators.utility import (
 )
 
 
+# Signature shared by the precompiled call paths: (wrapped_func, args, kwargs) -> result
+EntityCall = Callable[[Callable[..., Any], tuple, Dict[str, Any]], Any]
+
+
+def _parent_is_unsampled() -> bool:
+    """
+    Whether the current span is a valid span that was not sampled.
+
+    The SDK uses OpenTelemetry's default parent-based sampler, so children of an
+    unsampled span are never recorded either; decorated calls under one skip span
+    creation and input/output serialization entirely.
+    """
+    span_context = trace.get_current_span().get_span_context()
+    return span_context.is_valid and not span_context.trace_flags.sampled
+
+
+def _record_http_request(operation_name: str, version: Optional[Any]) -> None:
+    with _create_as_current_span(
+        f"{operation_name}.request",
+        SpanKind.HTTP,
+        version=version,
+        attributes={SpanAttributes.HTTP_METHOD: "REQUEST"},
+    ) as request_span:
+        try:
+            request_data = _extract_request_data()
+            if request_data:
+                # Set HTTP attributes
+                if request_data.get("method"):
+                    request_span.set_attribute(SpanAttributes.HTTP_METHOD, request_data["method"])
+                if request_data.get("url"):
+                    request_span.set_attribute(SpanAttributes.HTTP_URL, request_data["url"])
+
+                # Record the full request data
+                _record_entity_input(request_span, (request_data,), {})
+        except Exception as e:
+            logger.warning(f"Failed to record HTTP request for '{operation_name}': {e}")
+
+
+def _record_http_response(operation_name: str, version: Optional[Any], result: Any) -> None:
+    with _create_as_current_span(
+        f"{operation_name}.response",
+        SpanKind.HTTP,
+        version=version,
+        attributes={SpanAttributes.HTTP_METHOD: "RESPONSE"},
+    ) as response_span:
+        try:
+            response_data = _extract_response_data(result)
+            if response_data:
+                # Set HTTP attributes
+                if response_data.get("status_code"):
+                    response_span.set_attribute(SpanAttributes.HTTP_STATUS_CODE, response_data["status_code"])
+
+                # Record the full response data
+                _record_entity_output(response_span, response_data)
+        except Exception as e:
+            logger.warning(f"Failed to record HTTP response for '{operation_name}': {e}")
+
+
+def _end_trace(trace_context: Optional[TraceContext], label: str) -> None:
+    """End a trace started by a decorator if it's still open."""
+    if trace_context and trace_context.span.is_recording():
+        logger.warning(f"Trace for {label} not explicitly ended. Ending as 'Unknown'.")
+        tracer.end_trace(trace_context, "Unknown")
+
+
+def _compile_call(
+    entity_kind: str,
+    func: Callable[..., Any],
+    *,
+    name: Optional[str],
+    version: Optional[Any],
+    tags: Optional[Union[list, dict]],
+    cost: Any,
+    spec: Any,
+    capture_request: bool,
+    capture_response: bool,
+) -> EntityCall:
+    """
+    Build the call path for a decorated function once, at decoration time.
+
+    The function's shape (sync, async, generator, async generator) and the
+    entity kind decide which path is used, so none of that is re-inspected
+    on each call.
+    """
+    # staticmethod/classmethod objects expose the underlying function as __func__
+    target = getattr(func, "__func__", func)
+    operation_name = name or getattr(target, "__name__", type(target).__name__)
+    is_async = asyncio.iscoroutinefunction(target)
+    is_generator = inspect.isgeneratorfunction(target)
+    is_async_generator = inspect.isasyncgenfunction(target)
+
+    record_cost = entity_kind == "tool" and cost is not None
+    record_spec = entity_kind == "guardrail" and spec in ("input", "output")
+    spec_attribute = SpanAttributes.AGENTOPS_DECORATOR_SPEC.format(entity_kind=entity_kind)
+
+    def span_attributes() -> Optional[Dict[str, Any]]:
+        # span helpers add to the dict they're given, so build a new one each call
+        return {CoreAttributes.TAGS: tags} if tags else None
+
+    def record_input(span: Any, args: tuple, kwargs: Dict[str, Any]) -> None:
+        if not span.is_recording():
+            return
+        try:
+            _record_entity_input(span, args, kwargs, entity_kind=entity_kind)
+            # Set cost attribute if tool
+            if record_cost:
+                span.set_attribute(SpanAttributes.LLM_USAGE_TOOL_COST, cost)
+            # Set spec attribute if guardrail
+            if record_spec:
+                span.set_attribute(spec_attribute, spec)
+        except Exception as e:
+            logger.warning(f"Input recording failed for '{operation_name}': {e}")
+
+    def record_output(span: Any, result: Any) -> None:
+        if not span.is_recording():
+            return
+        try:
+            _record_entity_output(span, result, entity_kind=entity_kind)
+        except Exception as e:
+            logger.warning(f"Output recording failed for '{operation_name}': {e}")
+
+    def start_generator_span(args: tuple, kwargs: Dict[str, Any]) -> tuple:
+        span, _, token = tracer.make_span(operation_name, entity_kind, version=version, attributes=span_attributes())
+        record_input(span, args, kwargs)
+        return span, token
+
+    # Special handling for HTTP entity kind
+    if entity_kind == SpanKind.HTTP:
+        label = f"@track_endpoint '{operation_name}'"
+
+        if is_generator or is_async_generator:
+
+            def call_http_generator(wrapped_func, args, kwargs):
+                logger.warning(f"@track_endpoint on generator '{operation_name}' is not supported. Use @trace instead.")
+                return wrapped_func(*args, **kwargs)
+
+            return call_http_generator
+
+        if is_async:
+
+            async def call_http_async(wrapped_func, args, kwargs):
+                trace_context: Optional[TraceContext] = None
+                try:
+                    # Create main session span
+                    trace_context = tracer.start_trace(trace_name=operation_name, tags=tags)
+                    if not trace_context:
+                        logger.error(f"Failed to start trace for {label}. Executing without trace.")
+                        return await wrapped_func(*args, **kwargs)
+
+                    if capture_request:
+                        _record_http_request(operation_name, version)
+                    result = await wrapped_func(*args, **kwargs)
+                    if capture_response:
+                        _record_http_response(operation_name, version, result)
+
+                    tracer.end_trace(trace_context, "Success")
+                    return result
+                except Exception:
+                    if trace_context:
+                        tracer.end_trace(trace_context, "Indeterminate")
+                    raise
+                finally:
+                    _end_trace(trace_context, label)
+
+            return call_http_async
+
+        def call_http(wrapped_func, args, kwargs):
+            trace_context: Optional[TraceContext] = None
+            try:
+                # Create main session span
+                trace_context = tracer.start_trace(trace_name=operation_name, tags=tags)
+                if not trace_context:
+                    logger.error(f"Failed to start trace for {label}. Executing without trace.")
+                    return wrapped_func(*args, **kwargs)
+
+                if capture_request:
+                    _record_http_request(operation_name, version)
+                result = wrapped_func(*args, **kwargs)
+                if capture_response:
+                    _record_http_response(operation_name, version, result)
+
+                tracer.end_trace(trace_context, "Success")
+                return result
+            except Exception:
+                if trace_context:
+                    tracer.end_trace(trace_context, "Indeterminate")
+                raise
+            finally:
+                _end_trace(trace_context, label)
+
+        return call_http
+
+    if entity_kind == SpanKind.SESSION:
+        label = f"@trace '{operation_name}'"
+
+        if is_generator or is_async_generator:
+            # generators under @trace create a single span, not a full trace
+            def call_session_generator(wrapped_func, args, kwargs):
+                logger.warning(
+                    f"@agentops.trace on generator '{operation_name}' creates a single span, not a full trace."
+                )
+                span, token = start_generator_span(args, kwargs)
+                result = wrapped_func(*args, **kwargs)
+                if is_async_generator:
+                    return _process_async_generator(span, token, result)
+                return _process_sync_generator(span, result)
+
+            return call_session_generator
+
+        if is_async:
+
+            async def call_session_async(wrapped_func, args, kwargs):
+                trace_context: Optional[TraceContext] = None
+                try:
+                    trace_context = tracer.start_trace(trace_name=operation_name, tags=tags)
+                    if not trace_context:
+                        logger.error(f"Failed to start trace for {label}. Executing without trace.")
+                        return await wrapped_func(*args, **kwargs)
+                    try:
+                        _record_entity_input(trace_context.span, args, kwargs)
+                    except Exception as e:
+                        logger.warning(f"Input recording failed for {label}: {e}")
+                    result = await wrapped_func(*args, **kwargs)
+                    try:
+                        _record_entity_output(trace_context.span, result)
+                    except Exception as e:
+                        logger.warning(f"Output recording failed for {label}: {e}")
+                    tracer.end_trace(trace_context, "Success")
+                    return result
+                except Exception:
+                    if trace_context:
+                        tracer.end_trace(trace_context, "Indeterminate")
+                    raise
+                finally:
+                    _end_trace(trace_context, label)
+
+            return call_session_async
+
+        def call_session(wrapped_func, args, kwargs):
+            trace_context: Optional[TraceContext] = None
+            try:
+                trace_context = tracer.start_trace(trace_name=operation_name, tags=tags)
+                if not trace_context:
+                    logger.error(f"Failed to start trace for {label}. Executing without trace.")
+                    return wrapped_func(*args, **kwargs)
+                try:
+                    _record_entity_input(trace_context.span, args, kwargs)
+                except Exception as e:
+                    logger.warning(f"Input recording failed for {label}: {e}")
+                result = wrapped_func(*args, **kwargs)
+                try:
+                    _record_entity_output(trace_context.span, result)
+                except Exception as e:
+                    logger.warning(f"Output recording failed for {label}: {e}")
+                tracer.end_trace(trace_context, "Success")
+                return result
+            except Exception:
+                if trace_context:
+                    tracer.end_trace(trace_context, "Indeterminate")
+                raise
+            finally:
+                _end_trace(trace_context, label)
+
+        return call_session
+
+    # Entity spans (agent, tool, operation, ...)
+    if is_generator:
+
+        def call_generator(wrapped_func, args, kwargs):
+            if _parent_is_unsampled():
+                return wrapped_func(*args, **kwargs)
+            span, _ = start_generator_span(args, kwargs)
+            result = wrapped_func(*args, **kwargs)
+            return _process_sync_generator(span, result)
+
+        return call_generator
+
+    if is_async_generator:
+
+        def call_async_generator(wrapped_func, args, kwargs):
+            if _parent_is_unsampled():
+                return wrapped_func(*args, **kwargs)
+            span, token = start_generator_span(args, kwargs)
+            result = wrapped_func(*args, **kwargs)
+            return _process_async_generator(span, token, result)
+
+        return call_async_generator
+
+    if is_async:
+
+        async def call_async(wrapped_func, args, kwargs):
+            if _parent_is_unsampled():
+                return await wrapped_func(*args, **kwargs)
+            with _create_as_current_span(
+                operation_name, entity_kind, version=version, attributes=span_attributes()
+            ) as span:
+                record_input(span, args, kwargs)
+                try:
+                    result = await wrapped_func(*args, **kwargs)
+                    record_output(span, result)
+                    return result
+                except Exception as e:
+                    logger.error(f"Error in async function execution: {e}")
+                    span.record_exception(e)
+                    raise
+
+        return call_async
+
+    def call_sync(wrapped_func, args, kwargs):
+        if _parent_is_unsampled():
+            return wrapped_func(*args, **kwargs)
+        with _create_as_current_span(
+            operation_name, entity_kind, version=version, attributes=span_attributes()
+        ) as span:
+            record_input(span, args, kwargs)
+            try:
+                result = wrapped_func(*args, **kwargs)
+                record_output(span, result)
+                return result
+            except Exception as e:
+                logger.error(f"Error in sync function execution: {e}")
+                span.record_exception(e)
+                raise
+
+    return call_sync
+
+
 def create_entity_decorator(entity_kind: str) -> Callable[..., Any]:
     """
     Factory that creates decorators for instrumenting functions and classes.
@@ -97,389 +425,25 @@ def create_entity_decorator(entity_kind: str) -> Callable[..., Any]:
             WrappedClass.__doc__ = wrapped.__doc__
             return WrappedClass
 
+        call = _compile_call(
+            entity_kind,
+            wrapped,
+            name=name,
+            version=version,
+            tags=tags,
+            cost=cost,
+            spec=spec,
+            capture_request=capture_request,
+            capture_response=capture_response,
+        )
+
         @wrapt.decorator
         def wrapper(
             wrapped_func: Callable[..., Any], instance: Optional[Any], args: tuple, kwargs: Dict[str, Any]
         ) -> Any:
             if not tracer.initialized:
                 return wrapped_func(*args, **kwargs)
-
-            operation_name = name or wrapped_func.__name__
-            is_async = asyncio.iscoroutinefunction(wrapped_func)
-            is_generator = inspect.isgeneratorfunction(wrapped_func)
-            is_async_generator = inspect.isasyncgenfunction(wrapped_func)
-
-            # Special handling for HTTP entity kind
-            if entity_kind == SpanKind.HTTP:
-                if is_generator or is_async_generator:
-                    logger.warning(
-                        f"@track_endpoint on generator '{operation_name}' is not supported. Use @trace instead."
-                    )
-                    return wrapped_func(*args, **kwargs)
-
-                if is_async:
-
-                    async def _wrapped_http_async() -> Any:
-                        trace_context: Optional[TraceContext] = None
-                        try:
-                            # Create main session span
-                            trace_context = tracer.start_trace(trace_name=operation_name, tags=tags)
-                            if not trace_context:
-                                logger.error(
-                                    f"Failed to start trace for @track_endpoint '{operation_name}'. Executing without trace."
-                                )
-                                return await wrapped_func(*args, **kwargs)
-
-                            # Create HTTP request span
-                            if capture_request:
-                                with _create_as_current_span(
-                                    f"{operation_name}.request",
-                                    SpanKind.HTTP,
-                                    version=version,
-                                    attributes={SpanAttributes.HTTP_METHOD: "REQUEST"}
-                                    if SpanAttributes.HTTP_METHOD
-                                    else None,
-                                ) as request_span:
-                                    try:
-                                        request_data = _extract_request_data()
-                                        if request_data:
-                                            # Set HTTP attributes
-                                            if hasattr(SpanAttributes, "HTTP_METHOD") and request_data.get("method"):
-                                                request_span.set_attribute(
-                                                    SpanAttributes.HTTP_METHOD, request_data["method"]
-                                                )
-                                            if hasattr(SpanAttributes, "HTTP_URL") and request_data.get("url"):
-                                                request_span.set_attribute(SpanAttributes.HTTP_URL, request_data["url"])
-
-                                            # Record the full request data
-                                            _record_entity_input(request_span, (request_data,), {})
-                                    except Exception as e:
-                                        logger.warning(f"Failed to record HTTP request for '{operation_name}': {e}")
-
-                            # Execute the main function
-                            result = await wrapped_func(*args, **kwargs)
-
-                            # Create HTTP response span
-                            if capture_response:
-                                with _create_as_current_span(
-                                    f"{operation_name}.response",
-                                    SpanKind.HTTP,
-                                    version=version,
-                                    attributes={SpanAttributes.HTTP_METHOD: "RESPONSE"}
-                                    if SpanAttributes.HTTP_METHOD
-                                    else None,
-                                ) as response_span:
-                                    try:
-                                        response_data = _extract_response_data(result)
-                                        if response_data:
-                                            # Set HTTP attributes
-                                            if hasattr(SpanAttributes, "HTTP_STATUS_CODE") and response_data.get(
-                                                "status_code"
-                                            ):
-                                                response_span.set_attribute(
-                                                    SpanAttributes.HTTP_STATUS_CODE, response_data["status_code"]
-                                                )
-
-                                            # Record the full response data
-                                            _record_entity_output(response_span, response_data)
-                                    except Exception as e:
-                                        logger.warning(f"Failed to record HTTP response for '{operation_name}': {e}")
-
-                            tracer.end_trace(trace_context, "Success")
-                            return result
-                        except Exception:
-                            if trace_context:
-                                tracer.end_trace(trace_context, "Indeterminate")
-                            raise
-                        finally:
-                            if trace_context and trace_context.span.is_recording():
-                                logger.warning(
-                                    f"Trace for @track_endpoint '{operation_name}' not explicitly ended. Ending as 'Unknown'."
-                                )
-                                tracer.end_trace(trace_context, "Unknown")
-
-                    return _wrapped_http_async()
-                else:  # Sync function for HTTP
-                    trace_context: Optional[TraceContext] = None
-                    try:
-                        # Create main session span
-                        trace_context = tracer.start_trace(trace_name=operation_name, tags=tags)
-                        if not trace_context:
-                            logger.error(
-                                f"Failed to start trace for @track_endpoint '{operation_name}'. Executing without trace."
-                            )
-                            return wrapped_func(*args, **kwargs)
-
-                        # Create HTTP request span
-                        if capture_request:
-                            with _create_as_current_span(
-                                f"{operation_name}.request",
-                                SpanKind.HTTP,
-                                version=version,
-                                attributes={SpanAttributes.HTTP_METHOD: "REQUEST"}
-                                if SpanAttributes.HTTP_METHOD
-                                else None,
-                            ) as request_span:
-                                try:
-                                    request_data = _extract_request_data()
-                                    if request_data:
-                                        # Set HTTP attributes
-                                        if hasattr(SpanAttributes, "HTTP_METHOD") and request_data.get("method"):
-                                            request_span.set_attribute(
-                                                SpanAttributes.HTTP_METHOD, request_data["method"]
-                                            )
-                                        if hasattr(SpanAttributes, "HTTP_URL") and request_data.get("url"):
-                                            request_span.set_attribute(SpanAttributes.HTTP_URL, request_data["url"])
-
-                                        # Record the full request data
-                                        _record_entity_input(request_span, (request_data,), {})
-                                except Exception as e:
-                                    logger.warning(f"Failed to record HTTP request for '{operation_name}': {e}")
-
-                        # Execute the main function
-                        result = wrapped_func(*args, **kwargs)
-
-                        # Create HTTP response span
-                        if capture_response:
-                            with _create_as_current_span(
-                                f"{operation_name}.response",
-                                SpanKind.HTTP,
-                                version=version,
-                                attributes={SpanAttributes.HTTP_METHOD: "RESPONSE"}
-                                if SpanAttributes.HTTP_METHOD
-                                else None,
-                            ) as response_span:
-                                try:
-                                    response_data = _extract_response_data(result)
-                                    if response_data:
-                                        # Set HTTP attributes
-                                        if hasattr(SpanAttributes, "HTTP_STATUS_CODE") and response_data.get(
-                                            "status_code"
-                                        ):
-                                            response_span.set_attribute(
-                                                SpanAttributes.HTTP_STATUS_CODE, response_data["status_code"]
-                                            )
-
-                                        # Record the full response data
-                                        _record_entity_output(response_span, response_data)
-                                except Exception as e:
-                                    logger.warning(f"Failed to record HTTP response for '{operation_name}': {e}")
-
-                        tracer.end_trace(trace_context, "Success")
-                        return result
-                    except Exception:
-                        if trace_context:
-                            tracer.end_trace(trace_context, "Indeterminate")
-                        raise
-                    finally:
-                        if trace_context and trace_context.span.is_recording():
-                            logger.warning(
-                                f"Trace for @track_endpoint '{operation_name}' not explicitly ended. Ending as 'Unknown'."
-                            )
-                            tracer.end_trace(trace_context, "Unknown")
-
-            elif entity_kind == SpanKind.SESSION:
-                if is_generator or is_async_generator:
-                    logger.warning(
-                        f"@agentops.trace on generator '{operation_name}' creates a single span, not a full trace."
-                    )
-                    # Fallthrough to existing generator logic which creates a single span.
-
-                    # !! was previously not implemented, checking with @dwij if this was intentional or if my implementation should go in
-                    if is_generator:
-                        span, _, token = tracer.make_span(
-                            operation_name,
-                            entity_kind,
-                            version=version,
-                            attributes={CoreAttributes.TAGS: tags} if tags else None,
-                        )
-                        try:
-                            _record_entity_input(span, args, kwargs, entity_kind=entity_kind)
-                        except Exception as e:
-                            logger.warning(f"Input recording failed for '{operation_name}': {e}")
-                        result = wrapped_func(*args, **kwargs)
-                        return _process_sync_generator(span, result)
-                    elif is_async_generator:
-                        span, _, token = tracer.make_span(
-                            operation_name,
-                            entity_kind,
-                            version=version,
-                            attributes={CoreAttributes.TAGS: tags} if tags else None,
-                        )
-                        try:
-                            _record_entity_input(span, args, kwargs, entity_kind=entity_kind)
-                        except Exception as e:
-                            logger.warning(f"Input recording failed for '{operation_name}': {e}")
-                        result = wrapped_func(*args, **kwargs)
-                        return _process_async_generator(span, token, result)
-                elif is_async:
-
-                    async def _wrapped_session_async() -> Any:
-                        trace_context: Optional[TraceContext] = None
-                        try:
-                            trace_context = tracer.start_trace(trace_name=operation_name, tags=tags)
-                            if not trace_context:
-                                logger.error(
-                                    f"Failed to start trace for @trace '{operation_name}'. Executing without trace."
-                                )
-                                return await wrapped_func(*args, **kwargs)
-                            try:
-                                _record_entity_input(trace_context.span, args, kwargs)
-                            except Exception as e:
-                                logger.warning(f"Input recording failed for @trace '{operation_name}': {e}")
-                            result = await wrapped_func(*args, **kwargs)
-                            try:
-                                _record_entity_output(trace_context.span, result)
-                            except Exception as e:
-                                logger.warning(f"Output recording failed for @trace '{operation_name}': {e}")
-                            tracer.end_trace(trace_context, "Success")
-                            return result
-                        except Exception:
-                            if trace_context:
-                                tracer.end_trace(trace_context, "Indeterminate")
-                            raise
-                        finally:
-                            if trace_context and trace_context.span.is_recording():
-                                logger.warning(
-                                    f"Trace for @trace '{operation_name}' not explicitly ended. Ending as 'Unknown'."
-                                )
-                                tracer.end_trace(trace_context, "Unknown")
-
-                    return _wrapped_session_async()
-                else:  # Sync function for SpanKind.SESSION
-                    trace_context: Optional[TraceContext] = None
-                    try:
-                        trace_context = tracer.start_trace(trace_name=operation_name, tags=tags)
-                        if not trace_context:
-                            logger.error(
-                                f"Failed to start trace for @trace '{operation_name}'. Executing without trace."
-                            )
-                            return wrapped_func(*args, **kwargs)
-                        try:
-                            _record_entity_input(trace_context.span, args, kwargs)
-                        except Exception as e:
-                            logger.warning(f"Input recording failed for @trace '{operation_name}': {e}")
-                        result = wrapped_func(*args, **kwargs)
-                        try:
-                            _record_entity_output(trace_context.span, result)
-                        except Exception as e:
-                            logger.warning(f"Output recording failed for @trace '{operation_name}': {e}")
-                        tracer.end_trace(trace_context, "Success")
-                        return result
-                    except Exception:
-                        if trace_context:
-                            tracer.end_trace(trace_context, "Indeterminate")
-                        raise
-                    finally:
-                        if trace_context and trace_context.span.is_recording():
-                            logger.warning(
-                                f"Trace for @trace '{operation_name}' not explicitly ended. Ending as 'Unknown'."
-                            )
-                            tracer.end_trace(trace_context, "Unknown")
-
-            # Logic for non-SESSION kinds or generators under @trace (as per fallthrough)
-            elif is_generator:
-                span, _, token = tracer.make_span(
-                    operation_name,
-                    entity_kind,
-                    version=version,
-                    attributes={CoreAttributes.TAGS: tags} if tags else None,
-                )
-                try:
-                    _record_entity_input(span, args, kwargs, entity_kind=entity_kind)
-                    # Set cost attribute if tool
-                    if entity_kind == "tool" and cost is not None:
-                        span.set_attribute(SpanAttributes.LLM_USAGE_TOOL_COST, cost)
-                    # Set spec attribute if guardrail
-                    if entity_kind == "guardrail" and (spec == "input" or spec == "output"):
-                        span.set_attribute(SpanAttributes.AGENTOPS_DECORATOR_SPEC.format(entity_kind=entity_kind), spec)
-                except Exception as e:
-                    logger.warning(f"Input recording failed for '{operation_name}': {e}")
-                result = wrapped_func(*args, **kwargs)
-                return _process_sync_generator(span, result)
-            elif is_async_generator:
-                span, _, token = tracer.make_span(
-                    operation_name,
-                    entity_kind,
-                    version=version,
-                    attributes={CoreAttributes.TAGS: tags} if tags else None,
-                )
-                try:
-                    _record_entity_input(span, args, kwargs, entity_kind=entity_kind)
-                    # Set cost attribute if tool
-                    if entity_kind == "tool" and cost is not None:
-                        span.set_attribute(SpanAttributes.LLM_USAGE_TOOL_COST, cost)
-                    # Set spec attribute if guardrail
-                    if entity_kind == "guardrail" and (spec == "input" or spec == "output"):
-                        span.set_attribute(SpanAttributes.AGENTOPS_DECORATOR_SPEC.format(entity_kind=entity_kind), spec)
-                except Exception as e:
-                    logger.warning(f"Input recording failed for '{operation_name}': {e}")
-                result = wrapped_func(*args, **kwargs)
-                return _process_async_generator(span, token, result)
-            elif is_async:
-
-                async def _wrapped_async() -> Any:
-                    with _create_as_current_span(
-                        operation_name,
-                        entity_kind,
-                        version=version,
-                        attributes={CoreAttributes.TAGS: tags} if tags else None,
-                    ) as span:
-                        try:
-                            _record_entity_input(span, args, kwargs, entity_kind=entity_kind)
-                            # Set cost attribute if tool
-                            if entity_kind == "tool" and cost is not None:
-                                span.set_attribute(SpanAttributes.LLM_USAGE_TOOL_COST, cost)
-                            # Set spec attribute if guardrail
-                            if entity_kind == "guardrail" and (spec == "input" or spec == "output"):
-                                span.set_attribute(
-                                    SpanAttributes.AGENTOPS_DECORATOR_SPEC.format(entity_kind=entity_kind), spec
-                                )
-                        except Exception as e:
-                            logger.warning(f"Input recording failed for '{operation_name}': {e}")
-                        try:
-                            result = await wrapped_func(*args, **kwargs)
-                            try:
-                                _record_entity_output(span, result, entity_kind=entity_kind)
-                            except Exception as e:
-                                logger.warning(f"Output recording failed for '{operation_name}': {e}")
-                            return result
-                        except Exception as e:
-                            logger.error(f"Error in async function execution: {e}")
-                            span.record_exception(e)
-                            raise
-
-                return _wrapped_async()
-            else:  # Sync function for non-SESSION kinds
-                with _create_as_current_span(
-                    operation_name,
-                    entity_kind,
-                    version=version,
-                    attributes={CoreAttributes.TAGS: tags} if tags else None,
-                ) as span:
-                    try:
-                        _record_entity_input(span, args, kwargs, entity_kind=entity_kind)
-                        # Set cost attribute if tool
-                        if entity_kind == "tool" and cost is not None:
-                            span.set_attribute(SpanAttributes.LLM_USAGE_TOOL_COST, cost)
-                        # Set spec attribute if guardrail
-                        if entity_kind == "guardrail" and (spec == "input" or spec == "output"):
-                            span.set_attribute(
-                                SpanAttributes.AGENTOPS_DECORATOR_SPEC.format(entity_kind=entity_kind), spec
-                            )
-                    except Exception as e:
-                        logger.warning(f"Input recording failed for '{operation_name}': {e}")
-                    try:
-                        result = wrapped_func(*args, **kwargs)
-                        try:
-                            _record_entity_output(span, result, entity_kind=entity_kind)
-                        except Exception as e:
-                            logger.warning(f"Output recording failed for '{operation_name}': {e}")
-                        return result
-                    except Exception as e:
-                        logger.error(f"Error in sync function execution: {e}")
-                        span.record_exception(e)
-                        raise
+            return call(wrapped_func, args, kwargs)
 
         return wrapper(wrapped)
 
@@ -1,3 +1,4 @@
+import logging
 import types
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, Optional
@@ -94,9 +95,13 @@ def _create_as_current_span(
     Yields:
         A span with proper context that will be automatically closed when exiting the context
     """
+    # Context introspection is only worth its cost when it's going to be logged
+    debug = logger.isEnabledFor(logging.DEBUG)
+
     # Log before we do anything
-    before_span = _get_current_span_info()
-    logger.debug(f"[DEBUG] BEFORE {operation_name}.{span_kind} - Current context: {before_span}")
+    if debug:
+        before_span = _get_current_span_info()
+        logger.debug(f"[DEBUG] BEFORE {operation_name}.{span_kind} - Current context: {before_span}")
 
     # Create span with proper naming convention
     span_name = f"{operation_name}.{span_kind}"
@@ -122,7 +127,7 @@ def _create_as_current_span(
     # Use OpenTelemetry's context manager to properly handle span lifecycle
     with otel_tracer.start_as_current_span(span_name, attributes=attributes, context=current_context) as span:
         # Log after span creation
-        if hasattr(span, "get_span_context"):
+        if debug and hasattr(span, "get_span_context"):
             span_ctx = span.get_span_context()
             logger.debug(
                 f"[DEBUG] CREATED {span_name} - span_id: {span_ctx.span_id:x}, parent: {before_span.get('span_id', 'None')}"
@@ -131,8 +136,9 @@ def _create_as_current_span(
         yield span
 
     # Log after we're done
-    after_span = _get_current_span_info()
-    logger.debug(f"[DEBUG] AFTER {operation_name}.{span_kind} - Returned to context: {after_span}")
+    if debug:
+        after_span = _get_current_span_info()
+        logger.debug(f"[DEBUG] AFTER {operation_name}.{span_kind} - Returned to context: {after_span}")
 
 
 def _record_entity_input(span: trace.Span, args: tuple, kwargs: Dict[str, Any], entity_kind: str = "entity") -> None:
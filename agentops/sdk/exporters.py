@@ -7,9 +7,10 @@ import time
 import requests
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter, Compression
 from opentelemetry.sdk.trace import ReadableSpan
-from opentelemetry.sdk.trace.export import SpanExportResult
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
 
 from agentops.exceptions import AgentOpsApiJwtExpiredException, ApiServerException
+from agentops.helpers.overhead import COMPONENT_EXPORTER, measure_overhead
 from agentops.logging import logger
 
 
@@ -204,3 +205,26 @@ class AuthenticatedOTLPExporter(OTLPSpanExporter):
         The OTLP exporter doesn't store spans, so this is a no-op.
         """
         pass
+
+
+class ProfiledSpanExporter(SpanExporter):
+    """
+    Exporter that records the time spent in another exporter as AgentOps overhead.
+
+    Export runs on the span processor's worker thread, so this time is not
+    added to the instrumented code's latency, but it still competes for CPU.
+    """
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+        self._export_key = (COMPONENT_EXPORTER, type(exporter).__name__, "export")
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        with measure_overhead(self._export_key):
+            return self.exporter.export(spans)
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.exporter.force_flush(timeout_millis)
@@ -4,11 +4,16 @@ Span processors for AgentOps SDK.
 This module contains processors for OpenTelemetry spans.
 """
 
-from typing import Optional
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
 
 from opentelemetry.context import Context
 from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export import SpanExporter
 
+from agentops.helpers.overhead import COMPONENT_SPAN_PROCESSOR, measure_overhead
 from agentops.logging import logger, upload_logfile
 
 
@@ -69,3 +74,268 @@ class InternalSpanProcessor(SpanProcessor):
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """Force flush the processor."""
         return True
+
+
+class _TraceBuffer:
+    """Spans of one trace waiting to be exported."""
+
+    __slots__ = ("spans", "root_span_id", "first_buffered_at", "last_active_at")
+
+    def __init__(self, root_span_id: Optional[int] = None):
+        self.spans: List[ReadableSpan] = []
+        self.root_span_id = root_span_id
+        self.first_buffered_at = 0.0
+        self.last_active_at = time.monotonic()
+
+
+class _ExportBatch:
+    """A contiguous run of spans from one trace, handed to the exporter together."""
+
+    __slots__ = ("trace_id", "spans", "done")
+
+    def __init__(self, trace_id: int, spans: List[ReadableSpan]):
+        self.trace_id = trace_id
+        self.spans = spans
+        self.done = threading.Event()
+
+
+class TraceBatchSpanProcessor(SpanProcessor):
+    """
+    A span processor that exports spans grouped by trace.
+
+    Ended spans are buffered per trace and handed to the exporter as one batch
+    when the trace's root span ends, so a trace's spans arrive together instead
+    of being interleaved with other traces. A buffer is also exported early once
+    it holds `max_spans_per_trace` spans, or once its oldest span has waited
+    `max_trace_age_millis`, so long-running traces keep streaming. A trace
+    whose root never ends is forgotten once none of its spans have started or
+    ended for `max_trace_idle_millis`.
+
+    At most `max_queue_size` spans wait for the exporter; spans that would
+    overflow the queue are dropped and counted in `dropped_spans`.
+
+    Exports happen on a background thread. `flush_trace()` waits only for the
+    spans of one trace, which is what short-lived processes (serverless
+    handlers, scripts) need before returning.
+
+    Args:
+        exporter: The exporter spans are handed to
+        max_spans_per_trace: Buffered spans of a trace that trigger an early export
+        max_trace_age_millis: Longest time a buffered span waits for its root to end
+        schedule_delay_millis: How often the background thread checks for expired buffers
+        max_queue_size: Most spans waiting for the exporter before new ones are dropped
+        max_trace_idle_millis: How long a trace without activity waits for its root to end
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_spans_per_trace: int = 512,
+        max_trace_age_millis: int = 5000,
+        schedule_delay_millis: int = 1000,
+        max_queue_size: int = 2048,
+        max_trace_idle_millis: int = 10 * 60 * 1000,
+    ):
+        self._exporter = exporter
+        self._max_spans_per_trace = max(1, max_spans_per_trace)
+        self._max_trace_age = max_trace_age_millis / 1000
+        self._schedule_delay = schedule_delay_millis / 1000
+        self._max_queue_size = max(1, max_queue_size)
+        self._max_trace_idle = max_trace_idle_millis / 1000
+        self._condition = threading.Condition(threading.Lock())
+        self._buffers: Dict[int, _TraceBuffer] = {}
+        self._queue: Deque[_ExportBatch] = deque()
+        self._queued_spans = 0
+        self.dropped_spans = 0
+        # trace_id -> batches queued or being exported
+        self._pending: Dict[int, List[_ExportBatch]] = {}
+        self._shutdown = False
+        self._worker = threading.Thread(name="AgentOpsTraceBatchSpanProcessor", target=self._run, daemon=True)
+        self._worker.start()
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        """Remember the root span of each trace, so its end can trigger the export."""
+        if not span.context or not span.context.trace_flags.sampled:
+            return
+        if span.parent is not None and not span.parent.is_remote:
+            return
+
+        with self._condition:
+            buffer = self._buffers.get(span.context.trace_id)
+            if buffer is None:
+                self._buffers[span.context.trace_id] = _TraceBuffer(span.context.span_id)
+            else:
+                buffer.root_span_id = span.context.span_id
+                buffer.last_active_at = time.monotonic()
+
+    def on_end(self, span: ReadableSpan) -> None:
+        """Buffer an ended span, exporting its trace if the root ended or a cap was hit."""
+        if not span.context or not span.context.trace_flags.sampled:
+            return
+
+        trace_id = span.context.trace_id
+        with self._condition:
+            if self._shutdown:
+                return
+
+            buffer = self._buffers.get(trace_id)
+            if buffer is None:
+                buffer = self._buffers[trace_id] = _TraceBuffer()
+            buffer.last_active_at = time.monotonic()
+            if not buffer.spans:
+                buffer.first_buffered_at = buffer.last_active_at
+            buffer.spans.append(span)
+
+            if span.context.span_id == buffer.root_span_id:
+                del self._buffers[trace_id]
+                self._enqueue(trace_id, buffer)
+            elif len(buffer.spans) >= self._max_spans_per_trace:
+                self._enqueue(trace_id, buffer)
+            else:
+                return
+            self._condition.notify()
+
+    def _enqueue(self, trace_id: int, buffer: _TraceBuffer) -> Optional[_ExportBatch]:
+        """Queue the buffered spans of a trace for export. Caller holds the lock."""
+        if not buffer.spans:
+            return None
+
+        spans, buffer.spans = buffer.spans, []
+        if self._queued_spans + len(spans) > self._max_queue_size:
+            if not self.dropped_spans:
+                logger.warning("[agentops.TraceBatchSpanProcessor] Export queue is full, dropping spans")
+            self.dropped_spans += len(spans)
+            return None
+
+        batch = _ExportBatch(trace_id, spans)
+        self._queue.append(batch)
+        self._queued_spans += len(spans)
+        self._pending.setdefault(trace_id, []).append(batch)
+        return batch
+
+    def _enqueue_expired(self, now: float) -> None:
+        """Queue buffers whose oldest span has waited too long. Caller holds the lock."""
+        for trace_id, buffer in list(self._buffers.items()):
+            if not buffer.spans:
+                # Late spans of a finished trace leave an empty buffer without a root behind,
+                # and a root that never ends would keep its buffer forever
+                if buffer.root_span_id is None or now - buffer.last_active_at >= self._max_trace_idle:
+                    del self._buffers[trace_id]
+                continue
+            if now - buffer.first_buffered_at >= self._max_trace_age:
+                self._enqueue(trace_id, buffer)
+
+    def _run(self) -> None:
+        """Background loop that exports queued batches."""
+        while True:
+            with self._condition:
+                if not self._queue and not self._shutdown:
+                    self._condition.wait(self._schedule_delay)
+                self._enqueue_expired(time.monotonic())
+                batches = list(self._queue)
+                self._queue.clear()
+                self._queued_spans = 0
+                shutdown = self._shutdown
+
+            for batch in batches:
+                self._export(batch)
+
+            if shutdown and not batches:
+                return
+
+    def _export(self, batch: _ExportBatch) -> None:
+        try:
+            self._exporter.export(batch.spans)
+        except Exception as e:
+            logger.error(f"[agentops.TraceBatchSpanProcessor] Error exporting {len(batch.spans)} spans: {e}")
+        finally:
+            with self._condition:
+                pending = self._pending.get(batch.trace_id)
+                if pending is not None:
+                    pending.remove(batch)
+                    if not pending:
+                        del self._pending[batch.trace_id]
+            batch.done.set()
+
+    def _wait(self, batches: List[_ExportBatch], timeout_millis: int) -> bool:
+        deadline = time.monotonic() + timeout_millis / 1000
+        for batch in batches:
+            if not batch.done.wait(max(0.0, deadline - time.monotonic())):
+                return False
+        return True
+
+    def flush_trace(self, trace_id: int, timeout_millis: int = 30000) -> bool:
+        """
+        Export everything buffered for one trace and wait until it has been exported.
+
+        Args:
+            trace_id: The trace to flush
+            timeout_millis: Maximum time to wait
+
+        Returns:
+            True if all of the trace's spans were exported within the timeout
+        """
+        with self._condition:
+            buffer = self._buffers.get(trace_id)
+            if buffer is not None:
+                self._enqueue(trace_id, buffer)
+            batches = list(self._pending.get(trace_id, ()))
+            self._condition.notify()
+
+        return self._wait(batches, timeout_millis)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Export everything buffered for all traces and wait until it has been exported."""
+        with self._condition:
+            for trace_id, buffer in self._buffers.items():
+                self._enqueue(trace_id, buffer)
+            batches = [batch for pending in self._pending.values() for batch in pending]
+            self._condition.notify()
+
+        return self._wait(batches, timeout_millis)
+
+    def shutdown(self) -> None:
+        """Export all buffered spans, stop the background thread and shut down the exporter."""
+        with self._condition:
+            if self._shutdown:
+                return
+            for trace_id, buffer in self._buffers.items():
+                self._enqueue(trace_id, buffer)
+            self._buffers.clear()
+            self._shutdown = True
+            self._condition.notify()
+
+        self._worker.join()
+        self._exporter.shutdown()
+
+
+class ProfiledSpanProcessor(SpanProcessor):
+    """
+    A span processor that records the time spent in another processor as AgentOps overhead.
+
+    `on_start` and `on_end` run on the thread that starts or ends the span, so
+    they add directly to the latency of instrumented code.
+
+    Args:
+        processor: The processor to delegate to
+    """
+
+    def __init__(self, processor: SpanProcessor):
+        self.processor = processor
+        name = type(processor).__name__
+        self._on_start_key = (COMPONENT_SPAN_PROCESSOR, name, "on_start")
+        self._on_end_key = (COMPONENT_SPAN_PROCESSOR, name, "on_end")
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        with measure_overhead(self._on_start_key):
+            self.processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        with measure_overhead(self._on_end_key):
+            self.processor.on_end(span)
+
+    def shutdown(self) -> None:
+        self.processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.processor.force_flush(timeout_millis)
@@ -19,3 +19,6 @@ class TracingConfig(TypedDict, total=False):
     max_queue_size: int  # Required with a default value
     max_wait_time: int  # Required with a default value
     export_flush_interval: int  # Time interval between automatic exports
+    deferred_attribute_extraction: bool  # Extract LLM call attributes on the export thread
+    batch_by_trace: bool  # Export each trace's spans together when its root span ends
+    profile_overhead: bool  # Measure the time AgentOps adds to instrumented code
@@ -12,8 +12,9 @@ from agentops.semconv.span_attributes import SpanAttributes
 from agentops.semconv.meters import Meters
 from agentops.semconv.span_kinds import AgentOpsSpanKindValues
 from agentops.semconv.resource import ResourceAttributes
-from agentops.semconv.message import MessageAttributes
+from agentops.semconv.message import MessageAttributes, IndexedKeyTable, indexed_key, get_key_table
 from agentops.semconv.langchain import LangChainAttributes, LangChainAttributeValues
+from agentops.semconv.registry import AttributeRegistry, get_metadata_registry
 
 SUPPRESS_LANGUAGE_MODEL_INSTRUMENTATION_KEY = "suppress_language_model_instrumentation"
 __all__ = [
@@ -31,6 +32,11 @@ __all__ = [
     "AgentOpsSpanKindValues",
     "ResourceAttributes",
     "MessageAttributes",
+    "IndexedKeyTable",
+    "indexed_key",
+    "get_key_table",
     "LangChainAttributes",
     "LangChainAttributeValues",
+    "AttributeRegistry",
+    "get_metadata_registry",
 ]
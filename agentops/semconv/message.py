@@ -1,5 +1,8 @@
 """Semantic conventions for message-related attributes in AI systems."""
 
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
 
 class MessageAttributes:
     """Semantic conventions for message-related attributes in AI systems."""
@@ -8,6 +11,14 @@ class MessageAttributes:
     PROMPT_CONTENT = "gen_ai.prompt.{i}.content"  # Content of the prompt message
     PROMPT_TYPE = "gen_ai.prompt.{i}.type"  # Type of the prompt message
     PROMPT_SPEAKER = "gen_ai.prompt.{i}.speaker"  # Speaker/agent name for the prompt message
+    PROMPT_TOOL_CALL_ID = "gen_ai.prompt.{i}.tool_call_id"  # ID of the tool call a tool message responds to
+
+    # Indexed tool calls made in prompt messages (with {i}/{j} for nested interpolation)
+    PROMPT_TOOL_CALLS_ID = "gen_ai.prompt.{i}.tool_calls.{j}.id"  # ID of tool call {j} in prompt {i}
+    PROMPT_TOOL_CALLS_NAME = "gen_ai.prompt.{i}.tool_calls.{j}.name"  # Name of tool call {j} in prompt {i}
+    PROMPT_TOOL_CALLS_ARGUMENTS = (
+        "gen_ai.prompt.{i}.tool_calls.{j}.arguments"  # Arguments of tool call {j} in prompt {i}
+    )
 
     # Indexed function calls (with {i} for interpolation)
     TOOL_CALL_ID = "gen_ai.request.tools.{i}.id"  # Unique identifier for the function call at index {i}
@@ -59,3 +70,62 @@ class MessageAttributes:
     COMPLETION_ANNOTATION_URL = (
         "gen_ai.completion.{i}.annotations.{j}.url"  # URL link of the URL annotation {j} in completion {i}
     )
+
+
+# Formatted keys are interned for indices below this bound; longer histories
+# fall back to formatting so the cache can't grow without limit.
+MAX_CACHED_INDEX = 1024
+
+
+@lru_cache(maxsize=None)
+def _format_indexed_key(template: str, i: int, j: Optional[int]) -> str:
+    return template.format(i=i) if j is None else template.format(i=i, j=j)
+
+
+def indexed_key(template: str, i: int, j: Optional[int] = None) -> str:
+    """Format an indexed attribute template, e.g. `MessageAttributes.PROMPT_ROLE`.
+
+    Equivalent to `template.format(i=i, j=j)`, but the result is cached per
+    `(template, i, j)` so repeated calls return the same string object.
+    """
+    if i < MAX_CACHED_INDEX and (j is None or j < MAX_CACHED_INDEX):
+        return _format_indexed_key(template, i, j)
+    return template.format(i=i) if j is None else template.format(i=i, j=j)
+
+
+class IndexedKeyTable:
+    """The formatted keys for a fixed group of indexed attribute templates.
+
+    Attribute builders typically emit the same handful of templates for every
+    message in a list. A table formats the whole group once per `(i, j)` and
+    hands back the keys in template order:
+
+        PROMPT_KEYS = IndexedKeyTable(MessageAttributes.PROMPT_ROLE, MessageAttributes.PROMPT_CONTENT)
+
+        for i, message in enumerate(messages):
+            role_key, content_key = PROMPT_KEYS.keys(i)
+    """
+
+    __slots__ = ("templates", "_rows")
+
+    def __init__(self, *templates: str):
+        self.templates = templates
+        self._rows: Dict[Tuple[int, Optional[int]], Tuple[str, ...]] = {}
+
+    def keys(self, i: int, j: Optional[int] = None) -> Tuple[str, ...]:
+        """Return the keys for index `i` (and `j`), one per template."""
+        row = self._rows.get((i, j))
+        if row is None:
+            row = tuple(template.format(i=i) if j is None else template.format(i=i, j=j) for template in self.templates)
+            if i < MAX_CACHED_INDEX and (j is None or j < MAX_CACHED_INDEX):
+                self._rows[(i, j)] = row
+        return row
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+
+@lru_cache(maxsize=None)
+def get_key_table(templates: Tuple[str, ...]) -> IndexedKeyTable:
+    """Return the shared key table for a tuple of templates."""
+    return IndexedKeyTable(*templates)
@@ -22,3 +22,10 @@ class Meters:
     AGENT_RUNS = "gen_ai.agent.runs"
     AGENT_TURNS = "gen_ai.agent.turns"
     AGENT_EXECUTION_TIME = "gen_ai.agent.execution_time"
+
+    # Instrumentation self-monitoring metrics
+    SPAN_REGISTRY_LIVE_ENTRIES = "agentops.instrumentation.span_registry.live_entries"
+    SPAN_REGISTRY_EVICTIONS = "agentops.instrumentation.span_registry.evictions"
+    AGENTOPS_OVERHEAD_CALLS = "agentops.overhead.calls"
+    AGENTOPS_OVERHEAD_WALL_TIME = "agentops.overhead.wall_time"
+    AGENTOPS_OVERHEAD_CPU_TIME = "agentops.overhead.cpu_time"
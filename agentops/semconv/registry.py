@@ -0,0 +1,104 @@
+"""Lookup tables over the semantic convention classes.
+
+The attribute classes are plain namespaces of string constants, so resolving a
+user-supplied key against them means walking their `__dict__`. The registry does
+that walk once and keeps the result, so hot paths (metadata updates inside agent
+loops) only pay for a dict lookup.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from agentops.semconv.agent import AgentAttributes
+from agentops.semconv.core import CoreAttributes
+from agentops.semconv.span_attributes import SpanAttributes
+from agentops.semconv.tool import ToolAttributes
+from agentops.semconv.workflow import WorkflowAttributes
+
+# Classes whose attributes may be set directly as trace metadata, in order of
+# precedence (later classes win when two attributes share a user-friendly key).
+METADATA_ATTRIBUTE_CLASSES = (AgentAttributes, ToolAttributes, WorkflowAttributes, CoreAttributes, SpanAttributes)
+
+# Extra user-friendly keys that don't follow the `entity.attribute` -> `entity_attribute` rule
+METADATA_ALIASES = {"tags": CoreAttributes.TAGS}
+
+
+class AttributeRegistry:
+    """Resolves user-friendly metadata keys to semantic convention attributes.
+
+    Args:
+        attributes: Semantic convention attribute names that may be used as-is
+        aliases: User-friendly key -> semantic convention attribute
+    """
+
+    __slots__ = ("attributes", "aliases")
+
+    def __init__(self, attributes: FrozenSet[str], aliases: Mapping[str, str]):
+        self.attributes = attributes
+        self.aliases = aliases
+
+    @classmethod
+    def from_classes(cls, *attribute_classes: type, aliases: Optional[Mapping[str, str]] = None) -> "AttributeRegistry":
+        """Build a registry from semantic convention classes, skipping `gen_ai.*` attributes."""
+        attributes = set()
+        mapping: Dict[str, str] = {}
+
+        for attribute_class in attribute_classes:
+            for name, value in attribute_class.__dict__.items():
+                if name.startswith("_") or not isinstance(value, str) or value.startswith("gen_ai."):
+                    continue
+                attributes.add(value)
+                # entity.attribute -> entity_attribute
+                mapping[value.replace(".", "_")] = value
+
+        mapping.update(aliases or {})
+        return cls(frozenset(attributes), mapping)
+
+    def resolve(self, key: str, prefix: str) -> str:
+        """Return the span attribute name for a metadata key.
+
+        Semantic convention attributes are used as-is, user-friendly aliases are
+        mapped to their attribute and anything else is namespaced under `prefix`.
+        """
+        if key in self.attributes:
+            return key
+        attribute = self.aliases.get(key)
+        if attribute is not None:
+            return attribute
+        return f"{prefix}.{key}"
+
+    def to_attributes(self, metadata: Mapping[str, Any], prefix: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Convert a metadata dict into span attributes in one pass.
+
+        `None` values are skipped. Lists of primitives are JSON-encoded, since
+        span attributes can't hold mixed-type sequences.
+
+        Returns:
+            A tuple of the attributes to set and a dict of rejected key -> reason
+        """
+        attributes: Dict[str, Any] = {}
+        rejected: Dict[str, str] = {}
+
+        for key, value in metadata.items():
+            if value is None:
+                continue
+
+            if isinstance(value, list):
+                if not all(isinstance(item, (str, int, float, bool)) for item in value):
+                    rejected[key] = "list contains invalid types"
+                    continue
+                value = json.dumps(value)
+            elif not isinstance(value, (str, int, float, bool)):
+                rejected[key] = f"value type {type(value)} not supported"
+                continue
+
+            attributes[self.resolve(key, prefix)] = value
+
+        return attributes, rejected
+
+
+@lru_cache(maxsize=None)
+def get_metadata_registry() -> AttributeRegistry:
+    """Return the shared registry for trace metadata keys, built on first use."""
+    return AttributeRegistry.from_classes(*METADATA_ATTRIBUTE_CLASSES, aliases=METADATA_ALIASES)
@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from agentops.common.middleware import (
     CacheControlMiddleware,
+    CancelOnDisconnectMiddleware,
     ExceptionMiddleware,
     DefaultContentTypeMiddleware,
 )
@@ -33,6 +34,8 @@ app.add_middleware(
 app.add_middleware(CacheControlMiddleware)
 app.add_middleware(ExceptionMiddleware)
 app.add_middleware(DefaultContentTypeMiddleware)
+# registered last so it's outermost and can cancel everything below it
+app.add_middleware(CancelOnDisconnectMiddleware)
 
 # Include routers
 app.include_router(v1.router)
@@ -1,16 +1,24 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import hashlib
+import threading
+import time
 
 import jwt
 from fastapi import Header, HTTPException
 
-from agentops.api.environment import JWT_SECRET_KEY
+from agentops.api.environment import JWT_SECRET_KEY, JWT_VERIFY_CACHE_SIZE
 from agentops.opsboard.models import ProjectModel
 
 
 JWT_EXPIRATION_DAYS: int = 30
 JWT_ALGO: str = "HS256"
 
+# SHA-256 of a verified token -> its payload, least recently used first
+_verified_tokens: OrderedDict[bytes, dict] = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
 
 def _generate_jwt_timestamp() -> int:
     """Generate a timestamp for the JWT token expiration."""
@@ -81,16 +89,40 @@ def generate_jwt(project: ProjectModel) -> str:
 
 
 def verify_jwt(token: str) -> JWTPayload:
-    """Verify a JWT token"""
+    """
+    Verify a JWT token
+
+    The SDK sends the same token with every request, so verified tokens are
+    remembered until they expire and aren't decoded and verified again. Tokens
+    are keyed by their hash, so the cache doesn't hold usable credentials.
+    Tokens that fail verification are never cached.
+    """
     _assert_jwt_secret()
 
+    key = hashlib.sha256(token.encode()).digest()
+    with _verified_tokens_lock:
+        payload_data = _verified_tokens.get(key)
+        if payload_data is not None:
+            if time.time() < payload_data["exp"]:
+                _verified_tokens.move_to_end(key)
+                return JWTPayload(**payload_data)
+            # expired; verify again so the caller gets the usual error
+            del _verified_tokens[key]
+
     payload_data = jwt.decode(
         token,
         JWT_SECRET_KEY,
         algorithms=[JWT_ALGO],
         audience="authenticated",  # Verify audience claim
     )
-    return JWTPayload(**payload_data)
+    payload = JWTPayload(**payload_data)
+
+    with _verified_tokens_lock:
+        _verified_tokens[key] = payload_data
+        while len(_verified_tokens) > JWT_VERIFY_CACHE_SIZE:
+            _verified_tokens.popitem(last=False)
+
+    return payload
 
 
 async def get_jwt_token(authorization: str = Header(None)) -> JWTPayload:
@@ -0,0 +1,77 @@
+"""
+Concurrency limits for ClickHouse queries.
+
+Every query issued through `execute_query` first takes a slot from a process-wide
+semaphore sized to the client's connection pool, so excess queries wait on the
+event loop, where they can be cancelled, instead of queueing in the client's
+thread pool.
+
+Endpoints running expensive queries are additionally decorated with
+`limit_queries`, which caps how many of their queries run at once across all
+requests in the process. A burst of dashboard loads then can't take every
+connection from the rest of the API.
+"""
+
+from typing import AsyncIterator, Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import asyncio
+import functools
+
+from agentops.api.environment import CLICKHOUSE_POOL_SIZE
+
+__all__ = [
+    'limit_queries',
+    'query_slot',
+]
+
+_pool_limit = asyncio.Semaphore(CLICKHOUSE_POOL_SIZE)
+
+# group name -> semaphore shared by every endpoint in the group
+_group_limits: dict[str, asyncio.Semaphore] = {}
+
+# limit of the endpoint handling the current request, if it has one
+_current_limit: ContextVar[Optional[asyncio.Semaphore]] = ContextVar('clickhouse_query_limit', default=None)
+
+
+def limit_queries(group: str, limit: int):
+    """
+    Limit the number of ClickHouse queries an endpoint runs at once.
+
+    The limit is shared by all requests to every endpoint decorated with the
+    same `group`. Queries over the limit wait for a slot; requests are never
+    rejected.
+
+    Usage:
+        @limit_queries("project_metrics", CLICKHOUSE_DASHBOARD_QUERY_LIMIT)
+        async def __call__(self, ...):
+            ...
+    """
+    semaphore = _group_limits.setdefault(group, asyncio.Semaphore(limit))
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            token = _current_limit.set(semaphore)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _current_limit.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+@asynccontextmanager
+async def query_slot() -> AsyncIterator[None]:
+    """Wait until a query may run: first within its endpoint's limit, then the pool's."""
+    group_limit = _current_limit.get()
+    if group_limit is None:
+        async with _pool_limit:
+            yield
+        return
+
+    # take the group slot first so queued dashboard queries don't hold pool slots
+    async with group_limit, _pool_limit:
+        yield
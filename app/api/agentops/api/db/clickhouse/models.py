@@ -1,4 +1,5 @@
 import asyncio
+import re
 from typing import TypeVar, ClassVar, Type, Any, Optional, Union, Collection, Tuple, Literal
 from datetime import datetime
 from uuid import UUID
@@ -6,9 +7,12 @@ import abc
 import pydantic
 from clickhouse_connect.driver.asyncclient import AsyncClient
 from agentops.api.db.clickhouse_client import get_async_clickhouse  # type: ignore
+from agentops.api.db.clickhouse.profiling import execute_query, explain_query
+from agentops.api.db.clickhouse.singleflight import make_query_key, single_flight
 
 
 TOperation = TypeVar('TOperation', bound='BaseOperation')
+TSearchOperation = TypeVar('TSearchOperation', bound='BaseSearchOperation')
 TClickhouseModel = TypeVar('TClickhouseModel', bound='ClickhouseModel')
 TClickhouseAggregatedModel = TypeVar('TClickhouseAggregatedModel', bound='ClickhouseAggregatedModel')
 
@@ -24,10 +28,18 @@ FilterFields = dict[str, FormattableValue]  # Filter values for queries
 # SelectFields can be a string (like "*"), a list of field names, or a dict mapping
 SelectFields = Union[str, Collection[str], dict[str, str]]
 
-# Fields that can be searched with LIKE/ILIKE pattern matching
-SearchFields = dict[str, Tuple[Literal["LIKE", "ILIKE"], str]]  # {field_name: (operator, db_column)}
+# Fields that can be searched with LIKE/ILIKE pattern matching or a `BaseSearchOperation`
+SearchFields = dict[
+    str, Tuple[Union[Literal["LIKE", "ILIKE"], Type[TSearchOperation]], str]
+]  # {field_name: (operator, db_column)}
 # Search term is simply a string that gets applied to all configured searchable fields
 
+# Keys to read from a Map column; a key ending in `*` matches every key with that prefix
+AttributeKeys = Collection[str]
+
+# Attributes a query reads, keyed by the Map column (as named in `selectable_fields`) holding them
+SelectAttributes = dict[str, AttributeKeys]
+
 __all__ = [
     'ClickhouseModel',
     'TClickhouseModel',
@@ -38,6 +50,12 @@ __all__ = [
     'FormattableValue',
     'SelectFields',
     'SearchFields',
+    'AttributeKeys',
+    'SelectAttributes',
+    'project_attributes',
+    'BaseSearchOperation',
+    'NgramSearchOperation',
+    'TraceIdSearchOperation',
 ]
 
 
@@ -63,6 +81,31 @@ def _format_field_value(value: FormattableValue) -> Any:
     return value
 
 
+def _quote(value: str) -> str:
+    """Quote a string literal for use in a ClickHouse query."""
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def project_attributes(db_column: str, keys: AttributeKeys) -> str:
+    """
+    Build an expression that reads only `keys` from the Map column `db_column`.
+
+    Keys ending in `*` match by prefix, so `"gen_ai.*"` keeps every `gen_ai.`
+    attribute. Without any keys the column isn't read and an empty map is selected.
+    """
+    exact = [key for key in keys if not key.endswith("*")]
+    prefixes = [key[:-1] for key in keys if key.endswith("*")]
+    if not exact and not prefixes:
+        return "CAST(map(), 'Map(String, String)')"
+
+    conditions = []
+    if exact:
+        conditions.append(f"has([{', '.join(_quote(key) for key in exact)}], k)")
+    conditions.extend(f"startsWith(k, {_quote(prefix)})" for prefix in prefixes)
+    return f"mapFilter((k, v) -> {' OR '.join(conditions)}, {db_column})"
+
+
 class BaseOperation(abc.ABC):
     """
     Base class for custom Clickhouse filter operations.
@@ -90,6 +133,80 @@ class WithinListOperation(BaseOperation):
         return " OR ".join(conditions), params
 
 
+class BaseSearchOperation(abc.ABC):
+    """
+    Base class for custom Clickhouse search operations.
+
+    Search operations turn a user supplied search term into a predicate that a
+    skip index on `db_field` can use, and fall back to a plain `ILIKE` substring
+    match when no index can apply to the term.
+    """
+
+    @staticmethod
+    def fallback(db_field: str, field: str, value: str) -> tuple[str, dict]:
+        return f"{db_field} ILIKE %({field})s", {field: f"%{value}%"}
+
+    @classmethod
+    @abc.abstractmethod
+    def format(cls, db_field: str, field: str, value: str) -> tuple[str, dict]: ...
+
+
+class NgramSearchOperation(BaseSearchOperation):
+    """
+    Case-insensitive substring search backed by an `ngrambf_v1` index on
+    `lowerUTF8(db_field)`.
+
+    Terms shorter than the index's n-gram size can't be looked up in the bloom
+    filter so they fall back to `ILIKE`.
+    """
+
+    ngram_size: ClassVar[int] = 3
+
+    @classmethod
+    def format(cls, db_field: str, field: str, value: str) -> tuple[str, dict]:
+        needle = value.lower()
+        if len(needle) < cls.ngram_size:
+            return cls.fallback(db_field, field, value)
+
+        # `multiSearchAny` matches the needle literally, so `%` and `_` in the
+        # search term are not treated as wildcards
+        return f"multiSearchAny(lowerUTF8({db_field}), [%({field}_ngram)s])", {f"{field}_ngram": needle}
+
+
+class TraceIdSearchOperation(BaseSearchOperation):
+    """
+    Search on a trace id column.
+
+    A complete trace id is matched exactly so the `bloom_filter` index on the
+    column applies; partial ids fall back to `ILIKE`.
+    """
+
+    pattern: ClassVar[re.Pattern] = re.compile(r'[0-9a-fA-F]{32}')
+
+    @classmethod
+    def format(cls, db_field: str, field: str, value: str) -> tuple[str, dict]:
+        if not cls.pattern.fullmatch(value):
+            return cls.fallback(db_field, field, value)
+
+        return f"{db_field} = %({field}_exact)s", {f"{field}_exact": value.lower()}
+
+
+async def _execute_shared(query: str, params: dict[str, Any], *, model: str):
+    """
+    Execute a model query, sharing the execution with identical queries already in flight.
+
+    Dashboards opened in several tabs issue the same queries concurrently; see
+    `singleflight` for how they're coalesced. The shared `QueryResult` is only
+    read here, each caller builds its own model instances from it.
+    """
+
+    async def execute():
+        client: AsyncClient = await get_async_clickhouse()
+        return await execute_query(client, query, params, model=model)
+
+    return await single_flight(make_query_key(model, query, params), execute)
+
+
 class ClickhouseModel(abc.ABC, pydantic.BaseModel):
     """Base abstract model for Clickhouse database interactions.
 
@@ -113,6 +230,9 @@ class ClickhouseModel(abc.ABC, pydantic.BaseModel):
         (search_operator, db_column_name) for string search operations.
         For example:
             {"name": ("ILIKE", "UserName")} enables searching by name
+        The operator can also be a `BaseSearchOperation` subclass which builds a
+        predicate that can use a skip index on the column, like
+        `NgramSearchOperation`.
         For models using GROUP BY with HAVING clauses, the db_column_name should
         reference the column alias created in the query, not the original table column.
 
@@ -183,12 +303,53 @@ class ClickhouseModel(abc.ABC, pydantic.BaseModel):
         raise ValueError(f"Invalid fields type: {type(fields)}. Expected str, list, tuple, or dict.")
 
     @classmethod
-    def _get_search_clause(cls, search_term: Optional[str] = None) -> tuple[str, dict]:
+    def project_fields(
+        cls,
+        attributes: SelectAttributes,
+        *,
+        fields: Optional[dict[str, str]] = None,
+        empty_arrays: Collection[str] = (),
+    ) -> list[str]:
+        """
+        Get the selectable fields with the Map columns in `attributes` narrowed to the given keys.
+
+        Views pass the result as `fields` to read only the attributes they render,
+        so large payloads like prompts and completions aren't transferred for
+        views that don't show them:
+
+            SpanModel.select(fields=SpanModel.project_fields({'SpanAttributes': ["gen_ai.usage.*"]}))
+
+        Array columns listed in `empty_arrays` aren't read at all and are
+        selected as empty arrays, for views that don't render them.
+        """
+        if fields is None:
+            fields = cls.selectable_fields
+        if not isinstance(fields, dict):
+            raise ValueError(f"{cls.__name__} fields must be a dict to project attributes")
+
+        if unknown := (set(attributes) | set(empty_arrays)) - set(fields):
+            raise ValueError(f"{cls.__name__} does not select {', '.join(sorted(unknown))}")
+
+        def expression(db_col: str) -> str:
+            if db_col in empty_arrays:
+                return "emptyArrayString()"
+            if db_col in attributes:
+                return project_attributes(db_col, attributes[db_col])
+            return db_col
+
+        # a list, not a dict: emptied columns all share the same expression
+        return [f"{expression(db_col)} as {field}" for db_col, field in fields.items()]
+
+    @classmethod
+    def _get_search_clause(
+        cls, search_term: Optional[str] = None, *, fields: Optional[SearchFields] = None
+    ) -> tuple[str, dict]:
         """
         Generate search conditions based on the searchable_fields configuration.
 
         Arguments:
             search_term: The search term to apply to all searchable fields
+            fields: Search these fields instead of `searchable_fields`
 
         Returns:
             tuple[str, dict]: A tuple containing:
@@ -199,10 +360,19 @@ class ClickhouseModel(abc.ABC, pydantic.BaseModel):
         params = {}
 
         if search_term is not None:
-            for field, (op, db_field) in cls.searchable_fields.items():
+            if fields is None:
+                fields = cls.searchable_fields
+
+            for field, (op, db_field) in fields.items():
                 param_name = f"search_{field}"  # avoid collisions with other params
-                conditions.append(f"{db_field} {op} %({param_name})s")
-                params[param_name] = f"%{search_term}%"
+                if isinstance(op, type) and issubclass(op, BaseSearchOperation):
+                    # index-aware operation
+                    _cond, _params = op.format(db_field, param_name, search_term)
+                    conditions.append(_cond)
+                    params.update(_params)
+                else:
+                    conditions.append(f"{db_field} {op} %({param_name})s")
+                    params[param_name] = f"%{search_term}%"
 
         # Join conditions with OR - this is more intuitive for searches across multiple fields
         # Users expect to see results where ANY field matches, not where ALL fields match
@@ -369,11 +539,37 @@ class ClickhouseModel(abc.ABC, pydantic.BaseModel):
             offset=offset,
             limit=limit,
         )
-        client: AsyncClient = await get_async_clickhouse()
-        result = await client.query(query, parameters=params)
+        result = await _execute_shared(query, params, model=cls.__name__)
         results = list(result.named_results())
         return [cls(**row) for row in results]
 
+    @classmethod
+    async def explain(
+        cls: Type[TClickhouseModel],
+        *,
+        fields: Optional[SelectFields] = None,
+        filters: Optional[FilterFields] = None,
+        search: Optional[str] = None,
+        order_by: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> str:
+        """Return the `EXPLAIN indexes = 1` plan for the query `select` would run.
+
+        Accepts the same arguments as `select`. Useful for checking which
+        partitions, primary key ranges and skip indexes a query can use.
+        """
+        query, params = cls._get_select_query(
+            fields=fields,
+            filters=filters,
+            search=search,
+            order_by=order_by,
+            offset=offset,
+            limit=limit,
+        )
+        client: AsyncClient = await get_async_clickhouse()
+        return await explain_query(client, query, params)
+
 
 class ClickhouseAggregatedModel(abc.ABC, pydantic.BaseModel):
     """Base model for composing and executing multiple Clickhouse queries in parallel.
@@ -442,9 +638,9 @@ class ClickhouseAggregatedModel(abc.ABC, pydantic.BaseModel):
         """
         assert cls.aggregated_models, f"{cls.__name__} must define `aggregated_models`"
 
-        client: AsyncClient = await get_async_clickhouse()
         queries: list[str] = []
         params: list[dict] = []
+        names: list[str] = []
 
         for model_cls in cls.aggregated_models:
             _query, _params = model_cls._get_select_query(
@@ -457,9 +653,10 @@ class ClickhouseAggregatedModel(abc.ABC, pydantic.BaseModel):
             )
             queries.append(_query)
             params.append(_params)
+            names.append(model_cls.__name__)
 
         responses: list = await asyncio.gather(
-            *[client.query(q, parameters=p) for q, p in zip(queries, params)]
+            *[_execute_shared(q, p, model=n) for q, p, n in zip(queries, params, names)]
         )
 
         results: list = []
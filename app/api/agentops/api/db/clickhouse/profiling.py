@@ -0,0 +1,254 @@
+"""
+Query instrumentation for the ClickHouse model layer.
+
+Every query issued through `ClickhouseModel.select` runs via `execute_query`, which:
+- tags the query with a `query_id` that names the model (`agentops:<Model>:<uuid>`)
+  so it can be found in `system.query_log`
+- wraps it in an OTel span and records duration / rows read / bytes read metrics
+  (no-ops unless the process has a tracer/meter provider configured)
+- writes queries slower than `CLICKHOUSE_SLOW_QUERY_MS` to the slow query log
+  with their SQL, parameters, read stats and optionally `system.query_log` stats
+  and an `EXPLAIN indexes = 1` plan
+
+Slow query details are collected in a background task so they never add latency
+to the request that triggered them.
+
+Queries also wait for a slot from `concurrency.query_slot()` before they are sent,
+and are killed on the server with `KILL QUERY` if they run past
+`CLICKHOUSE_QUERY_TIMEOUT` or the request awaiting them is cancelled (for example
+because the client disconnected). Without that the query would keep running on
+the server, and hold a connection, after nobody is waiting for it. Inserts issued
+through `execute_insert` take the same slot and are bounded the same way.
+"""
+
+from typing import Any, Optional
+from dataclasses import dataclass
+import asyncio
+import time
+import uuid
+
+from clickhouse_connect.driver.asyncclient import AsyncClient
+from opentelemetry import metrics, trace
+
+from agentops.api.log_config import logger
+from agentops.api.environment import (
+    CLICKHOUSE_SLOW_QUERY_MS,
+    CLICKHOUSE_SLOW_QUERY_LOG_STATS,
+    CLICKHOUSE_EXPLAIN_SLOW_QUERIES,
+    CLICKHOUSE_QUERY_TIMEOUT,
+)
+
+from .concurrency import query_slot
+
+__all__ = [
+    'QueryStats',
+    'execute_insert',
+    'execute_query',
+    'explain_query',
+    'kill_query',
+]
+
+# seconds to wait before reading `system.query_log`; ClickHouse flushes it every 7.5s by default
+QUERY_LOG_FLUSH_DELAY: float = 8.0
+
+_tracer = trace.get_tracer(__name__)
+_meter = metrics.get_meter(__name__)
+_duration_histogram = _meter.create_histogram(
+    "clickhouse.query.duration",
+    unit="ms",
+    description="Wall time of ClickHouse queries issued by the model layer",
+)
+_read_rows_counter = _meter.create_counter(
+    "clickhouse.query.read_rows",
+    description="Rows read by ClickHouse queries issued by the model layer",
+)
+_read_bytes_counter = _meter.create_counter(
+    "clickhouse.query.read_bytes",
+    unit="By",
+    description="Bytes read by ClickHouse queries issued by the model layer",
+)
+
+# keep references to background tasks so they aren't garbage collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
+
+@dataclass
+class QueryStats:
+    """Statistics for a single query execution."""
+
+    model: str
+    query_id: str
+    duration_ms: float
+    read_rows: int = 0
+    read_bytes: int = 0
+    result_rows: int = 0
+
+    @classmethod
+    def from_summary(cls, model: str, query_id: str, duration_ms: float, summary: dict) -> 'QueryStats':
+        """Parse the `X-ClickHouse-Summary` values clickhouse-connect exposes on results."""
+        return cls(
+            model=model,
+            query_id=query_id,
+            duration_ms=duration_ms,
+            read_rows=int(summary.get('read_rows', 0)),
+            read_bytes=int(summary.get('read_bytes', 0)),
+            result_rows=int(summary.get('result_rows', 0)),
+        )
+
+
+def _make_query_id(model: str) -> str:
+    return f"agentops:{model}:{uuid.uuid4()}"
+
+
+def _spawn(coro) -> None:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def execute_query(
+    client: AsyncClient,
+    query: str,
+    parameters: Optional[dict[str, Any]] = None,
+    *,
+    model: str,
+):
+    """
+    Execute `query` on `client` with profiling.
+
+    Returns the clickhouse-connect `QueryResult` unchanged.
+    """
+    query_id = _make_query_id(model)
+    attributes = {'db.system': "clickhouse", 'agentops.model': model}
+
+    async with query_slot():
+        with _tracer.start_as_current_span("clickhouse.query", attributes=attributes) as span:
+            span.set_attribute('db.statement', query)
+            span.set_attribute('db.clickhouse.query_id', query_id)
+
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(
+                    client.query(query, parameters=parameters, settings={'query_id': query_id}),
+                    timeout=CLICKHOUSE_QUERY_TIMEOUT or None,
+                )
+            except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    logger.warning(f"ClickHouse query {query_id} timed out after {CLICKHOUSE_QUERY_TIMEOUT}s")
+                _spawn(kill_query(client, query_id))
+                raise
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            summary = getattr(result, 'summary', None) or {}
+            stats = QueryStats.from_summary(model, query_id, duration_ms, summary)
+            span.set_attribute('db.clickhouse.read_rows', stats.read_rows)
+            span.set_attribute('db.clickhouse.read_bytes', stats.read_bytes)
+
+    _duration_histogram.record(duration_ms, attributes)
+    _read_rows_counter.add(stats.read_rows, attributes)
+    _read_bytes_counter.add(stats.read_bytes, attributes)
+
+    if CLICKHOUSE_SLOW_QUERY_MS and duration_ms >= CLICKHOUSE_SLOW_QUERY_MS:
+        _spawn(_log_slow_query(client, query, parameters, stats))
+
+    return result
+
+
+async def execute_insert(client: AsyncClient, table: str, data: Any, *, model: str, **kwargs: Any):
+    """
+    Insert `data` into `table` on `client` within a query slot and the query timeout.
+
+    `kwargs` are passed on to `AsyncClient.insert`. Returns its `QuerySummary` unchanged.
+    """
+    query_id = _make_query_id(model)
+    attributes = {'db.system': "clickhouse", 'agentops.model': model}
+
+    async with query_slot():
+        with _tracer.start_as_current_span("clickhouse.insert", attributes=attributes) as span:
+            span.set_attribute('db.sql.table', table)
+            span.set_attribute('db.clickhouse.query_id', query_id)
+
+            start = time.perf_counter()
+            try:
+                summary = await asyncio.wait_for(
+                    client.insert(table=table, data=data, settings={'query_id': query_id}, **kwargs),
+                    timeout=CLICKHOUSE_QUERY_TIMEOUT or None,
+                )
+            except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    logger.warning(
+                        f"ClickHouse insert {query_id} timed out after {CLICKHOUSE_QUERY_TIMEOUT}s"
+                    )
+                _spawn(kill_query(client, query_id))
+                raise
+
+    _duration_histogram.record((time.perf_counter() - start) * 1000, attributes)
+    return summary
+
+
+async def kill_query(client: AsyncClient, query_id: str) -> None:
+    """Stop a query that is still running on the server."""
+    try:
+        await client.command(
+            "KILL QUERY WHERE query_id = %(query_id)s ASYNC",
+            parameters={'query_id': query_id},
+        )
+    except Exception as e:
+        logger.error(f"Could not kill ClickHouse query {query_id}: {e}")
+
+
+async def explain_query(client: AsyncClient, query: str, parameters: Optional[dict[str, Any]] = None) -> str:
+    """Return the `EXPLAIN indexes = 1` plan for `query`."""
+    result = await client.query(f"EXPLAIN indexes = 1 {query}", parameters=parameters)
+    return "\n".join(row[0] for row in result.result_rows)
+
+
+async def _get_query_log_stats(client: AsyncClient, query_id: str) -> Optional[dict[str, Any]]:
+    """Return the query's stats from `system.query_log` once it has been flushed, if it has."""
+    # a single delayed lookup; polling would add load to a server that is already slow
+    await asyncio.sleep(QUERY_LOG_FLUSH_DELAY)
+    result = await client.query(
+        """
+        SELECT
+            query_duration_ms,
+            read_rows,
+            read_bytes,
+            result_rows,
+            memory_usage,
+            ProfileEvents['SelectedParts'] AS selected_parts,
+            ProfileEvents['SelectedMarks'] AS selected_marks
+        FROM system.query_log
+        WHERE query_id = %(query_id)s AND type = 'QueryFinish'
+        LIMIT 1
+        """,
+        parameters={'query_id': query_id},
+    )
+    rows = list(result.named_results())
+    return rows[0] if rows else None
+
+
+async def _log_slow_query(
+    client: AsyncClient,
+    query: str,
+    parameters: Optional[dict[str, Any]],
+    stats: QueryStats,
+) -> None:
+    details: dict[str, Any] = {
+        'model': stats.model,
+        'query_id': stats.query_id,
+        'duration_ms': round(stats.duration_ms, 2),
+        'read_rows': stats.read_rows,
+        'read_bytes': stats.read_bytes,
+        'result_rows': stats.result_rows,
+        'parameters': parameters,
+    }
+
+    try:
+        if CLICKHOUSE_SLOW_QUERY_LOG_STATS:
+            details['query_log'] = await _get_query_log_stats(client, stats.query_id)
+        if CLICKHOUSE_EXPLAIN_SLOW_QUERIES:
+            details['explain'] = await explain_query(client, query, parameters)
+    except Exception as e:
+        details['error'] = f"Could not collect slow query details: {e}"
+
+    logger.warning(f"Slow ClickHouse query: {details}\n{query}")
@@ -0,0 +1,90 @@
+"""
+Single-flight execution of identical concurrent ClickHouse queries.
+
+When a team opens the same project dashboard, every browser tab issues the same
+trace list and metrics queries at about the same time. `ClickhouseModel.select`
+runs its queries through `single_flight`, so a query identical to one already in
+flight (same model, SQL and parameters) waits for that execution's result
+instead of running again. Nothing is cached: once a query finishes, the next
+identical query runs again.
+
+The shared execution runs in its own task, so a caller being cancelled doesn't
+cancel the query for the others. When the last caller waiting on it is
+cancelled, the shared task is cancelled too, which kills the query on the server.
+"""
+
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+import asyncio
+import json
+import re
+
+from agentops.api.environment import CLICKHOUSE_COALESCE_QUERIES
+
+__all__ = [
+    'make_query_key',
+    'single_flight',
+]
+
+T = TypeVar('T')
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _Flight:
+    """A shared query execution and the number of callers waiting on it."""
+
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+# query key -> execution in flight
+_flights: dict[Hashable, _Flight] = {}
+
+
+def make_query_key(model: str, query: str, parameters: Optional[dict[str, Any]] = None) -> str:
+    """
+    Build the key identifying a query, ignoring formatting differences.
+
+    Whitespace in the SQL is collapsed and the parameters are serialized with
+    sorted keys, so queries built by the same code with the same arguments match.
+    """
+    normalized = _WHITESPACE.sub(" ", query).strip()
+    params = json.dumps(parameters or {}, sort_keys=True, default=str)
+    return f"{model}\n{normalized}\n{params}"
+
+
+def _forget(key: Hashable, flight: _Flight) -> None:
+    if _flights.get(key) is flight:
+        del _flights[key]
+
+
+async def single_flight(key: Hashable, execute: Callable[[], Awaitable[T]]) -> T:
+    """
+    Await `execute()`, sharing one execution between concurrent callers with the same `key`.
+
+    All callers receive the same result object, or the same exception, so it
+    must not be mutated.
+    """
+    if not CLICKHOUSE_COALESCE_QUERIES:
+        return await execute()
+
+    flight = _flights.get(key)
+    if flight is None:
+        flight = _Flight(asyncio.ensure_future(execute()))
+        _flights[key] = flight
+        flight.task.add_done_callback(lambda _: _forget(key, flight))
+
+    flight.waiters += 1
+    try:
+        return await asyncio.shield(flight.task)
+    except asyncio.CancelledError:
+        if flight.waiters == 1 and not flight.task.done():
+            # nobody else is waiting for it; don't hand the cancelled task to new callers
+            _forget(key, flight)
+            flight.task.cancel()
+        raise
+    finally:
+        flight.waiters -= 1
@@ -5,13 +5,16 @@ from typing import Annotated
 from clickhouse_connect import get_async_client, get_client
 from clickhouse_connect.driver.asyncclient import AsyncClient
 from clickhouse_connect.driver.client import Client
+from clickhouse_connect.driver.httputil import get_pool_manager
 from fastapi import Depends
 
 from agentops.api.environment import (
     CLICKHOUSE_DATABASE,
     CLICKHOUSE_HOST,
     CLICKHOUSE_PASSWORD,
+    CLICKHOUSE_POOL_SIZE,
     CLICKHOUSE_PORT,
+    CLICKHOUSE_QUERY_TIMEOUT,
     CLICKHOUSE_USER,
 )
 
@@ -43,6 +46,28 @@ class ConnectionConfig:
         """Non-instantiable class has a lower chance of being printed."""
         raise NotImplementedError("Cannot instantiate ConnectionConfig.")
 
+    @classmethod
+    def to_async_client_dict(cls) -> dict:
+        """
+        Connection configuration plus the pooling and timeout options used by
+        the async client.
+
+        The client runs queries in a thread pool over a pool of HTTP connections;
+        both are sized to `CLICKHOUSE_POOL_SIZE`, which `execute_query` also uses
+        to bound the queries in flight. Two spare threads and a non-blocking pool
+        leave room for `KILL QUERY` when every slot is taken.
+        """
+        kwargs = {
+            **cls.to_connection_dict(),
+            'pool_mgr': get_pool_manager(maxsize=CLICKHOUSE_POOL_SIZE),
+            'executor_threads': CLICKHOUSE_POOL_SIZE + 2,
+        }
+        if CLICKHOUSE_QUERY_TIMEOUT:
+            # the server stops the query first; the socket timeout is a backstop
+            kwargs['settings'] = {'max_execution_time': CLICKHOUSE_QUERY_TIMEOUT}
+            kwargs['send_receive_timeout'] = CLICKHOUSE_QUERY_TIMEOUT + 5
+        return kwargs
+
     @classmethod
     def to_connection_dict(cls) -> dict[str, str | int]:
         """
@@ -67,6 +92,9 @@ def get_clickhouse():
     FastAPI dependency to get the synchronous ClickHouse client.
     This allows for proper dependency injection and easier testing.
 
+    Only meant for scripts and test fixtures: its calls block the event loop, so
+    request handlers use `get_async_clickhouse` instead.
+
     Returns:
         Client: The synchronous ClickHouse client instance
     """
@@ -95,7 +123,7 @@ async def get_async_clickhouse():
         async with _async_clickhouse_lock:
             # Check again inside the lock to prevent race conditions
             if async_clickhouse is None:
-                async_clickhouse = await get_async_client(**ConnectionConfig.to_connection_dict())
+                async_clickhouse = await get_async_client(**ConnectionConfig.to_async_client_dict())
     return async_clickhouse
 
 
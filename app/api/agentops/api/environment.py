@@ -10,8 +10,12 @@ SUPABASE_S3_BUCKET: str = os.getenv("SUPABASE_S3_BUCKET")
 SUPABASE_S3_LOGS_BUCKET: str = os.getenv("SUPABASE_S3_LOGS_BUCKET")
 SUPABASE_S3_ACCESS_KEY_ID: str = os.getenv("SUPABASE_S3_ACCESS_KEY_ID")
 SUPABASE_S3_SECRET_ACCESS_KEY: str = os.getenv("SUPABASE_S3_SECRET_ACCESS_KEY")
+# uploads are streamed to storage in parts of this size; S3 requires at least 5 MB
+SUPABASE_S3_UPLOAD_PART_SIZE: int = int(os.getenv("SUPABASE_S3_UPLOAD_PART_SIZE", 8 * 1024 * 1024))
 
 JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY")
+# most verified SDK tokens remembered per process, so repeat requests skip verification
+JWT_VERIFY_CACHE_SIZE: int = int(os.getenv("JWT_VERIFY_CACHE_SIZE", 10_000))
 
 CLICKHOUSE_HOST: str = os.getenv("CLICKHOUSE_HOST")
 CLICKHOUSE_PORT: int = int(os.getenv("CLICKHOUSE_PORT", 0))
@@ -19,6 +23,35 @@ CLICKHOUSE_USER: str = os.getenv("CLICKHOUSE_USER", "")
 CLICKHOUSE_PASSWORD: str = os.getenv("CLICKHOUSE_PASSWORD", "")
 CLICKHOUSE_DATABASE: str = os.getenv("CLICKHOUSE_DATABASE", "")
 
+# connections kept open to ClickHouse, and the most queries a process runs at once
+CLICKHOUSE_POOL_SIZE: int = int(os.getenv("CLICKHOUSE_POOL_SIZE", 16))
+# queries running longer than this many seconds are cancelled (0 disables)
+CLICKHOUSE_QUERY_TIMEOUT: int = int(os.getenv("CLICKHOUSE_QUERY_TIMEOUT", 60))
+# most queries the expensive dashboard endpoints run at once, per process
+CLICKHOUSE_DASHBOARD_QUERY_LIMIT: int = int(os.getenv("CLICKHOUSE_DASHBOARD_QUERY_LIMIT", 4))
+# identical queries issued concurrently share a single execution
+CLICKHOUSE_COALESCE_QUERIES: bool = os.getenv("CLICKHOUSE_COALESCE_QUERIES", "true").lower() == "true"
+
+# queries taking longer than this are written to the slow query log (0 disables)
+CLICKHOUSE_SLOW_QUERY_MS: int = int(os.getenv("CLICKHOUSE_SLOW_QUERY_MS", 1000))
+# include `system.query_log` stats for slow queries (costs one delayed extra query per slow query)
+CLICKHOUSE_SLOW_QUERY_LOG_STATS: bool = (
+    os.getenv("CLICKHOUSE_SLOW_QUERY_LOG_STATS", "false").lower() == "true"
+)
+# capture `EXPLAIN indexes = 1` for slow queries
+CLICKHOUSE_EXPLAIN_SLOW_QUERIES: bool = (
+    os.getenv("CLICKHOUSE_EXPLAIN_SLOW_QUERIES", "false").lower() == "true"
+)
+
+# a trace never changes projects, so its owner can be cached for a long time
+TRACE_PROJECT_CACHE_TTL: int = int(os.getenv("TRACE_PROJECT_CACHE_TTL", 24 * 60 * 60))
+# how long a free plan project's trace visibility cutoff is cached; new traces only
+# move it later, so a stale cutoff shows a few more traces, never fewer
+FREEPLAN_CUTOFF_CACHE_TTL: int = int(os.getenv("FREEPLAN_CUTOFF_CACHE_TTL", 5 * 60))
+
+# largest slice of a log file returned by a single request, in bytes
+LOGS_PAGE_SIZE: int = int(os.getenv("LOGS_PAGE_SIZE", 1024 * 1024))
+
 
 PROFILING_ENABLED: bool = os.environ.get("PROFILING_ENABLED", "false").lower() == "true"
 PROFILING_FORMAT: str = os.environ.get("PROFILING_FORMAT", "html")
@@ -16,3 +16,10 @@ class InvalidModelError(Exception):
     def __init__(self, msg):
         super().__init__(msg)
         pass
+
+
+class InvalidEventsError(RuntimeError):
+    def __init__(self, results):
+        self.results = results
+        invalid = sum(1 for result in results if result["status"] != "ok")
+        super().__init__(f"{invalid} of {len(results)} events are invalid")
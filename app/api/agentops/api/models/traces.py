@@ -1,16 +1,21 @@
-from typing import Any, Optional, Type
+from typing import Any, ClassVar, Optional, Type
 from datetime import datetime, timedelta, timezone
 import json
 import pydantic
 from decimal import Decimal
 
+from agentops.common import cache
+from agentops.api.environment import FREEPLAN_CUTOFF_CACHE_TTL, TRACE_PROJECT_CACHE_TTL
 from agentops.api.db.clickhouse.models import (
     ClickhouseModel,
     TClickhouseModel,
     ClickhouseAggregatedModel,
     SelectFields,
     FilterFields,
+    SearchFields,
     WithinListOperation,
+    NgramSearchOperation,
+    TraceIdSearchOperation,
 )
 
 from .span_metrics import SpanMetricsMixin, TraceMetricsMixin
@@ -19,6 +24,43 @@ from .span_metrics import SpanMetricsMixin, TraceMetricsMixin
 TRACE_STATUS_OK = "OK"
 TRACE_STATUS_ERROR = "ERROR"
 
+# Trace search against the raw `otel_traces` columns. The operations emit the
+# predicates the skip indexes on these columns (see migration 0002) can use.
+TRACE_SEARCH_FIELDS: SearchFields = {
+    "trace_id": (TraceIdSearchOperation, "TraceId"),
+    "span_name": (NgramSearchOperation, "SpanName"),
+    "tags": (NgramSearchOperation, "SpanAttributes['agentops.tags']"),
+}
+
+
+# Columns replaced when reading the spans of a trace truncated for the free plan.
+# `SpanItem` leaves these out of the response, so they're selected as empty values
+# instead of being transferred. Only the keys of `SpanAttributes` are kept, which
+# is all the span type and LLM metrics checks look at.
+FREEPLAN_TRUNCATED_COLUMNS: dict[str, str] = {
+    'resource_attributes': "CAST(map(), 'Map(String, String)')",
+    'span_attributes': "mapFromArrays(SpanAttributes.keys, arrayMap(k -> '', SpanAttributes.keys))",
+    'event_timestamps': "emptyArrayString()",
+    'event_names': "emptyArrayString()",
+    'event_attributes': "emptyArrayString()",
+    'link_trace_ids': "emptyArrayString()",
+    'link_span_ids': "emptyArrayString()",
+    'link_trace_states': "emptyArrayString()",
+    'link_attributes': "emptyArrayString()",
+}
+
+# Event and link columns, which hold large payloads like exception stack traces.
+# Views that don't render them select them as empty arrays instead.
+EVENT_AND_LINK_COLUMNS: tuple[str, ...] = (
+    'Events.Timestamp',
+    'Events.Name',
+    'Events.Attributes',
+    'Links.TraceId',
+    'Links.SpanId',
+    'Links.TraceState',
+    'Links.Attributes',
+)
+
 
 def nanosecond_timedelta(ns: int) -> timedelta:
     """Return a timedelta object from nanoseconds."""
@@ -132,6 +174,12 @@ class SpanModel(SpanMetricsMixin, BaseTraceModel):
     link_trace_states: list[str] = pydantic.Field(default_factory=list)
     link_attributes: list[Any] = pydantic.Field(default_factory=list)
 
+    # select these fields to read spans without the contents hidden from free plans
+    freeplan_truncated_fields: ClassVar[SelectFields] = [
+        f"{FREEPLAN_TRUNCATED_COLUMNS.get(field, db_col)} as {field}"
+        for db_col, field in BaseTraceModel.selectable_fields.items()
+    ]
+
     @property
     def start_time(self) -> datetime:
         """start_time property returns the timestamp of the span."""
@@ -143,6 +191,68 @@ class SpanModel(SpanMetricsMixin, BaseTraceModel):
         return self.start_time + nanosecond_timedelta(self.duration)
 
 
+class TraceIdIndexModel(ClickhouseModel):
+    """
+    TraceIdIndexModel resolves the project and time bounds of a single trace from
+    the `otel_traces_trace_id_idx` table.
+
+    `otel_traces` is ordered by `(project_id, Timestamp)`, so filtering it by
+    `TraceId` alone reads every partition. The index table is ordered by `TraceId`
+    and lets us turn a trace id into a narrow `(project_id, Timestamp)` range first.
+    """
+
+    table_name = "otel_traces_trace_id_idx"
+    selectable_fields = {
+        "any(project_id)": "project_id",
+        "min(Start)": "start_time",
+        "max(End)": "end_time",
+    }
+    filterable_fields = {
+        "trace_id": ("=", "TraceId"),
+    }
+
+    project_id: str
+    start_time: datetime
+    end_time: datetime
+
+    @classmethod
+    async def get(cls, trace_id: str) -> Optional['TraceIdIndexModel']:
+        """Get the bounds for `trace_id`, or None if the trace is not indexed."""
+        rows = await cls.select(filters={"trace_id": trace_id})
+
+        # aggregates without a GROUP BY always return a row; an empty project means no match
+        if not rows or not rows[0].project_id:
+            return None
+        return rows[0]
+
+    @classmethod
+    async def get_project_id(cls, trace_id: str) -> Optional[str]:
+        """
+        Get the ID of the project that owns `trace_id`, or None if the trace is not indexed.
+
+        Reads a single row of the index; the answer is cached since a trace
+        never moves between projects.
+        """
+        cache_key = f"agentops.trace_project:{trace_id}"
+        if project_id := cache.get(cache_key):
+            return project_id
+
+        if not (bounds := await cls.get(trace_id)):
+            return None
+
+        cache.setex(cache_key, TRACE_PROJECT_CACHE_TTL, bounds.project_id)
+        return bounds.project_id
+
+    def as_filters(self) -> FilterFields:
+        """Convert the bounds into filters understood by `BaseTraceModel`."""
+        return {
+            "project_id": self.project_id,
+            "start_time": self.start_time,
+            # filter values are formatted with second precision, so round the upper bound up
+            "end_time": self.end_time + timedelta(seconds=1),
+        }
+
+
 class TraceModel(TraceMetricsMixin, ClickhouseAggregatedModel):
     """
     TraceModel is an aggregate model that actually only queries one model, but
@@ -160,6 +270,25 @@ class TraceModel(TraceMetricsMixin, ClickhouseAggregatedModel):
             spans=spans,
         )
 
+    @classmethod
+    async def select(cls, *, filters: Optional[FilterFields] = None, **kwargs) -> 'TraceModel':
+        """
+        Select the spans of a trace.
+
+        When a trace is requested by `trace_id` alone its project and time bounds
+        are resolved through `TraceIdIndexModel` first, so the span query only
+        reads the matching partitions and primary key range. Traces missing from
+        the index fall back to the unbounded query.
+        """
+        filters = dict(filters or {})
+
+        bounded = any(filters.get(field) is not None for field in ("project_id", "start_time", "end_time"))
+        if filters.get("trace_id") and not bounded:
+            if bounds := await TraceIdIndexModel.get(filters["trace_id"]):
+                filters.update(bounds.as_filters())
+
+        return await super().select(filters=filters, **kwargs)
+
     @property
     def trace_id(self) -> str:
         """
@@ -215,9 +344,9 @@ class TraceSummaryModel(BaseTraceModel):
     }
     searchable_fields = {
         # searchable field should reference the alias we create in the sub-select
-        "trace_id": ("ILIKE", "trace_id"),
-        "span_name": ("ILIKE", "span_name"),
-        "tags": ("ILIKE", "tags"),
+        "trace_id": (TraceIdSearchOperation, "trace_id"),
+        "span_name": (NgramSearchOperation, "span_name"),
+        "tags": (NgramSearchOperation, "tags"),
     }
 
     trace_id: str
@@ -258,6 +387,19 @@ class TraceSummaryModel(BaseTraceModel):
         having_clause, having_params = cls._get_search_clause(search)
         params = {**where_params, **having_params}
 
+        if search:
+            # `HAVING` matches against the root span of each trace, which can't use
+            # the skip indexes; narrow the traces being aggregated to those with a
+            # matching span first so only their granules are read.
+            prefilter_clause, prefilter_params = cls._get_search_clause(search, fields=TRACE_SEARCH_FIELDS)
+            params.update(prefilter_params)
+
+            subquery_where = prefilter_clause
+            if where_clause:
+                subquery_where = f"({where_clause}) AND ({prefilter_clause})"
+            trace_ids = f"TraceId IN (SELECT TraceId FROM {cls.table_name} WHERE {subquery_where})"
+            where_clause = f"({where_clause}) AND {trace_ids}" if where_clause else trace_ids
+
         # we use `argMin` on the aggregation because we can assume that the oldest
         # span is the root span
         query = f"""
@@ -311,6 +453,83 @@ class TraceSummaryModel(BaseTraceModel):
         return query, params
 
 
+class TraceVisibilityCutoffModel(BaseTraceModel):
+    """
+    TraceVisibilityCutoffModel finds the start time of a project's Nth newest trace.
+
+    Free plan projects can always see their `FREEPLAN_TRACE_MIN_NUM` newest traces,
+    regardless of age. Those are exactly the traces starting at or after this
+    cutoff, so a single cached timestamp answers whether a trace is one of them
+    instead of listing the newest trace IDs on every request.
+    """
+
+    filterable_fields = {
+        "project_id": ("=", "project_id"),
+    }
+
+    cutoff: datetime
+    trace_count: int
+
+    @pydantic.field_validator('cutoff', mode='before')
+    def datetime_with_timezone(cls, v: datetime) -> datetime:
+        """Ensure the cutoff is timezone aware."""
+        return v.astimezone(timezone.utc)
+
+    @classmethod
+    def _get_select_query(
+        cls: Type[TClickhouseModel],
+        *,
+        fields: Optional[SelectFields] = None,
+        filters: Optional[FilterFields] = None,
+        search: Optional[str] = None,
+        order_by: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: int = 1,
+    ) -> tuple[str, dict[str, Any]]:
+        if fields or search:
+            raise NotImplementedError(
+                "`TraceVisibilityCutoffModel.select` does not support `fields` or `search`"
+            )
+
+        where_clause, params = cls._get_where_clause(**(filters or {}))
+        query = f"""
+        SELECT
+            min(start_time) AS cutoff,
+            count() AS trace_count
+        FROM
+        (
+            SELECT min(Timestamp) AS start_time
+            FROM {cls.table_name}
+            {f"WHERE {where_clause}" if where_clause else ""}
+            GROUP BY TraceId
+            ORDER BY start_time DESC
+            LIMIT {limit}
+        )
+        """
+        return query, params
+
+    @classmethod
+    async def get_cutoff(cls, project_id: str, num_traces: int) -> Optional[datetime]:
+        """
+        Get the start time of the project's `num_traces`th newest trace, or None if
+        the project has fewer traces than that, in which case all of them qualify.
+
+        The cutoff is cached for `FREEPLAN_CUTOFF_CACHE_TTL` seconds. Traces are
+        ingested straight into ClickHouse, so the cache can't be updated on ingest;
+        until it expires newer traces only make the cached cutoff too early, which
+        keeps a few more traces visible rather than hiding any.
+        """
+        cache_key = f"agentops.freeplan_cutoff:{project_id}"
+        if (cached := cache.get(cache_key)) is not None:
+            return datetime.fromisoformat(cached) if cached else None
+
+        rows = await cls.select(filters={"project_id": project_id}, limit=num_traces)
+        cutoff = rows[0].cutoff if rows and rows[0].trace_count >= num_traces else None
+
+        cache.setex(cache_key, FREEPLAN_CUTOFF_CACHE_TTL, cutoff.isoformat() if cutoff else "")
+        return cutoff
+
+
 class TraceListMetricsModel(SpanMetricsMixin, BaseTraceModel):
     """
     Returns statistics related to trace counts for a given project. This model is used to
@@ -335,12 +554,8 @@ class TraceListMetricsModel(SpanMetricsMixin, BaseTraceModel):
         "end_time": ("<=", "Timestamp"),
         "span_name": ("ILIKE", "SpanName"),
     }
-    searchable_fields = {
-        # searchable field should reference the columns in the table
-        "trace_id": ("ILIKE", "TraceId"),
-        "span_name": ("ILIKE", "SpanName"),
-        "tags": ("ILIKE", "SpanAttributes['agentops.tags']"),
-    }
+    # searchable field should reference the columns in the table
+    searchable_fields = TRACE_SEARCH_FIELDS
 
     # Add aggregated fields
     trace_id: str
@@ -398,15 +613,11 @@ class TraceListMetricsModel(SpanMetricsMixin, BaseTraceModel):
 
         # Apply search conditions if provided
         if search:
-            search_conditions = []
-            search_value = f"%{search}%"
-            for field, (operator, column) in cls.searchable_fields.items():
-                if operator == "ILIKE":
-                    search_conditions.append(f"{column} ILIKE %(search_{field})s")
-                    params[f"search_{field}"] = search_value
-
-            if search_conditions:
-                search_clause = f"({' OR '.join(search_conditions)})"
+            search_clause, search_params = cls._get_search_clause(search)
+            params.update(search_params)
+
+            if search_clause:
+                search_clause = f"({search_clause})"
                 where_clause = f"{where_clause} AND {search_clause}" if where_clause else search_clause
 
         # Aggregate by trace at the database level - this is the key optimization
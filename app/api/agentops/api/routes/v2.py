@@ -10,7 +10,12 @@ from termcolor import colored
 from agentops.common.environment import APP_URL
 import agentops.api.event_handlers as event_handlers
 from agentops.api.db.supabase_client import AsyncSupabaseClient
-from agentops.api.exceptions import ExpiredJWTError, InvalidModelError, InvalidAPIKeyError
+from agentops.api.exceptions import (
+    ExpiredJWTError,
+    InvalidAPIKeyError,
+    InvalidEventsError,
+    InvalidModelError,
+)
 from agentops.api.log_config import logger
 from agentops.api.utils import generate_jwt, update_stats, validate_uuid, verify_jwt
 
@@ -438,6 +443,98 @@ async def v2_create_thread(request: Request, supabase: AsyncSupabaseClient):
         )
 
 
+EVENT_TABLES = ("actions", "llms", "tools", "errors")
+
+
+def validate_events(events, *, update: bool = False) -> list[dict]:
+    """
+    Check a batch of events before anything is written.
+
+    Returns one result per event, in order. If any event would fail to be written,
+    raises `InvalidEventsError` carrying those results instead, so a batch is
+    written in full or not at all. Error events can't be updated (their rows carry
+    no id), so updates mark them as skipped, as older SDKs still send them.
+    """
+    if not isinstance(events, list):
+        raise RuntimeError("events must be a list")
+
+    results = []
+    for index, event in enumerate(events):
+        result = {"index": index, "id": None, "status": "ok"}
+        results.append(result)
+
+        if not isinstance(event, dict):
+            result.update(status="error", message="event must be an object")
+            continue
+
+        result["id"] = event.get("id")
+        if event.get("event_type") == "errors":
+            if update:
+                result.update(status="skipped", message="error events cannot be updated")
+            continue
+
+        missing = [key for key in ("init_timestamp", "end_timestamp") if key not in event]
+        if update and not event.get("id"):
+            missing.insert(0, "id")
+        if missing:
+            result.update(status="error", message=f"missing {', '.join(missing)}")
+
+    if any(result["status"] == "error" for result in results):
+        raise InvalidEventsError(results)
+    return results
+
+
+async def build_event_rows(
+    events: list[dict], session_id: str, supabase: AsyncSupabaseClient
+) -> dict[str, list[dict]]:
+    """Turn a validated batch of events into rows, grouped by the table they are written to."""
+    # premium_status = await get_premium_status(supabase, sessions['id'])
+    premium_status = False
+
+    def handle(event: dict):
+        if event["event_type"] == "llms":
+            return event_handlers.handle_llms(event, premium_status, session_id, supabase)
+        elif event["event_type"] == "tools":
+            return event_handlers.handle_tools(event, session_id, supabase)
+        elif event["event_type"] == "errors":
+            return event_handlers.handle_errors(event, session_id, supabase)
+        return event_handlers.handle_actions(event, session_id, supabase)
+
+    # screenshots are uploaded while action rows are built, so build the rows concurrently
+    rows = await asyncio.gather(*[handle(event) for event in events])
+
+    tables: dict[str, list[dict]] = {table: [] for table in EVENT_TABLES}
+    for event, row in zip(events, rows):
+        tables[event["event_type"] if event["event_type"] in tables else "actions"].append(row)
+    return tables
+
+
+async def keep_existing_rows(
+    tables: dict[str, list[dict]], supabase: AsyncSupabaseClient
+) -> dict[str, list[dict]]:
+    """Drop the rows whose id isn't in their table, so updating events never creates them."""
+
+    async def existing_ids(table: str, rows: list[dict]) -> set[str]:
+        if not rows:
+            return set()
+        ids = [str(row["id"]) for row in rows]
+        result = await supabase.table(table).select("id").in_("id", ids).execute()
+        return {str(row["id"]) for row in result.data}
+
+    found = await asyncio.gather(*[existing_ids(table, rows) for table, rows in tables.items()])
+    return {
+        table: [row for row in rows if str(row["id"]) in ids]
+        for (table, rows), ids in zip(tables.items(), found)
+    }
+
+
+async def _execute_writes(writes: list) -> None:
+    results = await asyncio.gather(*writes, return_exceptions=True)
+    runtime_errors = [result for result in results if isinstance(result, Exception)]
+    if len(runtime_errors) > 0:
+        raise RuntimeError(runtime_errors[0])
+
+
 @router.post("/create_events")
 async def v2_create_events(request: Request, supabase: AsyncSupabaseClient):
     try:
@@ -449,72 +546,40 @@ async def v2_create_events(request: Request, supabase: AsyncSupabaseClient):
         session_id = verify_jwt(token, jwt_secret)
         data = await request.json()
 
-        # premium_status = await get_premium_status(supabase, sessions['id'])
-        premium_status = False
+        events = data.get("events")
+        validate_events(events)
+        tables = await build_event_rows(events, session_id, supabase)
 
-        actions = []
-        llms = []
-        tools = []
-        errors = []
         additional_cost: Decimal | None = Decimal(0)
-        additional_events = 0
         additional_prompt_tokens = 0
         additional_completion_tokens = 0
-        for event in data.get("events"):
-            additional_events += 1
-            if event["event_type"] == "llms":
-                llm = await event_handlers.handle_llms(event, premium_status, session_id)
-                cost = llm.get("cost")
-                if cost is not None:
-                    additional_cost += Decimal(cost)
-                additional_prompt_tokens += llm["prompt_tokens"]
-                additional_completion_tokens += llm["completion_tokens"]
-                llms.append(llm)
-            elif event["event_type"] == "tools":
-                tools.append(await event_handlers.handle_tools(event, session_id))
-            elif event["event_type"] == "errors":
-                errors.append(await event_handlers.handle_errors(event, session_id))
-            else:
-                actions.append(await event_handlers.handle_actions(supabase, event, session_id))
+        for llm in tables["llms"]:
+            cost = llm.get("cost")
+            if cost is not None:
+                additional_cost += Decimal(cost)
+            additional_prompt_tokens += llm["prompt_tokens"]
+            additional_completion_tokens += llm["completion_tokens"]
 
         if additional_cost == Decimal(0):
             additional_cost = None
 
-        inserts = []
-        if len(actions) != 0:
-            inserts.append(supabase.table("actions").insert(actions).execute())
-            for action in actions:
-                await export.create_action_event(action)
-        if len(llms) != 0:
-            inserts.append(supabase.table("llms").insert(llms).execute())
-            for llm in llms:
-                await export.create_llm_event(llm)
-        if len(tools) != 0:
-            inserts.append(supabase.table("tools").insert(tools).execute())
-            for tool in tools:
-                await export.create_tool_event(tool)
-        if len(errors) != 0:
-            inserts.append(supabase.table("errors").insert(errors).execute())
-            for error in errors:
-                await export.create_error_event(error)
+        # one insert per table, and a single insert into ClickHouse for the whole batch
+        inserts = [supabase.table(table).insert(rows).execute() for table, rows in tables.items() if rows]
+        if inserts:
+            inserts.append(export.create_events(session_id, **tables))
 
         inserts.append(
             update_stats(
                 supabase=supabase,
                 session_id=session_id,
                 cost=additional_cost,
-                events=additional_events,
+                events=len(events),
                 prompt_tokens=additional_prompt_tokens,
                 completion_tokens=additional_completion_tokens,
-                errors=len(errors),
+                errors=len(tables["errors"]),
             )
         )
-
-        if inserts:
-            results = await asyncio.gather(*inserts, return_exceptions=True)
-            runtime_errors = [result for result in results if isinstance(result, Exception)]
-            if len(runtime_errors) > 0:
-                raise RuntimeError(runtime_errors[0])
+        await _execute_writes(inserts)
 
         logger.info(colored(f"Completed request request for Session: {session_id}", "yellow"))
         return JSONResponse("Success")
@@ -527,6 +592,12 @@ async def v2_create_events(request: Request, supabase: AsyncSupabaseClient):
             "message": f"Invalid model while posting event: {e}",
         }
         return JSONResponse(message, status_code=401)
+    except InvalidEventsError as e:
+        logger.warning(f"{request.url.path}: Rejected events: {e}")
+        return JSONResponse(
+            {"path": request.url.path, "message": f"Error posting event: {e}", "results": e.results},
+            status_code=400,
+        )
     except RuntimeError as e:
         try:
             data = await request.json()
@@ -551,43 +622,31 @@ async def v2_update_events(request: Request, supabase: AsyncSupabaseClient):
         session_id = verify_jwt(token, jwt_secret)
         data = await request.json()
 
-        # premium_status = await get_premium_status(supabase, sessions['id'])
-        premium_status = False
-
-        actions = []
-        llms = []
-        tools = []
-        errors = []
-        for event in data.get("events"):
-            if event["event_type"] == "llms":
-                llm = await event_handlers.handle_llms(event, premium_status, session_id)
-                llms.append(llm)
-            elif event["event_type"] == "tools":
-                tools.append(await event_handlers.handle_tools(event, session_id))
-            elif event["event_type"] == "errors":
-                errors.append(await event_handlers.handle_errors(event, session_id))
-            else:
-                actions.append(await event_handlers.handle_actions(supabase, event, session_id))
-
-        inserts = []
-        for action in actions:
-            inserts.append(supabase.table("actions").update(action).eq("id", action.get("id")).execute())
-            await export.update_action_event(action)
-        for llm in llms:
-            inserts.append(supabase.table("llms").update(llm).eq("id", llm.get("id")).execute())
-            await export.update_llm_event(llm)
-        for tool in tools:
-            inserts.append(supabase.table("tools").update(tool).eq("id", tool.get("id")).execute())
-            await export.update_tool_event(tool)
-        for error in errors:
-            inserts.append(supabase.table("errors").update(error).eq("id", error.get("id")).execute())
-            await export.update_error_event(error)
+        events = data.get("events")
+        results = validate_events(events, update=True)
+        events = [event for event, result in zip(events, results) if result["status"] == "ok"]
+        tables = await keep_existing_rows(await build_event_rows(events, session_id, supabase), supabase)
 
-        if inserts:
-            results = await asyncio.gather(*inserts, return_exceptions=True)
-            runtime_errors = [result for result in results if isinstance(result, RuntimeError)]
-            if len(runtime_errors) > 0:
-                raise RuntimeError(runtime_errors)
+        updated = {str(row["id"]) for rows in tables.values() for row in rows}
+        skipped = [
+            result for result in results if result["status"] == "ok" and str(result["id"]) not in updated
+        ]
+        for result in skipped:
+            result.update(status="skipped", message="event not found")
+        if skipped:
+            logger.warning(f"{request.url.path}: Skipped {len(skipped)} events that don't exist")
+
+        # every row exists and carries all of its table's columns, so upserting by id updates it in full
+        updates = [
+            supabase.table(table).upsert(rows, on_conflict="id").execute()
+            for table, rows in tables.items()
+            if rows
+        ]
+        if updates:
+            updates.append(
+                export.update_events(actions=tables["actions"], llms=tables["llms"], tools=tables["tools"])
+            )
+            await _execute_writes(updates)
 
         logger.info(colored(f"Completed request request for Session: {session_id}", "yellow"))
         return JSONResponse("Success")
@@ -600,6 +659,12 @@ async def v2_update_events(request: Request, supabase: AsyncSupabaseClient):
             "message": f"Invalid model while posting event: {e}",
         }
         return JSONResponse(message, status_code=401)
+    except InvalidEventsError as e:
+        logger.warning(f"{request.url.path}: Rejected events: {e}")
+        return JSONResponse(
+            {"path": request.url.path, "message": f"Error posting event: {e}", "results": e.results},
+            status_code=400,
+        )
     except RuntimeError as e:
         try:
             data = await request.json()
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, Request, HTTPException
 from fastapi.responses import JSONResponse
 
 from agentops.common.orm import get_orm_session, Session
+from agentops.opsboard.access import get_project_prem_status
 from agentops.opsboard.models import ProjectModel
 from agentops.api.auth import JWTPayload, generate_jwt, get_jwt_token
 from agentops.api.exceptions import InvalidAPIKeyError
@@ -108,12 +109,14 @@ async def verify_token(
     This endpoint verifies the JWT token in the Authorization header
     and returns the token payload if valid.
     """
-    project: ProjectModel = ProjectModel.get_by_id(orm, jwt_payload.project_id)
+    prem_status = get_project_prem_status(orm, jwt_payload.project_id)
+    if prem_status is None:
+        raise HTTPException(status_code=401, detail="Project not found")
 
     # if a user has upgraded or downgraded their plan, we need to reauthorize
     # the token to use the new plan. the SDK will call acquire a new auth token
     # when it sees a 401 response code.
-    if project.org.prem_status.value != jwt_payload.project_prem_status:
+    if prem_status.value != jwt_payload.project_prem_status:
         raise HTTPException(status_code=401, detail="Reauthorized to use new plan")
 
     return VerifyTokenResponse(
@@ -9,18 +9,21 @@ Uses Supabase Bucket storage (via the AWS S3 interface).
 """
 
 import re
-from fastapi import Depends, HTTPException, Request, status
+import asyncio
+from typing import Annotated, Optional
+from botocore.exceptions import ClientError
+from fastapi import Depends, HTTPException, Query, Request, status
 
 from agentops.common.environment import APP_URL, FREEPLAN_LOGS_LINE_LIMIT
 from agentops.common.views import add_cors_headers
 from agentops.common.orm import Session, get_orm_session
 from agentops.common.freeplan import FreePlanFilteredResponse
 from agentops.auth.views import public_route
-from agentops.opsboard.models import ProjectModel
-from agentops.api.environment import SUPABASE_S3_LOGS_BUCKET
+from agentops.opsboard.access import get_project_access
+from agentops.api.environment import SUPABASE_S3_LOGS_BUCKET, LOGS_PAGE_SIZE
 from agentops.api.storage import get_s3_client
 from agentops.api.storage import BaseObjectUploadView
-from agentops.api.models.traces import TraceModel
+from agentops.api.models.traces import TraceIdIndexModel
 
 
 @public_route
@@ -55,6 +58,9 @@ class LogContentResponse(FreePlanFilteredResponse):
 
     content: str
     trace_id: str
+    offset: int = 0
+    next_offset: Optional[int] = None
+    size: int = 0
 
 
 def convert_trace_id(trace_id: str) -> str:
@@ -70,6 +76,56 @@ def convert_trace_id(trace_id: str) -> str:
         return trace_id
 
 
+def read_log_range(s3_client, key: str, offset: int, limit: int) -> tuple[bytes, int]:
+    """
+    Read up to `limit` bytes of a log file starting at byte `offset`.
+
+    Only the requested range is transferred from storage. Returns the bytes read
+    and the total size of the file.
+    """
+    try:
+        response = s3_client.get_object(
+            Bucket=SUPABASE_S3_LOGS_BUCKET,
+            Key=key,
+            Range=f"bytes={offset}-{offset + limit - 1}",
+        )
+    except ClientError as e:
+        # the offset is at or past the end of the file (or the file is empty)
+        if e.response.get('Error', {}).get('Code') != 'InvalidRange':
+            raise
+        head = s3_client.head_object(Bucket=SUPABASE_S3_LOGS_BUCKET, Key=key)
+        return b'', head['ContentLength']
+
+    chunk = response['Body'].read()
+    # ContentRange looks like "bytes 0-1023/52413"
+    if content_range := response.get('ContentRange'):
+        size = int(content_range.rsplit('/', 1)[1])
+    else:  # storage ignored the range and returned the whole file
+        size = len(chunk)
+        chunk = chunk[offset : offset + limit]
+    return chunk, size
+
+
+def trim_partial_line(chunk: bytes) -> bytes:
+    """
+    Cut a page that stops mid-file back to the end of its last complete line.
+
+    A line longer than the whole page is cut after its last complete UTF-8
+    character instead, so the page can still be decoded.
+    """
+    if end := chunk.rfind(b'\n') + 1:
+        return chunk[:end]
+
+    for back in range(1, min(4, len(chunk)) + 1):
+        byte = chunk[-back]
+        if byte & 0xC0 != 0x80:  # first byte of the last character
+            width = 1 if byte < 0x80 else 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            if width > back:
+                return chunk[:-back] or chunk
+            break
+    return chunk
+
+
 @add_cors_headers(
     origins=[APP_URL],
     methods=["GET", "OPTIONS"],
@@ -79,42 +135,52 @@ async def get_trace_logs(
     request: Request,
     orm: Session = Depends(get_orm_session),
     trace_id: str,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=LOGS_PAGE_SIZE)] = LOGS_PAGE_SIZE,
 ) -> LogContentResponse:
     """
     Retrieve logs for a specific trace ID.
     Verifies that the user has access to the trace before returning the logs.
-    """
-    trace_id_int = convert_trace_id(trace_id)
 
-    trace = await TraceModel.select(
-        filters={
-            "trace_id": trace_id,
-        }
-    )
-    if not trace.spans:  # trace does not exist
+    Logs are returned a page at a time: at most `limit` bytes starting at byte
+    `offset`, ending on a line boundary. `next_offset` is the offset of the next
+    page, or None once the end of the file has been reached. Free plan users
+    only get the first page.
+    """
+    project_id = await TraceIdIndexModel.get_project_id(trace_id)
+    project = get_project_access(orm, request.state.session.user_id, project_id) if project_id else None
+    if not project:  # trace does not exist or belongs to another org
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have access to this trace",
         )
 
-    project = ProjectModel.get_by_id(orm, trace.project_id)
-    if not project or not project.org.is_user_member(request.state.session.user_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have access to this trace",
-        )
+    if project.is_freeplan:
+        offset = 0
+
+    trace_id_int = convert_trace_id(trace_id)
 
     try:
         s3_client = get_s3_client()
-        response = s3_client.get_object(
-            Bucket=SUPABASE_S3_LOGS_BUCKET,
-            Key=f"{trace_id_int}.log",
+        chunk, size = await asyncio.to_thread(
+            read_log_range,
+            s3_client,
+            f"{trace_id_int}.log",
+            offset,
+            limit,
         )
-        content = response['Body'].read().decode('utf-8')
+
+        next_offset = offset + len(chunk)
+        if next_offset < size:
+            chunk = trim_partial_line(chunk)
+            next_offset = offset + len(chunk)
 
         return LogContentResponse(
-            content=content,
+            content=chunk.decode('utf-8', errors='replace'),
             trace_id=trace_id,
+            offset=offset,
+            next_offset=next_offset if next_offset < size and not project.is_freeplan else None,
+            size=size,
             freeplan_truncated=project.is_freeplan,
         )
 
@@ -10,8 +10,10 @@ from agentops.common.views import add_cors_headers
 from agentops.common.orm import get_orm_session, Session
 from agentops.common.freeplan import freeplan_clamp_start_time, freeplan_clamp_end_time
 
-from agentops.opsboard.models import ProjectModel
+from agentops.opsboard.access import ProjectAccess, get_project_access
 from agentops.api.models.metrics import ProjectMetricsModel
+from agentops.api.environment import CLICKHOUSE_DASHBOARD_QUERY_LIMIT
+from agentops.api.db.clickhouse.concurrency import limit_queries
 
 from .responses import (
     ProjectMetricsResponse,
@@ -78,13 +80,14 @@ class ProjectMetricsView(BaseView):
     """
 
     orm: Session
-    project: ProjectModel
+    project: ProjectAccess
     freeplan_truncated: bool = False
 
     @add_cors_headers(
         origins=[APP_URL],
         methods=["GET", "OPTIONS"],
     )
+    @limit_queries("project_metrics", CLICKHOUSE_DASHBOARD_QUERY_LIMIT)
     async def __call__(
         self,
         *,
@@ -150,10 +153,10 @@ class ProjectMetricsView(BaseView):
 
         return end_time
 
-    async def get_project(self, project_id: str | UUID) -> ProjectModel:
-        project = ProjectModel.get_by_id(self.orm, project_id)
+    async def get_project(self, project_id: str | UUID) -> ProjectAccess:
+        project = get_project_access(self.orm, self.request.state.session.user_id, project_id)
 
-        if not project or not project.org.is_user_member(self.request.state.session.user_id):
+        if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
         return project
@@ -1,5 +1,5 @@
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from fastapi import Depends, Query, HTTPException, status
 import hashlib
 from time import time
@@ -15,9 +15,17 @@ from agentops.common.views import add_cors_headers
 from agentops.common.orm import get_orm_session, Session
 from agentops.common.freeplan import freeplan_clamp_datetime
 
-from agentops.opsboard.models import ProjectModel
-from agentops.api.models.traces import TraceModel, TraceSummaryModel, TraceListModel
+from agentops.opsboard.access import ProjectAccess, get_project_access
+from agentops.api.models.traces import (
+    SpanModel,
+    TraceIdIndexModel,
+    TraceModel,
+    TraceListModel,
+    TraceVisibilityCutoffModel,
+)
 from agentops.api.models.span_metrics import SpanMetricsResponse, TraceMetricsResponse
+from agentops.api.environment import CLICKHOUSE_DASHBOARD_QUERY_LIMIT
+from agentops.api.db.clickhouse.concurrency import limit_queries
 
 from .responses import (
     TraceListResponse,
@@ -129,48 +137,50 @@ class BaseTraceView(BaseView):
     """
 
     orm: Session
-    project: ProjectModel
+    project: ProjectAccess
     freeplan_truncated: bool = False
 
-    async def get_project(self, project_id: str) -> ProjectModel:
+    async def get_project(self, project_id: str) -> ProjectAccess:
         """
         Retrieves the project by ID and checks if the user has access to it.
         Raises HTTPException if the project is not found or access is denied.
         """
-        project = ProjectModel.get_by_id(self.orm, project_id)
+        project = get_project_access(self.orm, self.request.state.session.user_id, project_id)
 
-        if not project or not project.org.is_user_member(self.request.state.session.user_id):
+        if not project:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
         return project
 
-    async def get_trace_ids(self, limit: int, offset: int = 0) -> set[str]:
+    async def get_freeplan_cutoff(self) -> Optional[datetime]:
         """
-        Retrieves the trace IDs for the project, limited by the specified number and offset.
+        Retrieves the start time of the project's oldest always-visible trace, or None
+        if the project has too few traces for any of them to be hidden.
         """
-        traces = await TraceSummaryModel.select(
-            # fields=["trace_id"],
-            filters={"project_id": self.project.id},
-            order_by="start_time DESC",
-            limit=limit,
-            offset=offset,
-        )
-        return {trace.trace_id for trace in traces}
+        if not hasattr(self, '_freeplan_cutoff'):  # cache for the rest of the request
+            self._freeplan_cutoff = await TraceVisibilityCutoffModel.get_cutoff(
+                self.project.id, FREEPLAN_TRACE_MIN_NUM
+            )
+        return self._freeplan_cutoff
 
-    async def trace_is_freeplan_truncated(self, trace: TraceModel) -> bool:
+    async def is_freeplan_truncated(self, start_time: datetime, end_time: datetime) -> bool:
         """
-        Determines if a trace is truncated for free plan users.
+        Determines if a trace with the given bounds is truncated for free plan users.
         """
         if not self.project.is_freeplan:
             return False  # not a freeplan, always allow
 
-        if not hasattr(self, '_freeplan_trace_ids'):  # cache the minimum visible trace IDs
-            self._freeplan_trace_ids = await self.get_trace_ids(FREEPLAN_TRACE_MIN_NUM)
-
-        if trace.trace_id in self._freeplan_trace_ids:  # trace is in the minimum visible traces, allow
+        cutoff = await self.get_freeplan_cutoff()
+        if cutoff is None or start_time >= cutoff:  # trace is in the minimum visible traces, allow
             return False
 
-        return freeplan_clamp_datetime(trace.end_time, FREEPLAN_TRACE_DAYS_CUTOFF) > trace.end_time
+        return freeplan_clamp_datetime(end_time, FREEPLAN_TRACE_DAYS_CUTOFF) > end_time
+
+    async def trace_is_freeplan_truncated(self, trace: TraceModel) -> bool:
+        """
+        Determines if a trace is truncated for free plan users.
+        """
+        return await self.is_freeplan_truncated(trace.start_time, trace.end_time)
 
 
 class TraceListView(BaseTraceView):
@@ -187,6 +197,7 @@ class TraceListView(BaseTraceView):
         origins=[APP_URL],
         methods=["GET", "OPTIONS"],
     )
+    @limit_queries("trace_list", CLICKHOUSE_DASHBOARD_QUERY_LIMIT)
     async def __call__(
         self,
         *,
@@ -335,19 +346,45 @@ class TraceDetailView(BaseTraceView):
         """
         self.orm = orm
 
-        trace = await TraceModel.select(
-            filters={
-                "trace_id": trace_id,
-            }
-        )
+        if not (bounds := await TraceIdIndexModel.get(trace_id)):
+            # not indexed yet; read the whole trace and check access afterwards
+            trace = await self.get_trace(trace_id)
+            self.project = await self.get_project(trace.project_id)
+            self.freeplan_truncated = await self.trace_is_freeplan_truncated(trace)
+            return await self.get_response(trace)
+
+        # check access and free plan visibility before reading any spans, so the
+        # contents a free plan can't see are never read from ClickHouse
+        self.project = await self.get_project(bounds.project_id)
+        filters = {"trace_id": trace_id, **bounds.as_filters()}
+
+        # the index records when the last span started, not when it ended, so a
+        # truncated trace is confirmed against the spans before it's shown that way
+        start_time, end_time = (dt.astimezone(timezone.utc) for dt in (bounds.start_time, bounds.end_time))
+        if await self.is_freeplan_truncated(start_time, end_time):
+            trace = await self.get_trace(trace_id, filters, fields=SpanModel.freeplan_truncated_fields)
+            self.freeplan_truncated = await self.trace_is_freeplan_truncated(trace)
+            if self.freeplan_truncated:
+                return await self.get_response(trace)
+
+        trace = await self.get_trace(trace_id, filters)
+        return await self.get_response(trace)
+
+    async def get_trace(
+        self,
+        trace_id: str,
+        filters: Optional[dict] = None,
+        fields: Optional[list[str]] = None,
+    ) -> TraceModel:
+        """
+        Retrieves the spans of a trace. Raises HTTPException if the trace has none.
+        """
+        trace = await TraceModel.select(filters=filters or {"trace_id": trace_id}, fields=fields)
 
         if not trace.spans:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trace not found.")
 
-        self.project = await self.get_project(trace.project_id)
-        self.freeplan_truncated = await self.trace_is_freeplan_truncated(trace)
-
-        return await self.get_response(trace)
+        return trace
 
     async def get_response(self, trace: TraceModel) -> TraceDetailResponse:
         """
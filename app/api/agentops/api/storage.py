@@ -1,6 +1,7 @@
 from typing import Optional
 from abc import ABC
-from io import BytesIO
+import asyncio
+import zlib
 from pydantic import BaseModel
 from fastapi import HTTPException, Depends, status
 import boto3
@@ -11,6 +12,7 @@ from agentops.api.environment import (
     SUPABASE_URL,
     SUPABASE_S3_ACCESS_KEY_ID,
     SUPABASE_S3_SECRET_ACCESS_KEY,
+    SUPABASE_S3_UPLOAD_PART_SIZE,
 )
 from agentops.api.auth import get_jwt_token, JWTPayload
 from agentops.common.route_config import BaseView
@@ -35,6 +37,136 @@ def get_s3_client() -> boto3.client:
     return _s3_client_instance
 
 
+# S3 rejects multipart parts smaller than this, except for the last one
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class StreamingUpload:
+    """
+    Stream an object to S3-compatible storage while it is being received.
+
+    Written data is buffered until it fills a part. Full parts are uploaded from
+    a worker thread while the next part is being received, and a part is only
+    started once the previous one finished, so at most two parts are held in
+    memory at a time. Objects that never fill a part are stored with a single
+    `put_object` call when the upload completes.
+
+    The boto3 client is synchronous, so every call to it runs in a thread to
+    keep the event loop free while data is transferred.
+
+    Usage:
+        upload = StreamingUpload(client, bucket, key)
+        try:
+            async for chunk in stream:
+                await upload.write(chunk)
+            await upload.complete()
+        except BaseException:
+            await upload.abort()
+            raise
+    """
+
+    def __init__(
+        self,
+        client: boto3.client,
+        bucket: str,
+        key: str,
+        *,
+        part_size: int = SUPABASE_S3_UPLOAD_PART_SIZE,
+        content_encoding: Optional[str] = None,
+    ) -> None:
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.content_encoding = content_encoding
+
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: list[dict] = []
+        self._pending: Optional[asyncio.Task] = None
+
+    @property
+    def _object_args(self) -> dict:
+        args = {'Bucket': self.bucket, 'Key': self.key}
+        if self.content_encoding:
+            args['ContentEncoding'] = self.content_encoding
+        return args
+
+    async def write(self, data: bytes) -> None:
+        """Add data to the object, uploading a part once enough is buffered."""
+        self._buffer += data
+        if len(self._buffer) >= self.part_size:
+            await self._upload_buffer()
+
+    async def complete(self) -> None:
+        """Upload whatever is still buffered and finalize the object."""
+        if self._upload_id is None:
+            await asyncio.to_thread(self.client.put_object, Body=bytes(self._buffer), **self._object_args)
+            self._buffer.clear()
+            return
+
+        if self._buffer:
+            await self._upload_buffer()
+        await self._wait_for_pending()
+        await asyncio.to_thread(
+            self.client.complete_multipart_upload,
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={'Parts': self._parts},
+        )
+
+    async def abort(self) -> None:
+        """Discard the upload, including any parts already stored."""
+        self._buffer.clear()
+        if self._upload_id is None:
+            return
+
+        try:
+            await self._wait_for_pending()
+        except Exception:
+            pass  # the upload is being discarded anyway
+        try:
+            await asyncio.to_thread(
+                self.client.abort_multipart_upload,
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+            )
+        except Exception as e:
+            logger.error(f"Could not abort multipart upload of {self.key}: {e}")
+
+    async def _upload_buffer(self) -> None:
+        if self._upload_id is None:
+            response = await asyncio.to_thread(self.client.create_multipart_upload, **self._object_args)
+            self._upload_id = response['UploadId']
+
+        # only one part in flight; this also waits for the previous part to be accepted
+        await self._wait_for_pending()
+
+        part_number = len(self._parts) + 1
+        body = bytes(self._buffer)
+        self._buffer.clear()
+        self._pending = asyncio.create_task(asyncio.to_thread(self._upload_part, part_number, body))
+
+    async def _wait_for_pending(self) -> None:
+        if self._pending is None:
+            return
+
+        pending, self._pending = self._pending, None
+        self._parts.append(await pending)
+
+    def _upload_part(self, part_number: int, body: bytes) -> dict:
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+
 class ObjectUploadResponse(BaseModel):
     url: str
     size: int
@@ -48,10 +180,17 @@ class BaseObjectUploadView(BaseView, ABC):
     implement or override the `filename` property to define a unique naming
     convention for the uploaded files.
 
+    The request body is streamed to storage as it arrives (see `StreamingUpload`),
+    so memory use is bounded by the part size rather than the object size, and
+    the event loop is never blocked on the transfer.
+
     Attributes:
         bucket_name (str): The name of the S3 bucket where the object will be uploaded.
         max_size (int): The maximum allowed size for the uploaded object in bytes.
-            Defaults to 10 MB (10 * 1024 * 1024).
+            Defaults to 25 MB (25 * 1024 * 1024).
+        compress (bool): Gzip the object before storing it, with a
+            `Content-Encoding: gzip` header so it's served decompressed.
+            `max_size` and the reported size apply to the uncompressed body.
         token (dict): A dictionary containing authentication or metadata
             information, such as project-specific identifiers.
         client (boto3.client): An S3 client instance for interacting with the
@@ -59,11 +198,9 @@ class BaseObjectUploadView(BaseView, ABC):
 
     Methods:
         __call__() -> ObjectUploadResponse:
-            Handles the upload process by reading the request body, uploading
-            the object, and returning a response with the public URL and size
-            of the uploaded object.
-        upload_body(body: BytesIO) -> None:
-            Uploads the object to the storage bucket using the provided body.
+            Handles the upload process by streaming the request body to storage
+            and returning a response with the public URL and size of the
+            uploaded object.
         filename() -> str:
             Generates or retrieves a unique filename for the object. This
             property must be implemented or overridden in subclasses.
@@ -73,6 +210,7 @@ class BaseObjectUploadView(BaseView, ABC):
 
     bucket_name: str
     max_size: int = 25 * 1024 * 1024  # 25 MB
+    compress: bool = False
 
     token: dict
     client: boto3.client
@@ -83,33 +221,41 @@ class BaseObjectUploadView(BaseView, ABC):
         self.token = token
         self.client = get_s3_client()
 
-        body = BytesIO()
+        upload = StreamingUpload(
+            self.client,
+            self.bucket_name,
+            self.filename,
+            content_encoding='gzip' if self.compress else None,
+        )
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if self.compress else None
         total_size = 0
 
-        # read the body in chunks so we don't ever load an entire oversized file into memory
-        async for chunk in self.request.stream():
-            total_size += len(chunk)
+        try:
+            # stream the body so we never load an entire oversized file into memory
+            async for chunk in self.request.stream():
+                total_size += len(chunk)
+
+                if total_size > self.max_size:
+                    logger.error("Uploaded file exceeds maximum size limit")
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File size exceeds the maximum limit of {self.max_size} bytes",
+                    )
 
-            if total_size > self.max_size:
-                logger.error("Uploaded file exceeds maximum size limit")
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail=f"File size exceeds the maximum limit of {self.max_size} bytes",
-                )
+                await upload.write(compressor.compress(chunk) if compressor else chunk)
 
-            body.write(chunk)
+            if compressor:
+                await upload.write(compressor.flush())
+            await upload.complete()
+        except BaseException:  # includes the request being cancelled when the client goes away
+            await upload.abort()
+            raise
 
-        body.seek(0)
-        await self.upload_body(body)
         return ObjectUploadResponse(
             url=self.public_url,
             size=total_size,
         )
 
-    async def upload_body(self, body: BytesIO) -> None:
-        """Upload the object to S3."""
-        self.client.upload_fileobj(body, self.bucket_name, self.filename)
-
     @property
     def filename(self) -> str:
         """Generate a unique filename for the object"""
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.responses import JSONResponse
@@ -56,3 +58,70 @@ class ExceptionMiddleware(BaseHTTPMiddleware):
                 status_code=500,
                 content={"error": "Internal Server Error"},
             )
+
+
+class CancelOnDisconnectMiddleware:
+    """
+    Middleware to cancel read requests when the client disconnects.
+
+    Starlette keeps running a handler after its client has gone away, so an
+    abandoned dashboard load would hold its ClickHouse queries (and connections)
+    until they finish. For GET and HEAD requests this watches the connection and
+    cancels the handler if the client disconnects before the response starts;
+    `execute_query` then kills the handler's running queries on the server.
+
+    Written as a plain ASGI middleware since it has to own `receive`, and must be
+    registered last so it wraps the other middleware.
+    """
+
+    methods = ("GET", "HEAD")
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            return await self.app(scope, receive, send)
+
+        # read requests have no body, so the request message can be buffered up front
+        # and the watcher below becomes the only reader of `receive`
+        request = await receive()
+        if request["type"] == "http.disconnect":
+            return
+
+        disconnected = asyncio.Event()
+        response_started = False
+
+        async def receive_wrapper():
+            nonlocal request
+            if request is not None:
+                message, request = request, None
+                return message
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        app_task = asyncio.create_task(self.app(scope, receive_wrapper, send_wrapper))
+
+        async def watch_disconnect():
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+            if not response_started:
+                app_task.cancel()
+
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await app_task
+        except asyncio.CancelledError:
+            # only swallow the cancellation we caused, never one aimed at this task
+            if not disconnected.is_set() or asyncio.current_task().cancelling():
+                raise
+            logger.debug(f"Client disconnected, cancelled {scope['method']} {scope['path']}")
+        finally:
+            watcher.cancel()
@@ -0,0 +1,242 @@
+"""
+Asyncio log tailing for deployment pods.
+
+The kubernetes client only exposes a blocking log follower, so every viewer used
+to hold a threadpool worker for as long as their connection stayed open. Here a
+single upstream follower is started per pod and its lines are written into a
+bounded ring buffer; any number of viewers read from that buffer at their own
+pace without touching the upstream stream.
+
+Every line is assigned a monotonically increasing offset so clients can resume
+(`?offset=N` or the SSE `Last-Event-ID` header) after a reconnect. Viewers that
+fall further behind than the buffer holds skip ahead and receive a marker
+instead of forcing the buffer to grow.
+"""
+
+from typing import AsyncIterator, Callable, Iterable, Optional
+from collections import deque
+from itertools import islice
+import asyncio
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# number of log lines kept in memory per pod for late joiners and resumes
+LOG_STREAM_BUFFER_LINES: int = int(os.getenv('LOG_STREAM_BUFFER_LINES', 5000))
+# seconds to keep an upstream follower alive after the last viewer disconnects
+LOG_STREAM_IDLE_TIMEOUT: int = int(os.getenv('LOG_STREAM_IDLE_TIMEOUT', 30))
+# seconds between keepalive comments sent to idle viewers
+LOG_STREAM_KEEPALIVE: int = int(os.getenv('LOG_STREAM_KEEPALIVE', 15))
+# seconds to wait for the follower thread to exit once its stream is closed
+LOG_STREAM_STOP_TIMEOUT: float = float(os.getenv('LOG_STREAM_STOP_TIMEOUT', 1))
+
+# Returns the upstream lines; if the iterable has a `close()` method it's called
+# from the event loop on stop and must unblock a read pending on the follower thread.
+LogSource = Callable[[], Iterable[str]]
+
+
+class LogStream:
+    """
+    A single upstream log follower fanned out to many viewers.
+
+    The upstream iterator is drained on one dedicated thread which hands lines
+    back to the event loop; viewers only ever await on the loop.
+    """
+
+    key: str
+    offset: int  # offset of the next line to be appended
+    done: bool
+
+    def __init__(self, key: str, source: LogSource, buffer_lines: int = LOG_STREAM_BUFFER_LINES):
+        self.key = key
+        self.offset = 0
+        self.done = False
+        self.viewers = 0
+
+        self._source = source
+        self._lines: deque[str] = deque(maxlen=buffer_lines)
+        self._changed = asyncio.Event()
+        self._stopped = threading.Event()
+        self._upstream: Optional[Iterable[str]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def first_offset(self) -> int:
+        """Offset of the oldest line still held in the buffer."""
+        return self.offset - len(self._lines)
+
+    def start(self) -> None:
+        """Start draining the upstream source on a background thread."""
+        self._loop = asyncio.get_running_loop()
+        self._thread = threading.Thread(target=self._drain, name=f"log-stream:{self.key}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[asyncio.Future]:
+        """
+        Stop forwarding upstream lines, closing the upstream so the follower thread exits.
+
+        Runs on the event loop, so the follower is joined on a worker thread;
+        the returned future completes once it has exited or the join timed out.
+        """
+        self._stopped.set()
+        self._close_upstream()
+        self._finish()
+        if self._thread is None or self._thread is threading.current_thread():
+            return None
+        return asyncio.ensure_future(asyncio.to_thread(self._join))
+
+    def _join(self) -> None:
+        assert self._thread is not None
+        self._thread.join(timeout=LOG_STREAM_STOP_TIMEOUT)
+        if self._thread.is_alive():
+            logger.warning(f"Log stream {self.key} follower did not exit after stop")
+
+    def _close_upstream(self) -> None:
+        if (close := getattr(self._upstream, 'close', None)) is None:
+            return
+        try:
+            close()
+        except Exception as e:  # e.g. a generator that is mid-iteration on the follower thread
+            logger.debug(f"Log stream {self.key} could not close upstream: {e}")
+
+    def _drain(self) -> None:
+        """Runs on the follower thread."""
+        assert self._loop is not None
+        try:
+            self._upstream = self._source()
+            if self._stopped.is_set():  # stopped before the upstream was opened
+                self._close_upstream()
+                return
+            for line in self._upstream:
+                if self._stopped.is_set():
+                    break
+                self._loop.call_soon_threadsafe(self._append, line)
+        except Exception as e:
+            if not self._stopped.is_set():  # reads fail once the upstream is closed
+                logger.warning(f"Log stream {self.key} failed: {e}")
+        finally:
+            try:
+                self._loop.call_soon_threadsafe(self._finish)
+            except RuntimeError:  # event loop already closed
+                pass
+
+    def _notify(self) -> None:
+        # waiters hold a reference to the previous event, so swapping it wakes
+        # everyone currently waiting without any per-viewer bookkeeping
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _append(self, line: str) -> None:
+        self._lines.append(line)
+        self.offset += 1
+        self._notify()
+
+    def _finish(self) -> None:
+        if self.done:
+            return
+        self.done = True
+        self._notify()
+        _release(self)
+
+    def _read(self, cursor: int) -> list[str]:
+        """Return the buffered lines from `cursor` onwards."""
+        start = cursor - self.first_offset
+        if start >= len(self._lines):
+            return []
+        return list(islice(self._lines, start, None))
+
+    async def follow(
+        self, offset: int = 0, keepalive: float = LOG_STREAM_KEEPALIVE
+    ) -> AsyncIterator[tuple[int, str]]:
+        """
+        Yield `(offset, line)` pairs starting at `offset`.
+
+        When nothing has arrived for `keepalive` seconds `(-1, "")` is yielded so
+        callers can write a heartbeat and notice disconnected clients.
+        """
+        self._attach()
+        try:
+            cursor = max(offset, 0)
+            while True:
+                if cursor < self.first_offset:
+                    skipped = self.first_offset - cursor
+                    cursor = self.first_offset
+                    yield cursor - 1, f"... {skipped} lines skipped ..."
+
+                lines = self._read(cursor)
+                for line in lines:
+                    yield cursor, line
+                    cursor += 1
+
+                if lines:
+                    continue
+                if self.done:
+                    return
+
+                changed = self._changed
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield -1, ""
+        finally:
+            self._detach()
+
+    def _attach(self) -> None:
+        self.viewers += 1
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def _detach(self) -> None:
+        self.viewers -= 1
+        if self.viewers > 0 or self.done:
+            return
+
+        # keep the follower around briefly so a page reload doesn't restart it
+        loop = asyncio.get_running_loop()
+        self._idle_handle = loop.call_later(LOG_STREAM_IDLE_TIMEOUT, self._expire)
+
+    def _expire(self) -> None:
+        self._idle_handle = None
+        if self.viewers == 0:
+            self.stop()
+
+
+_streams: dict[str, LogStream] = {}
+
+
+def _release(stream: LogStream) -> None:
+    """Drop a finished stream from the registry."""
+    if _streams.get(stream.key) is stream:
+        del _streams[stream.key]
+
+
+def get_log_stream(key: str, source: LogSource) -> LogStream:
+    """
+    Get the shared log stream for `key`, starting a follower with `source` if
+    there is no live stream for it yet.
+
+    Must be called from the event loop.
+    """
+    if (stream := _streams.get(key)) and not stream.done:
+        return stream
+
+    stream = LogStream(key, source)
+    _streams[key] = stream
+    stream.start()
+    return stream
+
+
+async def sse_log_events(stream: LogStream, offset: int = 0) -> AsyncIterator[str]:
+    """Format a log stream as server-sent events, using line offsets as event ids."""
+    async for line_offset, line in stream.follow(offset):
+        if line_offset < 0:
+            yield ": keepalive\n\n"
+            continue
+
+        data = "\n".join(f"data: {part}" for part in line.rstrip("\n").split("\n"))
+        yield f"id: {line_offset}\n{data}\n\n"
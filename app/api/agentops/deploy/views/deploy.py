@@ -1,7 +1,9 @@
+from typing import Optional
 from datetime import datetime
+import asyncio
 import logging
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, Header, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 
@@ -23,6 +25,7 @@ from agentops.common.orm import get_orm_session
 from agentops.common.route_config import BaseView
 from agentops.opsboard.models import ProjectModel
 from agentops.deploy.models import HostingProjectModel
+from agentops.deploy.logs import get_log_stream, sse_log_events
 from agentops.deploy.schemas import (
     StatusResponse,
     HostingProjectResponse,
@@ -266,36 +269,49 @@ class DeploymentBuildLogView(BaseDeploymentView):
         self,
         project_id: str,
         job_id: str,
+        offset: int = 0,
+        last_event_id: Optional[str] = Header(None),
         orm: Session = Depends(get_orm_session),
     ) -> StreamingResponse:
         """
         Stream build logs from the builder pod for a specific deployment job.
 
+        Logs are sent as server-sent events with the line offset as the event id.
+        All viewers of a job share a single upstream log follower; reconnecting
+        clients resume from `offset` (or the `Last-Event-ID` header).
+
         Args:
             project_id: The project ID
             job_id: The deployment job ID
+            offset: Line offset to start streaming from
+            last_event_id: Id of the last event received, sent by reconnecting clients
             orm: Database session
 
         Returns:
-            StreamingResponse with plain text logs
+            StreamingResponse with server-sent log events
         """
         project: HostingProjectModel = await self.get_hosting_project(orm, project_id)
 
         # Use job_id to find the builder pod (builder pods are now named with job_id)
-        if not (pod := Image.get_builder_pod(project.namespace, job_id)):
+        if not (pod := await asyncio.to_thread(Image.get_builder_pod, project.namespace, job_id)):
             raise HTTPException(status_code=404, detail=f"Builder pod not found for job {job_id}")
 
-        # TODO this is not flushing mid-stream for some reason.
+        if last_event_id and last_event_id.isdigit():
+            offset = int(last_event_id) + 1
+
+        stream = get_log_stream(
+            f"{project.namespace}/{pod.name}",
+            lambda: pod.follow_logs(project.namespace),
+        )
         return StreamingResponse(
-            pod.stream_logs(project.namespace),
+            sse_log_events(stream, offset),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache, no-store, must-revalidate",
                 "Pragma": "no-cache",
                 "Expires": "0",
                 "Connection": "keep-alive",
-                # "X-Accel-Buffering": "no",
-                # "X-Content-Type-Options": "nosniff",
+                "X-Accel-Buffering": "no",
             },
         )
 
@@ -8,6 +8,8 @@ Traces and their root spans share the same ID which comes from the Session ID.
 `exporter` is a terrible name, but here we are.
 """
 
+from typing import Sequence
+
 from agentops.api.log_config import logger
 from agentops.api.db.supabase_client import get_async_supabase
 from .models import Session, Agent, LLMEvent, ActionEvent, ToolEvent, ErrorEvent
@@ -15,7 +17,9 @@ from .models import Trace, Span
 from .processor import (
     clickhouse_create_trace,
     clickhouse_create_span,
+    clickhouse_create_spans,
     clickhouse_update_span,
+    clickhouse_update_spans,
 )
 
 
@@ -161,3 +165,50 @@ async def update_error_event(data: dict) -> None:
     span: Span = await error_event.to_span()
     await clickhouse_update_span(span.span_id, span.to_clickhouse_dict())
     logger.info(f"Updated ClickHouse error event as span {span}")
+
+
+async def create_events(
+    session_id: str,
+    *,
+    actions: Sequence[dict] = (),
+    llms: Sequence[dict] = (),
+    tools: Sequence[dict] = (),
+    errors: Sequence[dict] = (),
+) -> None:
+    """Save a batch of events from one session to ClickHouse with a single insert."""
+    project_id = str(await _get_project_id(session_id))
+    trace_id = str(session_id)
+
+    spans: list[Span] = []
+    for model, events in ((ActionEvent, actions), (LLMEvent, llms), (ToolEvent, tools)):
+        for data in events:
+            # actions, llms, and tools belong to an agent
+            span = await model(**data).to_span(
+                trace_id=trace_id, parent_span_id=str(data['agent_id']), project_id=project_id
+            )
+            spans.append(span)
+    for data in errors:
+        # errors belong to the session's root span
+        error_event = ErrorEvent(**data)
+        span = await error_event.to_span(trace_id=trace_id, parent_span_id=trace_id, project_id=project_id)
+        spans.append(span)
+
+    await clickhouse_create_spans(spans)
+    logger.info(f"Created {len(spans)} ClickHouse spans for session {session_id}")
+
+
+async def update_events(
+    *,
+    actions: Sequence[dict] = (),
+    llms: Sequence[dict] = (),
+    tools: Sequence[dict] = (),
+) -> None:
+    """Update a batch of existing events in ClickHouse."""
+    updates: dict[str, dict] = {}
+    for model, events in ((ActionEvent, actions), (LLMEvent, llms), (ToolEvent, tools)):
+        for data in events:
+            span: Span = await model(**data).to_span()
+            updates[span.span_id] = span.to_clickhouse_dict()
+
+    await clickhouse_update_spans(updates)
+    logger.info(f"Updated {len(updates)} ClickHouse spans")
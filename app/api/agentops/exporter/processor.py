@@ -18,6 +18,7 @@ import psycopg_pool
 from clickhouse_driver.util.escape import escape_param as _clickhouse_escape_param
 
 from agentops.api.db.clickhouse_client import get_async_clickhouse
+from agentops.api.db.clickhouse.profiling import execute_insert, execute_query
 from .models import BaseModel, Session, Agent, ActionEvent, LLMEvent, ToolEvent, ErrorEvent
 from .models import Trace, Span
 
@@ -38,6 +39,8 @@ EXPORT_AS_SPANS = (
     'errors',
 )
 IMPORT_TABLE_NAME = 'otel_traces'
+# names this module's queries in query ids and metrics
+QUERY_MODEL = 'exporter'
 
 # Supabase connection pooling for export
 SUPABASE_MIN_POOL_SIZE = 12
@@ -315,7 +318,7 @@ async def get_v2_sourced_rows(limit: int, offset: int) -> list:
     """
     try:
         query = query.format(table_name=IMPORT_TABLE_NAME, limit=limit, offset=offset)
-        result = await client.query(query)
+        result = await execute_query(client, query, model=QUERY_MODEL)
         if result and hasattr(result, 'result_rows') and len(result.result_rows) > 0:
             rows = []
             for row in result.result_rows:
@@ -340,7 +343,7 @@ async def assign_correct_project_id(span_id: str, project_id: str) -> bool:
         raise Exception(f"Project id is None for span_id: {span_id}")
 
     query = query.format(table_name=IMPORT_TABLE_NAME, project_id=project_id, span_id=span_id)
-    result = await clickhouse_client.query(query)
+    result = await execute_query(clickhouse_client, query, model=QUERY_MODEL)
     if result.rows_affected > 0:
         return True
     return False
@@ -353,7 +356,7 @@ async def count_v2_sourced_rows() -> int:
     SELECT COUNT(1) FROM otel_2.otel_traces
     WHERE mapContains(SpanAttributes, 'session.id')
     """
-    result = await clickhouse_client.query(query)
+    result = await execute_query(clickhouse_client, query, model=QUERY_MODEL)
     return result.result_rows[0][0]
 
 
@@ -397,9 +400,11 @@ async def clickhouse_create(data: list[dict]) -> None:
             data[i][key] = clickhouse_escape_value(value)
 
     if not DRY_RUN:
-        await client.insert(
-            table=IMPORT_TABLE_NAME,
-            data=[list(row.values()) for row in data],
+        await execute_insert(
+            client,
+            IMPORT_TABLE_NAME,
+            [list(row.values()) for row in data],
+            model=QUERY_MODEL,
             column_names=list(data[0].keys()),
         )
     else:
@@ -420,7 +425,7 @@ async def clickhouse_get_span_raw(span_id: str) -> dict:
     WHERE SpanId = '{span_id}'
     """
     query = query.format(table_name=IMPORT_TABLE_NAME, span_id=span_id)
-    result = await client.query(query)
+    result = await execute_query(client, query, model=QUERY_MODEL)
     if result and hasattr(result, 'result_rows') and len(result.result_rows) > 0:
         row_dict = dict(zip(result.column_names, result.result_rows[0]))
         return row_dict
@@ -443,33 +448,34 @@ async def clickhouse_delete_span(span_id: Any) -> None:
     """
     query = query.format(table_name=IMPORT_TABLE_NAME, span_id=str(span_id))
     if not DRY_RUN:
-        await client.query(query)
+        await execute_query(client, query, model=QUERY_MODEL)
     else:
         print(query)
 
 
+def _merge_dicts_recursive(old: dict, new: dict) -> dict:
+    result = old.copy()
+    for key, value in new.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = _merge_dicts_recursive(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
 async def clickhouse_update_span(span_id: str, update_data: dict) -> None:
     """Update a record in ClickHouse by deleting and re-inserting it."""
     # reasons for going this route at the moment:
     # - serialization is a bitch and there is no tooling readily available to help with it
     # - latency for propagation of updates is apparently comparable to deletion
 
-    def merge_dicts_recursive(old, new):
-        result = old.copy()
-        for key, value in new.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = merge_dicts_recursive(result[key], value)
-            else:
-                result[key] = value
-        return result
-
     existing_span: dict = await clickhouse_get_span_raw(span_id)
     if existing_span:
         await clickhouse_delete_span(span_id)  # yolo
     else:
         existing_span = {}
 
-    merged_data = merge_dicts_recursive(existing_span, update_data)
+    merged_data = _merge_dicts_recursive(existing_span, update_data)
     await clickhouse_create(
         [
             merged_data,
@@ -477,6 +483,75 @@ async def clickhouse_update_span(span_id: str, update_data: dict) -> None:
     )
 
 
+async def clickhouse_create_columns(data: list[dict]) -> None:
+    """Create many records in ClickHouse with a single column-oriented insert"""
+    client = await get_async_clickhouse()
+
+    # columns are looked up by name, so rows only need to share the same keys
+    column_names = list(data[0].keys())
+    columns = [[clickhouse_escape_value(row[name]) for row in data] for name in column_names]
+
+    if not DRY_RUN:
+        await execute_insert(
+            client,
+            IMPORT_TABLE_NAME,
+            columns,
+            model=QUERY_MODEL,
+            column_names=column_names,
+            column_oriented=True,
+        )
+    else:
+        print(data)
+
+
+async def clickhouse_create_spans(spans: list[Span]) -> None:
+    """Create a batch of spans in ClickHouse"""
+    if spans:
+        await clickhouse_create_columns([span.to_clickhouse_dict() for span in spans])
+
+
+async def clickhouse_update_spans(updates: dict[str, dict]) -> None:
+    """
+    Update a batch of records in ClickHouse, keyed by SpanId.
+
+    Works like `clickhouse_update_span`, but reads, deletes and re-inserts every
+    span in the batch with one statement each.
+    """
+    if not updates:
+        return
+
+    client = await get_async_clickhouse()
+    span_ids = tuple(updates.keys())
+    parameters = {'span_ids': span_ids}
+
+    result = await execute_query(
+        client,
+        f"SELECT * FROM {IMPORT_TABLE_NAME} WHERE SpanId IN %(span_ids)s",
+        parameters,
+        model=QUERY_MODEL,
+    )
+    existing_spans = {}
+    for row in result.result_rows:
+        row_dict = dict(zip(result.column_names, row))
+        existing_spans[row_dict['SpanId']] = row_dict
+
+    if existing_spans:
+        delete = f"ALTER TABLE {IMPORT_TABLE_NAME} DELETE WHERE SpanId IN %(span_ids)s"
+        if not DRY_RUN:
+            await execute_query(client, delete, {'span_ids': tuple(existing_spans.keys())}, model=QUERY_MODEL)
+        else:
+            print(delete)
+
+    # spans we already have carry every column, new ones only what the update provides
+    merged: dict[tuple, list[dict]] = {}
+    for span_id, update_data in updates.items():
+        row = _merge_dicts_recursive(existing_spans.get(span_id, {}), update_data)
+        merged.setdefault(tuple(sorted(row.keys())), []).append(row)
+
+    for rows in merged.values():
+        await clickhouse_create_columns(rows)
+
+
 async def write_trace_with_timeout(trace: Trace) -> None:
     """Write a trace to ClickHouse with a timeout"""
     try:
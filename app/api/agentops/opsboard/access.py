@@ -0,0 +1,237 @@
+"""
+Cached project access checks for hot read endpoints.
+
+Trace, metrics and log endpoints only need to know whether the requesting user
+belongs to the project's organization, and which plan that organization is on.
+`ProjectModel.get_by_id` answers that by loading the org with all of its users,
+invites and projects, so those endpoints use `get_project_access` instead:
+
+- Membership is cached per (user, project) as the project's org ID.
+- The org's plan is cached per org, so a plan change invalidates one key.
+- On a miss, a single indexed query joins the project, the user's membership
+  row and the org.
+
+`get_project_prem_status` answers the plan question alone, for SDK endpoints
+authenticated by a project token rather than a user. A project never moves
+between organizations, so its org ID is cached, and the plan comes from the
+same per-org key.
+
+Only granted access is cached; denials always go to the database, so a user
+added to an org sees its projects immediately. Removing a member, deleting a
+project and changing an org's plan invalidate the affected keys through the
+ORM events at the bottom of this module, when the change is flushed and again
+once it is committed, and every entry expires after `PROJECT_ACCESS_CACHE_TTL`
+seconds regardless.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import object_session
+
+from agentops.common import cache
+from agentops.common.orm import Session
+
+from .environment import PROJECT_ACCESS_CACHE_TTL
+from .models import (
+    BaseProjectModel,
+    OrgModel,
+    PremStatus,
+    ProjectModel,
+    SparseFieldException,
+    UserOrgModel,
+    normalize_uuid,
+)
+
+
+def _make_access_key(user_id: str | UUID, project_id: str | UUID) -> str:
+    """Generate a cache key for a user's access to a project."""
+    return f"agentops.project_access:{user_id}:{project_id}"
+
+
+def _make_project_org_key(project_id: str | UUID) -> str:
+    """Generate a cache key for the organization that owns a project."""
+    return f"agentops.project_org:{project_id}"
+
+
+def _make_plan_key(org_id: str | UUID) -> str:
+    """Generate a cache key for an organization's plan."""
+    return f"agentops.org_plan:{org_id}"
+
+
+class ProjectAccess(BaseProjectModel):
+    """
+    Sparse project model returned by `get_project_access`.
+
+    Carries what the read endpoints need: the project and org IDs and whether
+    the org is on the free plan. Call `get_project()` to load the full model.
+    """
+
+    is_sparse = True
+    api_key = property(lambda self: SparseFieldException.raise_for_field("api_key"))
+    name = property(lambda self: SparseFieldException.raise_for_field("name"))
+    environment = property(lambda self: SparseFieldException.raise_for_field("environment"))
+    org = property(lambda self: SparseFieldException.raise_for_field("org"))
+
+    def __init__(self, id: str | UUID, org_id: str | UUID, prem_status: str | PremStatus):
+        self.id = normalize_uuid(id)
+        self.org_id = normalize_uuid(org_id)
+        self.prem_status = PremStatus(prem_status) if isinstance(prem_status, str) else prem_status
+
+    @property
+    def is_freeplan(self) -> bool:
+        """Check if the project is on a free plan."""
+        return self.prem_status == PremStatus.free
+
+    def get_project(self, orm: Session) -> Optional[ProjectModel]:
+        """Get the full project model from the database."""
+        return ProjectModel.get_by_id(orm, self.id)
+
+
+def get_project_access(orm: Session, user_id: str | UUID, project_id: str | UUID) -> Optional[ProjectAccess]:
+    """
+    Check that a user is a member of the organization that owns a project.
+
+    Args:
+        orm (Session): Database session, used on a cache miss
+        user_id (str | UUID): The requesting user
+        project_id (str | UUID): The project being accessed
+
+    Returns:
+        Optional[ProjectAccess]: The project's access details if the user has
+        access, None if the project doesn't exist or the user isn't a member
+    """
+    try:
+        user_id = normalize_uuid(user_id)
+        project_id = normalize_uuid(project_id)
+    except ValueError:
+        return None
+
+    access_key = _make_access_key(user_id, project_id)
+    if org_id := cache.get(access_key):
+        if prem_status := cache.get(_make_plan_key(org_id)):
+            return ProjectAccess(project_id, org_id, prem_status)
+
+        prem_status = orm.query(OrgModel.prem_status).filter(OrgModel.id == normalize_uuid(org_id)).scalar()
+        if prem_status is not None:
+            cache.setex(_make_plan_key(org_id), PROJECT_ACCESS_CACHE_TTL, prem_status.value)
+            return ProjectAccess(project_id, org_id, prem_status)
+
+    row = (
+        orm.query(ProjectModel.org_id, OrgModel.prem_status)
+        .join(OrgModel, OrgModel.id == ProjectModel.org_id)
+        .join(
+            UserOrgModel,
+            (UserOrgModel.org_id == ProjectModel.org_id) & (UserOrgModel.user_id == user_id),
+        )
+        .filter(ProjectModel.id == project_id)
+        .first()
+    )
+    if not row:
+        return None
+
+    org_id, prem_status = row
+    cache.setex(access_key, PROJECT_ACCESS_CACHE_TTL, str(org_id))
+    cache.setex(_make_plan_key(org_id), PROJECT_ACCESS_CACHE_TTL, prem_status.value)
+    return ProjectAccess(project_id, org_id, prem_status)
+
+
+def get_project_prem_status(orm: Session, project_id: str | UUID) -> Optional[PremStatus]:
+    """
+    Get the plan of the organization that owns a project.
+
+    Args:
+        orm (Session): Database session, used on a cache miss
+        project_id (str | UUID): The project to look up
+
+    Returns:
+        Optional[PremStatus]: The org's plan, None if the project doesn't exist
+    """
+    try:
+        project_id = normalize_uuid(project_id)
+    except ValueError:
+        return None
+
+    org_key = _make_project_org_key(project_id)
+    if org_id := cache.get(org_key):
+        if prem_status := cache.get(_make_plan_key(org_id)):
+            return PremStatus(prem_status)
+
+    row = (
+        orm.query(ProjectModel.org_id, OrgModel.prem_status)
+        .join(OrgModel, OrgModel.id == ProjectModel.org_id)
+        .filter(ProjectModel.id == project_id)
+        .first()
+    )
+    if not row:
+        return None
+
+    org_id, prem_status = row
+    cache.setex(org_key, PROJECT_ACCESS_CACHE_TTL, str(org_id))
+    cache.setex(_make_plan_key(org_id), PROJECT_ACCESS_CACHE_TTL, prem_status.value)
+    return prem_status
+
+
+def invalidate_project_access(user_id: str | UUID, project_id: str | UUID) -> None:
+    """Forget a user's cached access to a project."""
+    cache.delete(_make_access_key(user_id, project_id))
+
+
+def invalidate_org_plan(org_id: str | UUID) -> None:
+    """Forget an organization's cached plan."""
+    cache.delete(_make_plan_key(org_id))
+
+
+# Registered when this module is imported, which the API app does at startup
+# through the views using it. Every code path that removes a member, deletes a
+# project or changes a plan then invalidates the cache, whichever view it's in.
+#
+# Keys are deleted when the change is flushed and again after the transaction
+# commits: until then, a read in another session still sees the old rows and
+# can cache them again for `PROJECT_ACCESS_CACHE_TTL`.
+
+_PENDING_INVALIDATIONS = "agentops.project_access_invalidations"
+
+
+def _invalidate_on_commit(target, keys: list[str]) -> None:
+    """Delete cache keys now and once the session that changed `target` commits."""
+    for key in keys:
+        cache.delete(key)
+
+    if session := object_session(target):
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for key in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        cache.delete(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+@event.listens_for(UserOrgModel, "after_delete")
+def _invalidate_removed_member(mapper, connection, target: UserOrgModel) -> None:
+    query = select(ProjectModel.id).where(ProjectModel.org_id == target.org_id)
+    project_ids = connection.execute(query).scalars()
+    keys = [_make_access_key(target.user_id, project_id) for project_id in project_ids]
+    _invalidate_on_commit(target, keys)
+
+
+@event.listens_for(ProjectModel, "after_delete")
+def _invalidate_deleted_project(mapper, connection, target: ProjectModel) -> None:
+    query = select(UserOrgModel.user_id).where(UserOrgModel.org_id == target.org_id)
+    user_ids = connection.execute(query).scalars()
+    keys = [_make_access_key(user_id, target.id) for user_id in user_ids]
+    keys.append(_make_project_org_key(target.id))
+    _invalidate_on_commit(target, keys)
+
+
+@event.listens_for(OrgModel, "after_update")
+def _invalidate_changed_plan(mapper, connection, target: OrgModel) -> None:
+    if inspect(target).attrs.prem_status.history.has_changes():
+        _invalidate_on_commit(target, [_make_plan_key(target.id)])
@@ -1 +1,7 @@
+import os
+
+
 DEMO_ORG_ID = "c0000000-0000-0000-0000-000000000000"
+
+# How long (in seconds) a user's access to a project is cached for read endpoints.
+PROJECT_ACCESS_CACHE_TTL = int(os.environ.get("PROJECT_ACCESS_CACHE_TTL", 60))
@@ -2,13 +2,14 @@ import os
 import stripe
 import logging
 from decimal import Decimal, InvalidOperation
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
 from sqlalchemy.orm import Session
 
 from ...common.usage_tracking import UsageType
 from ..models import OrgModel, BillingPeriod
-from ...api.db.clickhouse_client import get_clickhouse
+from ...api.db.clickhouse_client import get_async_clickhouse
+from ...api.db.clickhouse.profiling import execute_query
 from ...api.environment import (
     STRIPE_SECRET_KEY,
     STRIPE_SUBSCRIPTION_PRICE_ID,
@@ -18,6 +19,86 @@ from ...api.environment import (
 
 logger = logging.getLogger(__name__)
 
+# Tokens billed for a single span. Must match the `project_usage_daily_mv` view in
+# app/clickhouse/migrations/0003_project_usage_daily.sql.
+SPAN_TOKENS_SQL = """
+    COALESCE(
+        toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.total_tokens'], '0')),
+        toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.prompt_tokens'], '0')) +
+        toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.completion_tokens'], '0')) +
+        toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.cache_read_input_tokens'], '0')) +
+        toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.reasoning_tokens'], '0'))
+    )
+"""
+
+CLICKHOUSE_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def build_usage_query(
+    project_ids: list[str], period_start: datetime, period_end: datetime
+) -> tuple[str, dict]:
+    """
+    Build a query for the span count and token total of each project between two
+    UTC datetimes, both inclusive.
+
+    Whole days inside the period are read from the `project_usage_daily` counters,
+    so the cost grows with the number of days rather than spans. Only the partial
+    days at either end of the period are counted from raw spans.
+
+    Returns:
+        tuple[str, dict]: The query, returning (project_id, span_count, total_tokens)
+        rows, and its parameters
+    """
+    first_full_day = period_start.date()
+    if period_start.time() != datetime.min.time():
+        first_full_day += timedelta(days=1)
+    end_day = period_end.date()  # the day `period_end` falls on is never complete
+
+    params = {
+        'project_ids': project_ids,
+        'period_start': period_start.strftime(CLICKHOUSE_DATETIME_FORMAT),
+        'period_end': period_end.strftime(CLICKHOUSE_DATETIME_FORMAT),
+    }
+
+    if first_full_day >= end_day:  # no whole day in the period
+        return (
+            f"""
+            SELECT project_id, count() AS span_count, sum({SPAN_TOKENS_SQL}) AS total_tokens
+            FROM otel_2.otel_traces
+            WHERE project_id IN %(project_ids)s
+                AND Timestamp >= %(period_start)s
+                AND Timestamp <= %(period_end)s
+            GROUP BY project_id
+            """,
+            params,
+        )
+
+    params['first_full_day'] = first_full_day.isoformat()
+    params['end_day'] = end_day.isoformat()
+    return (
+        f"""
+        SELECT project_id, sum(span_count) AS span_count, sum(total_tokens) AS total_tokens
+        FROM (
+            SELECT project_id, span_count, total_tokens
+            FROM otel_2.project_usage_daily
+            WHERE project_id IN %(project_ids)s
+                AND Date >= %(first_full_day)s
+                AND Date < %(end_day)s
+            UNION ALL
+            SELECT project_id, count() AS span_count, sum({SPAN_TOKENS_SQL}) AS total_tokens
+            FROM otel_2.otel_traces
+            WHERE project_id IN %(project_ids)s
+                AND (
+                    (Timestamp >= %(period_start)s AND Timestamp < %(first_full_day)s)
+                    OR (Timestamp >= %(end_day)s AND Timestamp <= %(period_end)s)
+                )
+            GROUP BY project_id
+        )
+        GROUP BY project_id
+        """,
+        params,
+    )
+
 
 class BillingService:
     def __init__(self):
@@ -378,7 +459,7 @@ class BillingService:
         period_end: datetime,
         project_id: Optional[str] = None,
     ) -> Dict[str, int]:
-        """Get usage quantities for a billing period by querying ClickHouse directly"""
+        """Get usage quantities for a billing period from ClickHouse (see `build_usage_query`)"""
         from ..models import ProjectModel
 
         # Ensure we have timezone-aware datetimes
@@ -429,57 +510,26 @@ class BillingService:
                 self._usage_cache[cache_key] = (empty_result, datetime.now())
                 return empty_result
 
-        clickhouse_client = get_clickhouse()
-
         try:
-            usage_query = """
-                SELECT 
-                    COUNT(*) as span_count,
-                    SUM(
-                        COALESCE(
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.total_tokens'], '0')),
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.prompt_tokens'], '0')) +
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.completion_tokens'], '0')) +
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.cache_read_input_tokens'], '0')) +
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.reasoning_tokens'], '0'))
-                        )
-                    ) as total_tokens
-                FROM otel_2.otel_traces
-                WHERE project_id IN %(project_ids)s
-                    AND Timestamp >= %(period_start)s
-                    AND Timestamp <= %(period_end)s
-            """
-
-            # Use timezone-aware formatting for ClickHouse (ClickHouse expects UTC)
-            formatted_start = period_start_utc.strftime('%Y-%m-%d %H:%M:%S')
-            formatted_end = period_end_utc.strftime('%Y-%m-%d %H:%M:%S')
-
             logger.info(
-                f"Querying usage for org {org_id} from {formatted_start} to {formatted_end} (project_ids: {project_ids})"
-            )
-
-            result = clickhouse_client.query(
-                usage_query,
-                {
-                    'project_ids': project_ids,
-                    'period_start': formatted_start,
-                    'period_end': formatted_end,
-                },
+                f"Querying usage for org {org_id} from {period_start_utc} to {period_end_utc} "
+                f"(project_ids: {project_ids})"
             )
 
-            if result.result_rows:
-                span_count, total_tokens = result.result_rows[0]
+            project_usage = await self._query_usage(project_ids, period_start_utc, period_end_utc)
+            span_count = sum(spans for spans, _ in project_usage.values())
+            total_tokens = sum(tokens for _, tokens in project_usage.values())
 
+            if project_usage:
                 logger.info(f"Usage data for org {org_id}: {total_tokens} total tokens, {span_count} spans")
             else:
-                span_count, total_tokens = 0, 0
                 logger.info(
-                    f"No usage data found for org {org_id} in period {formatted_start} to {formatted_end}"
+                    f"No usage data found for org {org_id} in period {period_start_utc} to {period_end_utc}"
                 )
 
             usage_data = {
-                'tokens': int(total_tokens) if total_tokens else 0,
-                'spans': int(span_count) if span_count else 0,
+                'tokens': total_tokens,
+                'spans': span_count,
             }
 
             logger.info(
@@ -527,55 +577,19 @@ class BillingService:
         if not project_ids:
             return {}
 
-        clickhouse_client = get_clickhouse()
-
         try:
-            # Same query as get_usage_for_period but grouped by project_id
-            usage_query = """
-                SELECT 
-                    project_id,
-                    COUNT(*) as span_count,
-                    SUM(
-                        COALESCE(
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.total_tokens'], '0')),
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.prompt_tokens'], '0')) +
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.completion_tokens'], '0')) +
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.cache_read_input_tokens'], '0')) +
-                            toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.reasoning_tokens'], '0'))
-                        )
-                    ) as total_tokens
-                FROM otel_2.otel_traces
-                WHERE project_id IN %(project_ids)s
-                    AND Timestamp >= %(period_start)s
-                    AND Timestamp <= %(period_end)s
-                GROUP BY project_id
-            """
-
-            formatted_start = period_start_utc.strftime('%Y-%m-%d %H:%M:%S')
-            formatted_end = period_end_utc.strftime('%Y-%m-%d %H:%M:%S')
-
             logger.info(
-                f"Querying per-project usage for org {org_id} from {formatted_start} to {formatted_end}"
-            )
-
-            result = clickhouse_client.query(
-                usage_query,
-                {
-                    'project_ids': project_ids,
-                    'period_start': formatted_start,
-                    'period_end': formatted_end,
-                },
+                f"Querying per-project usage for org {org_id} from {period_start_utc} to {period_end_utc}"
             )
 
             project_usage = {}
+            usage = await self._query_usage(project_ids, period_start_utc, period_end_utc)
 
-            for row in result.result_rows:
-                project_id, span_count, total_tokens = row
-
-                project_usage[str(project_id)] = {
-                    'tokens': int(total_tokens) if total_tokens else 0,
-                    'spans': int(span_count) if span_count else 0,
-                    'project_name': project_names.get(str(project_id), 'Unknown Project'),
+            for project_id, (span_count, total_tokens) in usage.items():
+                project_usage[project_id] = {
+                    'tokens': total_tokens,
+                    'spans': span_count,
+                    'project_name': project_names.get(project_id, 'Unknown Project'),
                 }
 
             # Include projects with zero usage
@@ -594,6 +608,19 @@ class BillingService:
             logger.error(f"Error querying per-project usage data for org {org_id}: {e}")
             return {}
 
+    async def _query_usage(
+        self, project_ids: list[str], period_start: datetime, period_end: datetime
+    ) -> Dict[str, tuple[int, int]]:
+        """Get the (span_count, total_tokens) of each project with usage in a UTC period"""
+        query, params = build_usage_query(project_ids, period_start, period_end)
+        client = await get_async_clickhouse()
+        result = await execute_query(client, query, params, model='BillingUsage')
+
+        return {
+            str(project_id): (int(span_count or 0), int(total_tokens or 0))
+            for project_id, span_count, total_tokens in result.result_rows
+        }
+
     async def calculate_usage_costs(self, usage_quantities: Dict[str, int]) -> Dict[str, int]:
         """Calculate costs from usage quantities
 
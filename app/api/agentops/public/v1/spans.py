@@ -1,9 +1,10 @@
-from typing import Optional, Any
+from typing import Any, ClassVar, Collection, Optional
 from datetime import datetime
 import pydantic
 from fastapi import HTTPException
 from agentops.common.otel import otel_attributes_to_nested
-from agentops.api.models.traces import SpanModel
+from agentops.api.db.clickhouse.models import SelectAttributes
+from agentops.api.models.traces import EVENT_AND_LINK_COLUMNS, SpanModel
 from agentops.api.models.span_metrics import SpanMetricsResponse
 from .base import AuthenticatedPublicAPIView, BaseResponse
 
@@ -14,6 +15,16 @@ class BaseSpanView(AuthenticatedPublicAPIView):
     This class can be extended to create specific views for different span endpoints.
     """
 
+    # span attributes read for the view; None reads all of them
+    attributes: ClassVar[Optional[SelectAttributes]] = None
+    # array columns the view doesn't render, selected empty instead of read
+    empty_arrays: ClassVar[Collection[str]] = ()
+
+    def _project_fields(self) -> Optional[list[str]]:
+        if self.attributes is None and not self.empty_arrays:
+            return None
+        return SpanModel.project_fields(self.attributes or {}, empty_arrays=self.empty_arrays)
+
     async def get_span(self, span_id: str) -> SpanModel:
         project = await self.get_sparse_project()
 
@@ -23,7 +34,8 @@ class BaseSpanView(AuthenticatedPublicAPIView):
         spans = await SpanModel.select(
             filters={
                 "span_id": span_id,
-            }
+            },
+            fields=self._project_fields(),
         )
 
         if not len(spans):
@@ -82,6 +94,10 @@ class SpanMetricsView(BaseSpanView):
     Get metrics for a span.
     """
 
+    # token counts and costs are selected separately by `SpanMetricsMixin`
+    attributes = {'SpanAttributes': (), 'ResourceAttributes': ()}
+    empty_arrays = EVENT_AND_LINK_COLUMNS
+
     async def __call__(self, span_id: str) -> SpanMetricsResponse:
         # use the internal trace metrics cuz it's easier.
         span = await self.get_span(span_id)
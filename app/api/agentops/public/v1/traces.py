@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import ClassVar, Collection, Optional
 from datetime import datetime
 import pydantic
 from fastapi import HTTPException
-from agentops.api.models.traces import TraceModel
+from agentops.api.db.clickhouse.models import SelectAttributes
+from agentops.api.models.traces import EVENT_AND_LINK_COLUMNS, SpanModel, TraceModel
 from agentops.api.models.span_metrics import TraceMetricsResponse
 from .base import AuthenticatedPublicAPIView, BaseResponse
 
@@ -13,6 +14,16 @@ class BaseTraceView(AuthenticatedPublicAPIView):
     This class can be extended to create specific views for different trace endpoints.
     """
 
+    # span attributes read for the view; None reads all of them
+    attributes: ClassVar[Optional[SelectAttributes]] = None
+    # array columns the view doesn't render, selected empty instead of read
+    empty_arrays: ClassVar[Collection[str]] = ()
+
+    def _project_fields(self) -> Optional[list[str]]:
+        if self.attributes is None and not self.empty_arrays:
+            return None
+        return SpanModel.project_fields(self.attributes or {}, empty_arrays=self.empty_arrays)
+
     async def get_trace(self, trace_id: str) -> TraceModel:
         project = await self.get_sparse_project()
 
@@ -22,7 +33,8 @@ class BaseTraceView(AuthenticatedPublicAPIView):
         trace = await TraceModel.select(
             filters={
                 "trace_id": trace_id,
-            }
+            },
+            fields=self._project_fields(),
         )
 
         if not trace or not len(trace.spans):
@@ -63,6 +75,9 @@ class TraceView(BaseTraceView):
     Get details about a trace with summarized information about its spans.
     """
 
+    attributes = {'SpanAttributes': (), 'ResourceAttributes': ()}
+    empty_arrays = EVENT_AND_LINK_COLUMNS
+
     async def __call__(self, trace_id: str) -> TraceResponse:
         trace = await self.get_trace(trace_id)
         return TraceResponse.model_validate(trace)
@@ -74,6 +89,10 @@ class TraceMetricsView(BaseTraceView):
     Get aggregated metrics data for a trace.
     """
 
+    # token counts and costs are selected separately by `SpanMetricsMixin`
+    attributes = {'SpanAttributes': (), 'ResourceAttributes': ()}
+    empty_arrays = EVENT_AND_LINK_COLUMNS
+
     async def __call__(self, trace_id: str) -> TraceMetricsResponse:
         # use the internal trace metrics cuz it's easier.
         trace = await self.get_trace(trace_id)
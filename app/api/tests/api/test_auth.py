@@ -3,6 +3,7 @@ import jwt
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
+from agentops.api import auth
 from agentops.api.auth import (
     JWTPayload,
     generate_jwt,
@@ -139,6 +140,63 @@ class TestJWTGeneration:
             verify_jwt(token)
 
 
+class TestJWTVerificationCache:
+    """Tests for the cache of verified tokens"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        auth._verified_tokens.clear()
+        yield
+        auth._verified_tokens.clear()
+
+    def test_verified_token_is_not_decoded_again(self, valid_jwt_payload, jwt_secret):
+        """Test that a token verified once is served from the cache"""
+        token = jwt.encode(valid_jwt_payload.asdict(), jwt_secret, algorithm=JWT_ALGO)
+        verify_jwt(token)
+
+        with patch('agentops.api.auth.jwt.decode') as decode:
+            payload = verify_jwt(token)
+
+        decode.assert_not_called()
+        assert payload == valid_jwt_payload
+
+    def test_invalid_token_is_not_cached(self, valid_jwt_payload):
+        """Test that tokens failing verification are rejected every time"""
+        token = jwt.encode(valid_jwt_payload.asdict(), "wrong-secret", algorithm=JWT_ALGO)
+
+        for _ in range(2):
+            with pytest.raises(jwt.InvalidSignatureError):
+                verify_jwt(token)
+        assert len(auth._verified_tokens) == 0
+
+    def test_cached_token_expires(self, valid_jwt_payload, jwt_secret):
+        """Test that a cached token is rejected once it expires"""
+        token = jwt.encode(valid_jwt_payload.asdict(), jwt_secret, algorithm=JWT_ALGO)
+        verify_jwt(token)
+
+        with patch('agentops.api.auth.time.time', return_value=valid_jwt_payload.exp + 1):
+            with patch('agentops.api.auth.jwt.decode', side_effect=jwt.ExpiredSignatureError) as decode:
+                with pytest.raises(jwt.ExpiredSignatureError):
+                    verify_jwt(token)
+
+        decode.assert_called_once()
+        assert len(auth._verified_tokens) == 0
+
+    def test_cache_is_bounded(self, valid_jwt_payload, jwt_secret):
+        """Test that the least recently used tokens are evicted"""
+        tokens = []
+        for i in range(3):
+            valid_jwt_payload.api_key = f"key-{i}"
+            tokens.append(jwt.encode(valid_jwt_payload.asdict(), jwt_secret, algorithm=JWT_ALGO))
+
+        with patch.object(auth, 'JWT_VERIFY_CACHE_SIZE', 2):
+            for token in tokens:
+                verify_jwt(token)
+
+        assert len(auth._verified_tokens) == 2
+        assert list(auth._verified_tokens)[0] == auth.hashlib.sha256(tokens[1].encode()).digest()
+
+
 class TestJWTDependency:
     """Tests for the get_jwt_token dependency"""
 
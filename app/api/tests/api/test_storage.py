@@ -1,9 +1,9 @@
+import gzip
 import pytest
-from io import BytesIO
 from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException, status, Request
 
-from agentops.api.storage import BaseObjectUploadView, ObjectUploadResponse
+from agentops.api.storage import BaseObjectUploadView, ObjectUploadResponse, StreamingUpload, MIN_PART_SIZE
 from agentops.api.environment import (
     SUPABASE_URL,
 )
@@ -25,10 +25,52 @@ def mock_jwt_payload():
 def mock_s3_client():
     """Mock S3 client for testing"""
     client = MagicMock()
-    client.upload_fileobj = MagicMock()
+    client.put_object = MagicMock()
     return client
 
 
+class FakeS3Client:
+    """
+    In-memory stand-in for the parts of the boto3 S3 client used for uploads.
+
+    Enforces the multipart rules S3 does, so uploads that work here work
+    against real storage.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+
+    def put_object(self, *, Bucket, Key, Body, **kwargs):
+        self.objects[(Bucket, Key)] = (Body, kwargs)
+        return {}
+
+    def create_multipart_upload(self, *, Bucket, Key, **kwargs):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {'key': (Bucket, Key), 'parts': {}, 'kwargs': kwargs}
+        return {'UploadId': upload_id}
+
+    def upload_part(self, *, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId]['parts'][PartNumber] = Body
+        return {'ETag': f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, *, Bucket, Key, UploadId, MultipartUpload):
+        upload = self.uploads.pop(UploadId)
+        parts = MultipartUpload['Parts']
+        assert [part['PartNumber'] for part in parts] == list(range(1, len(parts) + 1))
+        assert all(part['ETag'] == f"etag-{part['PartNumber']}" for part in parts)
+        bodies = [upload['parts'][part['PartNumber']] for part in parts]
+        assert all(len(body) >= MIN_PART_SIZE for body in bodies[:-1]), "part too small"
+        self.objects[upload['key']] = (b''.join(bodies), upload['kwargs'])
+        return {}
+
+    def abort_multipart_upload(self, *, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+        return {}
+
+
 @pytest.fixture
 def mock_request():
     """Mock FastAPI Request for testing"""
@@ -97,12 +139,12 @@ class TestBaseObjectUploadView:
                 == f"{SUPABASE_URL}/storage/v1/object/public/test-bucket/test-file-test-project-123.txt"
             )
 
-            # Verify S3 upload was called
-            mock_s3_client.upload_fileobj.assert_called_once()
-            args = mock_s3_client.upload_fileobj.call_args[0]
-            assert isinstance(args[0], BytesIO)
-            assert args[1] == "test-bucket"
-            assert args[2] == "test-file-test-project-123.txt"
+            # Small objects are stored with a single request
+            mock_s3_client.put_object.assert_called_once_with(
+                Bucket="test-bucket",
+                Key="test-file-test-project-123.txt",
+                Body=test_content,
+            )
 
     @pytest.mark.asyncio
     async def test_file_size_limit_exceeded(self, mock_jwt_payload, mock_request):
@@ -145,9 +187,7 @@ class TestBaseObjectUploadView:
             assert response.size == sum(len(chunk) for chunk in chunks)
 
             # Verify the complete content was uploaded
-            uploaded_content = mock_s3_client.upload_fileobj.call_args[0][0]
-            uploaded_content.seek(0)
-            assert uploaded_content.read() == b''.join(chunks)
+            assert mock_s3_client.put_object.call_args.kwargs['Body'] == b''.join(chunks)
 
     @pytest.mark.asyncio
     async def test_chunked_upload_size_limit(self, mock_jwt_payload, mock_request):
@@ -193,18 +233,113 @@ class TestBaseObjectUploadView:
         assert result is None, "Incomplete view returns None from base class ellipsis property"
 
     @pytest.mark.asyncio
-    async def test_upload_body_method(self, mock_jwt_payload, mock_s3_client, mock_request):
-        """Test the upload_body method directly"""
+    async def test_large_upload_is_streamed_in_parts(self, mock_jwt_payload, mock_request):
+        """Test that bodies larger than a part are uploaded as a multipart upload"""
         view = ConcreteObjectUploadView(mock_request)
-        view.token = mock_jwt_payload
-        view.client = mock_s3_client
+        view.max_size = 4 * MIN_PART_SIZE
+        s3 = FakeS3Client()
+
+        chunks = [bytes([i]) * (MIN_PART_SIZE // 4) for i in range(14)]
+
+        async def async_stream_generator():
+            for chunk in chunks:
+                yield chunk
+
+        mock_request.stream = lambda: async_stream_generator()
+
+        with patch('agentops.api.storage.get_s3_client', return_value=s3):
+            response = await view(token=mock_jwt_payload)
+
+        assert response.size == sum(len(chunk) for chunk in chunks)
+        body, _ = s3.objects[("test-bucket", "test-file-test-project-123.txt")]
+        assert body == b''.join(chunks)
+        assert not s3.uploads
+
+    @pytest.mark.asyncio
+    async def test_oversized_multipart_upload_is_aborted(self, mock_jwt_payload, mock_request):
+        """Test that parts already stored are discarded when the size limit is hit"""
+        view = ConcreteObjectUploadView(mock_request)
+        view.max_size = 2 * MIN_PART_SIZE
+        s3 = FakeS3Client()
+
+        async def async_stream_generator():
+            for _ in range(3):
+                yield b'x' * MIN_PART_SIZE
+
+        mock_request.stream = lambda: async_stream_generator()
+
+        with patch('agentops.api.storage.get_s3_client', return_value=s3):
+            with pytest.raises(HTTPException) as exc_info:
+                await view(token=mock_jwt_payload)
+
+        assert exc_info.value.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert s3.aborted == ["upload-0"]
+        assert not s3.uploads
+        assert not s3.objects
+
+    @pytest.mark.asyncio
+    async def test_compressed_upload(self, mock_jwt_payload, mock_request):
+        """Test that compressed uploads are stored gzipped and report the original size"""
+        view = ConcreteObjectUploadView(mock_request)
+        view.compress = True
+        s3 = FakeS3Client()
+
+        chunks = [b'repeated log line\n' * 100 for _ in range(5)]
+
+        async def async_stream_generator():
+            for chunk in chunks:
+                yield chunk
+
+        mock_request.stream = lambda: async_stream_generator()
+
+        with patch('agentops.api.storage.get_s3_client', return_value=s3):
+            response = await view(token=mock_jwt_payload)
+
+        assert response.size == sum(len(chunk) for chunk in chunks)
+        body, kwargs = s3.objects[("test-bucket", "test-file-test-project-123.txt")]
+        assert kwargs == {'ContentEncoding': 'gzip'}
+        assert len(body) < response.size
+        assert gzip.decompress(body) == b''.join(chunks)
+
+
+class TestStreamingUpload:
+    """Tests for the StreamingUpload class"""
+
+    @pytest.mark.asyncio
+    async def test_parts_are_uploaded_while_receiving(self):
+        """Test that a part is sent once it's full, before the upload completes"""
+        s3 = FakeS3Client()
+        upload = StreamingUpload(s3, "bucket", "key", part_size=MIN_PART_SIZE)
+
+        await upload.write(b'a' * MIN_PART_SIZE)
+        await upload.write(b'b' * MIN_PART_SIZE)
+        # the first part has been handed off and is no longer buffered
+        assert len(upload._buffer) == 0
+        assert s3.uploads["upload-0"]['parts'][1] == b'a' * MIN_PART_SIZE
+
+        await upload.write(b'c')
+        await upload.complete()
+
+        body, _ = s3.objects[("bucket", "key")]
+        assert body == b'a' * MIN_PART_SIZE + b'b' * MIN_PART_SIZE + b'c'
+
+    @pytest.mark.asyncio
+    async def test_part_size_has_s3_minimum(self):
+        """Test that parts are never smaller than S3 accepts"""
+        upload = StreamingUpload(FakeS3Client(), "bucket", "key", part_size=1024)
+        assert upload.part_size == MIN_PART_SIZE
+
+    @pytest.mark.asyncio
+    async def test_abort_before_any_part(self):
+        """Test that aborting a single-part upload doesn't touch storage"""
+        s3 = FakeS3Client()
+        upload = StreamingUpload(s3, "bucket", "key")
 
-        test_body = BytesIO(b'test content')
-        await view.upload_body(test_body)
+        await upload.write(b'partial')
+        await upload.abort()
 
-        mock_s3_client.upload_fileobj.assert_called_once_with(
-            test_body, "test-bucket", "test-file-test-project-123.txt"
-        )
+        assert not s3.objects
+        assert not s3.aborted
 
 
 class TestObjectUploadResponse:
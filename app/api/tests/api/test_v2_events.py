@@ -0,0 +1,128 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentops.api.exceptions import InvalidEventsError
+from agentops.api.routes.v2 import build_event_rows, keep_existing_rows, validate_events
+from agentops.exporter import processor
+from agentops.exporter.processor import clickhouse_create_columns, clickhouse_update_spans
+
+SESSION_ID = "5f6d7a3e-3c4b-4a6e-9a57-2d6f3e1b9c10"
+AGENT_ID = "0c1e9a8b-7d6f-4e5a-8b3c-2a1f0e9d8c7b"
+
+
+def _event(event_type: str, **extra) -> dict:
+    return {
+        'event_type': event_type,
+        'agent_id': AGENT_ID,
+        'init_timestamp': "2025-01-01T12:00:00+00:00",
+        'end_timestamp': "2025-01-01T12:00:01+00:00",
+        **extra,
+    }
+
+
+class TestValidateEvents:
+    def test_valid_batch(self):
+        results = validate_events([_event("actions", id="a"), _event("tools"), {'event_type': "errors"}])
+
+        assert [result['status'] for result in results] == ["ok", "ok", "ok"]
+        assert results[0] == {'index': 0, 'id': "a", 'status': "ok"}
+
+    def test_reports_every_invalid_event(self):
+        events = [_event("actions"), {'event_type': "llms", 'init_timestamp': "x"}, "not an event"]
+
+        with pytest.raises(InvalidEventsError) as exc_info:
+            validate_events(events)
+
+        results = exc_info.value.results
+        assert [result['status'] for result in results] == ["ok", "error", "error"]
+        assert results[1]['message'] == "missing end_timestamp"
+        assert str(exc_info.value) == "2 of 3 events are invalid"
+
+    def test_updates_need_an_id(self):
+        with pytest.raises(InvalidEventsError) as exc_info:
+            validate_events([_event("llms", id="a"), _event("tools")], update=True)
+
+        results = exc_info.value.results
+        assert results[0]['status'] == "ok"
+        assert results[1]['message'] == "missing id"
+
+    def test_error_updates_are_skipped(self):
+        results = validate_events([_event("llms", id="a"), {'event_type': "errors", 'id': "e"}], update=True)
+
+        assert results[0]['status'] == "ok"
+        assert results[1] == {
+            'index': 1,
+            'id': "e",
+            'status': "skipped",
+            'message': "error events cannot be updated",
+        }
+
+    def test_events_must_be_a_list(self):
+        with pytest.raises(RuntimeError):
+            validate_events(None)
+
+
+async def test_build_event_rows_groups_by_table():
+    events = [_event("actions", id="a1"), _event("tools", id="t1"), _event("custom", id="a2")]
+
+    tables = await build_event_rows(events, SESSION_ID, MagicMock())
+
+    assert [row['id'] for row in tables['actions']] == ["a1", "a2"]
+    assert [row['id'] for row in tables['tools']] == ["t1"]
+    assert tables['llms'] == tables['errors'] == []
+
+
+async def test_updates_only_keep_existing_rows():
+    def table(name):
+        query = MagicMock()
+        query.select.return_value.in_.return_value.execute = AsyncMock(
+            return_value=MagicMock(data=[{'id': "a1"}] if name == "actions" else [])
+        )
+        return query
+
+    supabase = MagicMock()
+    supabase.table.side_effect = table
+    tables = {'actions': [{'id': "a1"}, {'id': "a2"}], 'llms': [{'id': "l1"}], 'tools': [], 'errors': []}
+
+    kept = await keep_existing_rows(tables, supabase)
+
+    assert kept == {'actions': [{'id': "a1"}], 'llms': [], 'tools': [], 'errors': []}
+    supabase.table.assert_any_call("actions")
+    assert "tools" not in [call.args[0] for call in supabase.table.call_args_list]
+
+
+@pytest.fixture
+def clickhouse_client():
+    client = MagicMock()
+    client.insert = AsyncMock()
+    client.query = AsyncMock()
+    with patch.object(processor, 'get_async_clickhouse', AsyncMock(return_value=client)):
+        yield client
+
+
+async def test_batch_is_written_in_one_columnar_insert(clickhouse_client):
+    await clickhouse_create_columns([{'SpanId': "a", 'Duration': 1}, {'Duration': 2, 'SpanId': "b"}])
+
+    clickhouse_client.insert.assert_awaited_once()
+    kwargs = clickhouse_client.insert.call_args.kwargs
+    assert kwargs['column_names'] == ["SpanId", "Duration"]
+    assert kwargs['data'] == [["a", "b"], ["1", "2"]]
+    assert kwargs['column_oriented'] is True
+
+
+async def test_batch_update_merges_existing_spans(clickhouse_client):
+    existing = MagicMock(
+        column_names=["SpanId", "SpanName", "SpanAttributes"],
+        result_rows=[("a", "old", {'kept': "1", 'changed': "old"})],
+    )
+    clickhouse_client.query.side_effect = [existing, MagicMock()]
+
+    await clickhouse_update_spans({'a': {'SpanId': "a", 'SpanAttributes': {'changed': "new"}}})
+
+    select, delete = clickhouse_client.query.call_args_list
+    assert select.kwargs['parameters'] == {'span_ids': ("a",)}
+    assert delete.args[0].startswith("ALTER TABLE otel_traces DELETE")
+    kwargs = clickhouse_client.insert.call_args.kwargs
+    row = dict(zip(kwargs['column_names'], (column[0] for column in kwargs['data'])))
+    assert row == {'SpanId': "a", 'SpanName': "old", 'SpanAttributes': {'kept': "1", 'changed': "new"}}
@@ -0,0 +1,14 @@
+"""
+Query benchmarks for the v4 trace and metrics API.
+
+Seeds a local ClickHouse with synthetic spans and replays the queries issued by
+the trace list, trace detail, metrics and logs endpoints, reporting latency
+percentiles and the rows/bytes ClickHouse had to read.
+
+Usage (from `app/api`):
+    python -m tests.benchmark --projects 50 --traces-per-project 500 --max-depth 4 --iterations 30
+    python -m tests.benchmark --output baseline.json
+    python -m tests.benchmark --baseline baseline.json  # exits non-zero on regressions
+
+Not collected by pytest; the module names intentionally avoid the `test_` prefix.
+"""
@@ -0,0 +1,303 @@
+"""
+Benchmark runner for the v4 trace/metrics queries.
+
+See `tests/benchmark/__init__.py` for usage.
+"""
+
+from typing import Any, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+from tests._conftest.common import is_github_actions
+from tests._conftest.clickhouse import (
+    TEST_CLICKHOUSE_HOST,
+    TEST_CLICKHOUSE_PORT,
+    TEST_CLICKHOUSE_DATABASE,
+    TEST_CLICKHOUSE_USER,
+    TEST_CLICKHOUSE_PASSWORD,
+    clickhouse_start_docker,
+    clickhouse_stop_docker,
+    clickhouse_run_migrations,
+)
+
+from .generator import SPAN_COLUMNS, GeneratorConfig, SpanGenerator
+
+INSERT_BATCH_SIZE = 5_000
+
+# `calculate_*_cost` are UDFs installed on the production cluster by the collector
+# deployment; the benchmark only needs something with the same shape and cost.
+COST_FUNCTIONS = (
+    "CREATE OR REPLACE FUNCTION calculate_prompt_cost AS (tokens, model) -> "
+    "toFloat64(tokens) * if(model LIKE '%mini%', 0.00000015, 0.0000025)",
+    "CREATE OR REPLACE FUNCTION calculate_completion_cost AS (tokens, model) -> "
+    "toFloat64(tokens) * if(model LIKE '%mini%', 0.0000006, 0.00001)",
+)
+
+
+class RecordingClient:
+    """
+    Proxy for the async ClickHouse client that records the read statistics
+    ClickHouse reports for every query issued through it.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self.queries: list[dict[str, int]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def query(self, *args, **kwargs):
+        result = await self._client.query(*args, **kwargs)
+        summary = getattr(result, 'summary', None) or {}
+        self.queries.append(
+            {
+                'read_rows': int(summary.get('read_rows', 0)),
+                'read_bytes': int(summary.get('read_bytes', 0)),
+            }
+        )
+        return result
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    latencies: list[float] = field(default_factory=list)  # seconds
+    read_rows: int = 0
+    read_bytes: int = 0
+    queries: int = 0
+
+    def percentile(self, pct: float) -> float:
+        ordered = sorted(self.latencies)
+        idx = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+        return ordered[idx]
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            'p50_ms': round(self.percentile(50) * 1000, 2),
+            'p99_ms': round(self.percentile(99) * 1000, 2),
+            'mean_ms': round(statistics.mean(self.latencies) * 1000, 2),
+            'read_rows': self.read_rows,
+            'read_bytes': self.read_bytes,
+            'queries': self.queries,
+        }
+
+
+Scenario = Callable[[], Awaitable[Any]]
+
+
+def build_scenarios(generator: SpanGenerator) -> dict[str, Scenario]:
+    """
+    Scenarios mirror the model calls made by the v4 views so that a change to a
+    model's query is reflected here without duplicating SQL.
+    """
+    from agentops.common import cache
+    from agentops.api.models.traces import TraceIdIndexModel, TraceModel, TraceListModel, TraceSummaryModel
+    from agentops.api.models.metrics import ProjectMetricsModel
+
+    hot_project = generator.project_ids[0]
+    small_project = generator.project_ids[-1]
+    hot_trace = generator.trace_ids[hot_project][len(generator.trace_ids[hot_project]) // 2]
+    end_time = generator.now
+    start_time = end_time - timedelta(days=generator.config.days)
+
+    def trace_list(project_id: str, query: str | None = None) -> Scenario:
+        return lambda: TraceListModel.select(
+            filters={"project_id": project_id, "start_time": start_time, "end_time": end_time},
+            search=query,
+            order_by="start_time DESC",
+            limit=20,
+            offset=0,
+        )
+
+    async def logs_ownership():
+        # the project is cached per trace; clear it so every run hits the index
+        cache.delete(f"agentops.trace_project:{hot_trace}")
+        return await TraceIdIndexModel.get_project_id(hot_trace)
+
+    def metrics(project_id: str) -> Scenario:
+        return lambda: ProjectMetricsModel.select(
+            filters={"project_id": project_id, "start_time": start_time, "end_time": end_time},
+        )
+
+    return {
+        'trace_list_hot': trace_list(hot_project),
+        'trace_list_small': trace_list(small_project),
+        'trace_list_search': trace_list(hot_project, query="researcher"),
+        'trace_detail': lambda: TraceModel.select(filters={"trace_id": hot_trace}),
+        'freeplan_trace_ids': lambda: TraceSummaryModel.select(
+            filters={"project_id": hot_project},
+            order_by="start_time DESC",
+            limit=3,
+        ),
+        'metrics_hot': metrics(hot_project),
+        'metrics_small': metrics(small_project),
+        # the logs endpoint resolves trace ownership through the trace id index before reading from S3
+        'logs_ownership': logs_ownership,
+    }
+
+
+async def seed(client, generator: SpanGenerator) -> int:
+    """Insert the generated dataset and return the number of spans written."""
+    for statement in COST_FUNCTIONS:
+        client.command(statement)
+    client.command("TRUNCATE TABLE IF EXISTS otel_traces")
+
+    total, batch = 0, []
+    for row in generator.spans():
+        batch.append(row)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            client.insert("otel_traces", batch, column_names=list(SPAN_COLUMNS))
+            total += len(batch)
+            batch = []
+            print(f"\rinserted {total} spans", end="", flush=True)
+
+    if batch:
+        client.insert("otel_traces", batch, column_names=list(SPAN_COLUMNS))
+        total += len(batch)
+
+    client.command("OPTIMIZE TABLE otel_traces FINAL")
+    print(f"\rinserted {total} spans")
+    return total
+
+
+async def run_scenario(
+    name: str, scenario: Scenario, recorder: RecordingClient, iterations: int
+) -> ScenarioResult:
+    result = ScenarioResult(name)
+    await scenario()  # warm up caches and connections
+
+    for _ in range(iterations):
+        recorder.queries.clear()
+        start = time.perf_counter()
+        await scenario()
+        result.latencies.append(time.perf_counter() - start)
+
+    # read stats are deterministic for a fixed dataset, so the last run is representative
+    result.queries = len(recorder.queries)
+    result.read_rows = sum(q['read_rows'] for q in recorder.queries)
+    result.read_bytes = sum(q['read_bytes'] for q in recorder.queries)
+    return result
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Return a description of every metric that regressed beyond `tolerance`."""
+    regressions = []
+    for name, current in results.items():
+        if not (previous := baseline.get(name)):
+            continue
+        for metric in ('p99_ms', 'read_rows', 'read_bytes'):
+            if previous[metric] and current[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {previous[metric]} -> {current[metric]}")
+    return regressions
+
+
+def print_report(results: dict[str, dict]) -> None:
+    print(f"\n{'scenario':<22}{'p50 ms':>10}{'p99 ms':>10}{'queries':>9}{'rows read':>14}{'MB read':>10}")
+    for name, stats in results.items():
+        print(
+            f"{name:<22}{stats['p50_ms']:>10}{stats['p99_ms']:>10}{stats['queries']:>9}"
+            f"{stats['read_rows']:>14}{stats['read_bytes'] / 1_000_000:>10.1f}"
+        )
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmark", description=__doc__)
+    parser.add_argument("--projects", type=int, default=GeneratorConfig.projects)
+    parser.add_argument("--traces-per-project", type=int, default=GeneratorConfig.traces_per_project)
+    parser.add_argument("--max-depth", type=int, default=GeneratorConfig.max_depth)
+    parser.add_argument("--seed", type=int, default=GeneratorConfig.seed)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--scenario", action="append", help="Only run the named scenario(s)")
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse data from a previous run")
+    parser.add_argument("--no-docker", action="store_true", help="Use an already running ClickHouse")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a previous --output file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed regression ratio (default: 0.2)"
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str]) -> int:
+    from agentops.api.db import clickhouse_client
+    from agentops.api.db.clickhouse_client import ConnectionConfig, get_clickhouse, get_async_clickhouse
+
+    args = parse_args(argv)
+    ConnectionConfig.host = TEST_CLICKHOUSE_HOST
+    ConnectionConfig.port = TEST_CLICKHOUSE_PORT
+    ConnectionConfig.database = TEST_CLICKHOUSE_DATABASE
+    ConnectionConfig.username = TEST_CLICKHOUSE_USER
+    ConnectionConfig.password = TEST_CLICKHOUSE_PASSWORD
+    ConnectionConfig.secure = False
+
+    manage_docker = not (args.no_docker or is_github_actions())
+    if manage_docker:
+        clickhouse_start_docker()
+
+    try:
+        for _ in range(30):
+            try:
+                client = get_clickhouse()
+                client.command("SELECT 1")
+                break
+            except Exception:
+                time.sleep(2)
+        else:
+            print("ClickHouse did not become available", file=sys.stderr)
+            return 1
+
+        generator = SpanGenerator(
+            GeneratorConfig(
+                projects=args.projects,
+                traces_per_project=args.traces_per_project,
+                max_depth=args.max_depth,
+                seed=args.seed,
+            )
+        )
+        if args.skip_seed:
+            list(generator.spans())  # replay the generator to recover ids
+        else:
+            if manage_docker:
+                await clickhouse_run_migrations(client)
+            await seed(client, generator)
+
+        # every model query goes through the global async client, so recording it
+        # there captures the stats of exactly what the endpoints would run
+        recorder = RecordingClient(await get_async_clickhouse())
+        clickhouse_client.async_clickhouse = recorder
+
+        scenarios = build_scenarios(generator)
+        results: dict[str, dict] = {}
+        for name, scenario in scenarios.items():
+            if args.scenario and name not in args.scenario:
+                continue
+            results[name] = (await run_scenario(name, scenario, recorder, args.iterations)).to_dict()
+
+        print_report(results)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+
+        if args.baseline:
+            with open(args.baseline) as f:
+                regressions = compare(results, json.load(f), args.tolerance)
+            if regressions:
+                print("\nRegressions:\n  " + "\n  ".join(regressions), file=sys.stderr)
+                return 1
+
+        return 0
+    finally:
+        if manage_docker:
+            clickhouse_stop_docker()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
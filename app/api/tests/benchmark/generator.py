@@ -0,0 +1,209 @@
+"""
+Synthetic span generator for benchmarking.
+
+Produces rows shaped like the ones the collector writes to `otel_traces`: agent
+trees several levels deep with LLM and tool spans carrying gen_ai attributes of
+realistic size. Output is fully determined by the seed so runs are comparable.
+"""
+
+from typing import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import json
+import random
+import uuid
+
+# column order used for inserts; `project_id` is MATERIALIZED from ResourceAttributes
+SPAN_COLUMNS = (
+    "Timestamp",
+    "TraceId",
+    "SpanId",
+    "ParentSpanId",
+    "TraceState",
+    "SpanName",
+    "SpanKind",
+    "ServiceName",
+    "ResourceAttributes",
+    "ScopeName",
+    "ScopeVersion",
+    "SpanAttributes",
+    "Duration",
+    "StatusCode",
+    "StatusMessage",
+    "Events.Timestamp",
+    "Events.Name",
+    "Events.Attributes",
+    "Links.TraceId",
+    "Links.SpanId",
+    "Links.TraceState",
+    "Links.Attributes",
+)
+
+MODELS = ("gpt-4o", "gpt-4o-mini", "claude-3-5-sonnet-20241022", "gemini-1.5-pro")
+TOOLS = ("web_search", "read_file", "write_file", "run_python", "sql_query", "http_get")
+AGENTS = ("planner", "researcher", "coder", "reviewer", "summarizer")
+WORDS = (
+    "agent tool result context user assistant system function call response request model token "
+    "search document summary analysis plan step output input error retry memory vector query"
+).split()
+
+
+@dataclass
+class GeneratorConfig:
+    """Shape of the generated dataset."""
+
+    projects: int = 20
+    traces_per_project: int = 200
+    hot_project_multiplier: int = 10  # the first project is a large one, like our biggest customers
+    max_depth: int = 5
+    max_fanout: int = 4
+    days: int = 30  # spread traces over this many days before `now`
+    error_rate: float = 0.03
+    prompt_chars: tuple[int, int] = (500, 8000)
+    completion_chars: tuple[int, int] = (200, 3000)
+    seed: int = 42
+
+
+class SpanGenerator:
+    """Deterministic generator of `otel_traces` rows."""
+
+    def __init__(self, config: GeneratorConfig, now: datetime | None = None):
+        self.config = config
+        self.now = now or datetime.now(timezone.utc).replace(microsecond=0)
+        self.rng = random.Random(config.seed)
+        self.project_ids = [str(uuid.UUID(int=self.rng.getrandbits(128))) for _ in range(config.projects)]
+        self.trace_ids: dict[str, list[str]] = {project_id: [] for project_id in self.project_ids}
+
+    def _hex(self, bits: int) -> str:
+        return f"{self.rng.getrandbits(bits):0{bits // 4}x}"
+
+    def _text(self, bounds: tuple[int, int]) -> str:
+        target = self.rng.randint(*bounds)
+        words: list[str] = []
+        length = 0
+        while length < target:
+            word = self.rng.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        return " ".join(words)
+
+    def _llm_attributes(self) -> dict[str, str]:
+        model = self.rng.choice(MODELS)
+        prompt_tokens = self.rng.randint(50, 4000)
+        completion_tokens = self.rng.randint(10, 1500)
+        return {
+            "agentops.span.kind": "llm",
+            "gen_ai.system": "openai" if model.startswith("gpt") else "anthropic",
+            "gen_ai.request.model": model,
+            "gen_ai.response.model": model,
+            "gen_ai.prompt.0.role": "system",
+            "gen_ai.prompt.0.content": self._text((200, 1000)),
+            "gen_ai.prompt.1.role": "user",
+            "gen_ai.prompt.1.content": self._text(self.config.prompt_chars),
+            "gen_ai.completion.0.role": "assistant",
+            "gen_ai.completion.0.content": self._text(self.config.completion_chars),
+            "gen_ai.usage.prompt_tokens": str(prompt_tokens),
+            "gen_ai.usage.completion_tokens": str(completion_tokens),
+            "gen_ai.usage.total_tokens": str(prompt_tokens + completion_tokens),
+            "gen_ai.usage.cache_read_input_tokens": str(self.rng.randint(0, prompt_tokens)),
+        }
+
+    def _tool_attributes(self) -> dict[str, str]:
+        return {
+            "agentops.span.kind": "tool",
+            "tool.name": self.rng.choice(TOOLS),
+            "tool.parameters": json.dumps({"query": self._text((20, 200))}),
+            "tool.result": self._text((100, 2000)),
+        }
+
+    def _span(
+        self,
+        project_id: str,
+        trace_id: str,
+        parent_span_id: str,
+        name: str,
+        start: datetime,
+        duration_ns: int,
+        attributes: dict[str, str],
+    ) -> tuple[str, list]:
+        span_id = self._hex(64)
+        status = "STATUS_CODE_ERROR" if self.rng.random() < self.config.error_rate else "STATUS_CODE_OK"
+        row = [
+            start,
+            trace_id,
+            span_id,
+            parent_span_id,
+            "",
+            name,
+            "SPAN_KIND_INTERNAL",
+            "benchmark-agent",
+            {
+                "agentops.project.id": project_id,
+                "service.name": "benchmark-agent",
+                "telemetry.sdk.language": "python",
+            },
+            "agentops",
+            "0.4.0",
+            attributes,
+            duration_ns,
+            status,
+            "",
+            [],
+            [],
+            [],
+            [],
+            [],
+            [],
+            [],
+        ]
+        return span_id, row
+
+    def _children(
+        self,
+        project_id: str,
+        trace_id: str,
+        parent_span_id: str,
+        start: datetime,
+        depth: int,
+    ) -> Iterator[list]:
+        if depth >= self.config.max_depth:
+            return
+
+        cursor = start
+        for _ in range(self.rng.randint(1, self.config.max_fanout)):
+            leaf = depth + 1 >= self.config.max_depth or self.rng.random() < 0.4
+            if leaf:
+                is_llm = self.rng.random() < 0.6
+                attributes = self._llm_attributes() if is_llm else self._tool_attributes()
+                name = "openai.chat.completion" if is_llm else f"{attributes['tool.name']}.tool"
+            else:
+                name = f"{self.rng.choice(AGENTS)}.agent"
+                attributes = {"agentops.span.kind": "agent", "agent.name": name}
+
+            duration_ns = self.rng.randint(5_000_000, 20_000_000_000)
+            span_id, row = self._span(
+                project_id, trace_id, parent_span_id, name, cursor, duration_ns, attributes
+            )
+            yield row
+            if not leaf:
+                yield from self._children(project_id, trace_id, span_id, cursor, depth + 1)
+            cursor += timedelta(microseconds=self.rng.randint(1_000, 500_000))
+
+    def trace(self, project_id: str) -> Iterator[list]:
+        """Generate all spans for a single trace."""
+        trace_id = self._hex(128)
+        self.trace_ids[project_id].append(trace_id)
+        start = self.now - timedelta(seconds=self.rng.randint(0, self.config.days * 86400))
+        tags = json.dumps(self.rng.sample(("prod", "staging", "eval", "batch", "chat"), 2))
+        attributes = {"agentops.span.kind": "session", "agentops.tags": tags}
+
+        root_id, root = self._span(project_id, trace_id, "", "session", start, 60_000_000_000, attributes)
+        yield root
+        yield from self._children(project_id, trace_id, root_id, start, 1)
+
+    def spans(self) -> Iterator[list]:
+        """Generate spans for every trace of every project."""
+        for idx, project_id in enumerate(self.project_ids):
+            multiplier = self.config.hot_project_multiplier if idx == 0 else 1
+            for _ in range(self.config.traces_per_project * multiplier):
+                yield from self.trace(project_id)
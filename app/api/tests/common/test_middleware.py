@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from agentops.common.middleware import CancelOnDisconnectMiddleware
+
+
+def _scope(method: str = "GET") -> dict:
+    return {'type': "http", 'method': method, 'path': "/v4/traces/list/project"}
+
+
+def _client(*messages: dict):
+    """ASGI receive/send pair; `receive` returns `messages`, then waits for `disconnect`."""
+    queue: asyncio.Queue = asyncio.Queue()
+    for message in messages:
+        queue.put_nowait(message)
+    sent = []
+
+    async def receive():
+        return await queue.get()
+
+    async def send(message):
+        sent.append(message)
+
+    def disconnect():
+        queue.put_nowait({'type': "http.disconnect"})
+
+    return receive, send, sent, disconnect
+
+
+REQUEST = {'type': "http.request", 'body': b"", 'more_body': False}
+
+
+class TestCancelOnDisconnectMiddleware:
+    async def test_response_passes_through(self):
+        async def app(scope, receive, send):
+            assert await receive() == REQUEST
+            await send({'type': "http.response.start", 'status': 200, 'headers': []})
+            await send({'type': "http.response.body", 'body': b"ok"})
+
+        receive, send, sent, _ = _client(REQUEST)
+        await CancelOnDisconnectMiddleware(app)(_scope(), receive, send)
+
+        assert [message['type'] for message in sent] == ["http.response.start", "http.response.body"]
+
+    async def test_disconnect_cancels_handler(self):
+        cancelled = asyncio.Event()
+
+        async def app(scope, receive, send):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        receive, send, sent, disconnect = _client(REQUEST)
+        task = asyncio.create_task(CancelOnDisconnectMiddleware(app)(_scope(), receive, send))
+        await asyncio.sleep(0.01)
+        disconnect()
+        await asyncio.wait_for(task, 1)
+
+        assert cancelled.is_set()
+        assert sent == []
+
+    async def test_disconnect_after_response_started_is_ignored(self):
+        disconnected = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await send({'type': "http.response.start", 'status': 200, 'headers': []})
+            await disconnected.wait()
+            await send({'type': "http.response.body", 'body': b"ok"})
+
+        receive, send, sent, disconnect = _client(REQUEST)
+        task = asyncio.create_task(CancelOnDisconnectMiddleware(app)(_scope(), receive, send))
+        await asyncio.sleep(0.01)
+        disconnect()
+        await asyncio.sleep(0.01)
+        disconnected.set()
+        await asyncio.wait_for(task, 1)
+
+        assert sent[-1]['type'] == "http.response.body"
+
+    async def test_outside_cancellation_is_not_swallowed(self):
+        async def app(scope, receive, send):
+            await asyncio.sleep(10)
+
+        receive, send, _, _ = _client(REQUEST)
+        task = asyncio.create_task(CancelOnDisconnectMiddleware(app)(_scope(), receive, send))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    async def test_writes_are_not_cancelled(self):
+        async def app(scope, receive, send):
+            await receive()
+            await asyncio.sleep(0.05)
+            await send({'type': "http.response.start", 'status': 201, 'headers': []})
+
+        receive, send, sent, disconnect = _client(REQUEST)
+        disconnect()
+        await CancelOnDisconnectMiddleware(app)(_scope("POST"), receive, send)
+
+        assert sent[0]['status'] == 201
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agentops.common import cache
+from agentops.api.models.traces import SpanModel, TraceVisibilityCutoffModel
+
+
+@pytest.fixture(autouse=True)
+def clear_cutoff_cache():
+    cache.delete("agentops.freeplan_cutoff:project-1")
+    yield
+    cache.delete("agentops.freeplan_cutoff:project-1")
+
+
+def _cutoff(trace_count: int) -> TraceVisibilityCutoffModel:
+    return TraceVisibilityCutoffModel(
+        cutoff=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc), trace_count=trace_count
+    )
+
+
+def test_cutoff_query_limits_newest_traces():
+    query, params = TraceVisibilityCutoffModel._get_select_query(filters={"project_id": "project-1"}, limit=3)
+
+    assert "GROUP BY TraceId" in query
+    assert "ORDER BY start_time DESC" in query
+    assert "LIMIT 3" in query
+    assert params == {"project_id": "project-1"}
+
+
+async def test_cutoff_is_cached():
+    with patch.object(TraceVisibilityCutoffModel, "select", AsyncMock(return_value=[_cutoff(3)])) as select:
+        first = await TraceVisibilityCutoffModel.get_cutoff("project-1", 3)
+        second = await TraceVisibilityCutoffModel.get_cutoff("project-1", 3)
+
+    assert first == second == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    select.assert_awaited_once()
+
+
+async def test_no_cutoff_with_too_few_traces():
+    with patch.object(TraceVisibilityCutoffModel, "select", AsyncMock(return_value=[_cutoff(2)])) as select:
+        assert await TraceVisibilityCutoffModel.get_cutoff("project-1", 3) is None
+        assert await TraceVisibilityCutoffModel.get_cutoff("project-1", 3) is None
+
+    select.assert_awaited_once()
+
+
+def test_freeplan_truncated_fields_skip_hidden_contents():
+    query, _ = SpanModel._get_select_query(fields=SpanModel.freeplan_truncated_fields)
+
+    assert "ResourceAttributes as" not in query
+    assert "Events.Attributes" not in query
+    assert "Links.Attributes" not in query
+    assert "SpanAttributes.keys" in query
+    # columns shown in the truncated response are still selected
+    assert "SpanName as span_name" in query
+    assert "Duration as duration" in query
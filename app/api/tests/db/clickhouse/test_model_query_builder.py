@@ -1,6 +1,13 @@
 import re
 from typing import ClassVar
-from agentops.api.db.clickhouse.models import ClickhouseModel, SelectFields, FilterDict, SearchFields
+import pytest
+from agentops.api.db.clickhouse.models import (
+    ClickhouseModel,
+    SelectFields,
+    FilterDict,
+    SearchFields,
+    project_attributes,
+)
 
 
 def normalize_sql(sql: str) -> str:
@@ -38,6 +45,18 @@ class TestModel(ClickhouseModel):
     }
 
 
+class TestModelWithAttributes(ClickhouseModel):
+    """Test model with Map columns"""
+
+    table_name: ClassVar[str] = "test_table_attributes"
+    selectable_fields: ClassVar[SelectFields] = {
+        "Id": "id",
+        "SpanAttributes": "span_attributes",
+        "ResourceAttributes": "resource_attributes",
+        "Events.Name": "event_names",
+    }
+
+
 class TestModelWithStringFields(ClickhouseModel):
     """Test model with string selectable fields"""
 
@@ -250,3 +269,81 @@ def test_get_select_query_complete():
         "search_name": "%test%",
         "search_project_id": "%test%",
     }
+
+
+def test_project_attributes_exact_keys():
+    """Test project_attributes keeps only the listed keys"""
+    expression = project_attributes("SpanAttributes", ["gen_ai.request.model", "agentops.tags"])
+    assert expression == (
+        "mapFilter((k, v) -> has(['gen_ai.request.model', 'agentops.tags'], k), SpanAttributes)"
+    )
+
+
+def test_project_attributes_prefixes():
+    """Test project_attributes matches keys ending in `*` by prefix"""
+    expression = project_attributes("SpanAttributes", ["agentops.tags", "gen_ai.usage.*", "llm.*"])
+    assert expression == (
+        "mapFilter((k, v) -> has(['agentops.tags'], k) "
+        "OR startsWith(k, 'gen_ai.usage.') OR startsWith(k, 'llm.'), SpanAttributes)"
+    )
+
+
+def test_project_attributes_without_keys():
+    """Test project_attributes doesn't read the column when no keys are needed"""
+    assert project_attributes("ResourceAttributes", ()) == "CAST(map(), 'Map(String, String)')"
+
+
+def test_project_attributes_quotes_keys():
+    """Test project_attributes escapes quotes in keys"""
+    assert "has(['it\\'s'], k)" in project_attributes("SpanAttributes", ["it's"])
+
+
+def test_project_fields():
+    """Test project_fields narrows only the given Map columns"""
+    attributes = {"SpanAttributes": ["gen_ai.*"], "ResourceAttributes": ()}
+    fields = TestModelWithAttributes.project_fields(attributes)
+
+    query, _ = TestModelWithAttributes._get_select_query(fields=fields)
+    assert normalize_sql(query) == normalize_sql("""
+        SELECT Id as id,
+            mapFilter((k, v) -> startsWith(k, 'gen_ai.'), SpanAttributes) as span_attributes,
+            CAST(map(), 'Map(String, String)') as resource_attributes,
+            Events.Name as event_names
+        FROM test_table_attributes
+    """)
+
+
+def test_project_fields_without_keys():
+    """Test project_fields keeps every column that is left empty"""
+    fields = TestModelWithAttributes.project_fields({"SpanAttributes": (), "ResourceAttributes": ()})
+
+    assert fields == [
+        "Id as id",
+        "CAST(map(), 'Map(String, String)') as span_attributes",
+        "CAST(map(), 'Map(String, String)') as resource_attributes",
+        "Events.Name as event_names",
+    ]
+
+
+def test_project_fields_empty_arrays():
+    """Test project_fields selects the given array columns as empty arrays"""
+    fields = TestModelWithAttributes.project_fields({}, empty_arrays=["Events.Name"])
+
+    assert fields == [
+        "Id as id",
+        "SpanAttributes as span_attributes",
+        "ResourceAttributes as resource_attributes",
+        "emptyArrayString() as event_names",
+    ]
+
+
+def test_project_fields_unknown_column():
+    """Test project_fields rejects columns the model doesn't select"""
+    with pytest.raises(ValueError):
+        TestModelWithAttributes.project_fields({"Events.Attributes": ()})
+
+    with pytest.raises(ValueError):
+        TestModelWithAttributes.project_fields({}, empty_arrays=["Links.Attributes"])
+
+    with pytest.raises(ValueError):
+        TestModelWithListFields.project_fields({"Name": ()})
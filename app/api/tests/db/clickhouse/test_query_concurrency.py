@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentops.api.db.clickhouse import concurrency, profiling
+from agentops.api.db.clickhouse.concurrency import limit_queries
+from agentops.api.db.clickhouse.profiling import execute_query
+
+
+def _slow_client(release: asyncio.Event) -> MagicMock:
+    """Client whose queries block until `release` is set, tracking how many run at once."""
+    client = MagicMock()
+    client.running = 0
+    client.max_running = 0
+
+    async def query(*args, **kwargs):
+        client.running += 1
+        client.max_running = max(client.max_running, client.running)
+        try:
+            await release.wait()
+        finally:
+            client.running -= 1
+        return MagicMock(summary={})
+
+    client.query = AsyncMock(side_effect=query)
+    client.command = AsyncMock()
+    return client
+
+
+async def _drain_background_tasks():
+    await asyncio.gather(*profiling._background_tasks)
+
+
+async def test_group_limit_caps_concurrent_queries():
+    release = asyncio.Event()
+    client = _slow_client(release)
+
+    @limit_queries("test_group_limit", 2)
+    async def endpoint():
+        return await execute_query(client, "SELECT 1", model="SpanModel")
+
+    with patch.object(concurrency, '_pool_limit', asyncio.Semaphore(10)):
+        tasks = [asyncio.create_task(endpoint()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert client.running == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert client.max_running == 2
+    assert client.query.await_count == 5
+
+
+async def test_pool_limit_applies_outside_groups():
+    release = asyncio.Event()
+    client = _slow_client(release)
+
+    with patch.object(concurrency, '_pool_limit', asyncio.Semaphore(3)):
+        tasks = [asyncio.create_task(execute_query(client, "SELECT 1", model="SpanModel")) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert client.running == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert client.max_running == 3
+
+
+async def test_cancelled_query_is_killed():
+    client = _slow_client(asyncio.Event())
+
+    with patch.object(concurrency, '_pool_limit', asyncio.Semaphore(1)):
+        task = asyncio.create_task(execute_query(client, "SELECT 1", model="SpanModel"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await _drain_background_tasks()
+
+        # the slot is released for the next query
+        assert concurrency._pool_limit.locked() is False
+
+    query_id = client.query.call_args.kwargs['settings']['query_id']
+    sql = client.command.call_args.args[0]
+    assert sql.startswith("KILL QUERY")
+    assert client.command.call_args.kwargs['parameters'] == {'query_id': query_id}
+
+
+async def test_timed_out_query_is_killed():
+    client = _slow_client(asyncio.Event())
+
+    with (
+        patch.object(concurrency, '_pool_limit', asyncio.Semaphore(1)),
+        patch.object(profiling, 'CLICKHOUSE_QUERY_TIMEOUT', 0.01),
+    ):
+        with pytest.raises(asyncio.TimeoutError):
+            await execute_query(client, "SELECT 1", model="SpanModel")
+        await _drain_background_tasks()
+
+    client.command.assert_awaited_once()
+
+
+async def test_failed_kill_is_logged():
+    client = _slow_client(asyncio.Event())
+    client.command.side_effect = RuntimeError("connection refused")
+
+    with (
+        patch.object(concurrency, '_pool_limit', asyncio.Semaphore(1)),
+        patch.object(profiling, 'CLICKHOUSE_QUERY_TIMEOUT', 0.01),
+        patch.object(profiling.logger, 'error') as error,
+    ):
+        with pytest.raises(asyncio.TimeoutError):
+            await execute_query(client, "SELECT 1", model="SpanModel")
+        await _drain_background_tasks()
+
+    error.assert_called_once()
@@ -0,0 +1,112 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agentops.api.db.clickhouse import profiling
+from agentops.api.db.clickhouse.profiling import QueryStats, execute_query
+
+
+def _mock_client(summary: dict | None = None) -> MagicMock:
+    result = MagicMock()
+    result.summary = summary or {}
+    client = MagicMock()
+    client.query = AsyncMock(return_value=result)
+    return client
+
+
+def test_query_stats_from_summary():
+    stats = QueryStats.from_summary(
+        "SpanModel",
+        "agentops:SpanModel:1",
+        12.5,
+        {'read_rows': '100', 'read_bytes': '2048', 'result_rows': '3'},
+    )
+
+    assert stats.read_rows == 100
+    assert stats.read_bytes == 2048
+    assert stats.result_rows == 3
+
+
+async def test_execute_query_tags_query_id():
+    client = _mock_client({'read_rows': '10'})
+
+    result = await execute_query(client, "SELECT 1", {'a': 1}, model="SpanModel")
+
+    assert result is client.query.return_value
+    kwargs = client.query.call_args.kwargs
+    assert kwargs['parameters'] == {'a': 1}
+    assert kwargs['settings']['query_id'].startswith("agentops:SpanModel:")
+
+
+async def test_fast_query_is_not_logged():
+    client = _mock_client()
+
+    with (
+        patch.object(profiling, 'CLICKHOUSE_SLOW_QUERY_MS', 60_000),
+        patch.object(profiling, '_log_slow_query', AsyncMock()) as log_slow_query,
+    ):
+        await execute_query(client, "SELECT 1", model="SpanModel")
+
+    log_slow_query.assert_not_called()
+
+
+async def test_slow_query_is_logged_in_background():
+    client = _mock_client({'read_rows': '5'})
+
+    with (
+        patch.object(profiling, 'CLICKHOUSE_SLOW_QUERY_MS', 0.0001),
+        patch.object(profiling, 'CLICKHOUSE_SLOW_QUERY_LOG_STATS', False),
+        patch.object(profiling, 'CLICKHOUSE_EXPLAIN_SLOW_QUERIES', True),
+        patch.object(profiling, 'explain_query', AsyncMock(return_value="plan")) as explain,
+        patch.object(profiling.logger, 'warning') as warning,
+    ):
+        await execute_query(client, "SELECT 1", model="SpanModel")
+        await asyncio.gather(*profiling._background_tasks)
+
+    explain.assert_awaited_once()
+    message = warning.call_args.args[0]
+    assert "'model': 'SpanModel'" in message
+    assert "'explain': 'plan'" in message
+    assert "SELECT 1" in message
+
+
+async def test_query_log_stats_are_read_once():
+    client = _mock_client()
+    client.query.return_value.named_results.return_value = iter([])
+
+    with patch.object(profiling, 'QUERY_LOG_FLUSH_DELAY', 0):
+        stats = await profiling._get_query_log_stats(client, "agentops:SpanModel:1")
+
+    assert stats is None
+    client.query.assert_awaited_once()
+
+
+async def test_execute_insert_tags_query_id():
+    client = MagicMock()
+    client.insert = AsyncMock()
+
+    await profiling.execute_insert(client, "otel_traces", [["a"]], model="exporter", column_names=["SpanId"])
+
+    kwargs = client.insert.call_args.kwargs
+    assert kwargs['table'] == "otel_traces"
+    assert kwargs['column_names'] == ["SpanId"]
+    assert kwargs['settings']['query_id'].startswith("agentops:exporter:")
+
+
+async def test_execute_insert_is_killed_on_timeout():
+    async def slow_insert(**kwargs):
+        await asyncio.sleep(1)
+
+    client = MagicMock()
+    client.insert = AsyncMock(side_effect=slow_insert)
+
+    with (
+        patch.object(profiling, 'CLICKHOUSE_QUERY_TIMEOUT', 0.01),
+        patch.object(profiling, 'kill_query', AsyncMock()) as kill_query,
+    ):
+        try:
+            await profiling.execute_insert(client, "otel_traces", [], model="exporter")
+        except asyncio.TimeoutError:
+            pass
+        await asyncio.gather(*profiling._background_tasks)
+
+    kill_query.assert_awaited_once()
@@ -0,0 +1,59 @@
+from agentops.api.db.clickhouse.models import NgramSearchOperation, TraceIdSearchOperation
+from agentops.api.models.traces import TraceListMetricsModel, TraceSummaryModel
+
+TRACE_ID = "0123456789ABCDEF0123456789abcdef"
+
+
+def test_ngram_search_uses_index_expression():
+    clause, params = NgramSearchOperation.format("SpanName", "search_span_name", "Research")
+
+    assert clause == "multiSearchAny(lowerUTF8(SpanName), [%(search_span_name_ngram)s])"
+    assert params == {"search_span_name_ngram": "research"}
+
+
+def test_ngram_search_short_term_falls_back_to_ilike():
+    clause, params = NgramSearchOperation.format("SpanName", "search_span_name", "ab")
+
+    assert clause == "SpanName ILIKE %(search_span_name)s"
+    assert params == {"search_span_name": "%ab%"}
+
+
+def test_trace_id_search_matches_full_id_exactly():
+    clause, params = TraceIdSearchOperation.format("TraceId", "search_trace_id", TRACE_ID)
+
+    assert clause == "TraceId = %(search_trace_id_exact)s"
+    assert params == {"search_trace_id_exact": TRACE_ID.lower()}
+
+
+def test_trace_id_search_partial_id_falls_back_to_ilike():
+    clause, params = TraceIdSearchOperation.format("TraceId", "search_trace_id", "0123")
+
+    assert clause == "TraceId ILIKE %(search_trace_id)s"
+    assert params == {"search_trace_id": "%0123%"}
+
+
+def test_trace_list_metrics_search_uses_raw_columns():
+    query, params = TraceListMetricsModel._get_select_query(filters={"project_id": "abc"}, search="agent")
+
+    assert "multiSearchAny(lowerUTF8(SpanName), [%(search_span_name_ngram)s])" in query
+    assert "multiSearchAny(lowerUTF8(SpanAttributes['agentops.tags']), [%(search_tags_ngram)s])" in query
+    assert "TraceId ILIKE %(search_trace_id)s" in query
+    assert params["search_span_name_ngram"] == "agent"
+
+
+def test_trace_summary_search_prefilters_trace_ids():
+    query, params = TraceSummaryModel._get_select_query(filters={"project_id": "abc"}, search="agent")
+
+    # the raw columns are searched in a sub-select so the skip indexes apply ...
+    assert "TraceId IN (SELECT TraceId FROM otel_traces WHERE (project_id = %(project_id)s) AND (" in query
+    assert "multiSearchAny(lowerUTF8(SpanName), [%(search_span_name_ngram)s])" in query
+    # ... and the root span is still matched against the aggregated aliases
+    assert "multiSearchAny(lowerUTF8(span_name), [%(search_span_name_ngram)s])" in query
+    assert params["project_id"] == "abc"
+
+
+def test_trace_summary_without_search_has_no_prefilter():
+    query, _ = TraceSummaryModel._get_select_query(filters={"project_id": "abc"})
+
+    assert "TraceId IN" not in query
+    assert "HAVING" not in query
@@ -0,0 +1,143 @@
+import asyncio
+from typing import ClassVar
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentops.api.db.clickhouse import models, singleflight
+from agentops.api.db.clickhouse.models import ClickhouseModel, SelectFields
+from agentops.api.db.clickhouse.singleflight import make_query_key, single_flight
+
+
+class UserModel(ClickhouseModel):
+    table_name = "users"
+    selectable_fields: ClassVar[SelectFields] = {"Id": "id"}
+
+    id: str
+
+
+def _waiting_for(event: asyncio.Event) -> AsyncMock:
+    async def wait():
+        return await event.wait()
+
+    return AsyncMock(side_effect=wait)
+
+
+def _result(*ids: str) -> MagicMock:
+    result = MagicMock()
+    result.named_results.side_effect = lambda: iter([{'id': id} for id in ids])
+    return result
+
+
+def test_query_key_ignores_formatting():
+    key = make_query_key("SpanModel", "SELECT *\n  FROM spans ", {'b': 2, 'a': 1})
+
+    assert key == make_query_key("SpanModel", "SELECT * FROM spans", {'a': 1, 'b': 2})
+    assert key != make_query_key("SpanModel", "SELECT * FROM spans", {'a': 1, 'b': 3})
+    assert key != make_query_key("TraceModel", "SELECT * FROM spans", {'a': 1, 'b': 2})
+
+
+async def test_concurrent_callers_share_one_execution():
+    release = asyncio.Event()
+    execute = _waiting_for(release)
+
+    tasks = [asyncio.create_task(single_flight("key", execute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert execute.await_count == 1
+    assert results == [True, True, True]
+    assert singleflight._flights == {}
+
+
+async def test_sequential_callers_execute_again():
+    execute = AsyncMock(return_value="result")
+
+    await single_flight("key", execute)
+    await single_flight("key", execute)
+
+    assert execute.await_count == 2
+
+
+async def test_exception_is_shared():
+    release = asyncio.Event()
+
+    async def execute():
+        await release.wait()
+        raise RuntimeError("query failed")
+
+    tasks = [asyncio.create_task(single_flight("key", execute)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelling_one_caller_keeps_the_query_running():
+    release = asyncio.Event()
+    execute = _waiting_for(release)
+
+    first = asyncio.create_task(single_flight("key", execute))
+    second = asyncio.create_task(single_flight("key", execute))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second is True
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_cancelling_last_caller_cancels_the_query():
+    cancelled = asyncio.Event()
+
+    async def execute():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    task = asyncio.create_task(single_flight("key", execute))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+
+    assert cancelled.is_set()
+    assert singleflight._flights == {}
+
+
+async def test_disabled_coalescing_executes_every_call():
+    execute = AsyncMock(return_value="result")
+
+    with patch.object(singleflight, 'CLICKHOUSE_COALESCE_QUERIES', False):
+        await asyncio.gather(*[single_flight("key", execute) for _ in range(3)])
+
+    assert execute.await_count == 3
+
+
+async def test_model_select_coalesces_identical_queries():
+    release = asyncio.Event()
+
+    async def query(*args, **kwargs):
+        await release.wait()
+        return _result("a", "b")
+
+    with (
+        patch.object(models, 'get_async_clickhouse', AsyncMock()),
+        patch.object(models, 'execute_query', AsyncMock(side_effect=query)) as execute_query,
+    ):
+        tasks = [asyncio.create_task(UserModel.select(filters={'id': "a"})) for _ in range(3)]
+        tasks.append(asyncio.create_task(UserModel.select(filters={'id': "b"})))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert execute_query.await_count == 2
+    # every caller gets its own instances
+    assert results[0] == results[1] and results[0][0] is not results[1][0]
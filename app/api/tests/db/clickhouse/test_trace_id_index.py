@@ -0,0 +1,68 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agentops.api.db.clickhouse.models import ClickhouseAggregatedModel
+from agentops.api.models.traces import TraceIdIndexModel, TraceModel
+
+
+@pytest.fixture
+def bounds():
+    return TraceIdIndexModel(
+        project_id="project-1",
+        start_time=datetime(2025, 1, 1, 12, 0, 0, 500000),
+        end_time=datetime(2025, 1, 1, 12, 5, 30, 900000),
+    )
+
+
+def test_as_filters_rounds_end_time_up(bounds):
+    assert bounds.as_filters() == {
+        "project_id": "project-1",
+        "start_time": datetime(2025, 1, 1, 12, 0, 0, 500000),
+        "end_time": datetime(2025, 1, 1, 12, 5, 31, 900000),
+    }
+
+
+def test_index_query_targets_index_table():
+    query, params = TraceIdIndexModel._get_select_query(filters={"trace_id": "abc"})
+
+    assert "FROM otel_traces_trace_id_idx" in query
+    assert "TraceId = %(trace_id)s" in query
+    assert params == {"trace_id": "abc"}
+
+
+async def test_get_returns_none_for_unindexed_trace():
+    empty = TraceIdIndexModel(project_id="", start_time=datetime(1970, 1, 1), end_time=datetime(1970, 1, 1))
+    with patch.object(TraceIdIndexModel, "select", AsyncMock(return_value=[empty])):
+        assert await TraceIdIndexModel.get("abc") is None
+
+
+async def test_trace_select_uses_index_bounds(bounds):
+    with (
+        patch.object(TraceIdIndexModel, "get", AsyncMock(return_value=bounds)),
+        patch.object(ClickhouseAggregatedModel, "select", AsyncMock()) as select,
+    ):
+        await TraceModel.select(filters={"trace_id": "abc"})
+
+    assert select.call_args.kwargs["filters"] == {"trace_id": "abc", **bounds.as_filters()}
+
+
+async def test_trace_select_falls_back_without_index():
+    with (
+        patch.object(TraceIdIndexModel, "get", AsyncMock(return_value=None)),
+        patch.object(ClickhouseAggregatedModel, "select", AsyncMock()) as select,
+    ):
+        await TraceModel.select(filters={"trace_id": "abc"})
+
+    assert select.call_args.kwargs["filters"] == {"trace_id": "abc"}
+
+
+async def test_trace_select_keeps_explicit_bounds():
+    with (
+        patch.object(TraceIdIndexModel, "get", AsyncMock()) as get,
+        patch.object(ClickhouseAggregatedModel, "select", AsyncMock()),
+    ):
+        await TraceModel.select(filters={"trace_id": "abc", "project_id": "project-2"})
+
+    get.assert_not_called()
@@ -0,0 +1,111 @@
+"""Tests for the shared deployment log stream."""
+
+import asyncio
+import threading
+
+import pytest
+
+from agentops.deploy import logs
+from agentops.deploy.logs import LogStream, get_log_stream, sse_log_events
+
+
+def _source(lines, gate: threading.Event | None = None):
+    def source():
+        for line in lines:
+            if gate:
+                gate.wait(timeout=5)
+            yield line
+
+    return source
+
+
+async def _collect(stream: LogStream, offset: int = 0) -> list[tuple[int, str]]:
+    return [item async for item in stream.follow(offset, keepalive=5) if item[0] >= 0]
+
+
+@pytest.fixture(autouse=True)
+def clear_streams():
+    logs._streams.clear()
+    yield
+    logs._streams.clear()
+
+
+async def test_single_viewer_receives_all_lines():
+    stream = get_log_stream("ns/pod", _source(["a", "b", "c"]))
+
+    assert await _collect(stream) == [(0, "a"), (1, "b"), (2, "c")]
+    assert stream.done
+
+
+async def test_viewers_share_one_upstream():
+    calls = 0
+    gate = threading.Event()
+
+    def source():
+        nonlocal calls
+        calls += 1
+        yield from _source(["a", "b"], gate)()
+
+    first = get_log_stream("ns/pod", source)
+    second = get_log_stream("ns/pod", source)
+    assert first is second
+
+    viewers = asyncio.gather(_collect(first), _collect(second))
+    gate.set()
+    a, b = await viewers
+
+    assert a == b == [(0, "a"), (1, "b")]
+    assert calls == 1
+
+
+async def test_resume_from_offset():
+    stream = get_log_stream("ns/pod", _source(["a", "b", "c", "d"]))
+    await _collect(stream)
+
+    assert await _collect(stream, offset=2) == [(2, "c"), (3, "d")]
+
+
+async def test_slow_viewer_skips_evicted_lines():
+    stream = LogStream("ns/pod", _source([str(i) for i in range(10)]), buffer_lines=3)
+    stream.start()
+    while not stream.done:
+        await asyncio.sleep(0.01)
+
+    assert await _collect(stream) == [(6, "... 7 lines skipped ..."), (7, "7"), (8, "8"), (9, "9")]
+
+
+async def test_sse_format():
+    stream = get_log_stream("ns/pod", _source(["hello\n", "multi\nline"]))
+
+    events = [event async for event in sse_log_events(stream)]
+
+    assert events == ["id: 0\ndata: hello\n\n", "id: 1\ndata: multi\ndata: line\n\n"]
+
+
+class _BlockingSource:
+    """Upstream that blocks after its first line until it is closed, like a followed pod log."""
+
+    def __init__(self):
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        yield "a"
+        self.closed.wait(timeout=5)
+
+    def close(self):
+        self.closed.set()
+
+
+async def test_stop_closes_upstream_and_joins_follower():
+    upstream = _BlockingSource()
+    stream = get_log_stream("ns/pod", lambda: upstream)
+    while stream.offset == 0:
+        await asyncio.sleep(0.01)
+
+    joined = stream.stop()
+
+    # the loop isn't blocked while the follower is joined
+    assert upstream.closed.is_set()
+    assert stream.done
+    await joined
+    assert not stream._thread.is_alive()
@@ -0,0 +1,120 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentops.common import cache
+from agentops.opsboard.access import (
+    get_project_access,
+    get_project_prem_status,
+    invalidate_project_access,
+    invalidate_org_plan,
+)
+from agentops.opsboard.models import OrgRoles, PremStatus, UserOrgModel
+
+
+@pytest.fixture
+def clear_access_cache(test_project, test_user, test_user2):
+    """Make sure no access decision is left over from another test."""
+    for user in (test_user, test_user2):
+        invalidate_project_access(user.id, test_project.id)
+    invalidate_org_plan(test_project.org_id)
+    cache.delete(f"agentops.project_org:{test_project.id}")
+    yield
+    for user in (test_user, test_user2):
+        invalidate_project_access(user.id, test_project.id)
+    invalidate_org_plan(test_project.org_id)
+    cache.delete(f"agentops.project_org:{test_project.id}")
+
+
+class TestProjectAccess:
+    def test_member_has_access(self, orm_session, test_project, test_user, clear_access_cache):
+        access = get_project_access(orm_session, test_user.id, test_project.id)
+
+        assert access is not None
+        assert access.id == test_project.id
+        assert access.org_id == test_project.org_id
+        assert access.is_freeplan is True
+
+    def test_access_is_served_from_cache(self, orm_session, test_project, test_user, clear_access_cache):
+        get_project_access(orm_session, test_user.id, test_project.id)
+
+        orm = MagicMock()
+        access = get_project_access(orm, test_user.id, str(test_project.id))
+
+        assert access is not None
+        assert access.id == test_project.id
+        orm.query.assert_not_called()
+
+    def test_non_member_has_no_access(self, orm_session, test_project, test_user2, clear_access_cache):
+        assert get_project_access(orm_session, test_user2.id, test_project.id) is None
+
+    def test_unknown_or_invalid_project(self, orm_session, test_user):
+        assert get_project_access(orm_session, test_user.id, uuid.uuid4()) is None
+        assert get_project_access(orm_session, test_user.id, "not-a-uuid") is None
+
+    def test_plan_change_invalidates_cached_plan(
+        self, orm_session, test_project, test_user, clear_access_cache
+    ):
+        assert get_project_access(orm_session, test_user.id, test_project.id).is_freeplan is True
+
+        test_project.org.prem_status = PremStatus.pro
+        orm_session.flush()
+
+        assert get_project_access(orm_session, test_user.id, test_project.id).is_freeplan is False
+
+        test_project.org.prem_status = PremStatus.free
+        orm_session.flush()
+
+    def test_plan_is_invalidated_again_on_commit(self, orm_session, test_project, clear_access_cache):
+        plan_key = f"agentops.org_plan:{test_project.org_id}"
+        test_project.org.prem_status = PremStatus.pro
+        orm_session.flush()
+
+        # another session reads the plan before this one commits and caches the old value
+        cache.setex(plan_key, 60, PremStatus.free.value)
+        orm_session.commit()
+
+        assert cache.get(plan_key) is None
+        assert get_project_prem_status(orm_session, test_project.id) == PremStatus.pro
+
+        test_project.org.prem_status = PremStatus.free
+        orm_session.commit()
+
+    def test_removed_member_loses_access(self, orm_session, test_project, test_user2, clear_access_cache):
+        user_org = UserOrgModel(
+            user_id=test_user2.id,
+            org_id=test_project.org_id,
+            role=OrgRoles.developer,
+            user_email=test_user2.email,
+        )
+        orm_session.add(user_org)
+        orm_session.flush()
+        assert get_project_access(orm_session, test_user2.id, test_project.id) is not None
+
+        orm_session.delete(user_org)
+        orm_session.flush()
+
+        assert get_project_access(orm_session, test_user2.id, test_project.id) is None
+
+    def test_prem_status_is_served_from_cache(self, orm_session, test_project, clear_access_cache):
+        assert get_project_prem_status(orm_session, test_project.id) == PremStatus.free
+
+        orm = MagicMock()
+        assert get_project_prem_status(orm, str(test_project.id)) == PremStatus.free
+        orm.query.assert_not_called()
+
+    def test_prem_status_follows_plan_change(self, orm_session, test_project, clear_access_cache):
+        assert get_project_prem_status(orm_session, test_project.id) == PremStatus.free
+
+        test_project.org.prem_status = PremStatus.pro
+        orm_session.flush()
+
+        assert get_project_prem_status(orm_session, test_project.id) == PremStatus.pro
+
+        test_project.org.prem_status = PremStatus.free
+        orm_session.flush()
+
+    def test_prem_status_of_unknown_project(self, orm_session):
+        assert get_project_prem_status(orm_session, uuid.uuid4()) is None
+        assert get_project_prem_status(orm_session, "not-a-uuid") is None
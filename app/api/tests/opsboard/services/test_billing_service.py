@@ -1,10 +1,10 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime, timedelta
 from decimal import Decimal
 import os
 
-from agentops.opsboard.services.billing_service import BillingService
+from agentops.opsboard.services.billing_service import BillingService, build_usage_query
 from agentops.opsboard.models import ProjectModel, BillingPeriod
 from agentops.common.usage_tracking import UsageType
 
@@ -50,9 +50,9 @@ def mock_clickhouse_client():
     mock_client = MagicMock()
     mock_result = MagicMock()
     mock_result.result_rows = [
-        (1000, 82000)  # span_count, total_tokens (50000+25000+5000+2000)
+        ('project-1', 1000, 82000)  # project_id, span_count, total_tokens (50000+25000+5000+2000)
     ]
-    mock_client.query.return_value = mock_result
+    mock_client.query = AsyncMock(return_value=mock_result)
     return mock_client
 
 
@@ -257,7 +257,7 @@ class TestBillingService:
 
         assert seat_price == 5000
 
-    @patch('agentops.opsboard.services.billing_service.get_clickhouse')
+    @patch('agentops.opsboard.services.billing_service.get_async_clickhouse')
     async def test_get_usage_for_period_success(
         self, mock_get_clickhouse, billing_service, orm_session, test_org, mock_clickhouse_client
     ):
@@ -292,7 +292,7 @@ class TestBillingService:
 
         assert result == {}
 
-    @patch('agentops.opsboard.services.billing_service.get_clickhouse')
+    @patch('agentops.opsboard.services.billing_service.get_async_clickhouse')
     async def test_get_usage_for_period_clickhouse_error(
         self, mock_get_clickhouse, billing_service, orm_session, test_org
     ):
@@ -304,7 +304,7 @@ class TestBillingService:
 
         # Mock ClickHouse to raise an error
         mock_client = MagicMock()
-        mock_client.query.side_effect = Exception("ClickHouse connection failed")
+        mock_client.query = AsyncMock(side_effect=Exception("ClickHouse connection failed"))
         mock_get_clickhouse.return_value = mock_client
 
         period_start = datetime(2024, 1, 1)
@@ -359,7 +359,7 @@ class TestBillingService:
         expired_time = datetime.now() - timedelta(seconds=400)  # Older than 5 minutes
         billing_service._usage_cache[cache_key] = (expired_data, expired_time)
 
-        with patch('agentops.opsboard.services.billing_service.get_clickhouse') as mock_get_clickhouse:
+        with patch('agentops.opsboard.services.billing_service.get_async_clickhouse') as mock_get_clickhouse:
             mock_get_clickhouse.return_value = mock_clickhouse_client
 
             # Create test project
@@ -619,3 +619,39 @@ class TestBillingService:
             billing_period_in_db = orm_session.query(BillingPeriod).filter_by(id=result.id).first()
             assert billing_period_in_db is not None
             assert billing_period_in_db.org_id == test_org.id
+
+
+class TestBuildUsageQuery:
+    """Test cases for the usage query builder."""
+
+    def test_whole_days_read_from_counters(self):
+        """Whole days come from the daily counters, partial days at the edges from raw spans."""
+        query, params = build_usage_query(
+            ['project-1'],
+            datetime(2024, 1, 1, 15, 30),
+            datetime(2024, 1, 31, 9, 0),
+        )
+
+        assert 'otel_2.project_usage_daily' in query
+        assert params['first_full_day'] == '2024-01-02'
+        assert params['end_day'] == '2024-01-31'
+        assert params['period_start'] == '2024-01-01 15:30:00'
+        assert params['period_end'] == '2024-01-31 09:00:00'
+
+    def test_period_starting_at_midnight(self):
+        """A period starting at midnight reads its first day from the counters."""
+        _, params = build_usage_query(['project-1'], datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+        assert params['first_full_day'] == '2024-01-01'
+        assert params['end_day'] == '2024-01-31'
+
+    def test_period_without_whole_day(self):
+        """Periods shorter than a calendar day are counted from raw spans only."""
+        query, params = build_usage_query(
+            ['project-1'],
+            datetime(2024, 1, 1, 8, 0),
+            datetime(2024, 1, 2, 6, 0),
+        )
+
+        assert 'project_usage_daily' not in query
+        assert 'first_full_day' not in params
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime, timezone, timedelta
 from fastapi import HTTPException
 import stripe
@@ -337,11 +337,12 @@ class TestBillingIntegration:
         orm_session.flush()
 
         # Mock ClickHouse response
-        with patch('agentops.opsboard.services.billing_service.get_clickhouse') as mock_clickhouse:
+        with patch('agentops.opsboard.services.billing_service.get_async_clickhouse') as mock_clickhouse:
             mock_client = MagicMock()
             mock_result = MagicMock()
-            mock_result.result_rows = [(1000, 82000)]  # span_count, total_tokens (50000+25000+5000+2000)
-            mock_client.query.return_value = mock_result
+            # span_count, total_tokens (50000+25000+5000+2000)
+            mock_result.result_rows = [('project-1', 1000, 82000)]
+            mock_client.query = AsyncMock(return_value=mock_result)
             mock_clickhouse.return_value = mock_client
 
             period_start = datetime(2024, 1, 1)
@@ -405,11 +406,12 @@ class TestBillingIntegration:
         period_start = datetime(2024, 1, 1)
         period_end = datetime(2024, 1, 31)
 
-        with patch('agentops.opsboard.services.billing_service.get_clickhouse') as mock_clickhouse:
+        with patch('agentops.opsboard.services.billing_service.get_async_clickhouse') as mock_clickhouse:
             mock_client = MagicMock()
             mock_result = MagicMock()
-            mock_result.result_rows = [(500, 40000)]  # span_count, total_tokens (25000+12000+2000+1000)
-            mock_client.query.return_value = mock_result
+            # span_count, total_tokens (25000+12000+2000+1000)
+            mock_result.result_rows = [('project-1', 500, 40000)]
+            mock_client.query = AsyncMock(return_value=mock_result)
             mock_clickhouse.return_value = mock_client
 
             # First call should hit ClickHouse
@@ -834,14 +836,14 @@ class TestBillingPerformance:
         orm_session.flush()
 
         # Mock large dataset response
-        with patch('agentops.opsboard.services.billing_service.get_clickhouse') as mock_clickhouse:
+        with patch('agentops.opsboard.services.billing_service.get_async_clickhouse') as mock_clickhouse:
             mock_client = MagicMock()
             mock_result = MagicMock()
             # Simulate large usage numbers
             mock_result.result_rows = [
-                (100000, 8200000)
+                ('project-1', 100000, 8200000)
             ]  # span_count, total_tokens (5000000+2500000+500000+200000)
-            mock_client.query.return_value = mock_result
+            mock_client.query = AsyncMock(return_value=mock_result)
             mock_clickhouse.return_value = mock_client
 
             start_time = datetime.now()
@@ -868,11 +870,12 @@ class TestBillingPerformance:
         period_start = datetime(2024, 1, 1)
         period_end = datetime(2024, 1, 31)
 
-        with patch('agentops.opsboard.services.billing_service.get_clickhouse') as mock_clickhouse:
+        with patch('agentops.opsboard.services.billing_service.get_async_clickhouse') as mock_clickhouse:
             mock_client = MagicMock()
             mock_result = MagicMock()
-            mock_result.result_rows = [(1000, 82000)]  # span_count, total_tokens (50000+25000+5000+2000)
-            mock_client.query.return_value = mock_result
+            # span_count, total_tokens (50000+25000+5000+2000)
+            mock_result.result_rows = [('project-1', 1000, 82000)]
+            mock_client.query = AsyncMock(return_value=mock_result)
             mock_clickhouse.return_value = mock_client
 
             # First call - should hit database
@@ -64,12 +64,10 @@ def test_jwt_info_endpoint_with_valid_token(test_client, valid_jwt, valid_jwt_pa
 
     # Mock the verify_jwt function to avoid database lookup
     with patch('agentops.api.auth.verify_jwt', return_value=valid_jwt_payload):
-        # Also mock the ProjectModel.get_by_id to avoid database lookup
-        with patch('agentops.opsboard.models.ProjectModel.get_by_id') as mock_get:
-            # Create a mock project that matches the JWT payload
-            mock_project = MagicMock()
-            mock_project.org.prem_status.value = valid_jwt_payload.project_prem_status
-            mock_get.return_value = mock_project
+        # Also mock the plan lookup to avoid database lookup
+        with patch('agentops.api.routes.v3.get_project_prem_status') as mock_get:
+            # Return a plan that matches the JWT payload
+            mock_get.return_value = MagicMock(value=valid_jwt_payload.project_prem_status)
 
             response = test_client.get("/v3/auth/token", headers=headers)
 
@@ -118,13 +116,23 @@ def test_jwt_info_endpoint_plan_changed(test_client, valid_jwt, valid_jwt_payloa
 
     # Mock the verify_jwt function to return our payload
     with patch('agentops.api.auth.verify_jwt', return_value=valid_jwt_payload):
-        # Mock ProjectModel.get_by_id to return a project with a different plan
-        with patch('agentops.opsboard.models.ProjectModel.get_by_id') as mock_get:
-            mock_project = MagicMock()
-            mock_project.org.prem_status.value = "free"  # Different from token's "premium"
-            mock_get.return_value = mock_project
+        # Mock the plan lookup to return a different plan
+        with patch('agentops.api.routes.v3.get_project_prem_status') as mock_get:
+            mock_get.return_value = MagicMock(value="free")  # Different from token's "premium"
 
             response = test_client.get("/v3/auth/token", headers=headers)
 
     assert response.status_code == 401
     assert "Reauthorized to use new plan" in response.json()["detail"]
+
+
+def test_jwt_info_endpoint_project_deleted(test_client, valid_jwt, valid_jwt_payload):
+    """Test when the token's project no longer exists"""
+    headers = {"Authorization": f"Bearer {valid_jwt}"}
+
+    with patch('agentops.api.auth.verify_jwt', return_value=valid_jwt_payload):
+        with patch('agentops.api.routes.v3.get_project_prem_status', return_value=None):
+            response = test_client.get("/v3/auth/token", headers=headers)
+
+    assert response.status_code == 401
+    assert "Project not found" in response.json()["detail"]
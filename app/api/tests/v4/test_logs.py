@@ -2,14 +2,14 @@
 Tests for v4 logs API endpoints including LogsUploadView and get_trace_logs.
 """
 
+import json
 import pytest
-from io import BytesIO
 from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException, status, Request
 
-from agentops.api.routes.v4.logs import LogsUploadView, get_trace_logs, convert_trace_id
+from agentops.api.routes.v4.logs import LogsUploadView, get_trace_logs, convert_trace_id, trim_partial_line
 from agentops.api.storage import ObjectUploadResponse
-from agentops.api.environment import SUPABASE_URL, SUPABASE_S3_LOGS_BUCKET
+from agentops.api.environment import SUPABASE_URL, SUPABASE_S3_LOGS_BUCKET, LOGS_PAGE_SIZE
 
 
 @pytest.fixture
@@ -28,7 +28,7 @@ def mock_jwt_payload():
 def mock_s3_client():
     """Mock S3 client for testing"""
     client = MagicMock()
-    client.upload_fileobj = MagicMock()
+    client.put_object = MagicMock()
     client.get_object = MagicMock()
     client.exceptions.NoSuchKey = Exception
     return client
@@ -96,11 +96,11 @@ class TestLogsUploadView:
             assert response.url == expected_url
 
             # Verify S3 upload was called with correct parameters
-            mock_s3_client.upload_fileobj.assert_called_once()
-            args = mock_s3_client.upload_fileobj.call_args[0]
-            assert isinstance(args[0], BytesIO)
-            assert args[1] == SUPABASE_S3_LOGS_BUCKET
-            assert args[2] == f"{trace_id}.log"
+            mock_s3_client.put_object.assert_called_once_with(
+                Bucket=SUPABASE_S3_LOGS_BUCKET,
+                Key=f"{trace_id}.log",
+                Body=test_content,
+            )
 
     def test_missing_trace_id(self, mock_jwt_payload, mock_request):
         """Test that missing trace ID raises appropriate error"""
@@ -212,7 +212,10 @@ class TestGetTraceLogs:
         log_content = "INFO: Test log entry\nERROR: Test error"
 
         # Mock S3 response
-        mock_response = {'Body': MagicMock()}
+        mock_response = {
+            'Body': MagicMock(),
+            'ContentRange': f"bytes 0-{len(log_content) - 1}/{len(log_content)}",
+        }
         mock_response['Body'].read.return_value = log_content.encode('utf-8')
         mock_s3_client.get_object.return_value = mock_response
 
@@ -223,23 +226,18 @@ class TestGetTraceLogs:
         # Mock ORM session
         mock_orm = MagicMock()
 
-        # Mock trace model
+        # Mock trace ownership lookup
         with (
-            patch('agentops.api.routes.v4.logs.TraceModel') as mock_trace_model,
-            patch('agentops.api.routes.v4.logs.ProjectModel') as mock_project_model,
+            patch('agentops.api.routes.v4.logs.TraceIdIndexModel') as mock_trace_index,
+            patch('agentops.api.routes.v4.logs.get_project_access') as mock_get_project_access,
             patch('agentops.api.routes.v4.logs.get_s3_client', return_value=mock_s3_client),
         ):
-            # Setup trace mock with AsyncMock
-            mock_trace = MagicMock()
-            mock_trace.spans = ["span1", "span2"]  # Non-empty spans
-            mock_trace.project_id = "project-123"
-            mock_trace_model.select = AsyncMock(return_value=mock_trace)
+            mock_trace_index.get_project_id = AsyncMock(return_value="project-123")
 
             # Setup project mock
             mock_project = MagicMock()
             mock_project.is_freeplan = False
-            mock_project.org.is_user_member.return_value = True
-            mock_project_model.get_by_id.return_value = mock_project
+            mock_get_project_access.return_value = mock_project
 
             response = await get_trace_logs(request=mock_request, orm=mock_orm, trace_id=trace_id)
 
@@ -250,12 +248,17 @@ class TestGetTraceLogs:
             response_data = json.loads(response.body.decode())
             assert response_data['content'] == log_content
             assert response_data['trace_id'] == trace_id
+            assert response_data['next_offset'] is None
+            assert response_data['size'] == len(log_content)
             assert not response_data['freeplan_truncated']
 
-            # Verify S3 was called with converted trace ID
+            # Verify S3 was called with converted trace ID and only the first page was requested
             mock_s3_client.get_object.assert_called_once_with(
-                Bucket=SUPABASE_S3_LOGS_BUCKET, Key=f"{trace_id}.log"
+                Bucket=SUPABASE_S3_LOGS_BUCKET,
+                Key=f"{trace_id}.log",
+                Range=f"bytes=0-{LOGS_PAGE_SIZE - 1}",
             )
+            mock_get_project_access.assert_called_once_with(mock_orm, "user-123", "project-123")
 
     @pytest.mark.asyncio
     async def test_get_trace_logs_nonexistent_trace(self):
@@ -265,11 +268,9 @@ class TestGetTraceLogs:
         mock_request = MagicMock()
         mock_orm = MagicMock()
 
-        with patch('agentops.api.routes.v4.logs.TraceModel') as mock_trace_model:
-            # Mock empty trace (no spans)
-            mock_trace = MagicMock()
-            mock_trace.spans = []  # Empty spans indicate no trace
-            mock_trace_model.select = AsyncMock(return_value=mock_trace)
+        with patch('agentops.api.routes.v4.logs.TraceIdIndexModel') as mock_trace_index:
+            # Trace is not in the index
+            mock_trace_index.get_project_id = AsyncMock(return_value=None)
 
             with pytest.raises(HTTPException) as exc_info:
                 await get_trace_logs(request=mock_request, orm=mock_orm, trace_id=trace_id)
@@ -287,19 +288,13 @@ class TestGetTraceLogs:
         mock_orm = MagicMock()
 
         with (
-            patch('agentops.api.routes.v4.logs.TraceModel') as mock_trace_model,
-            patch('agentops.api.routes.v4.logs.ProjectModel') as mock_project_model,
+            patch('agentops.api.routes.v4.logs.TraceIdIndexModel') as mock_trace_index,
+            patch('agentops.api.routes.v4.logs.get_project_access') as mock_get_project_access,
         ):
-            # Setup trace mock
-            mock_trace = MagicMock()
-            mock_trace.spans = ["span1"]  # Non-empty spans
-            mock_trace.project_id = "project-123"
-            mock_trace_model.select = AsyncMock(return_value=mock_trace)
+            mock_trace_index.get_project_id = AsyncMock(return_value="project-123")
 
-            # Setup project mock - user is not a member
-            mock_project = MagicMock()
-            mock_project.org.is_user_member.return_value = False
-            mock_project_model.get_by_id.return_value = mock_project
+            # Setup project access mock - user is not a member
+            mock_get_project_access.return_value = None
 
             with pytest.raises(HTTPException) as exc_info:
                 await get_trace_logs(request=mock_request, orm=mock_orm, trace_id=trace_id)
@@ -320,22 +315,107 @@ class TestGetTraceLogs:
         mock_orm = MagicMock()
 
         with (
-            patch('agentops.api.routes.v4.logs.TraceModel') as mock_trace_model,
-            patch('agentops.api.routes.v4.logs.ProjectModel') as mock_project_model,
+            patch('agentops.api.routes.v4.logs.TraceIdIndexModel') as mock_trace_index,
+            patch('agentops.api.routes.v4.logs.get_project_access') as mock_get_project_access,
             patch('agentops.api.routes.v4.logs.get_s3_client', return_value=mock_s3_client),
         ):
             # Setup valid trace and project
-            mock_trace = MagicMock()
-            mock_trace.spans = ["span1"]
-            mock_trace.project_id = "project-123"
-            mock_trace_model.select = AsyncMock(return_value=mock_trace)
+            mock_trace_index.get_project_id = AsyncMock(return_value="project-123")
 
-            mock_project = MagicMock()
-            mock_project.org.is_user_member.return_value = True
-            mock_project_model.get_by_id.return_value = mock_project
+            mock_get_project_access.return_value = MagicMock()
 
             with pytest.raises(HTTPException) as exc_info:
                 await get_trace_logs(request=mock_request, orm=mock_orm, trace_id=trace_id)
 
             assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
-            assert f"No logs found for trace ID: {trace_id}" in exc_info.value.detail
\ No newline at end of file
+            assert f"No logs found for trace ID: {trace_id}" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_get_trace_logs_pages_by_byte_offset(self, mock_s3_client):
+        """Test that a page ending mid-file is cut at the last full line and points at the next page"""
+        trace_id = "paged-trace"
+        log_content = b"line one\nline two\nline three\n"
+
+        def get_object(Bucket, Key, Range):
+            start, end = (int(value) for value in Range.removeprefix("bytes=").split("-"))
+            chunk = log_content[start : end + 1]
+            body = MagicMock()
+            body.read.return_value = chunk
+            return {
+                'Body': body,
+                'ContentRange': f"bytes {start}-{start + len(chunk) - 1}/{len(log_content)}",
+            }
+
+        mock_s3_client.get_object.side_effect = get_object
+
+        mock_request = MagicMock()
+        mock_request.state.session.user_id = "user-123"
+
+        with (
+            patch('agentops.api.routes.v4.logs.TraceIdIndexModel') as mock_trace_index,
+            patch('agentops.api.routes.v4.logs.get_project_access') as mock_get_project_access,
+            patch('agentops.api.routes.v4.logs.get_s3_client', return_value=mock_s3_client),
+        ):
+            mock_trace_index.get_project_id = AsyncMock(return_value="project-123")
+            mock_get_project_access.return_value = MagicMock(is_freeplan=False)
+
+            response = await get_trace_logs(
+                request=mock_request,
+                orm=MagicMock(),
+                trace_id=trace_id,
+                limit=12,
+            )
+            first_page = json.loads(response.body.decode())
+            assert first_page['content'] == "line one\n"
+            assert first_page['next_offset'] == len("line one\n")
+            assert first_page['size'] == len(log_content)
+
+            response = await get_trace_logs(
+                request=mock_request,
+                orm=MagicMock(),
+                trace_id=trace_id,
+                offset=first_page['next_offset'],
+                limit=64,
+            )
+            last_page = json.loads(response.body.decode())
+            assert last_page['content'] == "line two\nline three\n"
+            assert last_page['next_offset'] is None
+
+    @pytest.mark.asyncio
+    async def test_get_trace_logs_freeplan_first_page_only(self, mock_s3_client):
+        """Test that free plan users always get the first page and no next page"""
+        log_content = b"line one\nline two\n"
+        mock_response = {'Body': MagicMock(), 'ContentRange': f"bytes 0-8/{len(log_content)}"}
+        mock_response['Body'].read.return_value = log_content[:9]
+        mock_s3_client.get_object.return_value = mock_response
+
+        mock_request = MagicMock()
+        mock_request.state.session.user_id = "user-123"
+
+        with (
+            patch('agentops.api.routes.v4.logs.TraceIdIndexModel') as mock_trace_index,
+            patch('agentops.api.routes.v4.logs.get_project_access') as mock_get_project_access,
+            patch('agentops.api.routes.v4.logs.get_s3_client', return_value=mock_s3_client),
+        ):
+            mock_trace_index.get_project_id = AsyncMock(return_value="project-123")
+            mock_get_project_access.return_value = MagicMock(is_freeplan=True)
+
+            response = await get_trace_logs(
+                request=mock_request,
+                orm=MagicMock(),
+                trace_id="trace",
+                offset=9,
+                limit=9,
+            )
+            response_data = json.loads(response.body.decode())
+            assert response_data['offset'] == 0
+            assert response_data['next_offset'] is None
+            assert mock_s3_client.get_object.call_args.kwargs['Range'] == "bytes=0-8"
+
+    def test_trim_partial_line(self):
+        """Test that partial pages are cut at a line or character boundary"""
+        assert trim_partial_line(b"first\nsecond") == b"first\n"
+        assert trim_partial_line(b"no newline") == b"no newline"
+        # a multi-byte character cut short is dropped
+        assert trim_partial_line("caf\u00e9".encode()[:-1]) == b"caf"
+        assert trim_partial_line("caf\u00e9".encode()) == "caf\u00e9".encode()
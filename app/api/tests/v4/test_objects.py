@@ -3,7 +3,6 @@ Tests for v4 objects API endpoints including ObjectUploadView.
 """
 
 import pytest
-from io import BytesIO
 from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import Request
 
@@ -28,7 +27,7 @@ def mock_jwt_payload():
 def mock_s3_client():
     """Mock S3 client for testing"""
     client = MagicMock()
-    client.upload_fileobj = MagicMock()
+    client.put_object = MagicMock()
     return client
 
 
@@ -91,10 +90,10 @@ class TestObjectUploadView:
             assert f"/{SUPABASE_S3_BUCKET}/test-project-123/" in response.url
 
             # Verify S3 upload was called
-            mock_s3_client.upload_fileobj.assert_called_once()
-            args = mock_s3_client.upload_fileobj.call_args[0]
-            assert isinstance(args[0], BytesIO)
-            assert args[1] == SUPABASE_S3_BUCKET
+            mock_s3_client.put_object.assert_called_once()
+            kwargs = mock_s3_client.put_object.call_args.kwargs
+            assert kwargs['Body'] == test_content
+            assert kwargs['Bucket'] == SUPABASE_S3_BUCKET
 
     def test_filename_generation_uniqueness(self, mock_jwt_payload, mock_request):
         """Test that filename generation includes project ID and UUID"""
@@ -148,6 +147,4 @@ class TestObjectUploadView:
             assert response.size == sum(len(chunk) for chunk in chunks)
 
             # Verify the complete content was uploaded
-            uploaded_content = mock_s3_client.upload_fileobj.call_args[0][0]
-            uploaded_content.seek(0)
-            assert uploaded_content.read() == b''.join(chunks)
\ No newline at end of file
+            assert mock_s3_client.put_object.call_args.kwargs['Body'] == b''.join(chunks)
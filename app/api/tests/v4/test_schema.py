@@ -15,11 +15,13 @@ EXPECTED_TABLES = [
     "otel_traces_0403251619",
     "otel_traces_legacy",
     "otel_traces_trace_id_ts",
+    "otel_traces_trace_id_idx",
     "otel_traces_with_project",
     "otel_traces_with_supabase_project_id",
     "otel_raw_traces_trace_id_ts_mv",
     "otel_traces_project_idx",
     "otel_traces_trace_id_ts_mv",
+    "otel_traces_trace_id_idx_mv",
 ]
 
 
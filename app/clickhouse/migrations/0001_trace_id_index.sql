@@ -0,0 +1,22 @@
+-- Trace id lookup index for otel_traces.
+--
+-- otel_traces is ordered by (project_id, Timestamp), so a lookup by TraceId alone
+-- has to consult every partition of the table. This table stores the project and
+-- the first/last span timestamp of every trace, ordered by TraceId, which lets the
+-- model layer resolve a trace's bounds with a single granule read and then scan
+-- only the matching (project_id, Timestamp) range.
+--
+-- Unlike otel_traces_trace_id_ts it has no TTL and carries the project id.
+
+
+-- Table: otel_traces_trace_id_idx
+CREATE TABLE IF NOT EXISTS otel_2.otel_traces_trace_id_idx (`TraceId` String CODEC(ZSTD(1)), `project_id` SimpleAggregateFunction(any, String) CODEC(ZSTD(1)), `Start` SimpleAggregateFunction(min, DateTime64(9)) CODEC(Delta(8), ZSTD(1)), `End` SimpleAggregateFunction(max, DateTime64(9)) CODEC(Delta(8), ZSTD(1))) ENGINE = AggregatingMergeTree() ORDER BY TraceId SETTINGS index_granularity = 1024;
+
+
+-- Table: otel_traces_trace_id_idx_mv
+CREATE MATERIALIZED VIEW IF NOT EXISTS otel_2.otel_traces_trace_id_idx_mv TO otel_2.otel_traces_trace_id_idx (`TraceId` String, `project_id` String, `Start` DateTime64(9), `End` DateTime64(9)) AS SELECT TraceId, any(ResourceAttributes['agentops.project.id']) AS project_id, min(Timestamp) AS Start, max(Timestamp) AS End FROM otel_2.otel_traces WHERE TraceId != '' GROUP BY TraceId;
+
+
+-- Backfill traces written before the materialized view existed. min/max are
+-- idempotent so rows inserted concurrently by the view are merged correctly.
+INSERT INTO otel_2.otel_traces_trace_id_idx SELECT TraceId, any(project_id) AS project_id, min(Timestamp) AS Start, max(Timestamp) AS End FROM otel_2.otel_traces WHERE TraceId != '' GROUP BY TraceId;
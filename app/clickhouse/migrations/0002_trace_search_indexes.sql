@@ -0,0 +1,24 @@
+-- Skip indexes for trace list search.
+--
+-- Trace search matches a case-insensitive substring against span names and tags.
+-- Without an index every granule in the selected (project_id, Timestamp) range has
+-- to be read and scanned. An n-gram bloom filter over the lower-cased value lets
+-- ClickHouse skip granules that cannot contain the search term. The model layer
+-- emits `multiSearchAny(lowerUTF8(<column>), [...])` predicates for these columns,
+-- which must match the index expressions below exactly for the index to apply.
+--
+-- Trace ids are already covered by the `idx_trace_id` bloom filter, which the
+-- model layer uses for exact-match searches on full trace ids.
+
+
+-- Index: idx_span_name_ngram
+ALTER TABLE otel_2.otel_traces ADD INDEX IF NOT EXISTS idx_span_name_ngram lowerUTF8(SpanName) TYPE ngrambf_v1(3, 8192, 3, 0) GRANULARITY 4;
+
+
+-- Index: idx_tags_ngram
+ALTER TABLE otel_2.otel_traces ADD INDEX IF NOT EXISTS idx_tags_ngram lowerUTF8(SpanAttributes['agentops.tags']) TYPE ngrambf_v1(3, 8192, 3, 0) GRANULARITY 4;
+
+
+-- Build the indexes for parts written before they existed.
+ALTER TABLE otel_2.otel_traces MATERIALIZE INDEX idx_span_name_ngram;
+ALTER TABLE otel_2.otel_traces MATERIALIZE INDEX idx_tags_ngram;
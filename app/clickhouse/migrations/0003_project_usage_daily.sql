@@ -0,0 +1,26 @@
+-- Daily usage counters for billing.
+--
+-- Billing needs the span count and token total of every project in an org over a
+-- billing period. Computing that from otel_traces reads every span of the period.
+-- This table keeps one row per (project_id, Date) with running totals that are
+-- added up at insert time by the materialized view below. SummingMergeTree merges
+-- rows with the same key in the background, so queries must still sum() them.
+--
+-- The token expression must match `SPAN_TOKENS_SQL` in
+-- app/api/agentops/opsboard/services/billing_service.py, which counts the partial
+-- days at the edges of a billing period from raw spans.
+
+
+-- Table: project_usage_daily
+CREATE TABLE IF NOT EXISTS otel_2.project_usage_daily (`project_id` String CODEC(ZSTD(1)), `Date` Date CODEC(Delta(2), ZSTD(1)), `span_count` UInt64 CODEC(ZSTD(1)), `total_tokens` UInt64 CODEC(ZSTD(1))) ENGINE = SummingMergeTree((span_count, total_tokens)) PARTITION BY toYYYYMM(Date) ORDER BY (project_id, Date) SETTINGS index_granularity = 1024;
+
+
+-- Table: project_usage_daily_mv
+CREATE MATERIALIZED VIEW IF NOT EXISTS otel_2.project_usage_daily_mv TO otel_2.project_usage_daily (`project_id` String, `Date` Date, `span_count` UInt64, `total_tokens` UInt64) AS SELECT ResourceAttributes['agentops.project.id'] AS project_id, toDate(Timestamp) AS Date, count() AS span_count, sum(COALESCE(toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.total_tokens'], '0')), toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.prompt_tokens'], '0')) + toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.completion_tokens'], '0')) + toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.cache_read_input_tokens'], '0')) + toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.reasoning_tokens'], '0')))) AS total_tokens FROM otel_2.otel_traces GROUP BY project_id, Date;
+
+
+-- Backfill spans written before the materialized view existed. Sums are not
+-- idempotent, so only spans timestamped before the view was created are copied;
+-- run this right after creating the view. Spans inserted in between with an
+-- older timestamp (late exports) would be counted twice.
+INSERT INTO otel_2.project_usage_daily SELECT project_id, toDate(Timestamp) AS Date, count() AS span_count, sum(COALESCE(toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.total_tokens'], '0')), toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.prompt_tokens'], '0')) + toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.completion_tokens'], '0')) + toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.cache_read_input_tokens'], '0')) + toUInt64OrZero(ifNull(SpanAttributes['gen_ai.usage.reasoning_tokens'], '0')))) AS total_tokens FROM otel_2.otel_traces WHERE Timestamp < (SELECT metadata_modification_time FROM system.tables WHERE database = 'otel_2' AND name = 'project_usage_daily_mv') GROUP BY project_id, Date;
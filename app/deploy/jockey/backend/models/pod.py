@@ -19,6 +19,49 @@ PodEventPhase = Literal["ADDED", "MODIFIED", "DELETED"]
 PodStreamEvent = Generator['PodEvent', None, None]
 
 
+class PodLogFollower:
+    """
+    Iterate the log lines of a Pod as they are written.
+
+    `close()` closes the underlying HTTP response, which unblocks a read pending
+    on another thread and ends the iteration.
+    """
+
+    def __init__(self, pod: Pod, namespace: str) -> None:
+        self.pod = pod
+        self.namespace = namespace
+        self._response = None
+        self._closed = False
+
+    def __iter__(self) -> Generator[str, None, None]:
+        try:
+            self._response = self.pod.client.core.read_namespaced_pod_log(
+                name=self.pod.name,
+                namespace=self.namespace,
+                follow=True,
+                _preload_content=False,
+            )
+            if self._closed:  # closed before the response was opened
+                self.close()
+                return
+            for line in watch.watch.iter_resp_lines(self._response):
+                yield line
+        except ApiException as e:
+            logger.debug(f"Stream logs for Pod {self.pod.name} failed: {e}")
+            yield f"Error streaming logs: {e}"
+        except Exception as e:
+            if self._closed:
+                return
+            logger.debug(f"Stream logs for Pod {self.pod.name} unexpected error: {e}")
+            yield f"Unexpected error: {e}"
+
+    def close(self) -> None:
+        self._closed = True
+        if self._response is not None:
+            self._response.close()
+            self._response.release_conn()
+
+
 class PodEvent(BaseEvent):
     """Event for pod operations."""
 
@@ -188,6 +231,10 @@ class Pod(KubernetesResourceWrapper):
             logger.debug(f"Get logs for Pod {self.name} returned empty")
             return ""
 
+    def follow_logs(self, namespace: str) -> PodLogFollower:
+        """Follow logs for the Pod; unlike `stream_logs` the follower can be closed from another thread."""
+        return PodLogFollower(self, namespace)
+
     def stream_logs(self, namespace: str) -> Generator[str, None, None]:
         """Stream logs for the Pod or a specific container."""
         try:
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+
+"""
+Benchmark script for measuring the per-call overhead of the entity decorators.
+
+Each function shape (sync, async, generator, async generator) is timed
+undecorated, decorated with tracing disabled, and decorated under an unsampled
+parent span, which are the paths hot tools take when they are not being traced.
+"""
+
+CALLS = 20_000
+
+
+def _timeit(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def _shapes(decorate):
+    def sync_tool(x):
+        return x
+
+    async def async_tool(x):
+        return x
+
+    def generator_tool(x):
+        yield x
+
+    async def async_generator_tool(x):
+        yield x
+
+    sync_tool, async_tool = decorate(sync_tool), decorate(async_tool)
+    generator_tool, async_generator_tool = decorate(generator_tool), decorate(async_generator_tool)
+
+    loop = asyncio.new_event_loop()
+
+    async def consume_async_generator():
+        async for _ in async_generator_tool(1):
+            pass
+
+    return {
+        "sync": lambda: sync_tool(1),
+        "async": lambda: loop.run_until_complete(async_tool(1)),
+        "generator": lambda: list(generator_tool(1)),
+        "async generator": lambda: loop.run_until_complete(consume_async_generator()),
+    }
+
+
+def run_benchmark(calls=CALLS):
+    """
+    Run a benchmark of decorated call overhead.
+
+    Returns:
+        Dictionary of {path: {shape: nanoseconds per call}}
+    """
+    from opentelemetry import trace
+    from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+
+    from agentops.sdk.core import tracer
+    from agentops.sdk.decorators import tool
+
+    results = {"undecorated": {}, "disabled": {}}
+    for shape, fn in _shapes(lambda f: f).items():
+        results["undecorated"][shape] = _timeit(fn, calls)
+
+    if not tracer.initialized:
+        for shape, fn in _shapes(tool).items():
+            results["disabled"][shape] = _timeit(fn, calls)
+
+        import agentops
+
+        agentops.init(auto_start_session=False)
+
+    if tracer.initialized:
+        results["unsampled"] = {}
+        unsampled = NonRecordingSpan(
+            SpanContext(trace_id=0x1, span_id=0x2, is_remote=False, trace_flags=TraceFlags(TraceFlags.DEFAULT))
+        )
+        with trace.use_span(unsampled):
+            for shape, fn in _shapes(tool).items():
+                results["unsampled"][shape] = _timeit(fn, calls)
+
+    return results
+
+
+def print_results(results):
+    """
+    Print benchmark results in a formatted way.
+
+    Args:
+        results: Dictionary with timing results
+    """
+    print("\n=== BENCHMARK RESULTS ===")
+
+    for path, shapes in results.items():
+        print(f"\n{path.upper()}")
+        for shape, ns in shapes.items():
+            print(f"  {shape:<16} {ns:>10.0f}ns per call")
+
+
+if __name__ == "__main__":
+    print("Running decorator benchmark...")
+    results = run_benchmark()
+    print_results(results)
@@ -0,0 +1,103 @@
+import json
+import time
+
+
+"""
+Benchmark script for measuring the overhead of the stream wrappers.
+
+Compares consuming a Chat Completions stream directly with consuming it through
+`OpenaiStreamWrapper` under a recording span. The provider stream decodes each
+chunk from its JSON payload into a `ChatCompletionChunk` the way the OpenAI SDK
+does for server-sent events, so the overhead is relative to the work a real
+stream does per chunk before any network time is counted.
+"""
+
+CHUNKS = 10_000
+RUNS = 20
+# most the wrapper may add to consuming a stream, in percent
+OVERHEAD_BUDGET_PCT = 5.0
+
+
+def make_payloads(count):
+    """Build the JSON payloads of content chunks followed by a usage chunk."""
+    base = {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": 0, "model": "gpt-4o"}
+    payloads = []
+    for i in range(count):
+        choice = {"index": 0, "delta": {"content": f"tok{i} "}, "finish_reason": None}
+        payloads.append(json.dumps({**base, "choices": [choice]}))
+
+    usage = {"prompt_tokens": 10, "completion_tokens": count, "total_tokens": count + 10}
+    payloads.append(json.dumps({**base, "choices": [], "usage": usage}))
+    return payloads
+
+
+def provider_stream(payloads):
+    """Yield chunks decoded from `payloads` as `openai.Stream` decodes server-sent events."""
+    from openai._models import construct_type
+    from openai.types.chat import ChatCompletionChunk
+
+    for payload in payloads:
+        yield construct_type(type_=ChatCompletionChunk, value=json.loads(payload))
+
+
+def run_benchmark(chunk_count=CHUNKS, runs=RUNS):
+    """
+    Run the stream wrapper benchmark.
+
+    Returns:
+        Dictionary with the best per-chunk times in nanoseconds and the overhead in percent
+    """
+    from opentelemetry.sdk.trace import TracerProvider
+
+    from agentops.instrumentation.providers.openai.stream_wrapper import OpenaiStreamWrapper
+
+    tracer = TracerProvider().get_tracer("benchmark")
+    payloads = make_payloads(chunk_count)
+
+    def consume(stream):
+        for _ in stream:
+            pass
+
+    baseline, wrapped = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        consume(provider_stream(payloads))
+        baseline.append(time.perf_counter() - start)
+
+        span = tracer.start_span("openai.chat.completion")
+        start = time.perf_counter()
+        consume(OpenaiStreamWrapper(provider_stream(payloads), span, {}))
+        wrapped.append(time.perf_counter() - start)
+
+    baseline_ns = min(baseline) / len(payloads) * 1e9
+    wrapped_ns = min(wrapped) / len(payloads) * 1e9
+    return {
+        "chunks": len(payloads),
+        "baseline_ns": baseline_ns,
+        "wrapped_ns": wrapped_ns,
+        "overhead_ns": wrapped_ns - baseline_ns,
+        "overhead_pct": (wrapped_ns - baseline_ns) / baseline_ns * 100,
+    }
+
+
+def print_results(results):
+    """
+    Print benchmark results in a formatted way.
+
+    Args:
+        results: Dictionary with timing results
+    """
+    print("\n=== BENCHMARK RESULTS ===")
+
+    print(f"\nCHUNKS: {results['chunks']}")
+    print(f"UNWRAPPED: {results['baseline_ns']:.1f}ns per chunk")
+    print(f"WRAPPED: {results['wrapped_ns']:.1f}ns per chunk")
+    print(f"OVERHEAD: {results['overhead_ns']:.1f}ns per chunk ({results['overhead_pct']:.2f}%)")
+
+
+if __name__ == "__main__":
+    print("Running stream wrapper benchmark...")
+    results = run_benchmark()
+    print_results(results)
+    if results["overhead_pct"] > OVERHEAD_BUDGET_PCT:
+        raise SystemExit(f"Stream wrapper overhead exceeds the {OVERHEAD_BUDGET_PCT:.0f}% budget")
@@ -0,0 +1,166 @@
+import gc
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from agentops.helpers import overhead
+from agentops.helpers.overhead import (
+    COMPONENT_STREAM,
+    COMPONENT_WRAPPER,
+    create_overhead_metrics,
+    enable_overhead_profiling,
+    get_overhead_report,
+    measure_overhead,
+    profiled,
+    reset_overhead_stats,
+    timed,
+)
+from agentops.instrumentation.common.wrappers import WrapConfig, _create_wrapper
+from agentops.semconv import Meters
+
+KEY = (COMPONENT_WRAPPER, "test", "Client.call")
+
+
+@pytest.fixture
+def profiling():
+    reset_overhead_stats()
+    enable_overhead_profiling()
+    yield
+    enable_overhead_profiling(False)
+    reset_overhead_stats()
+
+
+def entry(report, key):
+    for item in report["entries"]:
+        if (item["component"], item["instrumentor"], item["method"]) == key:
+            return item
+    return None
+
+
+class TestOverheadProfiling:
+    def test_disabled_profiling_records_nothing(self):
+        reset_overhead_stats()
+
+        with measure_overhead(KEY) as timer:
+            with timer.excluded():
+                pass
+
+        report = get_overhead_report()
+        assert report["enabled"] is False
+        assert report["entries"] == []
+
+    def test_timed_returns_function_unchanged_when_disabled(self):
+        def handler():
+            pass
+
+        assert timed(KEY, handler) is handler
+
+    def test_excluded_time_is_not_counted(self, profiling):
+        with measure_overhead(KEY) as timer:
+            with timer.excluded():
+                time.sleep(0.05)
+
+        item = entry(get_overhead_report(), KEY)
+        assert item["calls"] == 1
+        assert item["wall_time"] < 0.04
+
+    def test_profiled_and_timed_record_calls(self, profiling):
+        @profiled(COMPONENT_STREAM, "test", "finalize")
+        def finalize():
+            return "done"
+
+        handler = timed((COMPONENT_STREAM, "test", "chunk"), lambda chunk: chunk)
+
+        assert finalize() == "done"
+        for i in range(3):
+            handler(i)
+
+        report = get_overhead_report()
+        assert entry(report, (COMPONENT_STREAM, "test", "finalize"))["calls"] == 1
+        assert entry(report, (COMPONENT_STREAM, "test", "chunk"))["calls"] == 3
+        assert report["components"][COMPONENT_STREAM]["calls"] == 4
+
+    def test_totals_are_merged_across_threads(self, profiling):
+        def work():
+            for _ in range(10):
+                with measure_overhead(KEY):
+                    pass
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert entry(get_overhead_report(), KEY)["calls"] == 40
+
+    def test_tables_of_ended_threads_are_dropped(self, profiling):
+        with measure_overhead(KEY):
+            pass
+        tables = len(overhead._tables)
+
+        def work():
+            with measure_overhead(KEY):
+                pass
+
+        for _ in range(5):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert len(overhead._tables) == tables
+        assert entry(get_overhead_report(), KEY)["calls"] == 6
+
+    def test_wrapper_overhead_excludes_wrapped_call(self, profiling):
+        tracer = MagicMock()
+        config = WrapConfig(
+            trace_name="test",
+            package="test_package",
+            class_name="Client",
+            method_name="call",
+            handler=lambda args=None, kwargs=None, return_value=None: {},
+        )
+        wrapper = _create_wrapper(config, tracer)
+
+        def slow_call():
+            time.sleep(0.05)
+            return "result"
+
+        assert wrapper(slow_call, None, (), {}) == "result"
+
+        item = entry(get_overhead_report(), (COMPONENT_WRAPPER, "test_package", "Client.call"))
+        assert item["calls"] == 1
+        assert item["wall_time"] < 0.04
+
+    def test_metrics_are_reported_through_meter(self, profiling):
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+        create_overhead_metrics(meter)
+
+        with measure_overhead(KEY):
+            pass
+
+        metrics = {
+            metric.name: metric
+            for resource_metrics in reader.get_metrics_data().resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+        (point,) = metrics[Meters.AGENTOPS_OVERHEAD_CALLS].data.data_points
+        assert point.value == 1
+        assert point.attributes == {"component": "wrapper", "instrumentor": "test", "method": "Client.call"}
+        assert Meters.AGENTOPS_OVERHEAD_WALL_TIME in metrics
+        assert Meters.AGENTOPS_OVERHEAD_CPU_TIME in metrics
+
+    def test_reset_clears_all_threads(self, profiling):
+        with measure_overhead(KEY):
+            pass
+
+        reset_overhead_stats()
+
+        assert overhead._snapshot() == {}
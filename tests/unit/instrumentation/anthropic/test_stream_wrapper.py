@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock
 from opentelemetry.trace import SpanKind
 
+from agentops.helpers.overhead import enable_overhead_profiling, get_overhead_report, reset_overhead_stats
 from agentops.instrumentation.providers.anthropic.stream_wrapper import (
     messages_stream_wrapper,
     messages_stream_async_wrapper,
@@ -123,3 +124,24 @@ def test_stream_final_message_attributes(mock_tracer, mock_stream_manager):
     span.set_attribute.assert_any_call(SpanAttributes.LLM_USAGE_PROMPT_TOKENS, 10)
     span.set_attribute.assert_any_call(SpanAttributes.LLM_USAGE_COMPLETION_TOKENS, 20)
     span.set_attribute.assert_any_call(SpanAttributes.LLM_USAGE_TOTAL_TOKENS, 30)
+
+
+def test_stream_overhead_is_profiled(mock_tracer, mock_stream_manager):
+    """Test that text chunks and the final message are timed while overhead profiling is enabled."""
+    reset_overhead_stats()
+    enable_overhead_profiling()
+    try:
+        final_message = MagicMock()
+        final_message.content = [MagicMock(text="Final response")]
+        mock_stream_manager._MessageStreamManager__stream._MessageStream__final_message_snapshot = final_message
+
+        result = messages_stream_wrapper(mock_tracer)(MagicMock(return_value=mock_stream_manager), None, [], {})
+        with result as stream:
+            list(stream.text_stream)
+
+        calls = {(entry["instrumentor"], entry["method"]): entry["calls"] for entry in get_overhead_report()["entries"]}
+        assert calls[("anthropic", "messages.stream.text")] == 5
+        assert calls[("anthropic", "messages.stream.finalize")] == 1
+    finally:
+        enable_overhead_profiling(False)
+        reset_overhead_stats()
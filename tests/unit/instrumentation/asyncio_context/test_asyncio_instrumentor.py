@@ -0,0 +1,97 @@
+import asyncio
+import contextvars
+import functools
+from asyncio import base_events
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry import trace
+
+from agentops.instrumentation.utilities.asyncio_context import AsyncioInstrumentor
+from agentops.instrumentation.utilities.asyncio_context.instrumentation import (
+    _context_propagating_run_in_executor,
+    _runs_in_context,
+)
+
+
+def blocking_work(name):
+    with trace.get_tracer("worker").start_as_current_span(name):
+        return name
+
+
+@pytest.fixture
+def instrumented(instrumentation):
+    instrumentor = AsyncioInstrumentor()
+    instrumentor.instrument()
+    yield instrumentation
+    instrumentor.uninstrument()
+
+
+def spans_by_name(instrumentation):
+    return {span.name: span for span in instrumentation.memory_exporter.get_finished_spans()}
+
+
+class TestAsyncioInstrumentor:
+    def test_run_in_executor_runs_in_callers_context(self, instrumented):
+        executor = ThreadPoolExecutor(max_workers=1)
+        # Run something first so the worker thread exists before the span is started
+        executor.submit(lambda: None).result()
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            with trace.get_tracer("test").start_as_current_span("parent") as parent:
+                await loop.run_in_executor(executor, blocking_work, "custom")
+                await loop.run_in_executor(None, blocking_work, "default")
+            return parent
+
+        parent = asyncio.run(main())
+        executor.shutdown()
+
+        spans = spans_by_name(instrumented)
+        assert spans["custom"].parent.span_id == parent.get_span_context().span_id
+        assert spans["default"].parent.span_id == parent.get_span_context().span_id
+
+    def test_functions_bound_to_a_context_are_not_wrapped_again(self):
+        # asyncio.to_thread passes functools.partial(context.run, func)
+        bound = functools.partial(contextvars.copy_context().run, blocking_work)
+
+        assert _runs_in_context(bound)
+        assert not _runs_in_context(blocking_work)
+        assert not _runs_in_context(functools.partial(blocking_work, "name"))
+
+    def test_context_is_only_copied_under_a_span(self, instrumentation):
+        original = MagicMock()
+        wrapped = _context_propagating_run_in_executor(original)
+
+        wrapped(None, None, blocking_work, "untraced")
+        assert original.call_args.args[2] is blocking_work
+
+        with trace.get_tracer("test").start_as_current_span("parent"):
+            wrapped(None, None, blocking_work, "traced")
+        assert _runs_in_context(original.call_args.args[2])
+
+    def test_gathered_tasks_nest_under_the_creating_span(self, instrumented):
+        async def task(name):
+            await asyncio.sleep(0)
+            blocking_work(name)
+
+        async def main():
+            with trace.get_tracer("test").start_as_current_span("parent") as parent:
+                await asyncio.gather(task("a"), task("b"))
+            return parent
+
+        parent = asyncio.run(main())
+
+        spans = spans_by_name(instrumented)
+        assert spans["a"].parent.span_id == parent.get_span_context().span_id
+        assert spans["b"].parent.span_id == parent.get_span_context().span_id
+
+    def test_uninstrument_restores_run_in_executor(self, instrumentation):
+        original = base_events.BaseEventLoop.run_in_executor
+        instrumentor = AsyncioInstrumentor()
+        instrumentor.instrument()
+        assert base_events.BaseEventLoop.run_in_executor is not original
+
+        instrumentor.uninstrument()
+        assert base_events.BaseEventLoop.run_in_executor is original
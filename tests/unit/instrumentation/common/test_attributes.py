@@ -11,6 +11,8 @@ from unittest.mock import patch
 
 from agentops.instrumentation.common.attributes import (
     _extract_attributes_from_mapping,
+    _extract_attributes_from_mapping_with_index,
+    _extract_attributes_from_sequence_with_index,
     get_common_attributes,
     get_base_trace_attributes,
     get_base_span_attributes,
@@ -18,6 +20,7 @@ from agentops.instrumentation.common.attributes import (
 from agentops.semconv import (
     CoreAttributes,
     InstrumentationAttributes,
+    MessageAttributes,
     WorkflowAttributes,
 )
 
@@ -113,6 +116,50 @@ class TestAttributeExtraction:
         assert "target_attr8" not in attributes  # Missing key should be skipped
 
 
+class TestIndexedAttributeExtraction:
+    """Tests for indexed attribute extraction utilities."""
+
+    mapping = {
+        MessageAttributes.TOOL_CALL_ID: "id",
+        MessageAttributes.TOOL_CALL_NAME: "name",
+    }
+    nested_mapping = {
+        MessageAttributes.COMPLETION_TOOL_CALL_ID: "id",
+        MessageAttributes.COMPLETION_TOOL_CALL_NAME: "name",
+    }
+
+    def test_extract_attributes_with_index(self):
+        """Test that indexed keys are formatted with i and j."""
+        attributes = _extract_attributes_from_mapping_with_index(
+            {"id": "call_1", "name": None}, self.nested_mapping, i=2, j=3
+        )
+
+        assert attributes == {"gen_ai.completion.2.tool_calls.3.id": "call_1"}
+
+    def test_extract_attributes_from_sequence_indexed_by_i(self):
+        """Test that a sequence matches extracting each item individually."""
+        items = [{"id": "call_1", "name": "search"}, {"id": "call_2"}]
+
+        attributes = _extract_attributes_from_sequence_with_index(items, self.mapping)
+
+        expected = {}
+        for i, item in enumerate(items):
+            expected.update(_extract_attributes_from_mapping_with_index(item, self.mapping, i=i))
+        assert attributes == expected
+        assert attributes["gen_ai.request.tools.0.name"] == "search"
+
+    def test_extract_attributes_from_sequence_indexed_by_j(self):
+        """Test that passing i indexes the sequence by j."""
+        items = [{"id": "call_1"}, {"id": "call_2"}]
+
+        attributes = _extract_attributes_from_sequence_with_index(items, self.nested_mapping, i=1)
+
+        assert attributes == {
+            "gen_ai.completion.1.tool_calls.0.id": "call_1",
+            "gen_ai.completion.1.tool_calls.1.id": "call_2",
+        }
+
+
 class TestCommonAttributes:
     """Tests for common attribute getters."""
 
@@ -0,0 +1,127 @@
+import pytest
+from opentelemetry.sdk.trace import SpanLimits, TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from agentops.instrumentation.common.deferred import (
+    DeferredAttributeExporter,
+    defer_attributes,
+    enable_deferred_extraction,
+)
+
+
+def message_handler(args=None, kwargs=None, return_value=None):
+    attributes = {"llm.system": "test"}
+    if kwargs:
+        attributes["llm.request.model"] = kwargs["model"]
+        attributes["llm.prompts.count"] = len(kwargs["messages"])
+    if return_value is not None:
+        attributes["llm.request.model"] = "overwritten"
+        attributes["llm.response.model"] = return_value
+    return attributes
+
+
+@pytest.fixture
+def deferred_tracer():
+    memory_exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(DeferredAttributeExporter(memory_exporter)))
+    enable_deferred_extraction()
+    yield provider.get_tracer("test"), memory_exporter
+    enable_deferred_extraction(False)
+
+
+class TestDeferredAttributes:
+    def test_disabled_extraction_is_not_deferred(self):
+        span = TracerProvider().get_tracer("test").start_span("call")
+
+        assert defer_attributes(span, message_handler, kwargs={"model": "gpt-4o", "messages": []}) is False
+
+    def test_attributes_are_resolved_on_export(self, deferred_tracer):
+        tracer, memory_exporter = deferred_tracer
+        span = tracer.start_span("call")
+
+        assert defer_attributes(span, message_handler, kwargs={"model": "gpt-4o", "messages": ["hi"]})
+        assert "llm.request.model" not in span.attributes
+        span.end()
+
+        (exported,) = memory_exporter.get_finished_spans()
+        assert exported.attributes["llm.request.model"] == "gpt-4o"
+        assert exported.attributes["llm.prompts.count"] == 1
+
+    def test_kwargs_are_snapshotted(self, deferred_tracer):
+        tracer, memory_exporter = deferred_tracer
+        messages = ["hi"]
+        span = tracer.start_span("call")
+
+        defer_attributes(span, message_handler, kwargs={"model": "gpt-4o", "messages": messages})
+        messages.append("the agent loop keeps going")
+        span.end()
+
+        assert memory_exporter.get_finished_spans()[0].attributes["llm.prompts.count"] == 1
+
+    def test_overwrite_false_keeps_earlier_attributes(self, deferred_tracer):
+        tracer, memory_exporter = deferred_tracer
+        span = tracer.start_span("call")
+
+        defer_attributes(span, message_handler, kwargs={"model": "gpt-4o", "messages": []})
+        defer_attributes(span, message_handler, return_value="gpt-4o-2024", overwrite=False)
+        span.end()
+
+        attributes = memory_exporter.get_finished_spans()[0].attributes
+        assert attributes["llm.request.model"] == "gpt-4o"
+        assert attributes["llm.response.model"] == "gpt-4o-2024"
+
+    def test_span_attributes_take_precedence(self, deferred_tracer):
+        tracer, memory_exporter = deferred_tracer
+        span = tracer.start_span("call")
+
+        defer_attributes(span, message_handler, kwargs={"model": "gpt-4o", "messages": []})
+        span.set_attribute("llm.system", "set-on-span")
+        span.end()
+
+        assert memory_exporter.get_finished_spans()[0].attributes["llm.system"] == "set-on-span"
+
+    def test_handler_errors_do_not_drop_the_span(self, deferred_tracer):
+        tracer, memory_exporter = deferred_tracer
+        span = tracer.start_span("call")
+
+        defer_attributes(span, message_handler, kwargs={"model": "gpt-4o"})  # no messages -> KeyError
+        span.set_attribute("kept", True)
+        span.end()
+
+        (exported,) = memory_exporter.get_finished_spans()
+        assert exported.attributes["kept"] is True
+
+    def test_attributes_are_bounded_like_eager_ones(self):
+        def raw_handler(args=None, kwargs=None, return_value=None):
+            return {"none": None, "mapping": {"a": 1}, "tags": ["a", "b"], "content": "x" * 20}
+
+        limits = SpanLimits(max_span_attributes=3, max_span_attribute_length=5)
+        tracer_provider = TracerProvider(span_limits=limits)
+        tracer = tracer_provider.get_tracer("test")
+
+        eager_exporter = InMemorySpanExporter()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(eager_exporter))
+        span = tracer.start_span("call")
+        span.set_attributes(raw_handler())
+        span.end()
+        (eager,) = eager_exporter.get_finished_spans()
+
+        deferred_exporter = InMemorySpanExporter()
+        deferred_provider = TracerProvider(span_limits=limits)
+        deferred_provider.add_span_processor(
+            SimpleSpanProcessor(DeferredAttributeExporter(deferred_exporter, span_limits=limits))
+        )
+        enable_deferred_extraction()
+        try:
+            span = deferred_provider.get_tracer("test").start_span("call")
+            defer_attributes(span, raw_handler)
+            span.end()
+        finally:
+            enable_deferred_extraction(False)
+        (deferred,) = deferred_exporter.get_finished_spans()
+
+        assert dict(deferred.attributes) == dict(eager.attributes)
+        assert deferred.attributes["content"] == "xxxxx"
+        assert deferred.dropped_attributes == eager.dropped_attributes == 1
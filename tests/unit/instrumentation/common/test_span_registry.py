@@ -0,0 +1,150 @@
+from unittest.mock import Mock, patch
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from agentops.instrumentation.agentic.agno.instrumentor import StreamingContextManager
+from agentops.instrumentation.agentic.openai_agents.exporter import OpenAIAgentsExporter
+from agentops.instrumentation.common import span_registry
+from agentops.instrumentation.common.span_registry import SpanRegistry, end_evicted_span
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSpanRegistry:
+    def test_set_get_pop(self):
+        registry = SpanRegistry("test")
+
+        registry.set("a", 1)
+        registry["b"] = 2
+
+        assert registry.get("a") == 1
+        assert registry["b"] == 2
+        assert "a" in registry
+        assert len(registry) == 2
+        assert registry.pop("a") == 1
+        assert registry.pop("a") is None
+        assert "a" not in registry
+
+    def test_expired_entries_are_evicted(self):
+        clock = FakeClock()
+        on_evict = Mock()
+        registry = SpanRegistry("test", ttl=10, on_evict=on_evict)
+
+        with patch.object(span_registry.time, "monotonic", clock):
+            registry.set("a", "span-a")
+            clock.now += 5
+            registry.set("b", "span-b")
+            clock.now += 6
+
+            assert registry.get("a") is None
+            assert registry.get("b") == "span-b"
+
+        on_evict.assert_called_once_with("a", "span-a")
+        assert registry.stats() == {"live_entries": 1, "expired": 1, "overflowed": 0}
+
+    def test_writes_evict_expired_entries_of_their_shard(self):
+        clock = FakeClock()
+        registry = SpanRegistry("test", ttl=10, shards=1)
+
+        with patch.object(span_registry.time, "monotonic", clock):
+            for i in range(100):
+                registry.set(i, i)
+            clock.now += 11
+            registry.set("new", 1)
+
+        assert len(registry) == 1
+
+    def test_oldest_entries_overflow(self):
+        on_evict = Mock()
+        registry = SpanRegistry("test", max_size=2, shards=1, on_evict=on_evict)
+
+        registry.set("a", 1)
+        registry.set("b", 2)
+        registry.set("a", 3)  # refreshes "a", so "b" is now the oldest
+        registry.set("c", 4)
+
+        on_evict.assert_called_once_with("b", 2)
+        assert registry.get("a") == 3
+        assert registry.get("c") == 4
+        assert registry.stats()["overflowed"] == 1
+
+    def test_setdefault_builds_value_once(self):
+        registry = SpanRegistry("test")
+
+        first = registry.setdefault("a", list)
+        first.append(1)
+
+        assert registry.setdefault("a", list) == [1]
+
+    def test_purge_and_drain(self):
+        clock = FakeClock()
+        registry = SpanRegistry("test", ttl=10)
+
+        with patch.object(span_registry.time, "monotonic", clock):
+            registry.set("a", 1)
+            clock.now += 5
+            registry.set("b", 2)
+            clock.now += 6
+
+            assert registry.purge() == 1
+
+        assert registry.drain() == [("b", 2)]
+        assert len(registry) == 0
+
+    def test_eviction_callback_errors_are_swallowed(self):
+        registry = SpanRegistry("test", max_size=1, shards=1, on_evict=Mock(side_effect=RuntimeError))
+
+        registry.set("a", 1)
+        registry.set("b", 2)
+
+        assert registry.get("b") == 2
+
+
+class TestSpanEndingRegistries:
+    def test_long_running_spans_are_not_ended(self):
+        clock = FakeClock()
+        tracer = TracerProvider().get_tracer("test")
+        exporter = OpenAIAgentsExporter()
+        contexts = StreamingContextManager()
+
+        with patch.object(span_registry.time, "monotonic", clock):
+            run_span = tracer.start_span("agent.run")
+            stream_span = tracer.start_span("agent.stream")
+            exporter._span_map.set("run", run_span)
+            contexts.store_context("stream", stream_span.get_span_context(), stream_span)
+
+            clock.now += 7 * 24 * 3600
+            exporter._span_map.set("other", None)
+            exporter._span_map.purge()
+            contexts._contexts.purge()
+
+            assert exporter._span_map.get("run") is run_span
+            assert contexts.get_context("stream")[1] is stream_span
+
+        assert run_span.is_recording()
+        assert stream_span.is_recording()
+
+
+class TestEndEvictedSpan:
+    def test_ends_recording_span(self):
+        span = Mock()
+        span.is_recording.return_value = True
+
+        end_evicted_span("key", span)
+
+        span.set_attribute.assert_called_once_with("agentops.span_registry.evicted", True)
+        span.end.assert_called_once()
+
+    def test_skips_ended_span(self):
+        span = Mock()
+        span.is_recording.return_value = False
+
+        end_evicted_span("key", span)
+
+        span.end.assert_not_called()
@@ -8,8 +8,12 @@ from agentops.instrumentation.common.streaming import (
     AsyncStreamWrapper,
     create_stream_wrapper_factory,
     StreamingResponseHandler,
+    StreamAccumulator,
+    ToolCallBuffer,
+    TextChunkAdapter,
 )
 from agentops.instrumentation.common.token_counting import TokenUsage
+from agentops.semconv import SpanAttributes
 
 
 class TestBaseStreamWrapper:
@@ -579,3 +583,70 @@ class TestStreamingIntegration:
         assert wrapper.chunks_received == 3
         mock_span.set_attribute.assert_any_call("streaming.final_content", "Hello World")
         mock_span.set_attribute.assert_any_call("streaming.chunk_count", 3)
+
+
+class TestStreamAccumulator:
+    """Test the StreamAccumulator and its helpers."""
+
+    def test_slots(self):
+        """Accumulators and tool call buffers don't carry an instance dict."""
+        assert not hasattr(StreamAccumulator(Mock()), "__dict__")
+        assert not hasattr(ToolCallBuffer(), "__dict__")
+
+    def test_content_is_joined(self):
+        """Test content fragments are joined on read."""
+        accumulator = StreamAccumulator(Mock())
+        for fragment in ("Hello", " ", "World"):
+            accumulator.add_content(fragment)
+
+        assert accumulator.content == "Hello World"
+
+    def test_tool_call_buffers(self):
+        """Test tool call fragments are grouped by index."""
+        accumulator = StreamAccumulator(Mock())
+        accumulator.tool_call(0).name = "search"
+        accumulator.tool_call(0).append_arguments('{"q": ')
+        accumulator.tool_call(0).append_arguments('"docs"}')
+        accumulator.tool_call(1).append_arguments("{}")
+
+        assert len(accumulator.tool_calls) == 2
+        assert accumulator.tool_call(0).to_dict() == {
+            "id": "",
+            "type": "function",
+            "function": {"name": "search", "arguments": '{"q": "docs"}'},
+        }
+
+    def test_mark_first_token(self):
+        """Test the time to first token is recorded on the span."""
+        mock_span = Mock()
+        accumulator = StreamAccumulator(mock_span)
+        assert accumulator.generation_time is None
+
+        accumulator.mark_first_token("first_token_received")
+
+        assert accumulator.first_token_time is not None
+        assert accumulator.generation_time >= 0
+        attribute, _ = mock_span.set_attribute.call_args.args
+        assert attribute == SpanAttributes.LLM_STREAMING_TIME_TO_FIRST_TOKEN
+        assert mock_span.add_event.call_args.args[0] == "first_token_received"
+
+
+class TestTextChunkAdapter:
+    """Test the TextChunkAdapter class."""
+
+    def test_process(self):
+        """Test text and usage are read from chunks."""
+        mock_span = Mock()
+        accumulator = StreamAccumulator(mock_span)
+        adapter = TextChunkAdapter(text_attr="text", usage_attr="usage_metadata")
+        usage = SimpleNamespace(prompt_token_count=3)
+
+        adapter.process(accumulator, SimpleNamespace(text="Hello", usage_metadata=None))
+        adapter.process(accumulator, SimpleNamespace(text=None, usage_metadata=None))
+        adapter.process(accumulator, SimpleNamespace(text=" World", usage_metadata=usage))
+
+        assert accumulator.chunk_count == 3
+        assert accumulator.content == "Hello World"
+        assert accumulator.usage is usage
+        # time to first token is only recorded once
+        assert mock_span.set_attribute.call_count == 1
@@ -0,0 +1,96 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from opentelemetry import trace
+
+from agentops.instrumentation import instrument_process_pools, uninstrument_all
+from agentops.instrumentation.utilities.concurrent_futures import ConcurrentFuturesInstrumentor
+from agentops.instrumentation.utilities.concurrent_futures import process
+from agentops.instrumentation.utilities.concurrent_futures.process import deserialize_span, serialize_span
+
+
+def traced_work(value):
+    with trace.get_tracer("worker").start_as_current_span(f"work.{value}") as span:
+        span.set_attribute("work.value", value)
+        span.add_event("computed", {"result": value * 2})
+    return value * 2
+
+
+@pytest.fixture
+def instrumented(instrumentation):
+    instrumentor = ConcurrentFuturesInstrumentor()
+    instrumentor.instrument()
+    yield instrumentation
+    instrumentor.uninstrument()
+    for collector in list(process._collectors.values()):
+        collector.shutdown()
+
+
+def finished_spans(instrumentation):
+    instrumentation.tracer_provider.force_flush()
+    return {span.name: span for span in instrumentation.memory_exporter.get_finished_spans()}
+
+
+class TestProcessPropagation:
+    def test_process_pool_executor_spans_join_the_submitting_trace(self, instrumented):
+        # Forked workers inherit the parent's provider, whose processors must be replaced
+        context = multiprocessing.get_context("fork")
+        with trace.get_tracer("test").start_as_current_span("parent") as parent:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                assert executor.submit(traced_work, 1).result() == 2
+
+        spans = finished_spans(instrumented)
+        work = spans["work.1"]
+        assert work.context.trace_id == parent.get_span_context().trace_id
+        assert work.parent.span_id == parent.get_span_context().span_id
+        assert work.attributes["work.value"] == 1
+        assert work.resource == instrumented.tracer_provider.resource
+
+    def test_multiprocessing_pool_map_spans_join_the_submitting_trace(self, instrumented):
+        with trace.get_tracer("test").start_as_current_span("parent") as parent:
+            with multiprocessing.get_context("fork").Pool(2) as pool:
+                assert pool.map(traced_work, [1, 2, 3]) == [2, 4, 6]
+
+        spans = finished_spans(instrumented)
+        for value in (1, 2, 3):
+            assert spans[f"work.{value}"].parent.span_id == parent.get_span_context().span_id
+
+    def test_thread_pool_is_not_given_a_forwarding_initializer(self, instrumented):
+        with trace.get_tracer("test").start_as_current_span("parent") as parent:
+            with multiprocessing.pool.ThreadPool(1) as pool:
+                assert pool.apply(traced_work, (1,)) == 2
+
+        spans = finished_spans(instrumented)
+        assert spans["work.1"].parent.span_id == parent.get_span_context().span_id
+        assert process._worker_processor is None
+
+    def test_process_pools_are_instrumented_without_a_dependent_library(self, instrumentation):
+        # What agentops.init() does unless propagate_to_processes is off
+        instrument_process_pools()
+        try:
+            with trace.get_tracer("test").start_as_current_span("parent") as parent:
+                with multiprocessing.get_context("fork").Pool(1) as pool:
+                    assert pool.apply(traced_work, (1,)) == 2
+        finally:
+            uninstrument_all()
+            for collector in list(process._collectors.values()):
+                collector.shutdown()
+
+        spans = finished_spans(instrumentation)
+        assert spans["work.1"].parent.span_id == parent.get_span_context().span_id
+
+    def test_span_round_trips_through_serialization(self, instrumentation):
+        with trace.get_tracer("test").start_as_current_span("parent"):
+            traced_work(5)
+        original = finished_spans(instrumentation)["work.5"]
+
+        restored = deserialize_span(serialize_span(original), original.resource)
+
+        assert restored.context == original.context
+        assert restored.parent == original.parent
+        assert dict(restored.attributes) == dict(original.attributes)
+        assert restored.events[0].name == "computed"
+        assert dict(restored.events[0].attributes) == {"result": 10}
+        assert (restored.start_time, restored.end_time) == (original.start_time, original.end_time)
+        assert restored.instrumentation_scope == original.instrumentation_scope
@@ -0,0 +1,163 @@
+"""Tests for the OpenAI stream wrappers and their chunk adapters."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from agentops.instrumentation.common.streaming import StreamAccumulator
+from agentops.instrumentation.providers.openai.stream_wrapper import (
+    ChatCompletionChunkAdapter,
+    OpenaiStreamWrapper,
+    OpenAIAsyncStreamWrapper,
+    ResponsesAPIStreamWrapper,
+)
+from agentops.semconv import SpanAttributes, MessageAttributes
+
+
+def make_chunk(content=None, tool_calls=None, finish_reason=None, usage=None, choices=True):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    choice = SimpleNamespace(delta=delta, finish_reason=finish_reason)
+    return SimpleNamespace(
+        id="chatcmpl-123",
+        model="gpt-4o",
+        choices=[choice] if choices else [],
+        usage=usage,
+    )
+
+
+def make_tool_call_delta(index, arguments, name=None, id=None):
+    return SimpleNamespace(index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+def span_attributes(span):
+    return {call.args[0]: call.args[1] for call in span.set_attribute.call_args_list}
+
+
+class TestChatCompletionChunkAdapter:
+    def test_content_and_metadata(self):
+        span = Mock()
+        accumulator = StreamAccumulator(span)
+        adapter = ChatCompletionChunkAdapter()
+
+        adapter.process(accumulator, make_chunk(content="Hello"))
+        adapter.process(accumulator, make_chunk(content=" World", finish_reason="stop"))
+
+        assert accumulator.content == "Hello World"
+        assert accumulator.finish_reason == "stop"
+        assert accumulator.chunk_count == 2
+        attributes = span_attributes(span)
+        assert attributes[SpanAttributes.LLM_RESPONSE_ID] == "chatcmpl-123"
+        assert attributes[SpanAttributes.LLM_RESPONSE_MODEL] == "gpt-4o"
+        assert SpanAttributes.LLM_STREAMING_TIME_TO_FIRST_TOKEN in attributes
+        # response id, model and time to first token are only set once
+        assert span.set_attribute.call_count == 3
+
+    def test_tool_call_arguments_are_joined(self):
+        accumulator = StreamAccumulator(Mock())
+        adapter = ChatCompletionChunkAdapter()
+
+        adapter.process(
+            accumulator,
+            make_chunk(tool_calls=[make_tool_call_delta(0, '{"city": ', name="get_weather", id="call_1")]),
+        )
+        adapter.process(accumulator, make_chunk(tool_calls=[make_tool_call_delta(0, '"Paris"}')]))
+
+        assert accumulator.tool_call(0).to_dict() == {
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "get_weather", "arguments": '{"city": "Paris"}'},
+        }
+
+    def test_usage_only_chunk(self):
+        accumulator = StreamAccumulator(Mock())
+        usage = SimpleNamespace(prompt_tokens=5, completion_tokens=7, total_tokens=12)
+
+        ChatCompletionChunkAdapter().process(accumulator, make_chunk(usage=usage, choices=False))
+
+        assert accumulator.usage is usage
+        assert accumulator.content == ""
+
+
+class TestOpenaiStreamWrapper:
+    def test_sync_stream_finalizes_span(self):
+        span = Mock()
+        usage = SimpleNamespace(prompt_tokens=5, completion_tokens=7, total_tokens=12)
+        chunks = [
+            make_chunk(content="Hello"),
+            make_chunk(content=" World", finish_reason="stop"),
+            make_chunk(usage=usage, choices=False),
+        ]
+
+        with patch("agentops.instrumentation.providers.openai.stream_wrapper.context_api"):
+            wrapper = OpenaiStreamWrapper(iter(chunks), span, {})
+            assert list(wrapper) == chunks
+
+        attributes = span_attributes(span)
+        assert attributes[MessageAttributes.COMPLETION_CONTENT.format(i=0)] == "Hello World"
+        assert attributes[MessageAttributes.COMPLETION_FINISH_REASON.format(i=0)] == "stop"
+        assert attributes[SpanAttributes.LLM_USAGE_TOTAL_TOKENS] == 12
+        assert attributes["llm.openai.stream.chunk_count"] == 3
+        span.end.assert_called_once()
+
+    def test_sync_stream_creates_tool_spans(self):
+        chunks = [make_chunk(tool_calls=[make_tool_call_delta(0, "{}", name="lookup", id="call_1")])]
+
+        with (
+            patch("agentops.instrumentation.providers.openai.stream_wrapper.context_api"),
+            patch("agentops.instrumentation.providers.openai.stream_wrapper._create_tool_span") as create_tool_span,
+        ):
+            list(OpenaiStreamWrapper(iter(chunks), Mock(), {}))
+
+        tool_call = create_tool_span.call_args.args[1]
+        assert tool_call["function"] == {"name": "lookup", "arguments": "{}"}
+
+    @pytest.mark.asyncio
+    async def test_async_stream_finalizes_span(self):
+        span = Mock()
+
+        async def stream():
+            yield make_chunk(content="Hi")
+
+        with patch("agentops.instrumentation.providers.openai.stream_wrapper.context_api"):
+            result = [chunk async for chunk in OpenAIAsyncStreamWrapper(stream(), span, {})]
+
+        assert len(result) == 1
+        assert span_attributes(span)[MessageAttributes.COMPLETION_CONTENT.format(i=0)] == "Hi"
+        span.end.assert_called_once()
+
+
+class TestResponsesAPIStreamWrapper:
+    def test_events_are_accumulated(self):
+        span = Mock()
+        usage = SimpleNamespace(input_tokens=3, output_tokens=4, total_tokens=7)
+        events = [
+            SimpleNamespace(type="response.created", response=SimpleNamespace(id="resp_1", model="gpt-4o")),
+            SimpleNamespace(type="response.output_text.delta", delta="Hello"),
+            SimpleNamespace(type="response.output_text.delta", delta=" World"),
+            SimpleNamespace(type="response.completed", response=SimpleNamespace(usage=usage, output=[])),
+        ]
+
+        with patch("agentops.instrumentation.providers.openai.stream_wrapper.context_api"):
+            assert list(ResponsesAPIStreamWrapper(iter(events), span, {})) == events
+
+        attributes = span_attributes(span)
+        assert attributes[SpanAttributes.LLM_RESPONSE_ID] == "resp_1"
+        assert attributes[MessageAttributes.COMPLETION_CONTENT.format(i=0)] == "Hello World"
+        assert attributes[SpanAttributes.LLM_USAGE_TOTAL_TOKENS] == 7
+        assert attributes["llm.openai.responses.event_count"] == 4
+        span.end.assert_called_once()
+
+    def test_function_call_content(self):
+        span = Mock()
+        events = [
+            SimpleNamespace(type="response.function_call_arguments.delta", delta='{"a": '),
+            SimpleNamespace(type="response.function_call_arguments.delta", delta="1}"),
+            SimpleNamespace(type="response.output_text.delta", delta="done"),
+        ]
+
+        with patch("agentops.instrumentation.providers.openai.stream_wrapper.context_api"):
+            list(ResponsesAPIStreamWrapper(iter(events), span, {}))
+
+        content = span_attributes(span)[MessageAttributes.COMPLETION_CONTENT.format(i=0)]
+        assert content == 'Function Call: {"a": 1}\nResponse: done'
@@ -1186,3 +1186,53 @@ class TestFactoryModule:
         # The __del__ method should have been called, but we can't easily test this
         # since it's called during garbage collection. The coverage will show if the
         # lines were executed.
+
+    def test_function_shape_resolved_at_decoration(self, instrumentation: InstrumentationTester, monkeypatch):
+        """Test that the function shape is not re-inspected on every call."""
+        from agentops.sdk.decorators import factory
+
+        decorator = create_entity_decorator("test_kind")
+
+        @decorator
+        def test_function():
+            return "result"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("function shape inspected at call time")
+
+        monkeypatch.setattr(factory.asyncio, "iscoroutinefunction", fail)
+        monkeypatch.setattr(factory.inspect, "isgeneratorfunction", fail)
+        monkeypatch.setattr(factory.inspect, "isasyncgenfunction", fail)
+
+        assert test_function() == "result"
+        assert test_function() == "result"
+        assert len(instrumentation.get_finished_spans()) == 2
+
+    def test_unsampled_parent_skips_span(self, instrumentation: InstrumentationTester):
+        """Test that calls under an unsampled parent span don't create spans."""
+        from opentelemetry import trace as trace_api
+        from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+
+        decorator = create_entity_decorator("tool")
+
+        @decorator(cost=0.01)
+        def test_tool(x):
+            return x * 2
+
+        @decorator
+        async def test_async_tool(x):
+            return x * 3
+
+        @decorator
+        def test_generator_tool(count):
+            yield from range(count)
+
+        parent = NonRecordingSpan(
+            SpanContext(trace_id=0x1, span_id=0x2, is_remote=False, trace_flags=TraceFlags(TraceFlags.DEFAULT))
+        )
+        with trace_api.use_span(parent):
+            assert test_tool(2) == 4
+            assert asyncio.run(test_async_tool(2)) == 6
+            assert list(test_generator_tool(3)) == [0, 1, 2]
+
+        assert len(instrumentation.get_finished_spans()) == 0
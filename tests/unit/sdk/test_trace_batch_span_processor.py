@@ -0,0 +1,193 @@
+"""
+Unit tests for the TraceBatchSpanProcessor.
+"""
+
+import threading
+import time
+from typing import List, Sequence
+
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from agentops.sdk.processors import TraceBatchSpanProcessor
+
+
+class RecordingExporter(SpanExporter):
+    """Exporter that records each export call as a separate batch."""
+
+    def __init__(self, delay: float = 0.0):
+        self.batches: List[List[ReadableSpan]] = []
+        self.delay = delay
+        self.is_shutdown = False
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        time.sleep(self.delay)
+        with self._lock:
+            self.batches.append(list(spans))
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        self.is_shutdown = True
+
+    def names(self) -> List[List[str]]:
+        with self._lock:
+            return [[span.name for span in batch] for batch in self.batches]
+
+
+def start_root(tracer, name):
+    # Start from an empty context so the span is a root even if another test leaked an active span
+    return tracer.start_span(name, context=Context())
+
+
+def make_processor(exporter, **kwargs):
+    provider = TracerProvider()
+    processor = TraceBatchSpanProcessor(exporter, **kwargs)
+    provider.add_span_processor(processor)
+    return provider.get_tracer("test"), processor
+
+
+class TestTraceBatchSpanProcessor:
+    def test_trace_is_exported_together_when_root_ends(self):
+        exporter = RecordingExporter()
+        tracer, processor = make_processor(exporter, schedule_delay_millis=10_000)
+
+        root_a = start_root(tracer, "a")
+        root_b = start_root(tracer, "b")
+        with trace.use_span(root_a):
+            tracer.start_span("a.1").end()
+        with trace.use_span(root_b):
+            tracer.start_span("b.1").end()
+        with trace.use_span(root_a):
+            tracer.start_span("a.2").end()
+
+        root_a.end()
+        assert processor.flush_trace(root_a.get_span_context().trace_id)
+        assert exporter.names() == [["a.1", "a.2", "a"]]
+
+        root_b.end()
+        processor.shutdown()
+        assert exporter.names() == [["a.1", "a.2", "a"], ["b.1", "b"]]
+
+    def test_size_cap_exports_partial_trace(self):
+        exporter = RecordingExporter()
+        tracer, processor = make_processor(exporter, max_spans_per_trace=2, schedule_delay_millis=10_000)
+
+        root = start_root(tracer, "root")
+        with trace.use_span(root):
+            for i in range(3):
+                tracer.start_span(f"child.{i}").end()
+        root.end()
+        processor.shutdown()
+
+        assert exporter.names() == [["child.0", "child.1"], ["child.2", "root"]]
+
+    def test_age_cap_exports_trace_without_waiting_for_root(self):
+        exporter = RecordingExporter()
+        tracer, processor = make_processor(exporter, max_trace_age_millis=0, schedule_delay_millis=10)
+
+        root = start_root(tracer, "root")
+        with trace.use_span(root):
+            tracer.start_span("child").end()
+
+        deadline = time.monotonic() + 2
+        while not exporter.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert exporter.names() == [["child"]]
+        root.end()
+        processor.shutdown()
+
+    def test_flush_trace_waits_only_for_its_trace(self):
+        exporter = RecordingExporter()
+        tracer, processor = make_processor(exporter, schedule_delay_millis=10_000)
+
+        root_a = start_root(tracer, "a")
+        root_b = start_root(tracer, "b")
+        with trace.use_span(root_b):
+            tracer.start_span("b.1").end()
+        root_a.end()
+
+        assert processor.flush_trace(root_a.get_span_context().trace_id)
+        assert exporter.names() == [["a"]]
+
+        root_b.end()
+        processor.shutdown()
+
+    def test_flush_trace_times_out(self):
+        exporter = RecordingExporter(delay=0.5)
+        tracer, processor = make_processor(exporter)
+
+        root = start_root(tracer, "root")
+        root.end()
+
+        assert processor.flush_trace(root.get_span_context().trace_id, timeout_millis=10) is False
+        processor.shutdown()
+
+    def test_shutdown_exports_buffered_spans(self):
+        exporter = RecordingExporter()
+        tracer, processor = make_processor(exporter, schedule_delay_millis=10_000)
+
+        root = start_root(tracer, "root")
+        with trace.use_span(root):
+            tracer.start_span("child").end()
+        processor.shutdown()
+
+        assert exporter.names() == [["child"]]
+        assert exporter.is_shutdown
+
+    def test_force_flush_exports_all_traces(self):
+        exporter = RecordingExporter()
+        tracer, processor = make_processor(exporter, schedule_delay_millis=10_000)
+
+        for name in ("a", "b"):
+            root = start_root(tracer, name)
+            with trace.use_span(root):
+                tracer.start_span(f"{name}.1").end()
+
+        assert processor.force_flush()
+        assert sorted(exporter.names()) == [["a.1"], ["b.1"]]
+        processor.shutdown()
+
+    def test_full_queue_drops_and_counts_spans(self):
+        exporting, release = threading.Event(), threading.Event()
+
+        class BlockingExporter(RecordingExporter):
+            def export(self, spans):
+                exporting.set()
+                release.wait(2)
+                return super().export(spans)
+
+        exporter = BlockingExporter()
+        tracer, processor = make_processor(exporter, max_queue_size=2, schedule_delay_millis=10_000)
+
+        # Keep the background thread busy exporting "a" while the queue fills up
+        start_root(tracer, "a").end()
+        assert exporting.wait(2)
+        for name in ("b", "c", "d"):
+            start_root(tracer, name).end()
+        release.set()
+        processor.shutdown()
+
+        assert exporter.names() == [["a"], ["b"], ["c"]]
+        assert processor.dropped_spans == 1
+
+    def test_idle_trace_whose_root_never_ends_is_released(self):
+        exporter = RecordingExporter()
+        tracer, processor = make_processor(
+            exporter, max_trace_age_millis=0, max_trace_idle_millis=0, schedule_delay_millis=10
+        )
+
+        root = start_root(tracer, "root")
+        with trace.use_span(root):
+            tracer.start_span("child").end()
+
+        deadline = time.monotonic() + 2
+        while processor._buffers and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert not processor._buffers
+        assert exporter.names() == [["child"]]
+        processor.shutdown()
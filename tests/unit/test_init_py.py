@@ -113,7 +113,7 @@ def test_update_trace_metadata_success():
         mock_tracer.initialized = True
         result = agentops.update_trace_metadata({"foo": "bar"})
         assert result is True
-        mock_span.set_attribute.assert_called()
+        mock_span.set_attributes.assert_called_once_with({"trace.metadata.foo": "bar"})
 
 
 def test_update_trace_metadata_no_active_span():
@@ -155,7 +155,7 @@ def test_update_trace_metadata_list_type():
         mock_tracer.initialized = True
         # List of valid types
         assert agentops.update_trace_metadata({"foo": [1, 2, 3]})
-        mock_span.set_attribute.assert_called()
+        mock_span.set_attributes.assert_called_once_with({"trace.metadata.foo": "[1, 2, 3]"})
 
 
 def test_update_trace_metadata_extract_key_single_part():
@@ -299,7 +299,7 @@ def test_update_trace_metadata_exception_handling():
         mock_span = MagicMock()
         mock_span.is_recording.return_value = True
         mock_span.name = "foo.SESSION"
-        mock_span.set_attribute.side_effect = Exception("Test error")
+        mock_span.set_attributes.side_effect = Exception("Test error")
         mock_get_span.return_value = mock_span
         mock_tracer.get_active_traces.return_value = {}
         mock_tracer.initialized = True
@@ -326,6 +326,44 @@ def test_update_trace_metadata_no_valid_attributes():
         mock_logger.warning.assert_called_with("No valid metadata attributes were updated")
 
 
+def test_update_trace_metadata_resolves_semantic_conventions_in_one_batch():
+    with patch("agentops.tracer") as mock_tracer, patch("agentops.get_current_span") as mock_get_span:
+        mock_span = MagicMock()
+        mock_span.is_recording.return_value = True
+        mock_span.name = "foo.SESSION"
+        mock_get_span.return_value = mock_span
+        mock_tracer.initialized = True
+
+        assert agentops.update_trace_metadata(
+            {"agent_name": "planner", "tags": ["a", "b"], "agent.id": "123", "stage": "done"}, prefix="app"
+        )
+        mock_span.set_attributes.assert_called_once_with(
+            {
+                "agent.name": "planner",
+                "agentops.tags": '["a", "b"]',
+                "agent.id": "123",
+                "app.stage": "done",
+            }
+        )
+
+
+def test_update_trace_metadata_explicit_trace_context():
+    with patch("agentops.tracer") as mock_tracer, patch("agentops.get_current_span") as mock_get_span:
+        mock_tracer.initialized = True
+        trace_context = MagicMock()
+        trace_context.span.is_recording.return_value = True
+
+        assert agentops.update_trace_metadata({"foo": "bar"}, trace_context=trace_context)
+        trace_context.span.set_attributes.assert_called_once_with({"trace.metadata.foo": "bar"})
+        mock_get_span.assert_not_called()
+
+
+def test_metadata_registry_is_shared():
+    from agentops.semconv.registry import get_metadata_registry
+
+    assert get_metadata_registry() is get_metadata_registry()
+
+
 def test_start_trace_auto_init_failure():
     with (
         patch("agentops.tracer") as mock_tracer,
@@ -428,7 +466,7 @@ def test_end_trace_with_trace_context():
         mock_tracer.initialized = True
         mock_trace_context = MagicMock()
         agentops.end_trace(mock_trace_context, "Error")
-        mock_tracer.end_trace.assert_called_with(trace_context=mock_trace_context, end_state="Error")
+        mock_tracer.end_trace.assert_called_with(trace_context=mock_trace_context, end_state="Error", flush=False)
 
 
 def test_init_jupyter_detection_actual_nameerror():
@@ -454,7 +492,7 @@ def test_end_trace_with_default_state():
         from agentops import TraceState
 
         agentops.end_trace()  # Should use default TraceState.SUCCESS
-        mock_tracer.end_trace.assert_called_with(trace_context=None, end_state=TraceState.SUCCESS)
+        mock_tracer.end_trace.assert_called_with(trace_context=None, end_state=TraceState.SUCCESS, flush=False)
 
 
 def test_update_trace_metadata_extract_key_single_part_actual():
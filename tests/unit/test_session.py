@@ -173,7 +173,9 @@ def test_end_trace(mock_tracing_core, mock_trace_context):
     agentops.end_trace(mock_trace_context, end_state="Success")
 
     # Verify end_trace was called on global tracer
-    mock_tracing_core.end_trace.assert_called_once_with(trace_context=mock_trace_context, end_state="Success")
+    mock_tracing_core.end_trace.assert_called_once_with(
+        trace_context=mock_trace_context, end_state="Success", flush=False
+    )
 
 
 def test_session_decorator_creates_trace(mock_tracing_core, mock_api_client, mock_trace_context, reset_client):
@@ -319,6 +321,17 @@ def test_client_initialization_behavior(mock_tracing_core, mock_api_client, mock
     assert agentops._client.initialized
 
 
+@pytest.mark.parametrize("propagate_to_processes", [True, False])
+def test_init_instruments_process_pools(mock_tracing_core, mock_api_client, reset_client, propagate_to_processes):
+    """Test that init carries traces into process pools unless told not to"""
+    import agentops
+
+    with patch("agentops.client.client.instrument_process_pools") as instrument_process_pools:
+        agentops.init(api_key="test-api-key", auto_start_session=False, propagate_to_processes=propagate_to_processes)
+
+    assert instrument_process_pools.called is propagate_to_processes
+
+
 def test_multiple_concurrent_traces(mock_tracing_core, mock_api_client, reset_client):
     """Test that multiple traces can be started concurrently"""
     import agentops